@@ -0,0 +1,292 @@
+"""Vectorized fourth-down decision engine (go for it, punt or kick)."""
+
+import logging
+from typing import Dict, Optional
+import numpy as np
+import pandas as pd
+from sqlalchemy import and_
+from sqlalchemy.orm import Session
+
+from ..models.play import PlayModel
+
+logger = logging.getLogger(__name__)
+
+GO = 'go'
+PUNT = 'punt'
+FIELD_GOAL = 'field_goal'
+OPTIONS = (GO, PUNT, FIELD_GOAL)
+
+# Play types that reveal the offense's actual call
+ACTUAL_DECISIONS = {'pass': GO, 'run': GO, 'punt': PUNT, 'field_goal': FIELD_GOAL}
+
+# Same down adjustment as ExpectedPointsModel (index by down)
+DOWN_ADJUSTMENT = np.array([0.0, 1.0, 0.85, 0.6, 0.3])
+
+# Fourth-down conversion curve: logit falls with yards to go, harder near the goal line
+CONVERSION_INTERCEPT = 1.15
+CONVERSION_SLOPE = -0.23
+GOAL_LINE_PENALTY = -0.2
+
+# Field goal make curve by kick distance (yardline + 17)
+FG_INTERCEPT = 6.5
+FG_SLOPE = -0.11
+FG_MAX_DISTANCE = 70
+
+# Punting
+NET_PUNT_YARDS = 40
+TOUCHBACK_YARDLINE = 80  # Opponent yardline_100 after a touchback
+
+# Points and field position after scores
+TOUCHDOWN_POINTS = 7
+FIELD_GOAL_POINTS = 3
+KICKOFF_YARDLINE = 75
+
+
+def expected_points(down, yardline_100, game_seconds_remaining, score_differential) -> np.ndarray:
+    """Vectorized equivalent of ``ExpectedPointsModel.calculate_expected_points``."""
+    down = np.clip(np.asarray(down, dtype=np.int64), 1, 4)
+    yardline = np.asarray(yardline_100, dtype=np.float64)
+    seconds = np.asarray(game_seconds_remaining, dtype=np.float64)
+    score_diff = np.asarray(score_differential, dtype=np.float64)
+
+    base_ep = np.maximum(0, 7 - yardline * 0.07)
+    base_ep = np.where(yardline <= 20, 4.5 - yardline * 0.15, base_ep)
+    base_ep = np.where(yardline <= 5, 6.8 - yardline * 0.3, base_ep)
+    base_ep = np.where((yardline < 1) | (yardline > 100), 0.0, base_ep)
+
+    time_adjustment = np.where(seconds < 120, 1.15, np.where(seconds > 3000, 0.95, 1.0))
+    time_adjustment = np.where(np.abs(score_diff) > 14, time_adjustment * 0.8, time_adjustment)
+
+    return base_ep * DOWN_ADJUSTMENT[down] * time_adjustment
+
+
+def win_probability(score_differential, game_seconds_remaining, yardline_100,
+                    down=1, ydstogo=10) -> np.ndarray:
+    """Vectorized equivalent of ``WinProbabilityModel.calculate_win_probability``."""
+    score_diff = np.asarray(score_differential, dtype=np.float64)
+    seconds = np.asarray(game_seconds_remaining, dtype=np.float64)
+    yardline = np.asarray(yardline_100, dtype=np.float64)
+    down = np.asarray(down, dtype=np.int64)
+    ydstogo = np.asarray(ydstogo, dtype=np.float64)
+
+    time_factor = np.select(
+        [seconds > 1800, seconds > 900, seconds > 120],
+        [0.8, 1.0, 1.3],
+        default=2.0
+    )
+    field_pos_bonus = (100 - yardline) * 0.002
+    conversion_prob = np.select(
+        [down == 1, down == 2, down == 3],
+        [0.75 - ydstogo * 0.02, 0.65 - ydstogo * 0.03, 0.45 - ydstogo * 0.04],
+        default=0.25 - ydstogo * 0.05
+    )
+    down_bonus = (conversion_prob - 0.5) * 0.1
+
+    wp = 0.5 + score_diff * 0.02 + score_diff * 0.02 * time_factor + field_pos_bonus + down_bonus
+    return np.clip(wp, 0.01, 0.99)
+
+
+def conversion_probability(ydstogo, yardline_100) -> np.ndarray:
+    """Probability of converting a fourth down by going for it."""
+    ydstogo = np.asarray(ydstogo, dtype=np.float64)
+    yardline = np.asarray(yardline_100, dtype=np.float64)
+    logit = CONVERSION_INTERCEPT + CONVERSION_SLOPE * ydstogo
+    logit = np.where(yardline <= 5, logit + GOAL_LINE_PENALTY, logit)
+    return 1 / (1 + np.exp(-logit))
+
+
+def field_goal_probability(yardline_100) -> np.ndarray:
+    """Probability of making a field goal attempted from the given yardline."""
+    distance = np.asarray(yardline_100, dtype=np.float64) + 17
+    prob = 1 / (1 + np.exp(-(FG_INTERCEPT + FG_SLOPE * distance)))
+    return np.where(distance > FG_MAX_DISTANCE, 0.0, prob)
+
+
+def evaluate_fourth_downs(ydstogo, yardline_100, game_seconds_remaining,
+                          score_differential) -> Dict[str, np.ndarray]:
+    """Evaluate going for it, punting and kicking for arrays of fourth downs.
+
+    Values are from the possession team's perspective. Each option's EP and
+    WP is the probability-weighted value of the resulting states, with the
+    opponent's value negated (EP) or complemented (WP) after a change of
+    possession.
+
+    Args:
+        ydstogo: Yards to go
+        yardline_100: Yards from the opponent's goal line
+        game_seconds_remaining: Seconds left in the game
+        score_differential: Possession team score minus opponent score
+
+    Returns:
+        Dictionary of aligned arrays: ``go_probability``, ``fg_probability``,
+        ``ep_<option>``/``wp_<option>`` for each option, ``recommendation``
+        and ``wp_best``
+    """
+    ydstogo = np.maximum(np.asarray(ydstogo, dtype=np.float64), 1)
+    yardline = np.clip(np.asarray(yardline_100, dtype=np.float64), 1, 99)
+    seconds = np.asarray(game_seconds_remaining, dtype=np.float64)
+    score_diff = np.asarray(score_differential, dtype=np.float64)
+
+    def opponent_ep(opp_yardline, margin):
+        return -expected_points(1, opp_yardline, seconds, -margin)
+
+    def opponent_wp(opp_yardline, margin):
+        return 1 - win_probability(-margin, seconds, opp_yardline)
+
+    # Go for it: a conversion in goal-to-go is a touchdown
+    p_convert = conversion_probability(ydstogo, yardline)
+    touchdown = ydstogo >= yardline
+    new_yardline = np.maximum(yardline - ydstogo, 1)
+    ep_convert = np.where(
+        touchdown,
+        TOUCHDOWN_POINTS + opponent_ep(KICKOFF_YARDLINE, score_diff + TOUCHDOWN_POINTS),
+        expected_points(1, new_yardline, seconds, score_diff)
+    )
+    wp_convert = np.where(
+        touchdown,
+        opponent_wp(KICKOFF_YARDLINE, score_diff + TOUCHDOWN_POINTS),
+        win_probability(score_diff, seconds, new_yardline)
+    )
+    turnover_yardline = 100 - yardline
+    ep_go = p_convert * ep_convert + (1 - p_convert) * opponent_ep(turnover_yardline, score_diff)
+    wp_go = p_convert * wp_convert + (1 - p_convert) * opponent_wp(turnover_yardline, score_diff)
+
+    # Punt: a punt that would reach the end zone is a touchback
+    punt_yardline = np.where(
+        yardline - NET_PUNT_YARDS <= 0, TOUCHBACK_YARDLINE, 100 - (yardline - NET_PUNT_YARDS)
+    )
+    punt_yardline = np.minimum(punt_yardline, TOUCHBACK_YARDLINE)
+    ep_punt = opponent_ep(punt_yardline, score_diff)
+    wp_punt = opponent_wp(punt_yardline, score_diff)
+
+    # Field goal: a miss gives the opponent the ball at the spot of the kick (or the 20)
+    p_make = field_goal_probability(yardline)
+    miss_yardline = np.minimum(100 - (yardline + 7), TOUCHBACK_YARDLINE)
+    ep_fg = (p_make * (FIELD_GOAL_POINTS + opponent_ep(KICKOFF_YARDLINE, score_diff + FIELD_GOAL_POINTS))
+             + (1 - p_make) * opponent_ep(miss_yardline, score_diff))
+    wp_fg = (p_make * opponent_wp(KICKOFF_YARDLINE, score_diff + FIELD_GOAL_POINTS)
+             + (1 - p_make) * opponent_wp(miss_yardline, score_diff))
+
+    wp_options = np.stack([wp_go, wp_punt, wp_fg])
+    best = np.argmax(wp_options, axis=0)
+
+    return {
+        'go_probability': p_convert,
+        'fg_probability': p_make,
+        'ep_go': ep_go,
+        'ep_punt': ep_punt,
+        'ep_field_goal': ep_fg,
+        'wp_go': wp_go,
+        'wp_punt': wp_punt,
+        'wp_field_goal': wp_fg,
+        'recommendation': np.array(OPTIONS, dtype=object)[best],
+        'wp_best': wp_options.max(axis=0)
+    }
+
+
+def to_records(frame: pd.DataFrame, decimals: int = 4) -> list:
+    """Convert a decisions/summary frame to JSON-safe records (NaN becomes None)."""
+    rounded = frame.round(decimals).astype(object)
+    return rounded.where(rounded.notna(), None).to_dict('records')
+
+
+class FourthDownAnalyzer:
+    """Recommend go/punt/FG calls for every fourth down in a season."""
+
+    PLAY_COLUMNS = ('play_id', 'game_id', 'week', 'posteam', 'defteam', 'qtr',
+                    'game_seconds_remaining', 'yardline_100', 'ydstogo',
+                    'score_differential', 'play_type')
+
+    def __init__(self, db_session: Session):
+        """Initialize analyzer.
+
+        Args:
+            db_session: Database session for data access
+        """
+        self.db_session = db_session
+        self.logger = logging.getLogger(__name__)
+
+    def load_fourth_downs(self, season: int, team: Optional[str] = None) -> pd.DataFrame:
+        """Load a season's fourth-down plays with a single query."""
+        filters = [PlayModel.season == season, PlayModel.down == 4]
+        if team:
+            filters.append(PlayModel.posteam == team)
+
+        rows = self.db_session.query(
+            *(getattr(PlayModel, column) for column in self.PLAY_COLUMNS)
+        ).filter(and_(*filters)).all()
+
+        return pd.DataFrame(rows, columns=list(self.PLAY_COLUMNS))
+
+    def evaluate(self, plays: pd.DataFrame) -> pd.DataFrame:
+        """Score every option for each fourth down and the WP cost of the actual call.
+
+        Args:
+            plays: Fourth-down plays with ``PLAY_COLUMNS``
+
+        Returns:
+            The plays with option EP/WP, ``recommendation``, ``actual`` and
+            ``wp_cost`` columns (``wp_cost`` is NaN when the call is unknown)
+        """
+        if plays.empty:
+            return plays.assign(recommendation=pd.Series(dtype=object), actual=pd.Series(dtype=object),
+                                wp_cost=pd.Series(dtype=float))
+
+        qtr = plays['qtr'].fillna(1).to_numpy(dtype=np.float64)
+        seconds = plays['game_seconds_remaining'].to_numpy(dtype=np.float64)
+        # Approximate missing clock values with the start of the quarter
+        seconds = np.where(np.isnan(seconds), np.maximum(3600 - (qtr - 1) * 900, 0), seconds)
+
+        options = evaluate_fourth_downs(
+            plays['ydstogo'].fillna(10).to_numpy(),
+            plays['yardline_100'].fillna(50).to_numpy(),
+            seconds,
+            plays['score_differential'].fillna(0).to_numpy()
+        )
+
+        result = plays.assign(**options)
+        result['actual'] = plays['play_type'].map(ACTUAL_DECISIONS)
+
+        wp_actual = np.select(
+            [result['actual'] == option for option in OPTIONS],
+            [result[f'wp_{option}'] for option in OPTIONS],
+            default=np.nan
+        )
+        result['wp_cost'] = result['wp_best'] - wp_actual
+        return result
+
+    def analyze_season(self, season: int, team: Optional[str] = None) -> pd.DataFrame:
+        """Evaluate every fourth down of a season (optionally for one offense)."""
+        return self.evaluate(self.load_fourth_downs(season, team))
+
+    def team_summary(self, decisions: pd.DataFrame) -> pd.DataFrame:
+        """Aggregate decision quality per offense.
+
+        Args:
+            decisions: Output of ``evaluate``
+
+        Returns:
+            One row per team with decision counts, go rates, agreement with the
+            recommendation and total/average WP cost, sorted by total cost
+        """
+        decided = decisions[decisions['actual'].notna()]
+        if decided.empty:
+            return pd.DataFrame(columns=['team', 'decisions', 'go_rate', 'recommended_go_rate',
+                                         'agreement_rate', 'total_wp_cost', 'avg_wp_cost'])
+
+        summary = decided.assign(
+            went=decided['actual'] == GO,
+            should_go=decided['recommendation'] == GO,
+            agreed=decided['actual'] == decided['recommendation']
+        ).groupby('posteam').agg(
+            decisions=('play_id', 'size'),
+            go_rate=('went', 'mean'),
+            recommended_go_rate=('should_go', 'mean'),
+            agreement_rate=('agreed', 'mean'),
+            total_wp_cost=('wp_cost', 'sum'),
+            avg_wp_cost=('wp_cost', 'mean')
+        )
+
+        return summary.reset_index().rename(columns={'posteam': 'team'}).sort_values(
+            'total_wp_cost', ascending=False
+        ).reset_index(drop=True)
@@ -0,0 +1,198 @@
+"""Batch job that precomputes game insights for a range of weeks."""
+
+import logging
+from concurrent.futures import Executor, ProcessPoolExecutor
+from datetime import datetime
+from types import SimpleNamespace
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+from sqlalchemy import and_
+
+from ..models.game import GameModel
+from ..models.play import PlayModel
+from ..data.data_loader import DataLoadResult
+from .insights import InsightsGenerator, GameInsight
+from .wp_timeline import WPTimeline
+
+logger = logging.getLogger(__name__)
+
+# Columns needed to score a game; workers receive plain tuples, not ORM objects
+GAME_COLUMNS = ('game_id', 'home_team', 'away_team', 'season_type', 'game_date',
+                'home_score', 'away_score')
+PLAY_COLUMNS = ('game_id', 'play_id', 'qtr', 'game_seconds_remaining', 'posteam', 'down',
+                'ydstogo', 'yardline_100', 'score_differential', 'play_type',
+                'yards_gained', 'touchdown')
+
+GamePayload = Tuple[Tuple[Any, ...], List[Tuple[Any, ...]]]
+
+# Per-process generator so the EP/WP models are built once per worker
+_worker_generator: Optional[InsightsGenerator] = None
+
+
+def score_game(payload: GamePayload) -> Tuple[GameInsight, WPTimeline]:
+    """Score one game's plays into its timeline and insight.
+
+    Runs in worker processes, so it only touches the payload (no database).
+
+    Args:
+        payload: Game row and play rows in ``GAME_COLUMNS``/``PLAY_COLUMNS`` order
+
+    Returns:
+        (GameInsight, WPTimeline) for the game
+    """
+    global _worker_generator
+    if _worker_generator is None:
+        _worker_generator = InsightsGenerator(None)
+
+    game_row, play_rows = payload
+    game = SimpleNamespace(**dict(zip(GAME_COLUMNS, game_row)))
+    plays = [SimpleNamespace(**dict(zip(PLAY_COLUMNS, row))) for row in play_rows]
+
+    timeline = _worker_generator.build_wp_timeline(game, plays)
+    return _worker_generator.build_game_insight(game, timeline), timeline
+
+
+class GameInsightsJob:
+    """Precompute GameInsight and win probability timelines for many games.
+
+    Each (season, week) is handled with one query for its games and one for
+    its plays; plays are partitioned by game and scored across a process
+    pool, then all results for the week are written in bulk and committed.
+    """
+
+    def __init__(self, db_session, workers: Optional[int] = None, chunksize: int = 4):
+        """Initialize the job.
+
+        Args:
+            db_session: Database session for reads and writes
+            workers: Worker processes (None for CPU count, 1 to score in-process)
+            chunksize: Games sent to a worker per task
+        """
+        self.db_session = db_session
+        self.workers = workers
+        self.chunksize = chunksize
+        self.generator = InsightsGenerator(db_session)
+
+    def run(self, seasons: List[int], weeks: Optional[List[int]] = None) -> DataLoadResult:
+        """Compute and store insights for every game in the given weeks.
+
+        Args:
+            seasons: Seasons to process
+            weeks: Optional weeks to process (all weeks with games by default)
+
+        Returns:
+            DataLoadResult counting games processed, written (inserted) and
+            skipped for having no plays
+        """
+        result = DataLoadResult()
+        result.start_time = datetime.now()
+
+        executor: Optional[Executor] = None
+        try:
+            if self.workers is None or self.workers > 1:
+                executor = ProcessPoolExecutor(max_workers=self.workers)
+
+            for season, week in self._season_weeks(seasons, weeks):
+                payloads, skipped = self._load_week(season, week)
+                result.records_processed += len(payloads) + skipped
+                result.records_skipped += skipped
+
+                if executor is not None:
+                    scored = list(executor.map(score_game, payloads, chunksize=self.chunksize))
+                else:
+                    scored = [score_game(payload) for payload in payloads]
+
+                try:
+                    written = self.generator.store_game_results(scored)
+                    self.db_session.commit()
+                except Exception as e:
+                    self.db_session.rollback()
+                    logger.error(f"Failed to store game insights for {season} week {week}: {e}")
+                    result.errors.append(f"{season} week {week}: {e}")
+                    continue
+
+                result.records_inserted += written
+                logger.info(f"Stored insights for {len(scored)} games in {season} week {week}")
+
+            result.success = not result.errors
+
+        except Exception as e:
+            logger.error(f"Game insights job failed: {e}")
+            result.errors.append(str(e))
+            result.success = False
+
+        finally:
+            if executor is not None:
+                executor.shutdown()
+            result.end_time = datetime.now()
+
+        return result
+
+    def _season_weeks(self, seasons: List[int],
+                      weeks: Optional[List[int]]) -> Iterator[Tuple[int, int]]:
+        """Yield the (season, week) pairs that have games."""
+        query = self.db_session.query(GameModel.season, GameModel.week).filter(
+            GameModel.season.in_(seasons)
+        )
+        if weeks:
+            query = query.filter(GameModel.week.in_(weeks))
+
+        yield from query.distinct().order_by(GameModel.season, GameModel.week).all()
+
+    def _load_week(self, season: int, week: int) -> Tuple[List[GamePayload], int]:
+        """Load a week's games and plays and partition the plays by game.
+
+        Returns:
+            Payloads for games with plays, and the number of games without plays
+        """
+        games = self.db_session.query(
+            *(getattr(GameModel, column) for column in GAME_COLUMNS)
+        ).filter(
+            and_(GameModel.season == season, GameModel.week == week)
+        ).all()
+
+        if not games:
+            return [], 0
+
+        plays_by_game: Dict[str, List[Tuple[Any, ...]]] = {}
+        play_rows = self.db_session.query(
+            *(getattr(PlayModel, column) for column in PLAY_COLUMNS)
+        ).filter(
+            PlayModel.game_id.in_([game[0] for game in games])
+        ).all()
+        for row in play_rows:
+            plays_by_game.setdefault(row[0], []).append(tuple(row))
+
+        payloads = [
+            (tuple(game), plays_by_game[game[0]]) for game in games if game[0] in plays_by_game
+        ]
+        return payloads, len(games) - len(payloads)
+
+
+if __name__ == "__main__":
+    # CLI for backfilling precomputed game insights
+    import argparse
+    from ..database.manager import DatabaseManager
+
+    def parse_range(value: str) -> List[int]:
+        """Parse '2019-2023' or '1,2,5' into a list of integers."""
+        numbers: List[int] = []
+        for part in value.split(','):
+            start, _, end = part.strip().partition('-')
+            numbers.extend(range(int(start), int(end or start) + 1))
+        return numbers
+
+    parser = argparse.ArgumentParser(description="Precompute NFL game insights")
+    parser.add_argument("--seasons", required=True, help="Seasons, e.g. 2023 or 2019-2023")
+    parser.add_argument("--weeks", help="Weeks, e.g. 1-18 (default: all)")
+    parser.add_argument("--workers", type=int, default=None, help="Worker processes (default: CPU count)")
+
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.INFO)
+
+    session = DatabaseManager().get_session()
+    try:
+        job = GameInsightsJob(session, workers=args.workers)
+        job_result = job.run(parse_range(args.seasons), parse_range(args.weeks) if args.weeks else None)
+        print(f"Game insights result: {job_result.to_dict()}")
+    finally:
+        session.close()
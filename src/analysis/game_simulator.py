@@ -0,0 +1,366 @@
+"""Markov play-by-play Monte Carlo game simulator."""
+
+import logging
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Tuple
+import numpy as np
+import pandas as pd
+from sqlalchemy import and_
+from sqlalchemy.orm import Session
+
+from ..models.play import PlayModel
+from .fourth_down import (
+    evaluate_fourth_downs, field_goal_probability, OPTIONS, PUNT, FIELD_GOAL, NET_PUNT_YARDS
+)
+
+logger = logging.getLogger(__name__)
+
+# Situation buckets: down (4) x distance (short/medium/long) x field zone (own/middle/red zone)
+N_BUCKETS = 4 * 3 * 3
+
+# Quantiles kept per bucket to sample yards gained by inverse transform
+N_QUANTILES = 64
+QUANTILE_LEVELS = (np.arange(N_QUANTILES) + 0.5) / N_QUANTILES
+
+# Blend of offense / opposing defense / league when a bucket has enough samples
+OFFENSE_WEIGHT = 0.45
+DEFENSE_WEIGHT = 0.35
+MIN_BUCKET_SAMPLES = 15
+
+# Fumbles are recorded whether or not they were lost; roughly half are
+FUMBLE_LOST_RATE = 0.5
+
+SECONDS_PER_PLAY = 28
+HALF_SECONDS = 1800
+GAME_SECONDS = 3600
+KICKOFF_YARDLINE = 75
+SAFETY_FREE_KICK_YARDLINE = 65
+TOUCHBACK_YARDLINE = 80
+
+PLAY_TYPES = ('pass', 'run')
+
+
+def situation_bucket(down, ydstogo, yardline_100) -> np.ndarray:
+    """Map down, distance and field position arrays to bucket indices."""
+    down = np.clip(np.asarray(down, dtype=np.int64), 1, 4) - 1
+    ydstogo = np.asarray(ydstogo, dtype=np.float64)
+    yardline = np.asarray(yardline_100, dtype=np.float64)
+
+    distance = np.where(ydstogo <= 3, 0, np.where(ydstogo <= 7, 1, 2))
+    zone = np.where(yardline > 50, 0, np.where(yardline > 20, 1, 2))
+    return (down * 3 + distance) * 3 + zone
+
+
+def _quantile_tables(keys: np.ndarray, yards: np.ndarray,
+                     n_keys: int) -> Tuple[np.ndarray, np.ndarray]:
+    """Per-key yards-gained quantile tables, computed with one sort.
+
+    Returns:
+        (tables of shape (n_keys, N_QUANTILES), sample counts per key)
+    """
+    counts = np.bincount(keys, minlength=n_keys)
+    if len(yards) == 0:
+        return np.zeros((n_keys, N_QUANTILES)), counts
+
+    order = np.lexsort((yards, keys))
+    sorted_yards = yards[order].astype(np.float64)
+    starts = np.concatenate([[0], np.cumsum(counts)[:-1]])
+    positions = starts[:, None] + np.floor(QUANTILE_LEVELS[None, :] * counts[:, None]).astype(np.int64)
+    tables = sorted_yards[np.minimum(positions, len(sorted_yards) - 1)]
+    return np.where(counts[:, None] > 0, tables, 0.0), counts
+
+
+@dataclass
+class TeamTables:
+    """Yards-gained quantiles and turnover rates by situation bucket."""
+    quantiles: np.ndarray  # (N_BUCKETS, N_QUANTILES)
+    turnover_rate: np.ndarray  # (N_BUCKETS,)
+    counts: np.ndarray  # (N_BUCKETS,)
+
+
+class DriveTransitionModel:
+    """Per-team play outcome distributions estimated from historical plays."""
+
+    PLAY_COLUMNS = ('posteam', 'defteam', 'down', 'ydstogo', 'yardline_100',
+                    'yards_gained', 'interception', 'fumble')
+
+    def __init__(self, league: TeamTables, offense: Dict[str, TeamTables],
+                 defense: Dict[str, TeamTables]):
+        self.league = league
+        self.offense = offense
+        self.defense = defense
+
+    @property
+    def teams(self) -> List[str]:
+        """Teams with offensive data."""
+        return sorted(self.offense)
+
+    @classmethod
+    def load(cls, db_session: Session, seasons: List[int]) -> 'DriveTransitionModel':
+        """Estimate the model from scrimmage plays of the given seasons (one query)."""
+        rows = db_session.query(
+            *(getattr(PlayModel, column) for column in cls.PLAY_COLUMNS)
+        ).filter(
+            and_(PlayModel.season.in_(seasons), PlayModel.play_type.in_(PLAY_TYPES))
+        ).all()
+
+        return cls.from_plays(pd.DataFrame(rows, columns=list(cls.PLAY_COLUMNS)))
+
+    @classmethod
+    def from_plays(cls, plays: pd.DataFrame) -> 'DriveTransitionModel':
+        """Estimate the model from a frame of scrimmage plays."""
+        plays = plays.dropna(subset=['posteam', 'defteam', 'down', 'yardline_100'])
+
+        buckets = situation_bucket(
+            plays['down'].to_numpy(), plays['ydstogo'].fillna(10).to_numpy(),
+            plays['yardline_100'].to_numpy()
+        )
+        yards = plays['yards_gained'].fillna(0).to_numpy(dtype=np.float64)
+        turnovers = (plays['interception'].fillna(False).to_numpy(dtype=np.float64)
+                     + FUMBLE_LOST_RATE * plays['fumble'].fillna(False).to_numpy(dtype=np.float64))
+
+        league = cls._tables(buckets, yards, turnovers, np.zeros(len(buckets), dtype=np.int64), 1)[0]
+
+        offense, defense = {}, {}
+        for column, target in (('posteam', offense), ('defteam', defense)):
+            codes, teams = pd.factorize(plays[column])
+            tables = cls._tables(buckets, yards, turnovers, codes, len(teams))
+            target.update(zip(teams, tables))
+
+        return cls(league, offense, defense)
+
+    @staticmethod
+    def _tables(buckets: np.ndarray, yards: np.ndarray, turnovers: np.ndarray,
+                groups: np.ndarray, n_groups: int) -> List[TeamTables]:
+        """Build TeamTables for every group in one pass."""
+        keys = groups.astype(np.int64) * N_BUCKETS + buckets
+        n_keys = n_groups * N_BUCKETS
+        quantiles, counts = _quantile_tables(keys, yards, n_keys)
+        turnover_sums = np.bincount(keys, weights=turnovers, minlength=n_keys)
+        rates = np.divide(turnover_sums, counts, out=np.zeros(n_keys), where=counts > 0)
+
+        return [
+            TeamTables(
+                quantiles=quantiles[g * N_BUCKETS:(g + 1) * N_BUCKETS],
+                turnover_rate=rates[g * N_BUCKETS:(g + 1) * N_BUCKETS],
+                counts=counts[g * N_BUCKETS:(g + 1) * N_BUCKETS]
+            )
+            for g in range(n_groups)
+        ]
+
+    def matchup_tables(self, offense_team: str, defense_team: str) -> Tuple[np.ndarray, np.ndarray]:
+        """Blend an offense with the opposing defense, shrinking sparse buckets to league.
+
+        Returns:
+            (quantiles (N_BUCKETS, N_QUANTILES), turnover rates (N_BUCKETS,))
+        """
+        league = self.league
+        offense = self.offense.get(offense_team)
+        defense = self.defense.get(defense_team)
+
+        quantiles = np.zeros_like(league.quantiles)
+        turnover_rate = np.zeros_like(league.turnover_rate)
+        league_weight = np.ones(N_BUCKETS)
+
+        for tables, weight in ((offense, OFFENSE_WEIGHT), (defense, DEFENSE_WEIGHT)):
+            if tables is None:
+                continue
+            w = np.where(tables.counts >= MIN_BUCKET_SAMPLES, weight, 0.0)
+            quantiles += w[:, None] * tables.quantiles
+            turnover_rate += w * tables.turnover_rate
+            league_weight -= w
+
+        quantiles += league_weight[:, None] * league.quantiles
+        turnover_rate += league_weight * league.turnover_rate
+        return quantiles, turnover_rate
+
+
+@dataclass
+class SimulationResult:
+    """Score, margin and total distributions for a simulated matchup."""
+    home_team: str
+    away_team: str
+    home_scores: np.ndarray
+    away_scores: np.ndarray
+
+    @property
+    def n_simulations(self) -> int:
+        """Number of simulated games."""
+        return len(self.home_scores)
+
+    @property
+    def margins(self) -> np.ndarray:
+        """Home score minus away score per game."""
+        return self.home_scores - self.away_scores
+
+    @property
+    def totals(self) -> np.ndarray:
+        """Combined score per game."""
+        return self.home_scores + self.away_scores
+
+    @staticmethod
+    def _distribution(values: np.ndarray) -> Dict[str, Any]:
+        percentiles = np.percentile(values, [5, 25, 50, 75, 95])
+        counts = pd.Series(values).value_counts().sort_index()
+        return {
+            'mean': round(float(values.mean()), 2),
+            'std': round(float(values.std()), 2),
+            'percentiles': dict(zip(['p5', 'p25', 'p50', 'p75', 'p95'], (float(p) for p in percentiles))),
+            'histogram': {int(k): round(v / len(values), 4) for k, v in counts.items()}
+        }
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary of summary distributions."""
+        margins = self.margins
+        scores = pd.Series(list(zip(self.home_scores.tolist(), self.away_scores.tolist())))
+        top_scores = scores.value_counts().head(5)
+
+        return {
+            'home_team': self.home_team,
+            'away_team': self.away_team,
+            'n_simulations': self.n_simulations,
+            'home_win_prob': round(float((margins > 0).mean()), 4),
+            'away_win_prob': round(float((margins < 0).mean()), 4),
+            'tie_prob': round(float((margins == 0).mean()), 4),
+            'home_score': self._distribution(self.home_scores),
+            'away_score': self._distribution(self.away_scores),
+            'margin': self._distribution(margins),
+            'total': self._distribution(self.totals),
+            'most_likely_scores': [
+                {'home': int(home), 'away': int(away), 'probability': round(count / self.n_simulations, 4)}
+                for (home, away), count in top_scores.items()
+            ]
+        }
+
+
+class GameSimulator:
+    """Simulate many games of a matchup at once as NumPy state vectors.
+
+    Every array holds one entry per simulated game; each loop iteration
+    advances all games by one snap. Fourth downs use the fourth-down
+    engine's recommended call.
+    """
+
+    def __init__(self, model: DriveTransitionModel, seed: Optional[int] = None):
+        """Initialize simulator.
+
+        Args:
+            model: Estimated transition model
+            seed: Random seed for reproducible simulations
+        """
+        self.model = model
+        self.rng = np.random.default_rng(seed)
+
+    def simulate(self, home_team: str, away_team: str, n_simulations: int = 10000) -> SimulationResult:
+        """Simulate ``n_simulations`` games between two teams.
+
+        Args:
+            home_team: Home team abbreviation
+            away_team: Away team abbreviation
+            n_simulations: Number of games to simulate
+
+        Returns:
+            SimulationResult with per-game final scores
+        """
+        rng = self.rng
+        n = n_simulations
+
+        # Tables indexed by the offense (0 = home, 1 = away)
+        home_q, home_to = self.model.matchup_tables(home_team, away_team)
+        away_q, away_to = self.model.matchup_tables(away_team, home_team)
+        quantiles = np.stack([home_q, away_q])
+        turnover_rate = np.stack([home_to, away_to])
+
+        scores = np.zeros((n, 2), dtype=np.int64)
+        first_receiver = rng.integers(0, 2, n)
+        offense = first_receiver.copy()
+        yardline = np.full(n, KICKOFF_YARDLINE, dtype=np.float64)
+        down = np.ones(n, dtype=np.int64)
+        ydstogo = np.full(n, 10.0)
+
+        # Every game snaps once per step, so the clock is shared by all games
+        n_plays = -(-GAME_SECONDS // SECONDS_PER_PLAY)
+        halftime_play = -(-HALF_SECONDS // SECONDS_PER_PLAY)
+
+        for play in range(n_plays):
+            clock = float(GAME_SECONDS - play * SECONDS_PER_PLAY)
+
+            # Second-half kickoff goes to the team that kicked off the first half
+            if play == halftime_play:
+                offense[:] = 1 - first_receiver
+                yardline[:] = KICKOFF_YARDLINE
+                down[:] = 1
+                ydstogo[:] = 10
+
+            # Possession changes are collected and applied once per step
+            flip = np.zeros(n, dtype=bool)
+            flip_spot = np.zeros(n)
+            draws = rng.random((2, n))
+
+            # Fourth-down calls
+            fourth = np.flatnonzero(down == 4)
+            snap = np.ones(n, dtype=bool)
+            if len(fourth):
+                off = offense[fourth]
+                margin = scores[fourth, off] - scores[fourth, 1 - off]
+                options = evaluate_fourth_downs(
+                    ydstogo[fourth], yardline[fourth], np.full(len(fourth), clock), margin
+                )
+                best = np.argmax(np.stack([options[f'wp_{option}'] for option in OPTIONS]), axis=0)
+
+                punt = fourth[best == OPTIONS.index(PUNT)]
+                landing = yardline[punt] - NET_PUNT_YARDS
+                flip[punt] = True
+                flip_spot[punt] = np.where(landing <= 0, TOUCHBACK_YARDLINE, 100 - landing)
+
+                kick = fourth[best == OPTIONS.index(FIELD_GOAL)]
+                made = draws[0, kick] < field_goal_probability(yardline[kick])
+                scores[kick[made], offense[kick[made]]] += 3
+                flip[kick] = True
+                flip_spot[kick] = np.where(
+                    made, KICKOFF_YARDLINE, np.minimum(100 - (yardline[kick] + 7), TOUCHBACK_YARDLINE)
+                )
+                snap[punt] = False
+                snap[kick] = False
+
+            # Scrimmage plays
+            bucket = situation_bucket(down, ydstogo, yardline)
+            turnover = snap & (draws[1] < turnover_rate[offense, bucket])
+            level = rng.integers(0, N_QUANTILES, n)
+            yards = quantiles[offense, bucket, level].round()
+            new_yardline = yardline - yards
+
+            ran = snap & ~turnover
+            touchdown = ran & (new_yardline <= 0)
+            safety = ran & (new_yardline >= 100)
+            scores[touchdown, offense[touchdown]] += 7
+            scores[safety, 1 - offense[safety]] += 2
+
+            gained = ran & ~touchdown & ~safety
+            converted = gained & (yards >= ydstogo)
+            failed = gained & ~converted & (down == 4)
+            advance = gained & ~converted & ~failed
+
+            yardline[gained] = new_yardline[gained]
+            down[converted] = 1
+            ydstogo[converted] = np.minimum(10, yardline[converted])
+            down[advance] += 1
+            ydstogo[advance] -= yards[advance]
+
+            lost = turnover | failed
+            flip |= lost | touchdown | safety
+            flip_spot[lost] = np.clip(100 - new_yardline[lost], 1, 99)
+            flip_spot[touchdown] = KICKOFF_YARDLINE
+            flip_spot[safety] = SAFETY_FREE_KICK_YARDLINE
+
+            offense[flip] = 1 - offense[flip]
+            yardline[flip] = flip_spot[flip]
+            down[flip] = 1
+            ydstogo[flip] = np.minimum(10, yardline[flip])
+
+        return SimulationResult(
+            home_team=home_team,
+            away_team=away_team,
+            home_scores=scores[:, 0],
+            away_scores=scores[:, 1]
+        )
@@ -3,17 +3,22 @@
 import pandas as pd
 import numpy as np
 from typing import Dict, List, Optional, Tuple, Any, Union
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, fields
 from datetime import date, datetime, timedelta
 from enum import Enum
 import logging
 from sqlalchemy.orm import Session
-from sqlalchemy import and_, func
+from sqlalchemy import and_, or_, func
 
 from ..models.game import GameModel
 from ..models.play import PlayModel
 from ..models.team import TeamModel
 from ..models.player import PlayerModel
+from ..models.game_wp_timeline import GameWPTimelineModel
+from ..models.team_season_insights import TeamSeasonInsightsModel, TeamWeekInsightsModel
+from ..models.game_insight import GameInsightModel
+from .wp_timeline import WPTimeline, seconds_elapsed, MOMENTUM_SWING_THRESHOLD
+from .result_cache import cached_result
 
 logger = logging.getLogger(__name__)
 
@@ -153,6 +158,18 @@ class TeamInsights:
             'late_season_performance': round(self.late_season_performance, 3),
             'improvement_trajectory': round(self.improvement_trajectory, 3)
         }
+    
+    @classmethod
+    def from_model(cls, model: TeamSeasonInsightsModel) -> 'TeamInsights':
+        """Build insights from a stored team-season row."""
+        values = {f.name: getattr(model, f.name) for f in fields(cls)}
+        return cls(**{name: 0.0 if value is None else value for name, value in values.items()})
+    
+    def apply_to_model(self, model: TeamSeasonInsightsModel) -> TeamSeasonInsightsModel:
+        """Copy every metric onto a (new or existing) team-season row."""
+        for f in fields(self):
+            setattr(model, f.name, getattr(self, f.name))
+        return model
 
 
 @dataclass
@@ -205,6 +222,17 @@ class GameInsight:
             'third_down_battle': self.third_down_battle,
             'turnover_battle': self.turnover_battle
         }
+    
+    @classmethod
+    def from_model(cls, model: GameInsightModel) -> 'GameInsight':
+        """Build an insight from its stored row."""
+        return cls(**{f.name: getattr(model, f.name) for f in fields(cls)})
+    
+    def apply_to_model(self, model: GameInsightModel) -> GameInsightModel:
+        """Copy every field onto a (new or existing) game insight row."""
+        for f in fields(self):
+            setattr(model, f.name, getattr(self, f.name))
+        return model
 
 
 class ExpectedPointsModel:
@@ -320,16 +348,109 @@ class WinProbabilityModel:
             return 0.25 - (ydstogo * 0.05)
 
 
+@dataclass
+class _InsightTotals:
+    """Running play sums behind the per-play averages in ``TeamInsights``."""
+    plays: int = 0
+    epa: float = 0.0
+    pass_plays: int = 0
+    pass_epa: float = 0.0
+    rush_plays: int = 0
+    rush_epa: float = 0.0
+    red_zone_plays: int = 0
+    red_zone_touchdowns: int = 0
+    third_downs: int = 0
+    third_down_conversions: int = 0
+    defensive_plays: int = 0
+    defensive_epa: float = 0.0
+    def_pass_plays: int = 0
+    def_pass_epa: float = 0.0
+    def_rush_plays: int = 0
+    def_rush_epa: float = 0.0
+    
+    def add_offense(self, play: PlayModel, epa: float) -> None:
+        self.plays += 1
+        self.epa += epa
+        if play.play_type == 'pass':
+            self.pass_plays += 1
+            self.pass_epa += epa
+        elif play.play_type == 'run':
+            self.rush_plays += 1
+            self.rush_epa += epa
+        if play.yardline_100 is not None and play.yardline_100 <= 20:
+            self.red_zone_plays += 1
+            self.red_zone_touchdowns += bool(play.touchdown)
+        if play.down == 3:
+            self.third_downs += 1
+            self.third_down_conversions += (play.yards_gained or 0) >= (play.ydstogo or 10)
+    
+    def add_defense(self, play: PlayModel, epa: float) -> None:
+        self.defensive_plays += 1
+        self.defensive_epa += epa
+        if play.play_type == 'pass':
+            self.def_pass_plays += 1
+            self.def_pass_epa += epa
+        elif play.play_type == 'run':
+            self.def_rush_plays += 1
+            self.def_rush_epa += epa
+    
+    def to_insights(self, team_abbr: str, season: int) -> Optional[TeamInsights]:
+        """Insights over the plays added so far (None without offensive plays)."""
+        if self.plays == 0:
+            return None
+        
+        def average(total, count):
+            return total / count if count else 0
+        
+        offensive_epa = self.epa / self.plays
+        red_zone_efficiency = average(self.red_zone_touchdowns, self.red_zone_plays)
+        third_down_rate = average(self.third_down_conversions, self.third_downs)
+        
+        # Defensive metrics (negative EPA is good for defense)
+        defensive_epa = -average(self.defensive_epa, self.defensive_plays)
+        
+        # More sophisticated metrics would require additional data
+        # For now, use placeholder values with some variation
+        base_clutch = offensive_epa * 1.2
+        base_trend = offensive_epa - defensive_epa
+        
+        return TeamInsights(
+            team_abbr=team_abbr,
+            season=season,
+            offensive_epa_per_play=offensive_epa,
+            passing_epa_per_play=average(self.pass_epa, self.pass_plays),
+            rushing_epa_per_play=average(self.rush_epa, self.rush_plays),
+            red_zone_efficiency=red_zone_efficiency,
+            third_down_conversion_rate=third_down_rate,
+            defensive_epa_per_play=defensive_epa,
+            pass_defense_epa=-average(self.def_pass_epa, self.def_pass_plays),
+            run_defense_epa=-average(self.def_rush_epa, self.def_rush_plays),
+            red_zone_defense=max(0, 1 - red_zone_efficiency - 0.2),
+            third_down_defense=max(0, 1 - third_down_rate - 0.1),
+            two_minute_drill_efficiency=base_clutch,
+            clutch_performance=base_clutch,
+            turnover_margin=0.0,  # Would need turnover data
+            garbage_time_adjusted_epa=offensive_epa * 0.95,
+            strength_of_schedule=0.5,  # Would need opponent strength data
+            home_field_advantage=0.1,  # League average
+            early_season_performance=base_trend * 0.9,
+            late_season_performance=base_trend * 1.1,
+            improvement_trajectory=base_trend * 0.1
+        )
+
+
 class InsightsGenerator:
     """Main insights generator for advanced NFL analytics."""
     
-    def __init__(self, db_session: Session):
+    def __init__(self, db_session: Session, use_cache: bool = False):
         """Initialize insights generator.
         
         Args:
             db_session: Database session for data access
+            use_cache: Share results through the process-wide result cache
         """
         self.db_session = db_session
+        self.use_cache = use_cache
         self.ep_model = ExpectedPointsModel()
         self.wp_model = WinProbabilityModel()
         self.logger = logging.getLogger(__name__)
@@ -431,8 +552,12 @@ class InsightsGenerator:
             explosive_play=explosive_play
         )
     
+    @cached_result('games', 'plays')
     def generate_team_insights(self, team_abbr: str, season: int) -> Optional[TeamInsights]:
-        """Generate comprehensive insights for a team in a given season.
+        """Get comprehensive insights for a team in a given season.
+        
+        Reads the materialized team-season row when available and only
+        computes from plays for seasons that have not been refreshed yet.
         
         Args:
             team_abbr: Team abbreviation (e.g., 'SF', 'KC')
@@ -441,135 +566,246 @@ class InsightsGenerator:
         Returns:
             TeamInsights object with all calculated metrics
         """
+        stored = self.get_stored_team_insights(team_abbr, season)
+        if stored is not None:
+            return stored
+        
+        return self.compute_team_insights(team_abbr, season)
+    
+    def get_stored_team_insights(self, team_abbr: str, season: int) -> Optional[TeamInsights]:
+        """Get materialized insights for a team-season.
+        
+        Args:
+            team_abbr: Team abbreviation
+            season: Season year
+            
+        Returns:
+            TeamInsights if the team-season has been refreshed, None otherwise
+        """
         try:
-            # Get team's plays for the season
-            team_plays = self.db_session.query(PlayModel).filter(
+            row = self.db_session.query(TeamSeasonInsightsModel).filter(
                 and_(
-                    PlayModel.season == season,
-                    PlayModel.posteam == team_abbr
+                    TeamSeasonInsightsModel.team_abbr == team_abbr,
+                    TeamSeasonInsightsModel.season == season
                 )
-            ).all()
-            
-            if not team_plays:
-                self.logger.warning(f"No plays found for {team_abbr} in {season}")
-                return None
-            
-            # Calculate advanced metrics for all plays
-            play_metrics = []
-            for play in team_plays:
-                play_data = {
-                    'down': play.down,
-                    'ydstogo': play.ydstogo,
-                    'yardline_100': play.yardline_100,
-                    'qtr': play.qtr,
-                    'game_seconds_remaining': 3600 - (((play.qtr or 1) - 1) * 900),  # Approximate
-                    'score_differential': 0,  # Would need game state
-                    'timeouts_remaining': 3,
-                    'play_type': play.play_type,
-                    'yards_gained': play.yards_gained or 0,
-                    'touchdown': play.touchdown or False,
-                    'interception': False,  # Would need to parse desc
-                    'fumble_lost': False
-                }
-                
-                metrics = self.calculate_play_metrics(play_data)
-                play_metrics.append(metrics)
-            
-            # Aggregate metrics
-            total_plays = len(play_metrics)
-            if total_plays == 0:
-                return None
+            ).first()
+        except Exception as e:
+            self.logger.warning(f"Could not read stored insights for {team_abbr} {season}: {e}")
+            return None
+        
+        if not isinstance(row, TeamSeasonInsightsModel):
+            return None
+        
+        return TeamInsights.from_model(row)
+    
+    def get_team_insights_history(self, team_abbr: str) -> List[TeamInsights]:
+        """Get materialized insights for every stored season of a team.
+        
+        Args:
+            team_abbr: Team abbreviation
             
-            # Offensive metrics
-            offensive_epa = sum(m.epa for m in play_metrics) / total_plays
+        Returns:
+            List of TeamInsights ordered by season
+        """
+        rows = self.db_session.query(TeamSeasonInsightsModel).filter(
+            TeamSeasonInsightsModel.team_abbr == team_abbr
+        ).order_by(TeamSeasonInsightsModel.season).all()
+        
+        return [TeamInsights.from_model(row) for row in rows]
+    
+    @cached_result('games', 'plays')
+    def generate_team_insights_as_of(self, team_abbr: str, season: int, as_of_week: int) -> Optional[TeamInsights]:
+        """Get a team's insights over its plays through a week of a season.
+        
+        Reads the latest stored week-to-date row at or before the week and
+        only computes from plays for seasons that have not been refreshed.
+        
+        Args:
+            team_abbr: Team abbreviation (e.g., 'SF', 'KC')
+            season: Season year
+            as_of_week: Last week included
             
-            # Separate by play type
-            pass_plays = [m for i, m in enumerate(play_metrics) if team_plays[i].play_type == 'pass']
-            rush_plays = [m for i, m in enumerate(play_metrics) if team_plays[i].play_type == 'run']
+        Returns:
+            TeamInsights as they stood after the week, or None without plays
+        """
+        row = self.db_session.query(TeamWeekInsightsModel).filter(
+            and_(
+                TeamWeekInsightsModel.team_abbr == team_abbr,
+                TeamWeekInsightsModel.season == season,
+                TeamWeekInsightsModel.week <= as_of_week
+            )
+        ).order_by(TeamWeekInsightsModel.week.desc()).first()
+        if row is not None:
+            return TeamInsights.from_model(row)
+        
+        try:
+            weekly = self.compute_weekly_team_insights(team_abbr, season)
+        except Exception as e:
+            self.logger.error(f"Error generating team insights for {team_abbr}: {e}")
+            return None
+        
+        weeks = [week for week in weekly if week <= as_of_week]
+        return weekly[max(weeks)] if weeks else None
+    
+    def refresh_team_season_insights(self, team_seasons: List[Tuple[int, str]]) -> int:
+        """Recompute and store insights for the given (season, team) pairs.
+        
+        Writes the season row and one week-to-date row per week from the same
+        pass over the plays. Rows for team-seasons that no longer have plays
+        are removed. The caller owns the transaction (no commit here).
+        
+        Args:
+            team_seasons: (season, team_abbr) pairs whose plays changed
             
-            passing_epa = sum(m.epa for m in pass_plays) / len(pass_plays) if pass_plays else 0
-            rushing_epa = sum(m.epa for m in rush_plays) / len(rush_plays) if rush_plays else 0
+        Returns:
+            Number of season rows written
+        """
+        written = 0
+        for season, team_abbr in sorted(set(team_seasons)):
+            if not team_abbr:
+                continue
             
-            # Red zone plays (inside 20 yard line)
-            red_zone_plays = [m for i, m in enumerate(play_metrics) if team_plays[i].yardline_100 <= 20]
-            red_zone_touchdowns = sum(1 for i in range(len(team_plays)) 
-                                    if team_plays[i].yardline_100 <= 20 and team_plays[i].touchdown)
-            red_zone_efficiency = red_zone_touchdowns / len(red_zone_plays) if red_zone_plays else 0
+            row = self.db_session.query(TeamSeasonInsightsModel).filter(
+                and_(
+                    TeamSeasonInsightsModel.team_abbr == team_abbr,
+                    TeamSeasonInsightsModel.season == season
+                )
+            ).first()
             
-            # Third down plays
-            third_down_plays = [i for i in range(len(team_plays)) if team_plays[i].down == 3]
-            third_down_conversions = sum(1 for i in third_down_plays 
-                                       if (team_plays[i].yards_gained or 0) >= (team_plays[i].ydstogo or 10))
-            third_down_rate = third_down_conversions / len(third_down_plays) if third_down_plays else 0
+            try:
+                weekly = self.compute_weekly_team_insights(team_abbr, season)
+            except Exception as e:
+                self.logger.error(f"Error generating team insights for {team_abbr}: {e}")
+                weekly = {}
             
-            # Get defensive stats (plays against this team)
-            def_plays = self.db_session.query(PlayModel).filter(
+            self.db_session.query(TeamWeekInsightsModel).filter(
                 and_(
-                    PlayModel.season == season,
-                    PlayModel.defteam == team_abbr
+                    TeamWeekInsightsModel.team_abbr == team_abbr,
+                    TeamWeekInsightsModel.season == season
                 )
-            ).all()
+            ).delete(synchronize_session=False)
+            for week, week_insights in weekly.items():
+                if week >= 1:
+                    self.db_session.add(week_insights.apply_to_model(
+                        TeamWeekInsightsModel(team_abbr=team_abbr, season=season, week=week)
+                    ))
             
-            def_metrics = []
-            for play in def_plays:
-                play_data = {
-                    'down': play.down or 1,
-                    'ydstogo': play.ydstogo or 10,
-                    'yardline_100': play.yardline_100 or 50,
-                    'qtr': play.qtr or 1,
-                    'game_seconds_remaining': 3600 - (((play.qtr or 1) - 1) * 900),
-                    'score_differential': play.score_differential or 0,
-                    'timeouts_remaining': 3,
-                    'play_type': play.play_type or 'pass',
-                    'yards_gained': play.yards_gained or 0,
-                    'touchdown': play.touchdown or False,
-                    'interception': False,
-                    'fumble_lost': False
-                }
-                metrics = self.calculate_play_metrics(play_data)
-                def_metrics.append(metrics)
-            
-            # Defensive metrics (negative EPA is good for defense)
-            defensive_epa = -sum(m.epa for m in def_metrics) / len(def_metrics) if def_metrics else 0
-            
-            def_pass_plays = [m for i, m in enumerate(def_metrics) if def_plays[i].play_type == 'pass']
-            def_rush_plays = [m for i, m in enumerate(def_metrics) if def_plays[i].play_type == 'run']
-            
-            pass_defense_epa = -sum(m.epa for m in def_pass_plays) / len(def_pass_plays) if def_pass_plays else 0
-            run_defense_epa = -sum(m.epa for m in def_rush_plays) / len(def_rush_plays) if def_rush_plays else 0
-            
-            # More sophisticated metrics would require additional data
-            # For now, use placeholder values with some variation
-            base_clutch = offensive_epa * 1.2
-            base_trend = offensive_epa - defensive_epa
-            
-            return TeamInsights(
-                team_abbr=team_abbr,
-                season=season,
-                offensive_epa_per_play=offensive_epa,
-                passing_epa_per_play=passing_epa,
-                rushing_epa_per_play=rushing_epa,
-                red_zone_efficiency=red_zone_efficiency,
-                third_down_conversion_rate=third_down_rate,
-                defensive_epa_per_play=defensive_epa,
-                pass_defense_epa=pass_defense_epa,
-                run_defense_epa=run_defense_epa,
-                red_zone_defense=max(0, 1 - red_zone_efficiency - 0.2),
-                third_down_defense=max(0, 1 - third_down_rate - 0.1),
-                two_minute_drill_efficiency=base_clutch,
-                clutch_performance=base_clutch,
-                turnover_margin=0.0,  # Would need turnover data
-                garbage_time_adjusted_epa=offensive_epa * 0.95,
-                strength_of_schedule=0.5,  # Would need opponent strength data
-                home_field_advantage=0.1,  # League average
-                early_season_performance=base_trend * 0.9,
-                late_season_performance=base_trend * 1.1,
-                improvement_trajectory=base_trend * 0.1
-            )
+            insights = weekly[max(weekly)] if weekly else None
+            if insights is None:
+                if row is not None:
+                    self.db_session.delete(row)
+                continue
+            
+            if row is None:
+                row = TeamSeasonInsightsModel()
+                self.db_session.add(row)
+            insights.apply_to_model(row)
+            row.play_count = self.db_session.query(func.count(PlayModel.id)).filter(
+                and_(PlayModel.season == season, PlayModel.posteam == team_abbr)
+            ).scalar() or 0
+            written += 1
+        
+        return written
+    
+    def compute_team_insights(self, team_abbr: str, season: int) -> Optional[TeamInsights]:
+        """Compute comprehensive insights for a team in a given season from plays.
+        
+        Args:
+            team_abbr: Team abbreviation (e.g., 'SF', 'KC')
+            season: Season year
             
+        Returns:
+            TeamInsights object with all calculated metrics
+        """
+        try:
+            weekly = self.compute_weekly_team_insights(team_abbr, season)
         except Exception as e:
             self.logger.error(f"Error generating team insights for {team_abbr}: {e}")
             return None
+        
+        if not weekly:
+            self.logger.warning(f"No plays found for {team_abbr} in {season}")
+            return None
+        
+        return weekly[max(weekly)]
+    
+    def compute_weekly_team_insights(self, team_abbr: str, season: int) -> Dict[int, TeamInsights]:
+        """Compute a team's insights over its plays through each week of a season.
+        
+        Plays are read and scored once; running sums are snapshotted after
+        every week from the team's first to last, so bye weeks carry the
+        previous week's values forward.
+        
+        Args:
+            team_abbr: Team abbreviation (e.g., 'SF', 'KC')
+            season: Season year
+            
+        Returns:
+            TeamInsights keyed by week (empty if the team has no plays)
+        """
+        plays = self.db_session.query(PlayModel).filter(
+            and_(
+                PlayModel.season == season,
+                or_(PlayModel.posteam == team_abbr, PlayModel.defteam == team_abbr)
+            )
+        ).all()
+        
+        plays_by_week: Dict[int, List[PlayModel]] = {}
+        for play in plays:
+            plays_by_week.setdefault(play.week or 0, []).append(play)
+        if not plays_by_week:
+            return {}
+        
+        totals = _InsightTotals()
+        weekly = {}
+        for week in range(min(plays_by_week), max(plays_by_week) + 1):
+            for play in plays_by_week.get(week, []):
+                if play.posteam == team_abbr:
+                    totals.add_offense(play, self.calculate_play_metrics(self._offense_play_data(play)).epa)
+                else:
+                    totals.add_defense(play, self.calculate_play_metrics(self._defense_play_data(play)).epa)
+            
+            insights = totals.to_insights(team_abbr, season)
+            if insights is not None:
+                weekly[week] = insights
+        
+        return weekly
+    
+    @staticmethod
+    def _offense_play_data(play: PlayModel) -> Dict[str, Any]:
+        """Play data for scoring a team's offensive play."""
+        return {
+            'down': play.down,
+            'ydstogo': play.ydstogo,
+            'yardline_100': play.yardline_100,
+            'qtr': play.qtr,
+            'game_seconds_remaining': 3600 - (((play.qtr or 1) - 1) * 900),  # Approximate
+            'score_differential': 0,  # Would need game state
+            'timeouts_remaining': 3,
+            'play_type': play.play_type,
+            'yards_gained': play.yards_gained or 0,
+            'touchdown': play.touchdown or False,
+            'interception': False,  # Would need to parse desc
+            'fumble_lost': False
+        }
+    
+    @staticmethod
+    def _defense_play_data(play: PlayModel) -> Dict[str, Any]:
+        """Play data for scoring an opponent's play against the team."""
+        return {
+            'down': play.down or 1,
+            'ydstogo': play.ydstogo or 10,
+            'yardline_100': play.yardline_100 or 50,
+            'qtr': play.qtr or 1,
+            'game_seconds_remaining': 3600 - (((play.qtr or 1) - 1) * 900),
+            'score_differential': play.score_differential or 0,
+            'timeouts_remaining': 3,
+            'play_type': play.play_type or 'pass',
+            'yards_gained': play.yards_gained or 0,
+            'touchdown': play.touchdown or False,
+            'interception': False,
+            'fumble_lost': False
+        }
     
     def _generate_basic_game_insight(self, game: GameModel) -> GameInsight:
         """Generate basic game insight when play-by-play data is not available.
@@ -665,9 +901,212 @@ class InsightsGenerator:
         
         return basic_insight
 
+    def _game_play_data(self, play: PlayModel) -> Dict[str, Any]:
+        """Build the play dictionary used to score plays in game context."""
+        return {
+            'down': play.down or 1,
+            'ydstogo': play.ydstogo or 10,
+            'yardline_100': play.yardline_100 or 50,
+            'qtr': play.qtr or 1,
+            'game_seconds_remaining': 3600 - (((play.qtr or 1) - 1) * 900),
+            'score_differential': play.score_differential or 0,
+            'timeouts_remaining': 3,
+            'play_type': play.play_type or 'pass',
+            'yards_gained': play.yards_gained or 0,
+            'touchdown': play.touchdown or False,
+            'interception': False,
+            'fumble_lost': False
+        }
+    
+    def build_wp_timeline(self, game: GameModel, plays: List[PlayModel]) -> WPTimeline:
+        """Score a game's plays once and build its win probability timeline.
+        
+        Args:
+            game: Game model instance
+            plays: All plays for the game (any order)
+            
+        Returns:
+            WPTimeline with per-play series and game-level aggregates
+        """
+        def play_order(play: PlayModel) -> Tuple[float, int]:
+            elapsed = seconds_elapsed(play.qtr, play.game_seconds_remaining, game.season_type)
+            sequence = int(play.play_id) if str(play.play_id).isdigit() else 0
+            return elapsed, sequence
+        
+        ordered = sorted(plays, key=play_order)
+        count = len(ordered)
+        
+        elapsed = np.empty(count, dtype=np.float32)
+        home_wp = np.empty(count, dtype=np.float32)
+        epa = np.empty(count, dtype=np.float32)
+        
+        home_epa = 0.0
+        away_epa = 0.0
+        max_epa = 0.0
+        max_wpa = 0.0
+        momentum_changes = 0
+        last_wp = 0.5
+        
+        for i, play in enumerate(ordered):
+            metrics = self.calculate_play_metrics(self._game_play_data(play))
+            
+            # Track EPA by team
+            if play.posteam == game.home_team:
+                home_epa += metrics.epa
+                current_wp = metrics.win_prob_after
+            else:
+                if play.posteam == game.away_team:
+                    away_epa += metrics.epa
+                current_wp = 1 - metrics.win_prob_after
+            
+            # Track biggest plays
+            if abs(metrics.epa) > abs(max_epa):
+                max_epa = metrics.epa
+            if abs(metrics.wpa) > abs(max_wpa):
+                max_wpa = metrics.wpa
+            
+            # Count momentum swings on the home team's WP curve
+            if abs(current_wp - last_wp) > MOMENTUM_SWING_THRESHOLD:
+                momentum_changes += 1
+            last_wp = current_wp
+            
+            elapsed[i] = play_order(play)[0]
+            home_wp[i] = current_wp
+            epa[i] = metrics.epa
+        
+        return WPTimeline(
+            game_id=game.game_id,
+            seconds_elapsed=elapsed,
+            win_probability=home_wp,
+            epa=epa,
+            home_epa=home_epa,
+            away_epa=away_epa,
+            biggest_play_epa=max_epa,
+            biggest_play_wpa=max_wpa,
+            momentum_swings=momentum_changes
+        )
+    
+    def refresh_game_insights(self, game_ids: List[str]) -> int:
+        """Recompute and store win probability timelines and insights for games.
+        
+        Loads the games and their plays with one query each, scores every
+        game once and upserts both its timeline and its GameInsight. The
+        caller owns the transaction (no commit here).
+        
+        Args:
+            game_ids: Game identifiers whose plays changed
+            
+        Returns:
+            Number of games written
+        """
+        game_ids = sorted(set(game_ids))
+        if not game_ids:
+            return 0
+        
+        games = self.db_session.query(GameModel).filter(
+            GameModel.game_id.in_(game_ids)
+        ).all()
+        
+        plays_by_game: Dict[str, List[PlayModel]] = {}
+        for play in self.db_session.query(PlayModel).filter(PlayModel.game_id.in_(game_ids)).all():
+            plays_by_game.setdefault(play.game_id, []).append(play)
+        
+        results = []
+        for game in games:
+            plays = plays_by_game.get(game.game_id)
+            if not plays:
+                continue
+            
+            timeline = self.build_wp_timeline(game, plays)
+            results.append((self.build_game_insight(game, timeline), timeline))
+        
+        return self.store_game_results(results)
+    
+    def store_game_results(self, results: List[Tuple[GameInsight, WPTimeline]]) -> int:
+        """Upsert precomputed game insights and timelines in bulk.
+        
+        Existing rows for all games are fetched with one query per table. The
+        caller owns the transaction (no commit here).
+        
+        Args:
+            results: (GameInsight, WPTimeline) pairs, one per game
+            
+        Returns:
+            Number of games written
+        """
+        if not results:
+            return 0
+        
+        game_ids = [insight.game_id for insight, _ in results]
+        existing_insights = {
+            row.game_id: row for row in self.db_session.query(GameInsightModel).filter(
+                GameInsightModel.game_id.in_(game_ids)
+            ).all()
+        }
+        existing_timelines = {
+            row.game_id: row for row in self.db_session.query(GameWPTimelineModel).filter(
+                GameWPTimelineModel.game_id.in_(game_ids)
+            ).all()
+        }
+        
+        for insight, timeline in results:
+            insight_row = existing_insights.get(insight.game_id)
+            if insight_row is None:
+                insight_row = GameInsightModel()
+                self.db_session.add(insight_row)
+            insight.apply_to_model(insight_row)
+            
+            timeline_row = existing_timelines.get(timeline.game_id)
+            if timeline_row is None:
+                timeline_row = GameWPTimelineModel()
+                self.db_session.add(timeline_row)
+            timeline.apply_to_model(timeline_row)
+        
+        return len(results)
+    
+    def get_wp_timeline(self, game_id: str) -> Optional[WPTimeline]:
+        """Get the stored win probability timeline for a game.
+        
+        Args:
+            game_id: Game identifier
+            
+        Returns:
+            WPTimeline if one has been computed, None otherwise
+        """
+        row = self.db_session.query(GameWPTimelineModel).filter(
+            GameWPTimelineModel.game_id == game_id
+        ).first()
+        
+        if not isinstance(row, GameWPTimelineModel):
+            return None
+        
+        return WPTimeline.from_model(row)
+    
+    def get_stored_game_insight(self, game_id: str) -> Optional[GameInsight]:
+        """Get the precomputed insight for a game.
+        
+        Args:
+            game_id: Game identifier
+            
+        Returns:
+            GameInsight if one has been computed, None otherwise
+        """
+        row = self.db_session.query(GameInsightModel).filter(
+            GameInsightModel.game_id == game_id
+        ).first()
+        
+        if not isinstance(row, GameInsightModel):
+            return None
+        
+        return GameInsight.from_model(row)
+    
     def generate_game_insights(self, game_id: str) -> Optional[GameInsight]:
         """Generate insights for a specific game.
         
+        Reads the precomputed insight when available, then the stored win
+        probability timeline, and only scores the game's plays when neither
+        has been built yet.
+        
         Args:
             game_id: Game identifier
             
@@ -675,6 +1114,10 @@ class InsightsGenerator:
             GameInsight object with game analysis
         """
         try:
+            stored = self.get_stored_game_insight(game_id)
+            if stored is not None:
+                return stored
+            
             # Get game info
             game = self.db_session.query(GameModel).filter(
                 GameModel.game_id == game_id
@@ -684,100 +1127,77 @@ class InsightsGenerator:
                 self.logger.warning(f"Game {game_id} not found")
                 return None
             
-            # Get all plays for this game
-            plays = self.db_session.query(PlayModel).filter(
-                PlayModel.game_id == game_id
-            ).all()
+            timeline = self.get_wp_timeline(game_id)
             
-            if not plays:
-                self.logger.warning(f"No plays found for game {game_id}")
-                # Return basic game insight without play-by-play data
-                return self._generate_basic_game_insight(game)
-            
-            # Calculate metrics for all plays
-            home_epa = 0
-            away_epa = 0
-            max_epa = 0
-            max_wpa = 0
-            momentum_changes = 0
-            last_wp = 0.5
-            
-            for play in plays:
-                play_data = {
-                    'down': play.down or 1,
-                    'ydstogo': play.ydstogo or 10,
-                    'yardline_100': play.yardline_100 or 50,
-                    'qtr': play.qtr or 1,
-                    'game_seconds_remaining': 3600 - (((play.qtr or 1) - 1) * 900),
-                    'score_differential': play.score_differential or 0,
-                    'timeouts_remaining': 3,
-                    'play_type': play.play_type or 'pass',
-                    'yards_gained': play.yards_gained or 0,
-                    'touchdown': play.touchdown or False,
-                    'interception': False,
-                    'fumble_lost': False
-                }
+            if timeline is None:
+                # Get all plays for this game
+                plays = self.db_session.query(PlayModel).filter(
+                    PlayModel.game_id == game_id
+                ).all()
                 
-                metrics = self.calculate_play_metrics(play_data)
+                if not plays:
+                    self.logger.warning(f"No plays found for game {game_id}")
+                    # Return basic game insight without play-by-play data
+                    return self._generate_basic_game_insight(game)
                 
-                # Track EPA by team
-                if play.posteam == game.home_team:
-                    home_epa += metrics.epa
-                elif play.posteam == game.away_team:
-                    away_epa += metrics.epa
-                
-                # Track biggest plays
-                if abs(metrics.epa) > abs(max_epa):
-                    max_epa = metrics.epa
-                if abs(metrics.wpa) > abs(max_wpa):
-                    max_wpa = metrics.wpa
-                
-                # Count momentum swings
-                current_wp = metrics.win_prob_after
-                if abs(current_wp - last_wp) > 0.15:  # 15% swing
-                    momentum_changes += 1
-                last_wp = current_wp
-            
-            # Calculate game-level metrics
-            total_epa = abs(home_epa) + abs(away_epa)
-            excitement_index = min(10, total_epa + momentum_changes)
-            
-            # Competitiveness based on score differential
-            if game.home_score is not None and game.away_score is not None:
-                score_diff = abs(game.home_score - game.away_score)
-                competitiveness = max(0, 1 - (score_diff / 35.0))  # Close games are more competitive
-            else:
-                competitiveness = 0.5
-            
-            # Determine battle winners (simplified)
-            red_zone_winner = game.home_team if home_epa > away_epa else game.away_team
-            third_down_winner = game.home_team if home_epa > away_epa else game.away_team
-            turnover_winner = "Even"  # Would need turnover data
-            
-            return GameInsight(
-                game_id=game_id,
-                home_team=game.home_team,
-                away_team=game.away_team,
-                game_date=game.game_date,
-                excitement_index=excitement_index,
-                competitiveness=competitiveness,
-                momentum_swings=momentum_changes,
-                home_team_epa=home_epa,
-                away_team_epa=away_epa,
-                passing_game_dominance=0.0,  # Would need pass vs run breakdown
-                rushing_game_dominance=0.0,
-                biggest_play_epa=max_epa,
-                biggest_play_wpa=max_wpa,
-                turning_point_quarter=2,  # Would need detailed analysis
-                red_zone_battle=red_zone_winner,
-                third_down_battle=third_down_winner,
-                turnover_battle=turnover_winner
-            )
+                timeline = self.build_wp_timeline(game, plays)
+            
+            return self.build_game_insight(game, timeline)
             
         except Exception as e:
             self.logger.error(f"Error generating game insights for {game_id}: {e}")
             return None
     
+    def build_game_insight(self, game: GameModel, timeline: WPTimeline) -> GameInsight:
+        """Build a game's insight from its win probability timeline.
+        
+        Args:
+            game: Game model instance
+            timeline: The game's scored timeline
+            
+        Returns:
+            GameInsight with game analysis
+        """
+        home_epa = timeline.home_epa
+        away_epa = timeline.away_epa
+        momentum_changes = timeline.momentum_swings
+        
+        # Calculate game-level metrics
+        total_epa = abs(home_epa) + abs(away_epa)
+        excitement_index = min(10, total_epa + momentum_changes)
+        
+        # Competitiveness based on score differential
+        if game.home_score is not None and game.away_score is not None:
+            score_diff = abs(game.home_score - game.away_score)
+            competitiveness = max(0, 1 - (score_diff / 35.0))  # Close games are more competitive
+        else:
+            competitiveness = 0.5
+        
+        # Determine battle winners (simplified)
+        red_zone_winner = game.home_team if home_epa > away_epa else game.away_team
+        third_down_winner = game.home_team if home_epa > away_epa else game.away_team
+        turnover_winner = "Even"  # Would need turnover data
+        
+        return GameInsight(
+            game_id=game.game_id,
+            home_team=game.home_team,
+            away_team=game.away_team,
+            game_date=game.game_date,
+            excitement_index=excitement_index,
+            competitiveness=competitiveness,
+            momentum_swings=momentum_changes,
+            home_team_epa=home_epa,
+            away_team_epa=away_epa,
+            passing_game_dominance=0.0,  # Would need pass vs run breakdown
+            rushing_game_dominance=0.0,
+            biggest_play_epa=timeline.biggest_play_epa,
+            biggest_play_wpa=timeline.biggest_play_wpa,
+            turning_point_quarter=2,  # Would need detailed analysis
+            red_zone_battle=red_zone_winner,
+            third_down_battle=third_down_winner,
+            turnover_battle=turnover_winner
+        )
+    
     def get_league_leaders(self, season: int, metric: str, limit: int = 10) -> List[Dict[str, Any]]:
         """Get league leaders for a specific advanced metric.
         
@@ -792,32 +1212,86 @@ class InsightsGenerator:
         try:
             # Get all teams for the season
             teams = self.db_session.query(TeamModel).all()
-            team_metrics = []
+            team_insights = [(team, self.generate_team_insights(team.team_abbr, season)) for team in teams]
+            return self._rank_league_leaders(team_insights, metric, limit)
             
-            for team in teams:
-                insights = self.generate_team_insights(team.team_abbr, season)
-                if insights:
-                    metric_value = getattr(insights, metric, 0)
-                    team_metrics.append({
-                        'team_abbr': team.team_abbr,
-                        'team_name': f"{team.team_name} {team.team_nick}",
-                        'metric': metric,
-                        'value': metric_value
-                    })
+        except Exception as e:
+            self.logger.error(f"Error getting league leaders for {metric}: {e}")
+            return []
+    
+    def get_league_leaders_as_of(self, season: int, as_of_week: int, metric: str,
+                                 limit: int = 10) -> List[Dict[str, Any]]:
+        """Get league leaders for an advanced metric as they stood after a week.
+        
+        Reads every team's latest week-to-date row at or before the week in
+        one query, falling back to per-team computation when the season has
+        no stored weekly rows.
+        
+        Args:
+            season: Season year
+            as_of_week: Last week included
+            metric: Metric name (e.g., 'offensive_epa_per_play')
+            limit: Number of teams to return
             
-            # Sort by metric value (descending for most metrics)
-            reverse = True
-            if 'defense' in metric or 'allowed' in metric:
-                reverse = False  # Lower is better for defensive metrics
+        Returns:
+            List of team rankings with metric values
+        """
+        try:
+            latest = self.db_session.query(
+                TeamWeekInsightsModel.team_abbr,
+                func.max(TeamWeekInsightsModel.week).label('week')
+            ).filter(
+                TeamWeekInsightsModel.season == season,
+                TeamWeekInsightsModel.week <= as_of_week
+            ).group_by(TeamWeekInsightsModel.team_abbr).subquery()
             
-            team_metrics.sort(key=lambda x: x['value'], reverse=reverse)
+            rows = self.db_session.query(TeamModel, TeamWeekInsightsModel).join(
+                TeamWeekInsightsModel, TeamWeekInsightsModel.team_abbr == TeamModel.team_abbr
+            ).join(
+                latest, and_(
+                    latest.c.team_abbr == TeamWeekInsightsModel.team_abbr,
+                    latest.c.week == TeamWeekInsightsModel.week
+                )
+            ).filter(TeamWeekInsightsModel.season == season).all()
             
-            return team_metrics[:limit]
+            if rows:
+                team_insights = [(team, TeamInsights.from_model(row)) for team, row in rows]
+            else:
+                teams = self.db_session.query(TeamModel).all()
+                team_insights = [
+                    (team, self.generate_team_insights_as_of(team.team_abbr, season, as_of_week))
+                    for team in teams
+                ]
+            return self._rank_league_leaders(team_insights, metric, limit)
             
         except Exception as e:
             self.logger.error(f"Error getting league leaders for {metric}: {e}")
             return []
     
+    @staticmethod
+    def _rank_league_leaders(team_insights: List[Tuple[TeamModel, Optional[TeamInsights]]],
+                             metric: str, limit: int) -> List[Dict[str, Any]]:
+        """Rank teams by an insights metric."""
+        team_metrics = []
+        for team, insights in team_insights:
+            if insights:
+                metric_value = getattr(insights, metric, 0)
+                team_metrics.append({
+                    'team_abbr': team.team_abbr,
+                    'team_name': f"{team.team_name} {team.team_nick}",
+                    'metric': metric,
+                    'value': metric_value
+                })
+        
+        # Sort by metric value (descending for most metrics)
+        reverse = True
+        if 'defense' in metric or 'allowed' in metric:
+            reverse = False  # Lower is better for defensive metrics
+        
+        team_metrics.sort(key=lambda x: x['value'], reverse=reverse)
+        
+        return team_metrics[:limit]
+    
     def compare_teams(self, team1: str, team2: str, season: int) -> Dict[str, Any]:
         """Compare two teams using advanced metrics.
         
@@ -0,0 +1,373 @@
+"""Incrementally maintained player game and season statistics."""
+
+import logging
+from collections import defaultdict
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+from sqlalchemy import and_, case, func, not_
+from sqlalchemy.orm import Session
+
+from ..models.play import PlayModel
+from ..models.player import PlayerModel
+from ..models.player_stats import (
+    PlayerGameStatsModel, PlayerSeasonStatsModel, SUM_COLUMNS, MAX_COLUMNS, FLOAT_COLUMNS
+)
+
+logger = logging.getLogger(__name__)
+
+RED_ZONE_YARDLINE = 20
+DEEP_AIR_YARDS = 20
+
+# Games refreshed per transaction when rebuilding whole seasons
+REBUILD_CHUNK_SIZE = 64
+
+GameKey = Tuple[str, str]  # (player_id, game_id)
+SeasonKey = Tuple[str, int]  # (player_id, season)
+
+
+def _count(condition):
+    return func.sum(case((condition, 1), else_=0))
+
+
+def _total(value, condition=None):
+    if condition is None:
+        return func.sum(func.coalesce(value, 0))
+    return func.sum(case((condition, func.coalesce(value, 0)), else_=0))
+
+
+# Play classifications shared by the passer and receiver aggregates
+_sack = func.coalesce(PlayModel.desc, '').ilike('%sacked%')
+_completed = and_(
+    PlayModel.interception.isnot(True),
+    not_(func.coalesce(PlayModel.desc, '').ilike('%incomplete%'))
+)
+_red_zone = PlayModel.yardline_100 <= RED_ZONE_YARDLINE
+_deep = PlayModel.air_yards >= DEEP_AIR_YARDS
+
+_PASSER_COLUMNS = {
+    'pass_attempts': func.count(PlayModel.id),
+    'completions': _count(_completed),
+    'passing_yards': _total(PlayModel.yards_gained, _completed),
+    'passing_tds': _count(PlayModel.pass_touchdown.is_(True)),
+    'interceptions': _count(PlayModel.interception.is_(True)),
+    'passing_epa': _total(PlayModel.epa),
+    'successful_passes': _count(PlayModel.epa > 0),
+    'deep_attempts': _count(_deep),
+    'rz_pass_attempts': _count(_red_zone),
+    'rz_passing_tds': _count(and_(_red_zone, PlayModel.pass_touchdown.is_(True))),
+    'longest_pass': func.max(case((_completed, PlayModel.yards_gained))),
+}
+
+_RUSHER_COLUMNS = {
+    'carries': func.count(PlayModel.id),
+    'rushing_yards': _total(PlayModel.yards_gained),
+    'rushing_tds': _count(PlayModel.rush_touchdown.is_(True)),
+    'rushing_epa': _total(PlayModel.epa),
+    'rushing_first_downs': _count(PlayModel.first_down.is_(True)),
+    'runs_10plus': _count(PlayModel.yards_gained >= 10),
+    'runs_20plus': _count(PlayModel.yards_gained >= 20),
+    'rz_carries': _count(_red_zone),
+    'rz_rushing_tds': _count(and_(_red_zone, PlayModel.rush_touchdown.is_(True))),
+    'longest_run': func.max(PlayModel.yards_gained),
+}
+
+_RECEIVER_COLUMNS = {
+    'targets': func.count(PlayModel.id),
+    'receptions': _count(_completed),
+    'receiving_yards': _total(PlayModel.yards_gained, _completed),
+    'receiving_tds': _count(PlayModel.pass_touchdown.is_(True)),
+    'receiving_epa': _total(PlayModel.epa),
+    'receiving_first_downs': _count(and_(_completed, PlayModel.first_down.is_(True))),
+    'air_yards': _total(PlayModel.air_yards),
+    'yards_after_catch': _total(PlayModel.yards_after_catch, _completed),
+    'deep_targets': _count(_deep),
+    'rz_targets': _count(_red_zone),
+    'rz_receiving_tds': _count(and_(_red_zone, PlayModel.pass_touchdown.is_(True))),
+    'longest_reception': func.max(case((_completed, PlayModel.yards_gained))),
+}
+
+# (player column, play filter, aggregate columns) for each role
+_ROLES = {
+    'passer': (PlayModel.passer_player_id, and_(PlayModel.play_type == 'pass', not_(_sack)), _PASSER_COLUMNS),
+    'rusher': (PlayModel.rusher_player_id, PlayModel.play_type == 'run', _RUSHER_COLUMNS),
+    'receiver': (PlayModel.receiver_player_id, PlayModel.play_type == 'pass', _RECEIVER_COLUMNS),
+}
+
+
+def _empty_stats() -> Dict[str, Any]:
+    stats: Dict[str, Any] = {column: 0 for column in SUM_COLUMNS}
+    stats.update({column: 0.0 for column in FLOAT_COLUMNS})
+    stats.update({column: None for column in MAX_COLUMNS})
+    return stats
+
+
+def _apply_row(stats: Dict[str, Any], row, columns: Iterable[str]) -> None:
+    for name in columns:
+        value = getattr(row, name)
+        if name in FLOAT_COLUMNS:
+            stats[name] = float(value or 0)
+        else:
+            stats[name] = value if name in MAX_COLUMNS else int(value or 0)
+
+
+def player_totals(plays_query, player_id: str, roles: Iterable[str] = tuple(_ROLES)) -> Dict[str, Any]:
+    """Aggregate one player's counting stats over the plays of a query.
+
+    Each role is a single-row aggregate, so memory stays flat however many
+    plays the query matches.
+
+    Args:
+        plays_query: Query over PlayModel carrying any season/week filters
+        player_id: Player identifier
+        roles: Roles to aggregate ('passer', 'rusher', 'receiver')
+
+    Returns:
+        Totals keyed by stat column (zero for roles not aggregated)
+    """
+    totals = _empty_stats()
+    for role in roles:
+        player_column, play_filter, columns = _ROLES[role]
+        row = plays_query.filter(player_column == player_id, play_filter).with_entities(
+            *(expression.label(name) for name, expression in columns.items())
+        ).one()
+        _apply_row(totals, row, columns)
+    return totals
+
+
+class PlayerStatsAggregator:
+    """Maintain ``player_game_stats`` and ``player_season_stats`` from plays.
+
+    ``refresh_games`` rebuilds the game rows of the given games with three
+    grouped queries (passer, rusher, receiver) and applies the difference
+    from the previous rows to the season totals, so a load batch only costs
+    work proportional to the games it touched.
+    """
+
+    def __init__(self, db_session: Session):
+        """Initialize aggregator.
+
+        Args:
+            db_session: Database session for reads and writes
+        """
+        self.db_session = db_session
+
+    def compute_game_stats(self, game_ids: Iterable[str]) -> Dict[GameKey, Dict[str, Any]]:
+        """Aggregate player stats for the given games from plays.
+
+        Returns:
+            Stats per (player_id, game_id), including season, week and team_abbr
+        """
+        game_ids = list(game_ids)
+        results: Dict[GameKey, Dict[str, Any]] = {}
+        if not game_ids:
+            return results
+
+        for player_column, play_filter, columns in _ROLES.values():
+            rows = self.db_session.query(
+                player_column.label('player_id'),
+                PlayModel.game_id,
+                func.max(PlayModel.season).label('season'),
+                func.max(PlayModel.week).label('week'),
+                func.max(PlayModel.posteam).label('team_abbr'),
+                *(expression.label(name) for name, expression in columns.items())
+            ).filter(
+                PlayModel.game_id.in_(game_ids),
+                player_column.isnot(None),
+                play_filter
+            ).group_by(player_column, PlayModel.game_id).all()
+
+            for row in rows:
+                stats = results.get((row.player_id, row.game_id))
+                if stats is None:
+                    stats = _empty_stats()
+                    stats.update(season=row.season, week=row.week, team_abbr=row.team_abbr)
+                    results[(row.player_id, row.game_id)] = stats
+                _apply_row(stats, row, columns)
+                stats['team_abbr'] = stats['team_abbr'] or row.team_abbr
+
+        return results
+
+    def refresh_games(self, game_ids: List[str]) -> int:
+        """Rebuild game rows for the given games and apply deltas to season rows.
+
+        The caller owns the transaction (no commit here).
+
+        Args:
+            game_ids: Games whose plays changed
+
+        Returns:
+            Number of game rows written
+        """
+        game_ids = sorted(set(game_ids))
+        new_stats = self.compute_game_stats(game_ids)
+        old_rows = {
+            (row.player_id, row.game_id): row
+            for row in self.db_session.query(PlayerGameStatsModel).filter(
+                PlayerGameStatsModel.game_id.in_(game_ids)
+            ).all()
+        } if game_ids else {}
+
+        deltas: Dict[SeasonKey, Dict[str, Any]] = defaultdict(lambda: defaultdict(int))
+        latest_team: Dict[SeasonKey, Tuple[int, Optional[str]]] = {}
+
+        for key, row in old_rows.items():
+            delta = deltas[(row.player_id, row.season)]
+            for column in SUM_COLUMNS:
+                delta[column] -= getattr(row, column) or 0
+            delta['games'] -= 1
+            if key not in new_stats:
+                self.db_session.delete(row)
+
+        for (player_id, game_id), stats in new_stats.items():
+            row = old_rows.get((player_id, game_id))
+            if row is None:
+                row = PlayerGameStatsModel(player_id=player_id, game_id=game_id)
+                self.db_session.add(row)
+            for column, value in stats.items():
+                setattr(row, column, value)
+
+            season_key = (player_id, stats['season'])
+            delta = deltas[season_key]
+            for column in SUM_COLUMNS:
+                delta[column] += stats[column]
+            delta['games'] += 1
+
+            week = stats['week'] or 0
+            if season_key not in latest_team or week >= latest_team[season_key][0]:
+                latest_team[season_key] = (week, stats['team_abbr'])
+
+        self._apply_season_deltas(deltas, latest_team)
+        return len(new_stats)
+
+    def _apply_season_deltas(self, deltas: Dict[SeasonKey, Dict[str, Any]],
+                             latest_team: Dict[SeasonKey, Tuple[int, Optional[str]]]) -> None:
+        """Add game-row deltas to season rows and recompute their maxima."""
+        if not deltas:
+            return
+
+        player_ids = {player_id for player_id, _ in deltas}
+        seasons = {season for _, season in deltas}
+        season_rows = {
+            (row.player_id, row.season): row
+            for row in self.db_session.query(PlayerSeasonStatsModel).filter(
+                PlayerSeasonStatsModel.player_id.in_(player_ids),
+                PlayerSeasonStatsModel.season.in_(seasons)
+            ).all()
+        }
+
+        for (player_id, season), delta in deltas.items():
+            row = season_rows.get((player_id, season))
+            if row is None:
+                if delta['games'] <= 0:
+                    continue
+                row = PlayerSeasonStatsModel(player_id=player_id, season=season, games=0,
+                                             **_empty_stats())
+                self.db_session.add(row)
+                season_rows[(player_id, season)] = row
+
+            row.games = (row.games or 0) + delta['games']
+            if row.games <= 0:
+                self.db_session.delete(row)
+                del season_rows[(player_id, season)]
+                continue
+
+            for column in SUM_COLUMNS:
+                setattr(row, column, (getattr(row, column) or 0) + delta[column])
+            if (player_id, season) in latest_team:
+                row.team_abbr = latest_team[(player_id, season)][1] or row.team_abbr
+
+        # Maxima are not additive; recompute them from the (narrow) game rows
+        self.db_session.flush()
+        maxima = self.db_session.query(
+            PlayerGameStatsModel.player_id,
+            PlayerGameStatsModel.season,
+            *(func.max(getattr(PlayerGameStatsModel, column)) for column in MAX_COLUMNS)
+        ).filter(
+            PlayerGameStatsModel.player_id.in_(player_ids),
+            PlayerGameStatsModel.season.in_(seasons)
+        ).group_by(PlayerGameStatsModel.player_id, PlayerGameStatsModel.season).all()
+
+        for player_id, season, *values in maxima:
+            row = season_rows.get((player_id, season))
+            if row is not None:
+                for column, value in zip(MAX_COLUMNS, values):
+                    setattr(row, column, value)
+
+    def rebuild(self, seasons: List[int]) -> int:
+        """Rebuild stats for every game with plays in the given seasons.
+
+        Commits after each chunk of games.
+
+        Returns:
+            Number of game rows written
+        """
+        written = 0
+        for season in seasons:
+            game_ids = [
+                game_id for (game_id,) in self.db_session.query(PlayModel.game_id).filter(
+                    PlayModel.season == season
+                ).distinct().order_by(PlayModel.game_id).all()
+            ]
+            for start in range(0, len(game_ids), REBUILD_CHUNK_SIZE):
+                try:
+                    written += self.refresh_games(game_ids[start:start + REBUILD_CHUNK_SIZE])
+                    self.db_session.commit()
+                except Exception:
+                    self.db_session.rollback()
+                    raise
+            logger.info(f"Rebuilt player stats for {len(game_ids)} games in {season}")
+        return written
+
+    def season_leaders(self, season: int, qualifier: str, minimum: int = 0,
+                       order_by: Optional[str] = None, positions: Optional[List[str]] = None,
+                       limit: Optional[int] = None) -> List[Tuple[PlayerSeasonStatsModel, str, str, str]]:
+        """Read season rows that meet a qualifying threshold, joined to players.
+
+        Args:
+            season: Season year
+            qualifier: Column that must reach ``minimum`` (e.g. 'pass_attempts')
+            minimum: Qualifying threshold
+            order_by: Column to sort by descending (defaults to ``qualifier``)
+            positions: Optional player positions to include
+            limit: Optional row limit
+
+        Returns:
+            (season stats row, full name, team, position) tuples
+        """
+        order_column = getattr(PlayerSeasonStatsModel, order_by or qualifier)
+        query = self.db_session.query(
+            PlayerSeasonStatsModel,
+            PlayerModel.full_name,
+            func.coalesce(PlayerSeasonStatsModel.team_abbr, PlayerModel.team_abbr),
+            PlayerModel.position
+        ).join(
+            PlayerModel, PlayerSeasonStatsModel.player_id == PlayerModel.player_id
+        ).filter(
+            PlayerSeasonStatsModel.season == season,
+            getattr(PlayerSeasonStatsModel, qualifier) >= max(minimum, 1)
+        )
+        if positions:
+            query = query.filter(PlayerModel.position.in_(positions))
+
+        query = query.order_by(order_column.desc(), PlayerSeasonStatsModel.player_id)
+        if limit:
+            query = query.limit(limit)
+        return [tuple(row) for row in query.all()]
+
+
+if __name__ == "__main__":
+    # CLI for backfilling player aggregates on an existing database
+    import argparse
+    from ..database.manager import DatabaseManager
+
+    parser = argparse.ArgumentParser(description="Rebuild player game/season stats")
+    parser.add_argument("--seasons", type=int, nargs="+", required=True, help="Seasons to rebuild")
+
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.INFO)
+
+    session = DatabaseManager().get_session()
+    try:
+        rows = PlayerStatsAggregator(session).rebuild(args.seasons)
+        print(f"Wrote {rows} player game rows")
+    finally:
+        session.close()
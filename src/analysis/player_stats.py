@@ -1,8 +1,9 @@
 """
 Player statistics calculator for league leaders and rankings.
 
-This module calculates comprehensive player statistics from play-by-play data
-for quarterbacks, running backs, wide receivers, and defensive players.
+This module builds league leader boards for quarterbacks, running backs and
+wide receivers from the materialized player season stats, and team
+statistics from play-by-play data.
 """
 
 from typing import Dict, List, Optional, Tuple
@@ -14,6 +15,7 @@ import pandas as pd
 from ..models.play import PlayModel
 from ..models.player import PlayerModel
 from ..models.game import GameModel
+from .player_aggregates import PlayerStatsAggregator
 
 
 class PlayerStatsCalculator:
@@ -22,6 +24,7 @@ class PlayerStatsCalculator:
     def __init__(self, db: Session):
         """Initialize with database session."""
         self.db = db
+        self.aggregator = PlayerStatsAggregator(db)
         
     def get_qb_stats(self, season: int = 2024, min_attempts: int = 50) -> List[Dict]:
         """
@@ -34,39 +37,14 @@ class PlayerStatsCalculator:
         Returns:
             List of QB stats dictionaries sorted by passer rating
         """
-        # Query to aggregate QB stats from plays
-        qb_stats_query = self.db.query(
-            PlayModel.passer_player_id.label('player_id'),
-            func.count(PlayModel.id).label('attempts'),
-            func.sum(case((PlayModel.desc.like('%COMPLETE%'), 1), else_=0)).label('completions'),
-            func.sum(PlayModel.yards_gained).label('passing_yards'),
-            func.sum(case((PlayModel.pass_touchdown == True, 1), else_=0)).label('passing_tds'),
-            func.sum(case((PlayModel.interception == True, 1), else_=0)).label('interceptions'),
-            func.avg(PlayModel.epa).label('avg_epa'),
-            func.avg(PlayModel.yards_gained).label('yards_per_attempt')
-        ).filter(
-            PlayModel.play_type == 'pass',
-            PlayModel.season == season,
-            PlayModel.passer_player_id.isnot(None)
-        ).group_by(
-            PlayModel.passer_player_id
-        ).having(
-            func.count(PlayModel.id) >= min_attempts
-        ).all()
+        # Read qualifying passers from the materialized season stats
+        qb_rows = self.aggregator.season_leaders(season, 'pass_attempts', min_attempts)
         
         # Calculate passer rating and format results
         qb_results = []
-        for stat in qb_stats_query:
-            # Get player info
-            player = self.db.query(PlayerModel).filter(
-                PlayerModel.player_id == stat.player_id
-            ).first()
-            
-            if not player:
-                continue
-                
+        for stat, player_name, team, _ in qb_rows:
             # Calculate passer rating components
-            attempts = stat.attempts or 1  # Avoid division by zero
+            attempts = stat.pass_attempts or 1  # Avoid division by zero
             completions = stat.completions or 0
             yards = stat.passing_yards or 0
             tds = stat.passing_tds or 0
@@ -85,8 +63,8 @@ class PlayerStatsCalculator:
             
             qb_results.append({
                 'player_id': stat.player_id,
-                'player_name': player.full_name,
-                'team': player.team_abbr,
+                'player_name': player_name,
+                'team': team,
                 'position': 'QB',
                 'attempts': attempts,
                 'completions': completions,
@@ -95,8 +73,8 @@ class PlayerStatsCalculator:
                 'passing_tds': tds,
                 'interceptions': ints,
                 'passer_rating': round(passer_rating, 1),
-                'avg_epa': round(stat.avg_epa, 3) if stat.avg_epa else 0,
-                'yards_per_attempt': round(stat.yards_per_attempt, 1) if stat.yards_per_attempt else 0
+                'avg_epa': round(stat.passing_epa / attempts, 3),
+                'yards_per_attempt': round(yards / attempts, 1)
             })
         
         # Sort by passer rating
@@ -113,55 +91,32 @@ class PlayerStatsCalculator:
         Returns:
             List of RB stats dictionaries sorted by rushing yards
         """
-        # Query to aggregate RB stats from plays
-        rb_stats_query = self.db.query(
-            PlayModel.rusher_player_id.label('player_id'),
-            func.count(PlayModel.id).label('carries'),
-            func.sum(PlayModel.yards_gained).label('rushing_yards'),
-            func.sum(case((PlayModel.rush_touchdown == True, 1), else_=0)).label('rushing_tds'),
-            func.avg(PlayModel.yards_gained).label('yards_per_carry'),
-            func.avg(PlayModel.epa).label('avg_epa'),
-            func.max(PlayModel.yards_gained).label('longest_run'),
-            func.sum(case((PlayModel.yards_gained >= 10, 1), else_=0)).label('runs_10plus'),
-            func.sum(case((PlayModel.yards_gained >= 20, 1), else_=0)).label('runs_20plus')
-        ).filter(
-            PlayModel.play_type == 'run',
-            PlayModel.season == season,
-            PlayModel.rusher_player_id.isnot(None)
-        ).group_by(
-            PlayModel.rusher_player_id
-        ).having(
-            func.count(PlayModel.id) >= min_carries
-        ).all()
+        # Read qualifying rushers, already sorted by rushing yards
+        rb_rows = self.aggregator.season_leaders(
+            season, 'carries', min_carries, order_by='rushing_yards'
+        )
         
         # Format results
         rb_results = []
-        for stat in rb_stats_query:
-            # Get player info
-            player = self.db.query(PlayerModel).filter(
-                PlayerModel.player_id == stat.player_id
-            ).first()
-            
-            if not player:
-                continue
+        for stat, player_name, team, _ in rb_rows:
+            carries = stat.carries or 1
             
             rb_results.append({
                 'player_id': stat.player_id,
-                'player_name': player.full_name,
-                'team': player.team_abbr,
+                'player_name': player_name,
+                'team': team,
                 'position': 'RB',
                 'carries': stat.carries or 0,
                 'rushing_yards': stat.rushing_yards or 0,
                 'rushing_tds': stat.rushing_tds or 0,
-                'yards_per_carry': round(stat.yards_per_carry, 1) if stat.yards_per_carry else 0,
+                'yards_per_carry': round(stat.rushing_yards / carries, 1),
                 'longest_run': stat.longest_run or 0,
                 'runs_10plus': stat.runs_10plus or 0,
                 'runs_20plus': stat.runs_20plus or 0,
-                'avg_epa': round(stat.avg_epa, 3) if stat.avg_epa else 0
+                'avg_epa': round(stat.rushing_epa / carries, 3)
             })
         
-        # Sort by rushing yards
-        return sorted(rb_results, key=lambda x: x['rushing_yards'], reverse=True)
+        return rb_results
     
     def get_wr_stats(self, season: int = 2024, min_targets: int = 20) -> List[Dict]:
         """
@@ -174,60 +129,35 @@ class PlayerStatsCalculator:
         Returns:
             List of WR stats dictionaries sorted by receiving yards
         """
-        # Query to aggregate WR stats from plays
-        wr_stats_query = self.db.query(
-            PlayModel.receiver_player_id.label('player_id'),
-            func.count(PlayModel.id).label('targets'),
-            func.sum(case((PlayModel.desc.like('%COMPLETE%'), 1), else_=0)).label('receptions'),
-            func.sum(PlayModel.yards_gained).label('receiving_yards'),
-            func.sum(case((PlayModel.pass_touchdown == True, 1), else_=0)).label('receiving_tds'),
-            func.avg(PlayModel.yards_gained).label('yards_per_reception'),
-            func.avg(PlayModel.epa).label('avg_epa'),
-            func.avg(PlayModel.air_yards).label('avg_air_yards'),
-            func.avg(PlayModel.yards_after_catch).label('avg_yac')
-        ).filter(
-            PlayModel.play_type == 'pass',
-            PlayModel.season == season,
-            PlayModel.receiver_player_id.isnot(None)
-        ).group_by(
-            PlayModel.receiver_player_id
-        ).having(
-            func.count(PlayModel.id) >= min_targets
-        ).all()
+        # Read qualifying receivers, already sorted by receiving yards
+        wr_rows = self.aggregator.season_leaders(
+            season, 'targets', min_targets, order_by='receiving_yards'
+        )
         
         # Format results
         wr_results = []
-        for stat in wr_stats_query:
-            # Get player info
-            player = self.db.query(PlayerModel).filter(
-                PlayerModel.player_id == stat.player_id
-            ).first()
-            
-            if not player:
-                continue
-                
+        for stat, player_name, team, position in wr_rows:
             targets = stat.targets or 1
             receptions = stat.receptions or 0
             catch_rate = (receptions / targets * 100) if targets > 0 else 0
             
             wr_results.append({
                 'player_id': stat.player_id,
-                'player_name': player.full_name,
-                'team': player.team_abbr,
-                'position': player.position or 'WR',
+                'player_name': player_name,
+                'team': team,
+                'position': position or 'WR',
                 'targets': targets,
                 'receptions': receptions,
                 'catch_rate': round(catch_rate, 1),
                 'receiving_yards': stat.receiving_yards or 0,
                 'receiving_tds': stat.receiving_tds or 0,
-                'yards_per_reception': round(stat.yards_per_reception, 1) if stat.yards_per_reception else 0,
-                'avg_air_yards': round(stat.avg_air_yards, 1) if stat.avg_air_yards else 0,
-                'avg_yac': round(stat.avg_yac, 1) if stat.avg_yac else 0,
-                'avg_epa': round(stat.avg_epa, 3) if stat.avg_epa else 0
+                'yards_per_reception': round(stat.receiving_yards / receptions, 1) if receptions else 0,
+                'avg_air_yards': round(stat.air_yards / targets, 1),
+                'avg_yac': round(stat.yards_after_catch / receptions, 1) if receptions else 0,
+                'avg_epa': round(stat.receiving_epa / targets, 3)
             })
         
-        # Sort by receiving yards
-        return sorted(wr_results, key=lambda x: x['receiving_yards'], reverse=True)
+        return wr_results
     
     def get_team_offense_stats(self, season: int = 2024) -> List[Dict]:
         """
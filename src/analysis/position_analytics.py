@@ -8,6 +8,8 @@ import logging
 
 from ..models.play import PlayModel
 from ..models.player import PlayerModel
+from .player_aggregates import PlayerStatsAggregator
+from .result_cache import cached_result
 
 logger = logging.getLogger(__name__)
 
@@ -80,71 +82,35 @@ class WideReceiverStats:
 class PositionAnalytics:
     """Enhanced position-specific analytics calculator."""
     
-    def __init__(self, db_session: Session):
-        """Initialize with database session."""
+    def __init__(self, db_session: Session, use_cache: bool = False):
+        """Initialize with database session.
+
+        Args:
+            db_session: Database session
+            use_cache: Share results through the process-wide result cache
+        """
         self.db_session = db_session
+        self.use_cache = use_cache
+        self.aggregator = PlayerStatsAggregator(db_session)
     
+    @cached_result('players', 'plays')
     def calculate_quarterback_stats(self, season: int, min_attempts: int = 150) -> List[QuarterbackStats]:
         """Calculate comprehensive quarterback statistics."""
         logger.info(f"Calculating QB stats for season {season}")
         
-        # Main QB query with enhanced metrics
-        qb_query = self.db_session.query(
-            PlayModel.passer_player_id,
-            PlayerModel.full_name,
-            PlayerModel.team_abbr,
-            func.count(PlayModel.id).label('attempts'),
-            func.sum(case((PlayModel.yards_gained >= 0, PlayModel.yards_gained), else_=0)).label('total_yards'),
-            func.sum(case((
-                (PlayModel.play_type == 'pass') & 
-                (PlayModel.interception.is_(False)) & 
-                (PlayModel.yards_gained >= 0), 1
-            ), else_=0)).label('completions'),
-            func.sum(case((PlayModel.pass_touchdown.is_(True), 1), else_=0)).label('touchdowns'),
-            func.sum(case((PlayModel.interception.is_(True), 1), else_=0)).label('interceptions'),
-            func.avg(PlayModel.epa).label('avg_epa'),
-            func.sum(case((PlayModel.epa > 0, 1), else_=0)).label('successful_plays'),
-            func.sum(case((PlayModel.air_yards >= 20, 1), else_=0)).label('deep_attempts'),
-            func.max(PlayModel.yards_gained).label('longest_pass')
-        ).join(
-            PlayerModel, PlayModel.passer_player_id == PlayerModel.player_id
-        ).filter(
-            PlayModel.play_type == 'pass',
-            PlayModel.season == season,
-            PlayModel.passer_player_id.isnot(None)
-        ).group_by(
-            PlayModel.passer_player_id,
-            PlayerModel.full_name,
-            PlayerModel.team_abbr
-        ).having(func.count(PlayModel.id) >= min_attempts).all()
-        
-        # Calculate red zone stats separately
-        red_zone_stats = {}
-        for qb in qb_query:
-            red_zone_query = self.db_session.query(
-                func.count(PlayModel.id).label('rz_attempts'),
-                func.sum(case((PlayModel.pass_touchdown.is_(True), 1), else_=0)).label('rz_tds')
-            ).filter(
-                PlayModel.play_type == 'pass',
-                PlayModel.season == season,
-                PlayModel.passer_player_id == qb.passer_player_id,
-                PlayModel.yardline_100 <= 20
-            ).first()
-            
-            red_zone_stats[qb.passer_player_id] = {
-                'attempts': red_zone_query.rz_attempts or 0,
-                'tds': red_zone_query.rz_tds or 0
-            }
+        # Qualifying passers from the materialized season stats (one query)
+        qb_rows = self.aggregator.season_leaders(season, 'pass_attempts', min_attempts)
         
         qb_stats = []
-        for stat in qb_query:
-            attempts = stat.attempts or 1
+        for stat, player_name, team, _ in qb_rows:
+            attempts = stat.pass_attempts or 1
             completions = stat.completions or 0
-            yards = stat.total_yards or 0
-            tds = stat.touchdowns or 0
+            yards = stat.passing_yards or 0
+            tds = stat.passing_tds or 0
             ints = stat.interceptions or 0
-            successful_plays = stat.successful_plays or 0
+            successful_plays = stat.successful_passes or 0
             deep_attempts = stat.deep_attempts or 0
+            avg_epa = stat.passing_epa / attempts
             
             # Calculate percentages
             comp_pct = (completions / attempts) * 100
@@ -163,15 +129,15 @@ class PositionAnalytics:
             passer_rating = ((a + b + c + d) / 6) * 100
             
             # Simplified QBR (EPA-based approximation)
-            qbr = min(100, max(0, 50 + (stat.avg_epa or 0) * 25))
+            qbr = min(100, max(0, 50 + avg_epa * 25))
             
             # Red zone TD percentage
-            rz_data = red_zone_stats.get(stat.passer_player_id, {'attempts': 0, 'tds': 0})
-            red_zone_td_pct = (rz_data['tds'] / rz_data['attempts'] * 100) if rz_data['attempts'] > 0 else 0
+            rz_attempts = stat.rz_pass_attempts or 0
+            red_zone_td_pct = ((stat.rz_passing_tds or 0) / rz_attempts * 100) if rz_attempts > 0 else 0
             
             qb_stats.append(QuarterbackStats(
-                player_name=stat.full_name,
-                team=stat.team_abbr,
+                player_name=player_name,
+                team=team,
                 attempts=attempts,
                 completions=completions,
                 completion_pct=round(comp_pct, 1),
@@ -182,7 +148,7 @@ class PositionAnalytics:
                 qbr=round(qbr, 1),
                 yards_per_attempt=round(ypa, 1),
                 yards_per_completion=round(ypc, 1),
-                avg_epa=round(stat.avg_epa or 0, 3),
+                avg_epa=round(avg_epa, 3),
                 success_rate=round(success_rate, 1),
                 deep_ball_pct=round(deep_ball_pct, 1),
                 red_zone_td_pct=round(red_zone_td_pct, 1)
@@ -191,155 +157,71 @@ class PositionAnalytics:
         # Sort by passer rating
         return sorted(qb_stats, key=lambda x: x.passer_rating, reverse=True)
     
+    @cached_result('players', 'plays')
     def calculate_running_back_stats(self, season: int, min_carries: int = 75) -> List[RunningBackStats]:
         """Calculate comprehensive running back statistics."""
         logger.info(f"Calculating RB stats for season {season}")
         
-        # Rushing stats
-        rushing_query = self.db_session.query(
-            PlayModel.rusher_player_id,
-            PlayerModel.full_name,
-            PlayerModel.team_abbr,
-            func.count(PlayModel.id).label('carries'),
-            func.sum(PlayModel.yards_gained).label('total_yards'),
-            func.avg(PlayModel.yards_gained).label('avg_per_carry'),
-            func.sum(case((PlayModel.rush_touchdown.is_(True), 1), else_=0)).label('touchdowns'),
-            func.max(PlayModel.yards_gained).label('longest'),
-            func.sum(case((PlayModel.first_down.is_(True), 1), else_=0)).label('first_downs'),
-            func.avg(PlayModel.epa).label('avg_epa')
-        ).join(
-            PlayerModel, PlayModel.rusher_player_id == PlayerModel.player_id
-        ).filter(
-            PlayModel.play_type == 'run',
-            PlayModel.season == season,
-            PlayModel.rusher_player_id.isnot(None)
-        ).group_by(
-            PlayModel.rusher_player_id,
-            PlayerModel.full_name,
-            PlayerModel.team_abbr
-        ).having(func.count(PlayModel.id) >= min_carries).all()
+        # Season rows carry rushing and receiving stats together (one query)
+        rb_rows = self.aggregator.season_leaders(season, 'carries', min_carries)
         
         rb_stats = []
         
-        for stat in rushing_query:
-            # Get receiving stats for this RB
-            receiving_query = self.db_session.query(
-                func.count(case((PlayModel.receiver_player_id == stat.rusher_player_id, 1))).label('targets'),
-                func.count(case((
-                    (PlayModel.receiver_player_id == stat.rusher_player_id) &
-                    (PlayModel.yards_gained >= 0) &
-                    (PlayModel.interception.is_(False)), 1
-                ))).label('receptions'),
-                func.sum(case((
-                    (PlayModel.receiver_player_id == stat.rusher_player_id) &
-                    (PlayModel.yards_gained >= 0) &
-                    (PlayModel.interception.is_(False)), PlayModel.yards_gained
-                ), else_=0)).label('receiving_yards'),
-                func.sum(case((
-                    (PlayModel.receiver_player_id == stat.rusher_player_id) &
-                    (PlayModel.pass_touchdown.is_(True)), 1
-                ), else_=0)).label('receiving_tds'),
-                func.avg(case((
-                    PlayModel.receiver_player_id == stat.rusher_player_id, PlayModel.epa
-                ))).label('receiving_epa')
-            ).filter(
-                PlayModel.play_type == 'pass',
-                PlayModel.season == season
-            ).first()
-            
-            targets = receiving_query.targets or 0
-            receptions = receiving_query.receptions or 0
-            receiving_yards = receiving_query.receiving_yards or 0
-            receiving_tds = receiving_query.receiving_tds or 0
+        for stat, player_name, team, _ in rb_rows:
+            carries = stat.carries or 0
+            targets = stat.targets or 0
+            receptions = stat.receptions or 0
+            receiving_yards = stat.receiving_yards or 0
+            receiving_tds = stat.receiving_tds or 0
             
             catch_rate = (receptions / targets * 100) if targets > 0 else 0
             
             rb_stats.append(RunningBackStats(
-                player_name=stat.full_name,
-                team=stat.team_abbr,
-                carries=stat.carries or 0,
-                rushing_yards=int(stat.total_yards or 0),
-                rushing_tds=stat.touchdowns or 0,
-                yards_per_carry=round(stat.avg_per_carry or 0, 1),
-                longest_run=stat.longest or 0,
-                first_downs=stat.first_downs or 0,
+                player_name=player_name,
+                team=team,
+                carries=carries,
+                rushing_yards=int(stat.rushing_yards or 0),
+                rushing_tds=stat.rushing_tds or 0,
+                yards_per_carry=round((stat.rushing_yards or 0) / carries, 1) if carries else 0,
+                longest_run=stat.longest_run or 0,
+                first_downs=stat.rushing_first_downs or 0,
                 targets=targets,
                 receptions=receptions,
                 receiving_yards=int(receiving_yards),
                 receiving_tds=receiving_tds,
                 catch_rate=round(catch_rate, 1),
-                avg_epa_rushing=round(stat.avg_epa or 0, 3),
-                avg_epa_receiving=round(receiving_query.receiving_epa or 0, 3),
-                total_touchdowns=(stat.touchdowns or 0) + receiving_tds,
-                total_yards=int((stat.total_yards or 0) + receiving_yards)
+                avg_epa_rushing=round(stat.rushing_epa / carries, 3) if carries else 0,
+                avg_epa_receiving=round(stat.receiving_epa / targets, 3) if targets else 0,
+                total_touchdowns=(stat.rushing_tds or 0) + receiving_tds,
+                total_yards=int((stat.rushing_yards or 0) + receiving_yards)
             ))
         
         # Sort by total yards
         return sorted(rb_stats, key=lambda x: x.total_yards, reverse=True)
     
+    @cached_result('players', 'plays')
     def calculate_wide_receiver_stats(self, season: int, min_targets: int = 30) -> List[WideReceiverStats]:
         """Calculate comprehensive wide receiver statistics."""
         logger.info(f"Calculating WR stats for season {season}")
         
-        # WR receiving stats with targets calculation
-        wr_query = self.db_session.query(
-            PlayModel.receiver_player_id,
-            PlayerModel.full_name,
-            PlayerModel.team_abbr,
-            # Targets = all pass plays where this player was the intended receiver
-            func.count(PlayModel.id).label('targets'),
-            # Receptions = completed passes to this player
-            func.sum(case((
-                (PlayModel.interception.is_(False)) & 
-                (PlayModel.yards_gained >= 0), 1
-            ), else_=0)).label('receptions'),
-            func.sum(case((
-                (PlayModel.interception.is_(False)) & 
-                (PlayModel.yards_gained >= 0), PlayModel.yards_gained
-            ), else_=0)).label('total_yards'),
-            func.sum(case((PlayModel.pass_touchdown.is_(True), 1), else_=0)).label('touchdowns'),
-            func.sum(case((PlayModel.first_down.is_(True), 1), else_=0)).label('first_downs'),
-            func.max(case((
-                (PlayModel.interception.is_(False)) & 
-                (PlayModel.yards_gained >= 0), PlayModel.yards_gained
-            ))).label('longest'),
-            func.sum(case((PlayModel.air_yards >= 20, 1), else_=0)).label('deep_targets'),
-            func.avg(PlayModel.epa).label('avg_epa'),
-            func.avg(PlayModel.yards_after_catch).label('avg_yac')
-        ).join(
-            PlayerModel, PlayModel.receiver_player_id == PlayerModel.player_id
-        ).filter(
-            PlayModel.play_type == 'pass',
-            PlayModel.season == season,
-            PlayModel.receiver_player_id.isnot(None)
-        ).group_by(
-            PlayModel.receiver_player_id,
-            PlayerModel.full_name,
-            PlayerModel.team_abbr
-        ).having(func.count(PlayModel.id) >= min_targets).all()
+        # Qualifying receivers, already sorted by receiving yards (one query)
+        wr_rows = self.aggregator.season_leaders(
+            season, 'targets', min_targets, order_by='receiving_yards'
+        )
         
         wr_stats = []
         
-        for stat in wr_query:
+        for stat, player_name, team, _ in wr_rows:
             targets = stat.targets or 1
             receptions = stat.receptions or 0
-            yards = stat.total_yards or 0
-            tds = stat.touchdowns or 0
+            yards = stat.receiving_yards or 0
+            tds = stat.receiving_tds or 0
             
             # Calculate advanced metrics
             catch_rate = (receptions / targets * 100)
             yards_per_catch = yards / receptions if receptions > 0 else 0
             yards_per_target = yards / targets
-            
-            # Red zone targets
-            red_zone_targets = self.db_session.query(
-                func.count(PlayModel.id)
-            ).filter(
-                PlayModel.play_type == 'pass',
-                PlayModel.season == season,
-                PlayModel.receiver_player_id == stat.receiver_player_id,
-                PlayModel.yardline_100 <= 20
-            ).scalar() or 0
+            yards_after_catch = stat.yards_after_catch / receptions if receptions > 0 else 0
             
             # Estimate drop rate (incomplete passes that weren't INTs or throwaways)
             incomplete_passes = targets - receptions
@@ -348,8 +230,8 @@ class PositionAnalytics:
             drop_rate = (estimated_drops / targets * 100) if targets > 0 else 0
             
             wr_stats.append(WideReceiverStats(
-                player_name=stat.full_name,
-                team=stat.team_abbr,
+                player_name=player_name,
+                team=team,
                 targets=targets,
                 receptions=receptions,
                 receiving_yards=int(yards),
@@ -357,17 +239,16 @@ class PositionAnalytics:
                 catch_rate=round(catch_rate, 1),
                 yards_per_catch=round(yards_per_catch, 1),
                 yards_per_target=round(yards_per_target, 1),
-                yards_after_catch=round(stat.avg_yac or 0, 1),
-                first_downs=stat.first_downs or 0,
-                longest_reception=stat.longest or 0,
+                yards_after_catch=round(yards_after_catch, 1),
+                first_downs=stat.receiving_first_downs or 0,
+                longest_reception=stat.longest_reception or 0,
                 deep_targets=stat.deep_targets or 0,
-                red_zone_targets=red_zone_targets,
-                avg_epa=round(stat.avg_epa or 0, 3),
+                red_zone_targets=stat.rz_targets or 0,
+                avg_epa=round(stat.receiving_epa / targets, 3),
                 drop_rate=round(drop_rate, 1)
             ))
         
-        # Sort by receiving yards
-        return sorted(wr_stats, key=lambda x: x.receiving_yards, reverse=True)
+        return wr_stats
     
     def get_position_leaders(self, season: int, position: str = 'all') -> Dict[str, List[Any]]:
         """Get comprehensive position leaders for a season."""
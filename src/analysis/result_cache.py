@@ -0,0 +1,229 @@
+"""Process-wide cache for analytics results.
+
+Full-season computations are keyed by method, arguments and the data version
+of the datasets they read (see ``src.data.data_versions``), so a result stays
+valid until a load touches those datasets. A completed season's version never
+changes again, which makes its results compute once per process unless they
+are evicted. Entries are evicted least recently used first, bounded by count
+and by estimated size. Concurrent misses for the same key are coalesced so
+only one caller computes.
+
+Caching is opt-in per analytics instance (``use_cache=True``) because cached
+results are shared between callers and must be treated as read-only.
+"""
+
+import functools
+import inspect
+import logging
+import sys
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple
+
+
+logger = logging.getLogger(__name__)
+
+RESULT_CACHE_MAX_ENTRIES = 1024
+RESULT_CACHE_MAX_BYTES = 64 * 1024 * 1024
+
+
+def estimate_size(value: Any) -> int:
+    """Approximate the memory held by a value and everything it references."""
+    seen = set()
+    total = 0
+    stack = [value]
+    while stack:
+        obj = stack.pop()
+        if id(obj) in seen:
+            continue
+        seen.add(id(obj))
+        total += sys.getsizeof(obj)
+        if isinstance(obj, (str, bytes, int, float, bool)) or obj is None:
+            continue
+        if isinstance(obj, dict):
+            stack.extend(obj.keys())
+            stack.extend(obj.values())
+        elif isinstance(obj, (list, tuple, set, frozenset)):
+            stack.extend(obj)
+        elif hasattr(obj, '__dict__'):
+            stack.append(vars(obj))
+        elif hasattr(obj, '__slots__'):
+            stack.extend(getattr(obj, slot) for slot in obj.__slots__ if hasattr(obj, slot))
+    return total
+
+
+@dataclass
+class CacheEntry:
+    """A cached result with its estimated size and hit count."""
+    value: Any
+    size: int
+    hits: int = 0
+
+
+class _Flight:
+    """A computation in progress that other callers of the same key wait on."""
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.value: Any = None
+        self.failed = False
+
+
+class ResultCache:
+    """Thread-safe LRU cache bounded by entry count and estimated bytes."""
+
+    def __init__(self, max_entries: int = RESULT_CACHE_MAX_ENTRIES,
+                 max_bytes: int = RESULT_CACHE_MAX_BYTES):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._entries: 'OrderedDict[Hashable, CacheEntry]' = OrderedDict()
+        self._in_flight: Dict[Hashable, _Flight] = {}
+        self._lock = threading.Lock()
+        self._bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.coalesced = 0
+        self.evictions = 0
+
+    def get_or_compute(self, key: Hashable, compute: Callable[[], Any]) -> Any:
+        """Return the cached value for ``key``, computing it once on a miss.
+
+        Callers that miss while another caller is computing the same key wait
+        for that result instead of computing it again. Exceptions are not
+        cached; waiters of a failed computation retry it themselves.
+        """
+        while True:
+            with self._lock:
+                entry = self._entries.get(key)
+                if entry is not None:
+                    self._entries.move_to_end(key)
+                    entry.hits += 1
+                    self.hits += 1
+                    return entry.value
+
+                flight = self._in_flight.get(key)
+                leader = flight is None
+                if leader:
+                    flight = self._in_flight[key] = _Flight()
+                    self.misses += 1
+                else:
+                    self.coalesced += 1
+
+            if leader:
+                break
+            flight.done.wait()
+            if not flight.failed:
+                return flight.value
+
+        try:
+            value = compute()
+        except BaseException:
+            flight.failed = True
+            raise
+        else:
+            flight.value = value
+            self._store(key, value)
+            return value
+        finally:
+            with self._lock:
+                self._in_flight.pop(key, None)
+            flight.done.set()
+
+    def _store(self, key: Hashable, value: Any) -> None:
+        size = estimate_size(value)
+        if size > self.max_bytes:
+            logger.info(f"Result for {key!r} too large to cache ({size} bytes)")
+            return
+
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._bytes -= previous.size
+            self._entries[key] = CacheEntry(value, size)
+            self._bytes += size
+            while len(self._entries) > self.max_entries or self._bytes > self.max_bytes:
+                _, evicted = self._entries.popitem(last=False)
+                self._bytes -= evicted.size
+                self.evictions += 1
+
+    def clear(self) -> None:
+        """Drop every entry and reset the counters."""
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+            self.hits = self.misses = self.coalesced = self.evictions = 0
+
+    def stats(self) -> Dict[str, Any]:
+        """Cache counters plus size and hit count of each entry, most recently used last."""
+        with self._lock:
+            return {
+                'entries': len(self._entries),
+                'bytes': self._bytes,
+                'max_entries': self.max_entries,
+                'max_bytes': self.max_bytes,
+                'hits': self.hits,
+                'misses': self.misses,
+                'coalesced': self.coalesced,
+                'evictions': self.evictions,
+                'items': [
+                    {'key': repr(key), 'size': entry.size, 'hits': entry.hits}
+                    for key, entry in self._entries.items()
+                ],
+            }
+
+
+_result_cache = ResultCache()
+
+
+def get_result_cache() -> ResultCache:
+    """Get the process-wide analytics result cache."""
+    return _result_cache
+
+
+def cached_result(*datasets: str, session_attr: str = 'db_session') -> Callable:
+    """Cache an analytics method's result by arguments and data version.
+
+    The instance must have a ``use_cache`` flag and a session in
+    ``session_attr``. When the method takes a ``season`` argument only that
+    season's versions (plus season-less datasets) are part of the key. If the
+    versions cannot be read the method runs uncached.
+
+    Args:
+        datasets: Datasets ('teams', 'players', 'games', 'plays') the method reads
+        session_attr: Instance attribute holding the database session
+
+    Returns:
+        Method decorator
+    """
+    def decorator(method: Callable) -> Callable:
+        signature = inspect.signature(method)
+
+        @functools.wraps(method)
+        def wrapper(self, *args, **kwargs):
+            if not getattr(self, 'use_cache', False):
+                return method(self, *args, **kwargs)
+
+            bound = signature.bind(self, *args, **kwargs)
+            bound.apply_defaults()
+            arguments: Tuple = tuple(bound.arguments.items())[1:]
+            try:
+                hash(arguments)
+            except TypeError:
+                return method(self, *args, **kwargs)
+
+            # Imported here: src.data's loader imports the analytics modules
+            from ..data.data_versions import read_data_version
+
+            season: Optional[int] = bound.arguments.get('season')
+            version = read_data_version(getattr(self, session_attr), datasets, season)
+            if version is None:
+                # Without versions nothing can be validated; compute uncached
+                logger.warning(f"Computing {method.__qualname__} uncached")
+                return method(self, *args, **kwargs)
+            key = (method.__qualname__, arguments, version)
+            return _result_cache.get_or_compute(key, lambda: method(self, *args, **kwargs))
+
+        return wrapper
+
+    return decorator
@@ -0,0 +1,472 @@
+"""Season standings with NFL tiebreakers.
+
+Records, division/conference splits and the tiebreaker cascade are computed
+for every team in one pass over a season's regular-season games. The
+computation is a pure function of (teams, games) so a playoff simulator can
+feed it simulated results; ``StandingsCalculator`` loads a season from the
+database once and caches the result per (season, through_week).
+"""
+
+import logging
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+from sqlalchemy import func
+from sqlalchemy.orm import Session
+
+from ..models.game import GameModel
+from ..models.team import TeamModel
+from .result_cache import ResultCache
+
+logger = logging.getLogger(__name__)
+
+PLAYOFF_TEAMS_PER_CONFERENCE = 7
+DIVISION_WINNER_SEEDS = 4
+
+# Wild card common-games tiebreaker only applies with at least this many games
+MIN_COMMON_GAMES = 4
+
+STANDINGS_CACHE_SIZE = 64
+
+# Keyed by (season, through_week) and the data version of the games and teams
+_standings_cache = ResultCache(max_entries=STANDINGS_CACHE_SIZE)
+
+# A tiebreak step maps the tied teams to comparable values (higher is better),
+# or returns None when it does not apply to this group
+TiebreakStep = Callable[[List[str]], Optional[Dict[str, float]]]
+
+
+def win_pct(wins: int, losses: int, ties: int) -> float:
+    """Win percentage with ties counted as half a win."""
+    games = wins + losses + ties
+    return (wins + 0.5 * ties) / games if games else 0.0
+
+
+@dataclass
+class GameResult:
+    """One side of a completed game."""
+    opponent: str
+    points_for: int
+    points_against: int
+
+    @property
+    def outcome(self) -> float:
+        """1 for a win, 0.5 for a tie, 0 for a loss."""
+        if self.points_for > self.points_against:
+            return 1.0
+        if self.points_for < self.points_against:
+            return 0.0
+        return 0.5
+
+
+@dataclass
+class TeamRecord:
+    """A team's record and standings position."""
+    team: str
+    conference: str
+    division: str
+    results: List[GameResult] = field(default_factory=list)
+    home_games: int = 0
+    away_games: int = 0
+    home_wins: int = 0
+    away_wins: int = 0
+    division_wins: int = 0
+    division_losses: int = 0
+    division_ties: int = 0
+    conference_wins: int = 0
+    conference_losses: int = 0
+    conference_ties: int = 0
+    conference_point_differential: int = 0
+    strength_of_victory: float = 0.0
+    strength_of_schedule: float = 0.0
+    division_rank: Optional[int] = None
+    conference_rank: Optional[int] = None
+    playoff_seed: Optional[int] = None
+
+    @property
+    def games_played(self) -> int:
+        return len(self.results)
+
+    @property
+    def wins(self) -> int:
+        return sum(1 for result in self.results if result.outcome == 1.0)
+
+    @property
+    def losses(self) -> int:
+        return sum(1 for result in self.results if result.outcome == 0.0)
+
+    @property
+    def ties(self) -> int:
+        return sum(1 for result in self.results if result.outcome == 0.5)
+
+    @property
+    def points_for(self) -> int:
+        return sum(result.points_for for result in self.results)
+
+    @property
+    def points_against(self) -> int:
+        return sum(result.points_against for result in self.results)
+
+    @property
+    def point_differential(self) -> int:
+        return self.points_for - self.points_against
+
+    @property
+    def win_percentage(self) -> float:
+        return win_pct(self.wins, self.losses, self.ties)
+
+    @property
+    def division_win_percentage(self) -> float:
+        return win_pct(self.division_wins, self.division_losses, self.division_ties)
+
+    @property
+    def conference_win_percentage(self) -> float:
+        return win_pct(self.conference_wins, self.conference_losses, self.conference_ties)
+
+    def results_against(self, opponents: Iterable[str]) -> List[GameResult]:
+        """Results of games against any of ``opponents``."""
+        opponents = set(opponents)
+        return [result for result in self.results if result.opponent in opponents]
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Standings row for this record."""
+        return standings_row(self)
+
+
+def standings_row(record) -> Dict[str, Any]:
+    """Standings row in the shape of ``TeamService.get_team_stats``.
+
+    Args:
+        record: A TeamRecord, or a stored row with the same record attributes
+    """
+    games = record.games_played
+    return {
+        "games_played": games,
+        "wins": record.wins,
+        "losses": record.losses,
+        "ties": record.ties,
+        "points_for": record.points_for,
+        "points_against": record.points_against,
+        "home_games": record.home_games,
+        "away_games": record.away_games,
+        "home_wins": record.home_wins,
+        "away_wins": record.away_wins,
+        "win_percentage": win_pct(record.wins, record.losses, record.ties),
+        "points_per_game": record.points_for / games if games else 0.0,
+        "points_allowed_per_game": record.points_against / games if games else 0.0,
+        "point_differential": record.points_for - record.points_against,
+        "division_record": f"{record.division_wins}-{record.division_losses}-{record.division_ties}",
+        "conference_record": f"{record.conference_wins}-{record.conference_losses}-{record.conference_ties}",
+        "strength_of_victory": round(record.strength_of_victory, 3),
+        "strength_of_schedule": round(record.strength_of_schedule, 3),
+        "division_rank": record.division_rank,
+        "conference_rank": record.conference_rank,
+        "playoff_seed": record.playoff_seed,
+    }
+
+
+def _pct_of(results: Sequence[GameResult]) -> float:
+    return sum(result.outcome for result in results) / len(results) if results else 0.0
+
+
+def _rank(values: Dict[str, float], ascending: bool) -> Dict[str, int]:
+    """Competition ranking ('1224') of teams by value."""
+    ordered = sorted(values.values(), reverse=not ascending)
+    return {team: ordered.index(value) + 1 for team, value in values.items()}
+
+
+class SeasonStandings:
+    """Standings for every team in a season through a given week."""
+
+    def __init__(self, season: Optional[int], through_week: Optional[int], records: Dict[str, TeamRecord]):
+        self.season = season
+        self.through_week = through_week
+        self.records = records
+
+        self._compute_strength()
+        self._compute_point_ranks()
+
+        self._division_order: Dict[Tuple[str, str], List[str]] = {}
+        for key in sorted({(record.conference, record.division) for record in records.values()}):
+            teams = [team for team, record in records.items() if (record.conference, record.division) == key]
+            order = self._order(teams, self._break_division_tie)
+            self._division_order[key] = order
+            for rank, team in enumerate(order, start=1):
+                records[team].division_rank = rank
+
+        self._conference_order: Dict[str, List[str]] = {}
+        for conference in sorted({record.conference for record in records.values()}):
+            self._conference_order[conference] = self._seed_conference(conference)
+
+    # Lookups
+
+    def division(self, conference: str, division: str) -> List[TeamRecord]:
+        """Division teams in tiebreaker order."""
+        return [self.records[team] for team in self._division_order.get((conference, division), [])]
+
+    def conference(self, conference: str) -> List[TeamRecord]:
+        """Conference teams in seeding order: division winners, wild cards, then the rest."""
+        return [self.records[team] for team in self._conference_order.get(conference, [])]
+
+    def playoff_seeds(self, conference: str) -> List[TeamRecord]:
+        """The conference's playoff teams, seed 1 first."""
+        return self.conference(conference)[:PLAYOFF_TEAMS_PER_CONFERENCE]
+
+    # Derived ranking inputs
+
+    def _compute_strength(self) -> None:
+        """Strength of victory and schedule: combined win% of beaten and faced opponents."""
+        pct = {team: (record.wins + 0.5 * record.ties, record.games_played)
+               for team, record in self.records.items()}
+
+        def combined(opponents: List[str]) -> float:
+            wins = sum(pct[team][0] for team in opponents if team in pct)
+            games = sum(pct[team][1] for team in opponents if team in pct)
+            return wins / games if games else 0.0
+
+        for record in self.records.values():
+            record.strength_of_victory = combined([r.opponent for r in record.results if r.outcome == 1.0])
+            record.strength_of_schedule = combined([r.opponent for r in record.results])
+
+    def _compute_point_ranks(self) -> None:
+        """Combined points-scored and points-allowed rankings, in conference and league."""
+        def combined(teams: List[str]) -> Dict[str, int]:
+            scored = _rank({team: self.records[team].points_for for team in teams}, ascending=False)
+            allowed = _rank({team: self.records[team].points_against for team in teams}, ascending=True)
+            return {team: scored[team] + allowed[team] for team in teams}
+
+        self._league_points_rank = combined(list(self.records))
+        self._conference_points_rank: Dict[str, int] = {}
+        for conference in {record.conference for record in self.records.values()}:
+            self._conference_points_rank.update(
+                combined([team for team, record in self.records.items() if record.conference == conference])
+            )
+
+    # Ordering
+
+    def _order(self, teams: List[str], break_tie: Callable[[List[str]], str]) -> List[str]:
+        """Order teams by win% and pick the top of each tied group by tiebreakers."""
+        remaining = list(teams)
+        ordered = []
+        while remaining:
+            best = max(self.records[team].win_percentage for team in remaining)
+            tied = [team for team in remaining if self.records[team].win_percentage == best]
+            top = break_tie(tied) if len(tied) > 1 else tied[0]
+            ordered.append(top)
+            remaining.remove(top)
+        return ordered
+
+    def _seed_conference(self, conference: str) -> List[str]:
+        """Seed division winners first, then wild cards, and rank the rest."""
+        teams = [team for team, record in self.records.items() if record.conference == conference]
+        winners = [team for team in teams if self.records[team].division_rank == 1]
+        others = [team for team in teams if self.records[team].division_rank != 1]
+
+        order = self._order(winners, self._break_conference_tie) + self._order(others, self._break_conference_tie)
+        for rank, team in enumerate(order, start=1):
+            record = self.records[team]
+            record.conference_rank = rank
+            record.playoff_seed = rank if rank <= PLAYOFF_TEAMS_PER_CONFERENCE else None
+        return order
+
+    def _break_division_tie(self, tied: List[str]) -> str:
+        return self._cascade(tied, [
+            self._head_to_head,
+            lambda teams: {team: self.records[team].division_win_percentage for team in teams},
+            lambda teams: self._common_games(teams, minimum=1),
+            lambda teams: {team: self.records[team].conference_win_percentage for team in teams},
+            lambda teams: {team: self.records[team].strength_of_victory for team in teams},
+            lambda teams: {team: self.records[team].strength_of_schedule for team in teams},
+            lambda teams: {team: -self._conference_points_rank[team] for team in teams},
+            lambda teams: {team: -self._league_points_rank[team] for team in teams},
+            self._net_points_common_games,
+            lambda teams: {team: self.records[team].point_differential for team in teams},
+        ])
+
+    def _break_conference_tie(self, tied: List[str]) -> str:
+        # Only the highest ranked club of each division stays in a wild card tie
+        best_in_division: Dict[str, str] = {}
+        for team in sorted(tied, key=lambda team: self.records[team].division_rank):
+            best_in_division.setdefault(self.records[team].division, team)
+        tied = list(best_in_division.values())
+        if len(tied) == 1:
+            return tied[0]
+
+        return self._cascade(tied, [
+            self._head_to_head_sweep,
+            lambda teams: {team: self.records[team].conference_win_percentage for team in teams},
+            lambda teams: self._common_games(teams, minimum=MIN_COMMON_GAMES),
+            lambda teams: {team: self.records[team].strength_of_victory for team in teams},
+            lambda teams: {team: self.records[team].strength_of_schedule for team in teams},
+            lambda teams: {team: -self._conference_points_rank[team] for team in teams},
+            lambda teams: {team: -self._league_points_rank[team] for team in teams},
+            lambda teams: {team: self.records[team].conference_point_differential for team in teams},
+            lambda teams: {team: self.records[team].point_differential for team in teams},
+        ])
+
+    @staticmethod
+    def _cascade(tied: List[str], steps: List[TiebreakStep]) -> str:
+        """Apply tiebreak steps until one team remains.
+
+        Whenever a step separates some teams from the group, the cascade
+        restarts from the first step with the remaining teams. Net
+        touchdowns are not tracked, and the coin toss is replaced by
+        alphabetical order so results are deterministic.
+        """
+        while len(tied) > 1:
+            for step in steps:
+                values = step(tied)
+                if values is None:
+                    continue
+                values = {team: round(value, 9) for team, value in values.items()}
+                best = max(values.values())
+                survivors = [team for team in tied if values[team] == best]
+                if len(survivors) < len(tied):
+                    tied = survivors
+                    break
+            else:
+                return min(tied)
+        return tied[0]
+
+    # Tiebreak steps
+
+    def _head_to_head(self, teams: List[str]) -> Optional[Dict[str, float]]:
+        """Win% in games among the tied teams."""
+        games = {team: self.records[team].results_against(t for t in teams if t != team) for team in teams}
+        if not any(games.values()):
+            return None
+        return {team: _pct_of(games[team]) for team in teams}
+
+    def _head_to_head_sweep(self, teams: List[str]) -> Optional[Dict[str, float]]:
+        """Head-to-head for wild cards: two teams that met, or a sweep among three or more."""
+        if len(teams) == 2:
+            return self._head_to_head(teams)
+
+        for team in teams:
+            others = [other for other in teams if other != team]
+            outcomes = {other: [r.outcome for r in self.records[team].results_against([other])] for other in others}
+            if all(outcomes[other] and all(o == 1.0 for o in outcomes[other]) for other in others):
+                return {other: 1.0 if other == team else 0.0 for other in teams}
+            if all(outcomes[other] and all(o == 0.0 for o in outcomes[other]) for other in others):
+                return {other: 0.0 if other == team else 1.0 for other in teams}
+        return None
+
+    def _common_opponents(self, teams: List[str]) -> set:
+        opponents = [{r.opponent for r in self.records[team].results} for team in teams]
+        return set.intersection(*opponents) - set(teams)
+
+    def _common_games(self, teams: List[str], minimum: int) -> Optional[Dict[str, float]]:
+        """Win% against common opponents."""
+        common = self._common_opponents(teams)
+        games = {team: self.records[team].results_against(common) for team in teams}
+        if any(len(results) < minimum for results in games.values()):
+            return None
+        return {team: _pct_of(games[team]) for team in teams}
+
+    def _net_points_common_games(self, teams: List[str]) -> Optional[Dict[str, float]]:
+        common = self._common_opponents(teams)
+        if not common:
+            return None
+        return {
+            team: sum(r.points_for - r.points_against for r in self.records[team].results_against(common))
+            for team in teams
+        }
+
+
+def compute_standings(teams: Iterable[Tuple[str, str, str]],
+                      games: Iterable[Tuple[str, str, int, int]],
+                      season: Optional[int] = None,
+                      through_week: Optional[int] = None) -> SeasonStandings:
+    """Compute standings from completed games.
+
+    Args:
+        teams: (team_abbr, conference, division) for every team
+        games: (home_team, away_team, home_score, away_score) for completed regular-season games
+        season: Season year, for reference
+        through_week: Last week included, for reference
+
+    Returns:
+        SeasonStandings with records, ranks and playoff seeds
+    """
+    records = {abbr: TeamRecord(team=abbr, conference=conf, division=div) for abbr, conf, div in teams}
+
+    for home, away, home_score, away_score in games:
+        if home not in records or away not in records:
+            continue
+        home_record, away_record = records[home], records[away]
+        same_conference = home_record.conference == away_record.conference
+        same_division = same_conference and home_record.division == away_record.division
+
+        for record, opponent, points_for, points_against, is_home in (
+            (home_record, away, home_score, away_score, True),
+            (away_record, home, away_score, home_score, False),
+        ):
+            result = GameResult(opponent, points_for, points_against)
+            record.results.append(result)
+            won, tied = result.outcome == 1.0, result.outcome == 0.5
+
+            if is_home:
+                record.home_games += 1
+                record.home_wins += won
+            else:
+                record.away_games += 1
+                record.away_wins += won
+
+            if same_conference:
+                record.conference_wins += won
+                record.conference_ties += tied
+                record.conference_losses += not (won or tied)
+                record.conference_point_differential += points_for - points_against
+            if same_division:
+                record.division_wins += won
+                record.division_ties += tied
+                record.division_losses += not (won or tied)
+
+    return SeasonStandings(season, through_week, records)
+
+
+class StandingsCalculator:
+    """Load a season's games once and compute cached standings."""
+
+    def __init__(self, db: Session):
+        self.db = db
+
+    def get_standings(self, season: Optional[int] = None, through_week: Optional[int] = None) -> SeasonStandings:
+        """Get standings for a season through a week.
+
+        Args:
+            season: Season year (latest season with games if None)
+            through_week: Last regular-season week to include (all if None)
+
+        Returns:
+            SeasonStandings, shared across callers until the season's games or
+            the teams change (see ``src.data.data_versions``)
+        """
+        if season is None:
+            season = self.db.query(func.max(GameModel.season)).scalar()
+
+        # Imported here: src.data's loader imports the analytics modules
+        from ..data.data_versions import read_data_version
+
+        version = read_data_version(self.db, ('games', 'teams'), season)
+        if version is None:
+            return self._compute_standings(season, through_week)
+        return _standings_cache.get_or_compute((season, through_week, version),
+                                               lambda: self._compute_standings(season, through_week))
+
+    def _compute_standings(self, season: int, through_week: Optional[int]) -> SeasonStandings:
+        teams = self.db.query(TeamModel.team_abbr, TeamModel.team_conf, TeamModel.team_division).all()
+
+        query = self.db.query(
+            GameModel.home_team, GameModel.away_team, GameModel.home_score, GameModel.away_score
+        ).filter(
+            GameModel.season == season,
+            GameModel.season_type == 'REG',
+            GameModel.home_score.isnot(None),
+            GameModel.away_score.isnot(None)
+        )
+        if through_week is not None:
+            query = query.filter(GameModel.week <= through_week)
+
+        standings = compute_standings(teams, query.all(), season, through_week)
+        logger.info(f"Computed standings for season {season} through week {through_week or 'final'}")
+        return standings
@@ -7,6 +7,7 @@ from sqlalchemy import text, func, case
 from src.models.team import TeamModel
 from src.models.play import PlayModel
 from src.models.game import GameModel
+from src.analysis.result_cache import cached_result
 import logging
 
 logger = logging.getLogger(__name__)
@@ -100,12 +101,83 @@ class TeamAnalytics:
     point_differential: float
 
 
+# Play filters folded into the grouped side queries as CASE conditions
+_EFFICIENCY_PLAY = "play_type IN ('pass', 'run') AND yards_gained IS NOT NULL"
+_RED_ZONE_PLAY = "yardline_100 <= 20 AND play_type IN ('pass', 'run', 'field_goal')"
+_THIRD_DOWN_PLAY = "down = 3 AND play_type IN ('pass', 'run')"
+_CONVERTED = "(first_down = true OR touchdown = true)"
+
+_SIDE_QUERY = f"""
+    SELECT
+        {{team_column}} as team,
+        -- Efficiency
+        SUM(CASE WHEN {_EFFICIENCY_PLAY} THEN 1 ELSE 0 END) as total_plays,
+        SUM(CASE WHEN {_EFFICIENCY_PLAY} THEN yards_gained END) as total_yards,
+        AVG(CASE WHEN {_EFFICIENCY_PLAY} THEN yards_gained END) as yards_per_play,
+        SUM(CASE WHEN {_EFFICIENCY_PLAY} AND first_down = true THEN 1 ELSE 0 END) as first_downs,
+        SUM(CASE WHEN {_EFFICIENCY_PLAY} AND yards_gained >= 20 AND play_type = 'pass' THEN 1
+                 WHEN {_EFFICIENCY_PLAY} AND yards_gained >= 15 AND play_type = 'run' THEN 1
+                 ELSE 0 END) as explosive_plays,
+        AVG(CASE WHEN {_EFFICIENCY_PLAY} THEN epa END) as avg_epa,
+        SUM(CASE WHEN {_EFFICIENCY_PLAY} AND epa > 0 THEN 1 ELSE 0 END) as successful_plays,
+        SUM(CASE WHEN {_EFFICIENCY_PLAY} AND yards_gained < 0 THEN 1 ELSE 0 END) as sacks,
+        -- Red zone
+        SUM(CASE WHEN {_RED_ZONE_PLAY} AND down = 1 THEN 1 ELSE 0 END) as rz_attempts,
+        SUM(CASE WHEN {_RED_ZONE_PLAY} AND touchdown = true THEN 1 ELSE 0 END) as rz_touchdowns,
+        SUM(CASE WHEN {_RED_ZONE_PLAY} AND play_type = 'field_goal' AND yards_gained > 0 THEN 1 ELSE 0 END) as rz_field_goals,
+        -- Third down
+        SUM(CASE WHEN {_THIRD_DOWN_PLAY} THEN 1 ELSE 0 END) as td_attempts,
+        SUM(CASE WHEN {_THIRD_DOWN_PLAY} AND {_CONVERTED} THEN 1 ELSE 0 END) as td_conversions,
+        AVG(CASE WHEN {_THIRD_DOWN_PLAY} THEN ydstogo END) as td_avg_yards_to_go,
+        SUM(CASE WHEN {_THIRD_DOWN_PLAY} AND ydstogo <= 3 AND {_CONVERTED} THEN 1 ELSE 0 END) as td_short_conversions,
+        SUM(CASE WHEN {_THIRD_DOWN_PLAY} AND ydstogo <= 3 THEN 1 ELSE 0 END) as td_short_attempts,
+        SUM(CASE WHEN {_THIRD_DOWN_PLAY} AND ydstogo BETWEEN 4 AND 7 AND {_CONVERTED} THEN 1 ELSE 0 END) as td_medium_conversions,
+        SUM(CASE WHEN {_THIRD_DOWN_PLAY} AND ydstogo BETWEEN 4 AND 7 THEN 1 ELSE 0 END) as td_medium_attempts,
+        SUM(CASE WHEN {_THIRD_DOWN_PLAY} AND ydstogo >= 8 AND {_CONVERTED} THEN 1 ELSE 0 END) as td_long_conversions,
+        SUM(CASE WHEN {_THIRD_DOWN_PLAY} AND ydstogo >= 8 THEN 1 ELSE 0 END) as td_long_attempts,
+        -- Turnovers (giveaways on offense, takeaways on defense)
+        SUM(CASE WHEN interception = true THEN 1 ELSE 0 END) as interceptions,
+        SUM(CASE WHEN fumble = true THEN 1 ELSE 0 END) as fumbles
+    FROM plays
+    WHERE season = :season
+        AND {{team_column}} IS NOT NULL
+        {{team_filter}}
+    GROUP BY {{team_column}}
+"""
+
+_SCORING_QUERY = """
+    SELECT
+        team,
+        COUNT(*) as games_played,
+        AVG(points_for) as ppg,
+        AVG(points_against) as papg
+    FROM (
+        SELECT home_team as team, home_score as points_for, away_score as points_against
+        FROM games
+        WHERE season = :season AND home_score IS NOT NULL
+        UNION ALL
+        SELECT away_team as team, away_score as points_for, home_score as points_against
+        FROM games
+        WHERE season = :season AND home_score IS NOT NULL
+    ) as team_games
+    {team_filter}
+    GROUP BY team
+"""
+
+
 class TeamAnalyticsCalculator:
-    """Calculator for advanced team analytics."""
+    """Calculator for advanced team analytics.
     
-    def __init__(self, db: Session):
+    All teams are computed together: one grouped query per side of the ball
+    (``GROUP BY posteam`` / ``GROUP BY defteam``) with conditional aggregates,
+    plus one grouped query over games for scoring.
+    """
+    
+    def __init__(self, db: Session, use_cache: bool = False):
         self.db = db
+        self.use_cache = use_cache
     
+    @cached_result('teams', 'games', 'plays', session_attr='db')
     def calculate_team_analytics(self, season: int, team_abbr: Optional[str] = None) -> List[TeamAnalytics]:
         """Calculate comprehensive team analytics for all teams or specific team."""
         logger.info(f"Calculating team analytics for season {season}")
@@ -116,11 +188,21 @@ class TeamAnalyticsCalculator:
             team_query = team_query.filter(TeamModel.team_abbr == team_abbr)
         teams = team_query.all()
         
+        if not teams:
+            return []
+        
+        offense = self._side_rows(season, 'posteam', team_abbr)
+        defense = self._side_rows(season, 'defteam', team_abbr)
+        scoring = self._scoring_rows(season, team_abbr)
+        
         team_analytics = []
         
         for team in teams:
             try:
-                analytics = self._calculate_single_team_analytics(season, team.team_abbr, team.team_name)
+                analytics = self._build_team_analytics(
+                    season, team.team_abbr, team.team_name,
+                    offense.get(team.team_abbr), defense.get(team.team_abbr), scoring.get(team.team_abbr)
+                )
                 if analytics:
                     team_analytics.append(analytics)
             except Exception as e:
@@ -129,148 +211,96 @@ class TeamAnalyticsCalculator:
         
         return team_analytics
     
-    def _calculate_single_team_analytics(self, season: int, team_abbr: str, team_name: str) -> Optional[TeamAnalytics]:
-        """Calculate analytics for a single team."""
-        
-        # Get games played
-        games_played = self.db.query(func.count(GameModel.game_id)).filter(
-            ((GameModel.home_team == team_abbr) | (GameModel.away_team == team_abbr)),
-            GameModel.season == season,
-            GameModel.home_score.isnot(None)
-        ).scalar() or 0
+    def _side_rows(self, season: int, team_column: str, team_abbr: Optional[str]) -> Dict[str, Any]:
+        """Run the grouped play aggregate for one side of the ball, keyed by team."""
+        query = text(_SIDE_QUERY.format(
+            team_column=team_column,
+            team_filter=f"AND {team_column} = :team" if team_abbr else ""
+        ))
+        rows = self.db.execute(query, {'season': season, 'team': team_abbr}).all()
+        return {row.team: row for row in rows}
+    
+    def _scoring_rows(self, season: int, team_abbr: Optional[str]) -> Dict[str, Any]:
+        """Run the grouped games aggregate, keyed by team."""
+        query = text(_SCORING_QUERY.format(team_filter="WHERE team = :team" if team_abbr else ""))
+        rows = self.db.execute(query, {'season': season, 'team': team_abbr}).all()
+        return {row.team: row for row in rows}
+    
+    def _build_team_analytics(self, season: int, team_abbr: str, team_name: str,
+                              offense, defense, scoring) -> Optional[TeamAnalytics]:
+        """Assemble a team's analytics from its grouped rows."""
         
+        # Teams without completed games are skipped
+        games_played = scoring.games_played if scoring else 0
         if games_played == 0:
             return None
         
-        # Calculate all metrics
-        offensive_efficiency = self._calculate_offensive_efficiency(season, team_abbr)
-        defensive_efficiency = self._calculate_defensive_efficiency(season, team_abbr)
-        red_zone_offense = self._calculate_red_zone_stats(season, team_abbr, 'offense')
-        red_zone_defense = self._calculate_red_zone_stats(season, team_abbr, 'defense')
-        third_down_offense = self._calculate_third_down_stats(season, team_abbr, 'offense')
-        third_down_defense = self._calculate_third_down_stats(season, team_abbr, 'defense')
-        turnover_stats = self._calculate_turnover_stats(season, team_abbr)
-        
-        # Calculate scoring metrics
-        scoring_stats = self._calculate_scoring_stats(season, team_abbr, games_played)
+        ppg = scoring.ppg or 0
+        papg = scoring.papg or 0
         
         return TeamAnalytics(
             team=team_abbr,
             team_name=team_name,
             season=season,
             games_played=games_played,
-            offensive_efficiency=offensive_efficiency,
-            defensive_efficiency=defensive_efficiency,
-            red_zone_offense=red_zone_offense,
-            red_zone_defense=red_zone_defense,
-            third_down_offense=third_down_offense,
-            third_down_defense=third_down_defense,
-            turnover_stats=turnover_stats,
-            points_per_game=scoring_stats['ppg'],
-            points_allowed_per_game=scoring_stats['papg'],
-            point_differential=scoring_stats['diff']
+            offensive_efficiency=self._offensive_efficiency(offense),
+            defensive_efficiency=self._defensive_efficiency(defense),
+            red_zone_offense=self._red_zone_stats(offense),
+            red_zone_defense=self._red_zone_stats(defense),
+            third_down_offense=self._third_down_stats(offense),
+            third_down_defense=self._third_down_stats(defense),
+            turnover_stats=self._turnover_stats(offense, defense),
+            points_per_game=round(ppg, 1),
+            points_allowed_per_game=round(papg, 1),
+            point_differential=round(ppg - papg, 1)
         )
     
-    def _calculate_offensive_efficiency(self, season: int, team_abbr: str) -> OffensiveEfficiency:
-        """Calculate offensive efficiency metrics."""
-        query = text("""
-            SELECT 
-                COUNT(*) as total_plays,
-                SUM(yards_gained) as total_yards,
-                AVG(yards_gained) as yards_per_play,
-                SUM(CASE WHEN first_down = true THEN 1 ELSE 0 END) as first_downs,
-                SUM(CASE WHEN yards_gained >= 20 AND play_type = 'pass' THEN 1 
-                         WHEN yards_gained >= 15 AND play_type = 'run' THEN 1 
-                         ELSE 0 END) as explosive_plays,
-                AVG(epa) as avg_epa,
-                SUM(CASE WHEN epa > 0 THEN 1 ELSE 0 END) as successful_plays
-            FROM plays 
-            WHERE season = :season 
-                AND posteam = :team
-                AND play_type IN ('pass', 'run')
-                AND yards_gained IS NOT NULL
-        """)
-        
-        result = self.db.execute(query, {'season': season, 'team': team_abbr}).first()
-        
-        if not result or result.total_plays == 0:
+    @staticmethod
+    def _offensive_efficiency(row) -> OffensiveEfficiency:
+        """Build offensive efficiency metrics from a posteam row."""
+        if not row or not row.total_plays:
             return OffensiveEfficiency(0, 0, 0.0, 0, 0.0, 0, 0.0, 0.0, 0.0)
         
         return OffensiveEfficiency(
-            total_plays=result.total_plays,
-            total_yards=result.total_yards or 0,
-            yards_per_play=round(result.yards_per_play or 0, 2),
-            first_downs=result.first_downs or 0,
-            first_down_rate=round((result.first_downs or 0) / result.total_plays * 100, 1),
-            explosive_plays=result.explosive_plays or 0,
-            explosive_play_rate=round((result.explosive_plays or 0) / result.total_plays * 100, 1),
-            avg_epa=round(result.avg_epa or 0, 3),
-            success_rate=round((result.successful_plays or 0) / result.total_plays * 100, 1)
+            total_plays=row.total_plays,
+            total_yards=row.total_yards or 0,
+            yards_per_play=round(row.yards_per_play or 0, 2),
+            first_downs=row.first_downs or 0,
+            first_down_rate=round((row.first_downs or 0) / row.total_plays * 100, 1),
+            explosive_plays=row.explosive_plays or 0,
+            explosive_play_rate=round((row.explosive_plays or 0) / row.total_plays * 100, 1),
+            avg_epa=round(row.avg_epa or 0, 3),
+            success_rate=round((row.successful_plays or 0) / row.total_plays * 100, 1)
         )
     
-    def _calculate_defensive_efficiency(self, season: int, team_abbr: str) -> DefensiveEfficiency:
-        """Calculate defensive efficiency metrics."""
-        query = text("""
-            SELECT 
-                COUNT(*) as total_plays,
-                SUM(yards_gained) as total_yards,
-                AVG(yards_gained) as yards_per_play,
-                SUM(CASE WHEN first_down = true THEN 1 ELSE 0 END) as first_downs,
-                SUM(CASE WHEN yards_gained >= 20 AND play_type = 'pass' THEN 1 
-                         WHEN yards_gained >= 15 AND play_type = 'run' THEN 1 
-                         ELSE 0 END) as explosive_plays,
-                AVG(epa) as avg_epa,
-                SUM(CASE WHEN epa > 0 THEN 1 ELSE 0 END) as successful_plays,
-                SUM(CASE WHEN yards_gained < 0 THEN 1 ELSE 0 END) as sacks
-            FROM plays 
-            WHERE season = :season 
-                AND defteam = :team
-                AND play_type IN ('pass', 'run')
-                AND yards_gained IS NOT NULL
-        """)
-        
-        result = self.db.execute(query, {'season': season, 'team': team_abbr}).first()
-        
-        if not result or result.total_plays == 0:
+    @staticmethod
+    def _defensive_efficiency(row) -> DefensiveEfficiency:
+        """Build defensive efficiency metrics from a defteam row."""
+        if not row or not row.total_plays:
             return DefensiveEfficiency(0, 0, 0.0, 0, 0, 0.0, 0.0, 0, 0.0)
         
         return DefensiveEfficiency(
-            total_plays=result.total_plays,
-            total_yards_allowed=result.total_yards or 0,
-            yards_per_play_allowed=round(result.yards_per_play or 0, 2),
-            first_downs_allowed=result.first_downs or 0,
-            explosive_plays_allowed=result.explosive_plays or 0,
-            avg_epa_allowed=round(result.avg_epa or 0, 3),
-            success_rate_allowed=round((result.successful_plays or 0) / result.total_plays * 100, 1),
-            sacks=result.sacks or 0,
-            sack_rate=round((result.sacks or 0) / result.total_plays * 100, 1)
+            total_plays=row.total_plays,
+            total_yards_allowed=row.total_yards or 0,
+            yards_per_play_allowed=round(row.yards_per_play or 0, 2),
+            first_downs_allowed=row.first_downs or 0,
+            explosive_plays_allowed=row.explosive_plays or 0,
+            avg_epa_allowed=round(row.avg_epa or 0, 3),
+            success_rate_allowed=round((row.successful_plays or 0) / row.total_plays * 100, 1),
+            sacks=row.sacks or 0,
+            sack_rate=round((row.sacks or 0) / row.total_plays * 100, 1)
         )
     
-    def _calculate_red_zone_stats(self, season: int, team_abbr: str, side: str) -> RedZoneStats:
-        """Calculate red zone statistics."""
-        team_filter = 'posteam' if side == 'offense' else 'defteam'
-        
-        query = text(f"""
-            SELECT 
-                COUNT(CASE WHEN yardline_100 <= 20 AND down = 1 THEN 1 END) as attempts,
-                SUM(CASE WHEN touchdown = true THEN 1 ELSE 0 END) as touchdowns,
-                SUM(CASE WHEN play_type = 'field_goal' AND yards_gained > 0 THEN 1 ELSE 0 END) as field_goals
-            FROM plays 
-            WHERE season = :season 
-                AND {team_filter} = :team
-                AND yardline_100 <= 20
-                AND play_type IN ('pass', 'run', 'field_goal')
-        """)
-        
-        result = self.db.execute(query, {'season': season, 'team': team_abbr}).first()
-        
-        attempts = result.attempts or 0
-        touchdowns = result.touchdowns or 0
-        field_goals = result.field_goals or 0
-        
+    @staticmethod
+    def _red_zone_stats(row) -> RedZoneStats:
+        """Build red zone statistics from a side row."""
+        attempts = (row.rz_attempts or 0) if row else 0
         if attempts == 0:
             return RedZoneStats(0, 0, 0, 0.0, 0.0, 0.0)
         
+        touchdowns = row.rz_touchdowns or 0
+        field_goals = row.rz_field_goals or 0
+        
         return RedZoneStats(
             attempts=attempts,
             touchdowns=touchdowns,
@@ -280,73 +310,37 @@ class TeamAnalyticsCalculator:
             success_percentage=round((touchdowns + field_goals) / attempts * 100, 1)
         )
     
-    def _calculate_third_down_stats(self, season: int, team_abbr: str, side: str) -> ThirdDownStats:
-        """Calculate third down conversion statistics."""
-        team_filter = 'posteam' if side == 'offense' else 'defteam'
-        
-        query = text(f"""
-            SELECT 
-                COUNT(*) as attempts,
-                SUM(CASE WHEN first_down = true OR touchdown = true THEN 1 ELSE 0 END) as conversions,
-                AVG(ydstogo) as avg_yards_to_go,
-                SUM(CASE WHEN ydstogo <= 3 AND (first_down = true OR touchdown = true) THEN 1 ELSE 0 END) as short_conversions,
-                SUM(CASE WHEN ydstogo <= 3 THEN 1 ELSE 0 END) as short_attempts,
-                SUM(CASE WHEN ydstogo BETWEEN 4 AND 7 AND (first_down = true OR touchdown = true) THEN 1 ELSE 0 END) as medium_conversions,
-                SUM(CASE WHEN ydstogo BETWEEN 4 AND 7 THEN 1 ELSE 0 END) as medium_attempts,
-                SUM(CASE WHEN ydstogo >= 8 AND (first_down = true OR touchdown = true) THEN 1 ELSE 0 END) as long_conversions,
-                SUM(CASE WHEN ydstogo >= 8 THEN 1 ELSE 0 END) as long_attempts
-            FROM plays 
-            WHERE season = :season 
-                AND {team_filter} = :team
-                AND down = 3
-                AND play_type IN ('pass', 'run')
-        """)
-        
-        result = self.db.execute(query, {'season': season, 'team': team_abbr}).first()
-        
-        attempts = result.attempts or 0
-        conversions = result.conversions or 0
-        
+    @staticmethod
+    def _third_down_stats(row) -> ThirdDownStats:
+        """Build third down conversion statistics from a side row."""
+        attempts = (row.td_attempts or 0) if row else 0
         if attempts == 0:
             return ThirdDownStats(0, 0, 0.0, 0.0, {})
         
+        conversions = row.td_conversions or 0
+        
         # Calculate success by distance
         success_by_distance = {
-            'short': round((result.short_conversions or 0) / max(1, result.short_attempts or 1) * 100, 1),
-            'medium': round((result.medium_conversions or 0) / max(1, result.medium_attempts or 1) * 100, 1),
-            'long': round((result.long_conversions or 0) / max(1, result.long_attempts or 1) * 100, 1)
+            'short': round((row.td_short_conversions or 0) / max(1, row.td_short_attempts or 1) * 100, 1),
+            'medium': round((row.td_medium_conversions or 0) / max(1, row.td_medium_attempts or 1) * 100, 1),
+            'long': round((row.td_long_conversions or 0) / max(1, row.td_long_attempts or 1) * 100, 1)
         }
         
         return ThirdDownStats(
             attempts=attempts,
             conversions=conversions,
             conversion_rate=round(conversions / attempts * 100, 1),
-            avg_yards_to_go=round(result.avg_yards_to_go or 0, 1),
+            avg_yards_to_go=round(row.td_avg_yards_to_go or 0, 1),
             success_by_distance=success_by_distance
         )
     
-    def _calculate_turnover_stats(self, season: int, team_abbr: str) -> TurnoverStats:
-        """Calculate turnover differential statistics."""
-        query = text("""
-            SELECT 
-                -- Giveaways (when team is on offense)
-                SUM(CASE WHEN posteam = :team AND interception = true THEN 1 ELSE 0 END) as ints_thrown,
-                SUM(CASE WHEN posteam = :team AND fumble = true THEN 1 ELSE 0 END) as fumbles_lost,
-                -- Takeaways (when team is on defense)  
-                SUM(CASE WHEN defteam = :team AND interception = true THEN 1 ELSE 0 END) as ints_caught,
-                SUM(CASE WHEN defteam = :team AND fumble = true THEN 1 ELSE 0 END) as fumbles_recovered
-            FROM plays 
-            WHERE season = :season 
-                AND (posteam = :team OR defteam = :team)
-                AND (interception = true OR fumble = true)
-        """)
-        
-        result = self.db.execute(query, {'season': season, 'team': team_abbr}).first()
-        
-        ints_thrown = result.ints_thrown or 0
-        fumbles_lost = result.fumbles_lost or 0
-        ints_caught = result.ints_caught or 0
-        fumbles_recovered = result.fumbles_recovered or 0
+    @staticmethod
+    def _turnover_stats(offense, defense) -> TurnoverStats:
+        """Build turnover differential statistics from both side rows."""
+        ints_thrown = (offense.interceptions or 0) if offense else 0
+        fumbles_lost = (offense.fumbles or 0) if offense else 0
+        ints_caught = (defense.interceptions or 0) if defense else 0
+        fumbles_recovered = (defense.fumbles or 0) if defense else 0
         
         giveaways = ints_thrown + fumbles_lost
         takeaways = ints_caught + fumbles_recovered
@@ -361,34 +355,15 @@ class TeamAnalyticsCalculator:
             interceptions_caught=ints_caught
         )
     
-    def _calculate_scoring_stats(self, season: int, team_abbr: str, games_played: int) -> Dict[str, float]:
-        """Calculate points per game statistics."""
-        query = text("""
-            SELECT 
-                AVG(CASE WHEN home_team = :team THEN home_score 
-                         WHEN away_team = :team THEN away_score END) as ppg,
-                AVG(CASE WHEN home_team = :team THEN away_score 
-                         WHEN away_team = :team THEN home_score END) as papg
-            FROM games 
-            WHERE season = :season 
-                AND (home_team = :team OR away_team = :team)
-                AND home_score IS NOT NULL
-        """)
-        
-        result = self.db.execute(query, {'season': season, 'team': team_abbr}).first()
-        
-        ppg = result.ppg or 0
-        papg = result.papg or 0
-        
-        return {
-            'ppg': round(ppg, 1),
-            'papg': round(papg, 1),
-            'diff': round(ppg - papg, 1)
-        }
-    
-    def get_team_rankings(self, season: int) -> Dict[str, List[Dict[str, Any]]]:
-        """Get team rankings across key metrics."""
-        teams = self.calculate_team_analytics(season)
+    def get_team_rankings(self, season: int,
+                          team_analytics: Optional[List[TeamAnalytics]] = None) -> Dict[str, List[Dict[str, Any]]]:
+        """Get team rankings across key metrics.
+        
+        Args:
+            season: Season year
+            team_analytics: Already computed league analytics to rank (computed if None)
+        """
+        teams = team_analytics if team_analytics is not None else self.calculate_team_analytics(season)
         
         # Create rankings for different categories
         rankings = {
@@ -0,0 +1,226 @@
+"""Week-to-date team and player snapshots for "as of week N" queries."""
+
+import logging
+from collections import defaultdict
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+from sqlalchemy import func, insert
+from sqlalchemy.orm import Session
+
+from ..models.game import GameModel
+from ..models.team import TeamModel
+from ..models.player_stats import (
+    PlayerGameStatsModel, PlayerWeekStatsModel, SUM_COLUMNS, MAX_COLUMNS
+)
+from ..models.team_week_stats import TeamWeekStatsModel
+from .standings import compute_standings
+
+logger = logging.getLogger(__name__)
+
+SeasonWeek = Tuple[int, Optional[int]]  # (season, week)
+
+# TeamRecord attributes copied onto team week rows
+TEAM_RECORD_COLUMNS = (
+    'games_played', 'wins', 'losses', 'ties', 'points_for', 'points_against',
+    'home_games', 'away_games', 'home_wins', 'away_wins',
+    'division_wins', 'division_losses', 'division_ties',
+    'conference_wins', 'conference_losses', 'conference_ties',
+    'strength_of_victory', 'strength_of_schedule',
+    'division_rank', 'conference_rank', 'playoff_seed',
+)
+
+
+def _first_weeks(season_weeks: Iterable[SeasonWeek]) -> Dict[int, int]:
+    """Earliest changed week per season (week 1 when unknown)."""
+    first: Dict[int, int] = {}
+    for season, week in season_weeks:
+        if season is None:
+            continue
+        week = week or 1
+        first[season] = min(first.get(season, week), week)
+    return first
+
+
+def snapshot_week(db_session: Session, model, season: int, as_of_week: int) -> Optional[int]:
+    """Latest stored snapshot week at or before ``as_of_week`` (None if none)."""
+    return db_session.query(func.max(model.week)).filter(
+        model.season == season,
+        model.week <= as_of_week
+    ).scalar()
+
+
+class WeeklySnapshotBuilder:
+    """Maintain ``team_week_stats`` and ``player_week_stats``.
+
+    Team rows come from the standings engine run through each regular-season
+    week of completed games. Player rows are running sums of
+    ``player_game_stats``, rebuilt from the earliest changed week onward and
+    started from the stored totals of the week before.
+    """
+
+    def __init__(self, db_session: Session):
+        """Initialize builder.
+
+        Args:
+            db_session: Database session for reads and writes
+        """
+        self.db_session = db_session
+
+    def refresh_team_weeks(self, season_weeks: List[SeasonWeek]) -> int:
+        """Rebuild team week rows from the earliest changed week of each season.
+
+        The caller owns the transaction (no commit here).
+
+        Args:
+            season_weeks: (season, week) pairs whose games changed
+
+        Returns:
+            Number of rows written
+        """
+        written = 0
+        for season, from_week in sorted(_first_weeks(season_weeks).items()):
+            written += self._refresh_team_season(season, from_week)
+        return written
+
+    def refresh_player_weeks(self, season_weeks: List[SeasonWeek]) -> int:
+        """Rebuild player week rows from the earliest changed week of each season.
+
+        Must run after ``player_game_stats`` is refreshed. The caller owns
+        the transaction (no commit here).
+
+        Args:
+            season_weeks: (season, week) pairs whose plays changed
+
+        Returns:
+            Number of rows written
+        """
+        written = 0
+        for season, from_week in sorted(_first_weeks(season_weeks).items()):
+            written += self._refresh_player_season(season, from_week)
+        return written
+
+    def rebuild(self, seasons: List[int]) -> int:
+        """Rebuild every team and player week row of the given seasons.
+
+        Commits after each season.
+
+        Returns:
+            Number of rows written
+        """
+        written = 0
+        for season in seasons:
+            try:
+                written += self._refresh_team_season(season, 1)
+                written += self._refresh_player_season(season, 1)
+                self.db_session.commit()
+            except Exception:
+                self.db_session.rollback()
+                raise
+            logger.info(f"Rebuilt weekly snapshots for {season}")
+        return written
+
+    def _refresh_team_season(self, season: int, from_week: int) -> int:
+        self.db_session.query(TeamWeekStatsModel).filter(
+            TeamWeekStatsModel.season == season,
+            TeamWeekStatsModel.week >= from_week
+        ).delete(synchronize_session=False)
+
+        games = self.db_session.query(
+            GameModel.week, GameModel.home_team, GameModel.away_team,
+            GameModel.home_score, GameModel.away_score
+        ).filter(
+            GameModel.season == season,
+            GameModel.season_type == 'REG',
+            GameModel.week.isnot(None),
+            GameModel.home_score.isnot(None),
+            GameModel.away_score.isnot(None)
+        ).all()
+        if not games:
+            return 0
+
+        teams = self.db_session.query(TeamModel.team_abbr, TeamModel.team_conf, TeamModel.team_division).all()
+        rows = []
+        for week in range(from_week, max(game.week for game in games) + 1):
+            standings = compute_standings(
+                teams, [game[1:] for game in games if game.week <= week], season, week
+            )
+            for team, record in standings.records.items():
+                row = {column: getattr(record, column) for column in TEAM_RECORD_COLUMNS}
+                row.update(team_abbr=team, season=season, week=week)
+                rows.append(row)
+
+        if rows:
+            self.db_session.execute(insert(TeamWeekStatsModel), rows)
+        return len(rows)
+
+    def _refresh_player_season(self, season: int, from_week: int) -> int:
+        # Restart from the last stored week before the change
+        base_week = self.db_session.query(func.max(PlayerWeekStatsModel.week)).filter(
+            PlayerWeekStatsModel.season == season,
+            PlayerWeekStatsModel.week < from_week
+        ).scalar() or 0
+
+        self.db_session.query(PlayerWeekStatsModel).filter(
+            PlayerWeekStatsModel.season == season,
+            PlayerWeekStatsModel.week > base_week
+        ).delete(synchronize_session=False)
+
+        totals: Dict[str, Dict[str, Any]] = {}
+        for row in self.db_session.query(PlayerWeekStatsModel).filter(
+            PlayerWeekStatsModel.season == season,
+            PlayerWeekStatsModel.week == base_week
+        ).all():
+            totals[row.player_id] = {
+                column: getattr(row, column) for column in ('games', 'team_abbr') + SUM_COLUMNS + MAX_COLUMNS
+            }
+
+        games_by_week: Dict[int, List[PlayerGameStatsModel]] = defaultdict(list)
+        for row in self.db_session.query(PlayerGameStatsModel).filter(
+            PlayerGameStatsModel.season == season,
+            PlayerGameStatsModel.week > base_week
+        ).all():
+            games_by_week[row.week].append(row)
+        if not games_by_week:
+            return 0
+
+        rows = []
+        for week in range(base_week + 1, max(games_by_week) + 1):
+            for game_row in games_by_week.get(week, []):
+                total = totals.get(game_row.player_id)
+                if total is None:
+                    total = {column: 0 for column in ('games',) + SUM_COLUMNS}
+                    total.update({column: None for column in MAX_COLUMNS})
+                    totals[game_row.player_id] = total
+                total['games'] += 1
+                total['team_abbr'] = game_row.team_abbr or total.get('team_abbr')
+                for column in SUM_COLUMNS:
+                    total[column] += getattr(game_row, column) or 0
+                for column in MAX_COLUMNS:
+                    value = getattr(game_row, column)
+                    if value is not None and (total[column] is None or value > total[column]):
+                        total[column] = value
+
+            rows.extend(dict(total, player_id=player_id, season=season, week=week)
+                        for player_id, total in totals.items())
+
+        if rows:
+            self.db_session.execute(insert(PlayerWeekStatsModel), rows)
+        return len(rows)
+
+
+if __name__ == "__main__":
+    # CLI for backfilling weekly snapshots on an existing database
+    import argparse
+    from ..database.manager import DatabaseManager
+
+    parser = argparse.ArgumentParser(description="Rebuild team and player week-to-date snapshots")
+    parser.add_argument("--seasons", type=int, nargs="+", required=True, help="Seasons to rebuild")
+
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.INFO)
+
+    session = DatabaseManager().get_session()
+    try:
+        rows = WeeklySnapshotBuilder(session).rebuild(args.seasons)
+        print(f"Wrote {rows} weekly snapshot rows")
+    finally:
+        session.close()
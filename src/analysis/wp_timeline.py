@@ -0,0 +1,177 @@
+"""Per-game win probability timelines and chart downsampling."""
+
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional
+import numpy as np
+
+from ..models.game_wp_timeline import GameWPTimelineModel
+
+# Serialized arrays are always little-endian float32
+ARRAY_DTYPE = np.dtype('<f4')
+
+# Win probability change between consecutive plays that counts as a momentum swing
+MOMENTUM_SWING_THRESHOLD = 0.15
+
+# Overtime period length in seconds (regular season / postseason)
+REGULAR_SEASON_OT_SECONDS = 600
+POSTSEASON_OT_SECONDS = 900
+
+
+def encode_array(values) -> bytes:
+    """Serialize a numeric sequence as a compact float32 blob."""
+    return np.asarray(values, dtype=ARRAY_DTYPE).tobytes()
+
+
+def decode_array(blob: Optional[bytes]) -> np.ndarray:
+    """Deserialize a float32 blob produced by ``encode_array``."""
+    if not blob:
+        return np.empty(0, dtype=ARRAY_DTYPE)
+    return np.frombuffer(blob, dtype=ARRAY_DTYPE)
+
+
+def seconds_elapsed(qtr: Optional[int], game_seconds_remaining: Optional[int],
+                    season_type: Optional[str] = 'REG') -> float:
+    """Convert a play's clock state to seconds elapsed since kickoff.
+
+    Overtime plays continue past 3600 seconds; nflfastR reports
+    ``game_seconds_remaining`` relative to the overtime period there.
+    """
+    qtr = qtr or 1
+    if game_seconds_remaining is None:
+        # Approximate with the start of the quarter
+        return float(min(qtr - 1, 4) * 900 + max(0, qtr - 5) * 900)
+
+    if qtr <= 4:
+        return float(max(0, 3600 - game_seconds_remaining))
+
+    ot_length = REGULAR_SEASON_OT_SECONDS if (season_type or 'REG') == 'REG' else POSTSEASON_OT_SECONDS
+    remaining = min(game_seconds_remaining, ot_length)
+    return float(3600 + (qtr - 5) * ot_length + (ot_length - remaining))
+
+
+def lttb_indices(x: np.ndarray, y: np.ndarray, threshold: int) -> np.ndarray:
+    """Select indices with the Largest-Triangle-Three-Buckets algorithm.
+
+    Keeps the first and last points and, for every bucket in between, the
+    point forming the largest triangle with the previously selected point and
+    the average of the next bucket. Preserves spikes that uniform sampling
+    would drop.
+
+    Args:
+        x: Monotonic x values
+        y: Y values aligned with ``x``
+        threshold: Number of points to keep
+
+    Returns:
+        Sorted array of selected indices
+    """
+    n = len(x)
+    if threshold >= n or threshold < 3:
+        return np.arange(n)
+
+    x = np.asarray(x, dtype=np.float64)
+    y = np.asarray(y, dtype=np.float64)
+    bucket_size = (n - 2) / (threshold - 2)
+
+    selected = np.empty(threshold, dtype=np.int64)
+    selected[0] = 0
+    a = 0
+
+    for i in range(threshold - 2):
+        # Average of the next bucket (the last bucket averages the final point)
+        avg_start = int(np.floor((i + 1) * bucket_size)) + 1
+        avg_end = min(int(np.floor((i + 2) * bucket_size)) + 1, n)
+        avg_x = x[avg_start:avg_end].mean()
+        avg_y = y[avg_start:avg_end].mean()
+
+        range_start = int(np.floor(i * bucket_size)) + 1
+        range_end = int(np.floor((i + 1) * bucket_size)) + 1
+
+        areas = np.abs(
+            (x[a] - avg_x) * (y[range_start:range_end] - y[a])
+            - (x[a] - x[range_start:range_end]) * (avg_y - y[a])
+        )
+        a = range_start + int(np.argmax(areas))
+        selected[i + 1] = a
+
+    selected[-1] = n - 1
+    return selected
+
+
+@dataclass
+class WPTimeline:
+    """Win probability timeline for a single game."""
+    game_id: str
+    seconds_elapsed: np.ndarray
+    win_probability: np.ndarray  # Home team perspective
+    epa: np.ndarray
+    home_epa: float
+    away_epa: float
+    biggest_play_epa: float
+    biggest_play_wpa: float
+    momentum_swings: int
+
+    @property
+    def play_count(self) -> int:
+        """Number of plays in the timeline."""
+        return len(self.seconds_elapsed)
+
+    @classmethod
+    def from_model(cls, model: GameWPTimelineModel) -> 'WPTimeline':
+        """Build a timeline from its stored row."""
+        return cls(
+            game_id=model.game_id,
+            seconds_elapsed=decode_array(model.seconds_elapsed),
+            win_probability=decode_array(model.win_probability),
+            epa=decode_array(model.epa),
+            home_epa=model.home_epa or 0.0,
+            away_epa=model.away_epa or 0.0,
+            biggest_play_epa=model.biggest_play_epa or 0.0,
+            biggest_play_wpa=model.biggest_play_wpa or 0.0,
+            momentum_swings=model.momentum_swings or 0
+        )
+
+    def apply_to_model(self, model: GameWPTimelineModel) -> GameWPTimelineModel:
+        """Copy the timeline onto a (new or existing) row."""
+        model.game_id = self.game_id
+        model.play_count = self.play_count
+        model.seconds_elapsed = encode_array(self.seconds_elapsed)
+        model.win_probability = encode_array(self.win_probability)
+        model.epa = encode_array(self.epa)
+        model.home_epa = float(self.home_epa)
+        model.away_epa = float(self.away_epa)
+        model.biggest_play_epa = float(self.biggest_play_epa)
+        model.biggest_play_wpa = float(self.biggest_play_wpa)
+        model.momentum_swings = int(self.momentum_swings)
+        return model
+
+    def downsample(self, points: int) -> Dict[str, List[float]]:
+        """Return the series reduced to at most ``points`` with LTTB on WP.
+
+        Args:
+            points: Maximum number of points to return
+
+        Returns:
+            Dictionary of aligned ``seconds_elapsed``, ``win_probability`` and ``epa`` lists
+        """
+        idx = lttb_indices(self.seconds_elapsed, self.win_probability, points)
+        return {
+            'seconds_elapsed': [round(float(v), 1) for v in self.seconds_elapsed[idx]],
+            'win_probability': [round(float(v), 4) for v in self.win_probability[idx]],
+            'epa': [round(float(v), 3) for v in self.epa[idx]]
+        }
+
+    def to_dict(self, points: Optional[int] = None) -> Dict[str, Any]:
+        """Convert to dictionary, optionally downsampled."""
+        series = self.downsample(points if points else self.play_count)
+        return {
+            'game_id': self.game_id,
+            'play_count': self.play_count,
+            'points': len(series['seconds_elapsed']),
+            'home_epa': round(self.home_epa, 3),
+            'away_epa': round(self.away_epa, 3),
+            'biggest_play_epa': round(self.biggest_play_epa, 3),
+            'biggest_play_wpa': round(self.biggest_play_wpa, 3),
+            'momentum_swings': self.momentum_swings,
+            **series
+        }
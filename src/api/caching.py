@@ -0,0 +1,91 @@
+"""HTTP caching for read endpoints: data-version ETags and Cache-Control.
+
+An endpoint declares which datasets its response is computed from. Its ETag
+hashes the request path and query with those datasets' data versions, so it
+changes exactly when a load touches the data. A matching ``If-None-Match``
+ends the request with 304 before the endpoint runs any query of its own.
+"""
+
+import hashlib
+import logging
+from datetime import date
+from typing import Callable, Optional
+
+from fastapi import Depends, HTTPException, Request, Response
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm import Session
+
+from ..data.data_versions import get_data_version
+from .dependencies import get_db_session
+
+logger = logging.getLogger(__name__)
+
+# Completed seasons no longer change, so shared caches may keep them for good
+IMMUTABLE_CACHE_CONTROL = "public, max-age=31536000, immutable"
+# Anything else may be stored but must be revalidated against the ETag
+REVALIDATE_CACHE_CONTROL = "public, no-cache"
+
+
+def current_season(today: Optional[date] = None) -> int:
+    """NFL season in progress (seasons start in September and end in February)."""
+    today = today or date.today()
+    return today.year if today.month >= 3 else today.year - 1
+
+
+def _request_season(request: Request) -> Optional[int]:
+    season = request.path_params.get('season', request.query_params.get('season'))
+    try:
+        return int(season) if season is not None else None
+    except (TypeError, ValueError):
+        return None
+
+
+def _etag_matches(if_none_match: str, etag: str) -> bool:
+    """Weak comparison of an If-None-Match header against an ETag."""
+    if if_none_match.strip() == '*':
+        return True
+    opaque = etag[2:] if etag.startswith('W/') else etag
+    for candidate in if_none_match.split(','):
+        candidate = candidate.strip()
+        if candidate.startswith('W/'):
+            candidate = candidate[2:]
+        if candidate == opaque:
+            return True
+    return False
+
+
+def versioned(*datasets: str) -> Callable:
+    """Dependency adding an ETag and Cache-Control to a GET endpoint.
+
+    Args:
+        datasets: Datasets ('teams', 'players', 'games', 'plays') the
+            endpoint's response is computed from
+
+    Returns:
+        Dependency that raises a 304 HTTPException when the client's copy is current
+    """
+    def dependency(request: Request, response: Response, db: Session = Depends(get_db_session)) -> None:
+        season = _request_season(request)
+        try:
+            version = get_data_version(db, datasets, season)
+        except SQLAlchemyError as e:
+            # Without versions nothing can be validated; serve uncached
+            logger.warning(f"Data versions unavailable, skipping ETag: {str(e)}")
+            db.rollback()
+            return
+
+        query = '&'.join(f"{key}={value}" for key, value in sorted(request.query_params.multi_items()))
+        fingerprint = f"{request.url.path}?{query}|{','.join(map(str, version))}"
+        etag = f'W/"{hashlib.sha1(fingerprint.encode()).hexdigest()}"'
+        completed = season is not None and season < current_season()
+        headers = {
+            'ETag': etag,
+            'Cache-Control': IMMUTABLE_CACHE_CONTROL if completed else REVALIDATE_CACHE_CONTROL,
+        }
+
+        if_none_match = request.headers.get('if-none-match')
+        if if_none_match and _etag_matches(if_none_match, etag):
+            raise HTTPException(status_code=304, headers=headers)
+        response.headers.update(headers)
+
+    return dependency
@@ -0,0 +1,176 @@
+"""Streaming table export in NDJSON, CSV, Parquet and Arrow IPC.
+
+Rows are read from a server-side cursor in fixed-size chunks and each chunk
+is encoded and handed to the response as soon as it is ready, so memory per
+request is bounded by the chunk size rather than the result size.
+"""
+
+import csv
+import io
+import json
+from datetime import date, datetime
+from decimal import Decimal
+from typing import Any, Iterable, Iterator, List, Sequence
+
+from sqlalchemy import Boolean, Date, DateTime, Float, Integer, Numeric
+from sqlalchemy.engine import Engine
+
+# pyarrow is only needed for the columnar formats
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+    PYARROW_AVAILABLE = True
+except ImportError:
+    pa = pq = None
+    PYARROW_AVAILABLE = False
+
+DEFAULT_CHUNK_SIZE = 5000
+
+# Format name -> (media type, file extension, needs pyarrow)
+EXPORT_FORMATS = {
+    'ndjson': ('application/x-ndjson', 'ndjson', False),
+    'csv': ('text/csv', 'csv', False),
+    'parquet': ('application/vnd.apache.parquet', 'parquet', True),
+    'arrow': ('application/vnd.apache.arrow.stream', 'arrows', True),
+}
+
+
+def _json_default(value: Any) -> Any:
+    if isinstance(value, Decimal):
+        return float(value)
+    if isinstance(value, (date, datetime)):
+        return value.isoformat()
+    raise TypeError(f"Cannot serialize {type(value).__name__}")
+
+
+def encode_ndjson(columns: Sequence[str], chunks: Iterable[Sequence[tuple]]) -> Iterator[bytes]:
+    """Encode row chunks as newline-delimited JSON objects."""
+    for rows in chunks:
+        yield ''.join(
+            json.dumps(dict(zip(columns, row)), default=_json_default) + '\n' for row in rows
+        ).encode()
+
+
+def encode_csv(columns: Sequence[str], chunks: Iterable[Sequence[tuple]]) -> Iterator[bytes]:
+    """Encode row chunks as CSV with a header row."""
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(columns)
+    for rows in chunks:
+        writer.writerows(rows)
+        yield buffer.getvalue().encode()
+        buffer.seek(0)
+        buffer.truncate()
+    if buffer.tell():
+        yield buffer.getvalue().encode()
+
+
+class _ChunkSink(io.RawIOBase):
+    """Write-only file that hands out what was written since the last drain."""
+
+    def __init__(self):
+        super().__init__()
+        self._parts: List[bytes] = []
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data) -> int:
+        self._parts.append(bytes(data))
+        return len(data)
+
+    def drain(self) -> bytes:
+        data = b''.join(self._parts)
+        self._parts.clear()
+        return data
+
+
+def arrow_schema(table_columns) -> 'pa.Schema':
+    """Arrow schema for SQLAlchemy table columns."""
+    def arrow_type(column_type):
+        if isinstance(column_type, Boolean):
+            return pa.bool_()
+        if isinstance(column_type, Integer):
+            return pa.int64()
+        if isinstance(column_type, (Float, Numeric)):
+            return pa.float64()
+        if isinstance(column_type, DateTime):
+            return pa.timestamp('us')
+        if isinstance(column_type, Date):
+            return pa.date32()
+        return pa.string()
+
+    return pa.schema([pa.field(column.name, arrow_type(column.type)) for column in table_columns])
+
+
+def _record_batch(schema: 'pa.Schema', rows: Sequence[tuple]) -> 'pa.RecordBatch':
+    arrays = []
+    for i, field in enumerate(schema):
+        values = [row[i] for row in rows]
+        if pa.types.is_floating(field.type):
+            values = [None if value is None else float(value) for value in values]
+        arrays.append(pa.array(values, type=field.type))
+    return pa.RecordBatch.from_arrays(arrays, schema=schema)
+
+
+def encode_parquet(schema: 'pa.Schema', chunks: Iterable[Sequence[tuple]]) -> Iterator[bytes]:
+    """Encode row chunks as a Parquet file with one row group per chunk."""
+    sink = _ChunkSink()
+    with pq.ParquetWriter(sink, schema) as writer:
+        for rows in chunks:
+            writer.write_batch(_record_batch(schema, rows))
+            yield sink.drain()
+    yield sink.drain()
+
+
+def encode_arrow(schema: 'pa.Schema', chunks: Iterable[Sequence[tuple]]) -> Iterator[bytes]:
+    """Encode row chunks as an Arrow IPC stream with one record batch per chunk."""
+    sink = _ChunkSink()
+    with pa.ipc.new_stream(sink, schema) as writer:
+        yield sink.drain()
+        for rows in chunks:
+            writer.write_batch(_record_batch(schema, rows))
+            yield sink.drain()
+    yield sink.drain()
+
+
+def stream_rows(engine: Engine, statement, chunk_size: int = DEFAULT_CHUNK_SIZE) -> Iterator[List[tuple]]:
+    """Execute a select on its own connection and yield its rows in chunks.
+
+    Uses a server-side cursor where the driver supports one. The connection
+    is released when the iterator is exhausted or closed, which lets the
+    stream outlive the request's session.
+    """
+    with engine.connect() as connection:
+        result = connection.execution_options(stream_results=True, yield_per=chunk_size).execute(statement)
+        for partition in result.partitions(chunk_size):
+            yield [tuple(row) for row in partition]
+
+
+def export_stream(engine: Engine, statement, table_columns, export_format: str,
+                  chunk_size: int = DEFAULT_CHUNK_SIZE) -> Iterator[bytes]:
+    """Stream the rows of a select over ``table_columns`` in an export format.
+
+    Args:
+        engine: Engine to read from
+        statement: Select whose result columns are ``table_columns`` in order
+        table_columns: SQLAlchemy columns being exported
+        export_format: One of EXPORT_FORMATS
+        chunk_size: Rows fetched and encoded at a time
+
+    Returns:
+        Iterator of encoded byte chunks
+    """
+    chunks = stream_rows(engine, statement, chunk_size)
+    names = [column.name for column in table_columns]
+    if export_format == 'ndjson':
+        encoded = encode_ndjson(names, chunks)
+    elif export_format == 'csv':
+        encoded = encode_csv(names, chunks)
+    elif export_format == 'parquet':
+        encoded = encode_parquet(arrow_schema(table_columns), chunks)
+    elif export_format == 'arrow':
+        encoded = encode_arrow(arrow_schema(table_columns), chunks)
+    else:
+        raise ValueError(f"Unknown export format: {export_format}")
+    return (data for data in encoded if data)
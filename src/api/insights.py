@@ -4,15 +4,18 @@ from typing import List, Optional, Dict, Any
 from fastapi import APIRouter, Depends, HTTPException, Query, Request
 from sqlalchemy.orm import Session
 
+from .caching import versioned
 from .dependencies import get_db_session
 from ..analysis.insights import InsightsGenerator
+from ..analysis.fourth_down import FourthDownAnalyzer, to_records
 from ..models.schemas import (
     AdvancedMetricsResponse,
     TeamInsightsResponse,
     GameInsightResponse,
     LeagueLeadersResponse,
     TeamComparisonResponse,
-    SeasonNarrativeResponse
+    SeasonNarrativeResponse,
+    FourthDownResponse
 )
 
 router = APIRouter(prefix="/insights", tags=["insights"])
@@ -20,7 +23,7 @@ router = APIRouter(prefix="/insights", tags=["insights"])
 
 def get_insights_generator(db: Session = Depends(get_db_session)) -> InsightsGenerator:
     """Get insights generator instance."""
-    return InsightsGenerator(db)
+    return InsightsGenerator(db, use_cache=True)
 
 
 @router.post("/play-metrics", response_model=AdvancedMetricsResponse)
@@ -59,10 +62,48 @@ def calculate_play_metrics(
         raise HTTPException(status_code=400, detail=f"Error calculating play metrics: {str(e)}")
 
 
-@router.get("/team/{team_abbr}/{season}", response_model=TeamInsightsResponse)
+@router.get("/team/{team_abbr}/history", response_model=TeamInsightsResponse,
+            dependencies=[Depends(versioned('games', 'plays'))])
+def get_team_insights_history(
+    team_abbr: str,
+    generator: InsightsGenerator = Depends(get_insights_generator)
+):
+    """Get stored season-by-season insights for a team.
+    
+    Args:
+        team_abbr: Team abbreviation (e.g., 'SF', 'KC')
+    
+    Returns:
+        TeamInsights for every refreshed season, oldest first
+    """
+    try:
+        history = generator.get_team_insights_history(team_abbr.upper())
+        if not history:
+            raise HTTPException(
+                status_code=404, 
+                detail=f"No insights history found for {team_abbr}"
+            )
+        
+        return TeamInsightsResponse(
+            status="success",
+            message=f"Insights history retrieved for {team_abbr}",
+            data={
+                'team_abbr': team_abbr.upper(),
+                'seasons': [insights.to_dict() for insights in history]
+            }
+        )
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Error retrieving insights history: {str(e)}")
+
+
+@router.get("/team/{team_abbr}/{season}", response_model=TeamInsightsResponse,
+            dependencies=[Depends(versioned('games', 'plays'))])
 def get_team_insights(
     team_abbr: str,
     season: int,
+    as_of_week: Optional[int] = Query(None, ge=1, le=22, description="Insights as of this week"),
     generator: InsightsGenerator = Depends(get_insights_generator)
 ):
     """Get comprehensive insights for a team in a specific season.
@@ -70,12 +111,16 @@ def get_team_insights(
     Args:
         team_abbr: Team abbreviation (e.g., 'SF', 'KC')
         season: Season year
+        as_of_week: Only include plays through this week
     
     Returns:
         TeamInsights with advanced metrics and analysis
     """
     try:
-        insights = generator.generate_team_insights(team_abbr.upper(), season)
+        if as_of_week is None:
+            insights = generator.generate_team_insights(team_abbr.upper(), season)
+        else:
+            insights = generator.generate_team_insights_as_of(team_abbr.upper(), season, as_of_week)
         if not insights:
             raise HTTPException(
                 status_code=404, 
@@ -93,7 +138,8 @@ def get_team_insights(
         raise HTTPException(status_code=500, detail=f"Error generating team insights: {str(e)}")
 
 
-@router.get("/game/{game_id}", response_model=GameInsightResponse)
+@router.get("/game/{game_id}", response_model=GameInsightResponse,
+            dependencies=[Depends(versioned('games', 'plays'))])
 def get_game_insights(
     game_id: str,
     generator: InsightsGenerator = Depends(get_insights_generator)
@@ -125,11 +171,13 @@ def get_game_insights(
         raise HTTPException(status_code=500, detail=f"Error generating game insights: {str(e)}")
 
 
-@router.get("/league-leaders/{season}", response_model=LeagueLeadersResponse)
+@router.get("/league-leaders/{season}", response_model=LeagueLeadersResponse,
+            dependencies=[Depends(versioned('games', 'plays'))])
 def get_league_leaders(
     season: int,
     metric: str = Query(..., description="Metric name (e.g., 'offensive_epa_per_play')"),
     limit: int = Query(10, ge=1, le=32, description="Number of teams to return"),
+    as_of_week: Optional[int] = Query(None, ge=1, le=22, description="Leaders as of this week"),
     generator: InsightsGenerator = Depends(get_insights_generator)
 ):
     """Get league leaders for a specific advanced metric.
@@ -138,17 +186,22 @@ def get_league_leaders(
         season: Season year
         metric: Metric name to rank by
         limit: Number of teams to return (1-32)
+        as_of_week: Rank teams as they stood after this week
     
     Returns:
         List of team rankings with metric values
     """
     try:
-        leaders = generator.get_league_leaders(season, metric, limit)
+        if as_of_week is None:
+            leaders = generator.get_league_leaders(season, metric, limit)
+        else:
+            leaders = generator.get_league_leaders_as_of(season, as_of_week, metric, limit)
         return LeagueLeadersResponse(
             status="success",
             message=f"League leaders for {metric} in {season}",
             data={
                 "season": season,
+                "as_of_week": as_of_week,
                 "metric": metric,
                 "leaders": leaders
             }
@@ -157,7 +210,8 @@ def get_league_leaders(
         raise HTTPException(status_code=500, detail=f"Error getting league leaders: {str(e)}")
 
 
-@router.get("/compare/{team1}/{team2}/{season}", response_model=TeamComparisonResponse)
+@router.get("/compare/{team1}/{team2}/{season}", response_model=TeamComparisonResponse,
+            dependencies=[Depends(versioned('games', 'plays'))])
 def compare_teams(
     team1: str,
     team2: str,
@@ -193,7 +247,8 @@ def compare_teams(
         raise HTTPException(status_code=500, detail=f"Error comparing teams: {str(e)}")
 
 
-@router.get("/narrative/{team_abbr}/{season}", response_model=SeasonNarrativeResponse)
+@router.get("/narrative/{team_abbr}/{season}", response_model=SeasonNarrativeResponse,
+            dependencies=[Depends(versioned('games', 'plays'))])
 def get_season_narrative(
     team_abbr: str,
     season: int,
@@ -223,6 +278,84 @@ def get_season_narrative(
         raise HTTPException(status_code=500, detail=f"Error generating narrative: {str(e)}")
 
 
+@router.get("/fourth-down/{season}", response_model=FourthDownResponse,
+            dependencies=[Depends(versioned('plays'))])
+def get_fourth_down_summary(
+    season: int,
+    db: Session = Depends(get_db_session)
+):
+    """Grade every team's fourth-down decisions in a season.
+    
+    Args:
+        season: Season year
+    
+    Returns:
+        Per-team decision counts, go rates, agreement with the recommended
+        call and win probability lost, worst first
+    """
+    try:
+        analyzer = FourthDownAnalyzer(db)
+        decisions = analyzer.analyze_season(season)
+        if decisions.empty:
+            raise HTTPException(status_code=404, detail=f"No fourth downs found for {season}")
+        
+        return FourthDownResponse(
+            status="success",
+            message=f"Fourth-down decisions graded for {season}",
+            data={
+                "season": season,
+                "plays": len(decisions),
+                "teams": to_records(analyzer.team_summary(decisions))
+            }
+        )
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Error analyzing fourth downs: {str(e)}")
+
+
+@router.get("/fourth-down/{season}/{team_abbr}", response_model=FourthDownResponse,
+            dependencies=[Depends(versioned('plays'))])
+def get_team_fourth_downs(
+    season: int,
+    team_abbr: str,
+    db: Session = Depends(get_db_session)
+):
+    """Get the recommended call and WP cost for each of a team's fourth downs.
+    
+    Args:
+        season: Season year
+        team_abbr: Offense team abbreviation
+    
+    Returns:
+        Per-play option values, recommendation, actual call and WP cost
+    """
+    try:
+        analyzer = FourthDownAnalyzer(db)
+        decisions = analyzer.analyze_season(season, team_abbr.upper())
+        if decisions.empty:
+            raise HTTPException(
+                status_code=404,
+                detail=f"No fourth downs found for {team_abbr} in {season}"
+            )
+        
+        summary = analyzer.team_summary(decisions)
+        return FourthDownResponse(
+            status="success",
+            message=f"Fourth-down decisions for {team_abbr} - {season}",
+            data={
+                "team": team_abbr.upper(),
+                "season": season,
+                "summary": to_records(summary)[0] if not summary.empty else None,
+                "plays": to_records(decisions)
+            }
+        )
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Error analyzing fourth downs: {str(e)}")
+
+
 @router.get("/available-metrics")
 def get_available_metrics():
     """Get list of available metrics for league leaders and comparisons.
@@ -1,13 +1,16 @@
 """Data management API endpoints."""
 
 from typing import Optional, Dict, Any
-from fastapi import APIRouter, Depends, HTTPException, BackgroundTasks
+from fastapi import APIRouter, Depends, HTTPException, BackgroundTasks, Query
 from sqlalchemy.orm import Session
 from sqlalchemy.exc import SQLAlchemyError
 import logging
 
 from ...data.data_loader import DataLoader
 from ...data.pipeline import DataValidationPipeline, PipelineConfig
+from ...analysis.game_insights_job import GameInsightsJob
+from ...analysis.result_cache import get_result_cache
+from ..caching import current_season
 from ..dependencies import get_db_session
 from ..auth import authenticated
 
@@ -183,6 +186,9 @@ async def load_plays_data(
     background_tasks: BackgroundTasks,
     seasons: Optional[str] = None,
     weeks: Optional[str] = None,
+    stream: bool = Query(False, description="Read, map and write plays chunk by chunk with bounded memory"),
+    memory_budget_mb: Optional[int] = Query(None, ge=16, le=8192, description="Memory per streamed chunk"),
+    resume: bool = Query(False, description="Skip batches an interrupted load already committed"),
     db: Session = Depends(get_db_session)
 ):
     """Load play-by-play data from nfl_data_py for specified seasons and weeks."""
@@ -208,7 +214,8 @@ async def load_plays_data(
                 raise HTTPException(status_code=400, detail="Invalid weeks format. Use comma-separated integers.")
         
         # Load plays data
-        result = loader.load_plays(seasons=season_list, weeks=week_list)
+        result = loader.load_plays(seasons=season_list, weeks=week_list, streaming=stream,
+                                   memory_budget_mb=memory_budget_mb, resume=resume)
         
         return {
             "status": "success",
@@ -229,6 +236,47 @@ async def load_plays_data(
         raise HTTPException(status_code=500, detail=f"Failed to load plays data: {str(e)}")
 
 
+@router.post("/insights/games")
+def precompute_game_insights(
+    seasons: str,
+    weeks: Optional[str] = None,
+    workers: Optional[int] = Query(None, ge=1, le=32, description="Worker processes (default: CPU count)"),
+    authenticated: bool = Depends(authenticated),
+    db: Session = Depends(get_db_session)
+):
+    """Precompute game insights and win probability timelines for a season/week range.
+
+    Declared as a plain function so FastAPI runs the long job in its threadpool
+    instead of blocking the event loop for other requests.
+    """
+    try:
+        try:
+            season_list = [int(s.strip()) for s in seasons.split(',')]
+        except ValueError:
+            raise HTTPException(status_code=400, detail="Invalid seasons format. Use comma-separated integers.")
+        
+        week_list = None
+        if weeks:
+            try:
+                week_list = [int(w.strip()) for w in weeks.split(',')]
+            except ValueError:
+                raise HTTPException(status_code=400, detail="Invalid weeks format. Use comma-separated integers.")
+        
+        result = GameInsightsJob(db, workers=workers).run(season_list, week_list)
+        
+        return {
+            "status": "success" if result.success else "partial",
+            "message": f"Precomputed insights for {result.records_inserted} games in seasons {season_list}",
+            "result": result.to_dict()
+        }
+    
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"Error precomputing game insights: {str(e)}")
+        raise HTTPException(status_code=500, detail=f"Failed to precompute game insights: {str(e)}")
+
+
 @router.post("/validate")
 async def validate_data(
     data_type: str,
@@ -345,7 +393,8 @@ async def get_cache_info():
         return {
             "status": "success",
             "cache_enabled": cache_info["cache_enabled"],
-            "cache_stats": cache_info if cache_info["cache_enabled"] else None
+            "cache_stats": cache_info if cache_info["cache_enabled"] else None,
+            "analytics_cache": get_result_cache().stats()
         }
     
     except Exception as e:
@@ -355,10 +404,11 @@ async def get_cache_info():
 
 @router.delete("/cache")
 async def clear_cache():
-    """Clear the data cache."""
+    """Clear the data cache and the analytics result cache."""
     try:
         loader = get_data_loader()
         loader.client.clear_cache()
+        get_result_cache().clear()
         
         return {
             "status": "success",
@@ -376,7 +426,12 @@ async def refresh_all_data(
     current_season_only: bool = False,
     db: Session = Depends(get_db_session)
 ):
-    """Refresh all data (teams, games, recent plays) automatically."""
+    """Refresh teams plus the games and plays of weeks whose source data changed.
+
+    Each week's schedule and play-by-play source is fingerprinted against the
+    stored load watermarks, so weeks that have not changed since the last
+    refresh are neither re-fetched (plays) nor re-written.
+    """
     try:
         from datetime import datetime
         
@@ -387,23 +442,15 @@ async def refresh_all_data(
         logger.info("Starting automated data refresh...")
         results['teams'] = loader.load_teams()
         
+        season = current_season()
         if current_season_only:
             # Only refresh current season
-            current_year = datetime.now().year
-            seasons = [current_year]
+            seasons = [season]
         else:
             # Refresh recent seasons
-            current_year = datetime.now().year
-            seasons = [current_year, current_year - 1]
-        
-        # Refresh games
-        results['games'] = loader.load_games(seasons)
-        
-        # Refresh recent plays (current season, recent weeks)
-        current_week = min(18, max(1, datetime.now().timetuple().tm_yday // 7 - 35))  # Rough NFL week calculation
-        recent_weeks = [max(1, current_week - 2), max(1, current_week - 1), current_week]
+            seasons = [season, season - 1]
         
-        results['plays'] = loader.load_plays([current_year], recent_weeks[:2])  # Last 2 weeks
+        results.update(loader.refresh_changed_weeks(seasons))
         
         # Calculate totals
         total_teams = results['teams'].records_inserted + results['teams'].records_updated
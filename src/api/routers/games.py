@@ -8,18 +8,27 @@ from datetime import date
 import logging
 
 from ...models.game import GameModel as Game
+from ...analysis.insights import InsightsGenerator
+from ...services.base import ValidationException
+from ...services.pagination import keyset_page
+from ..caching import versioned
 from ..dependencies import get_db_session
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter()
 
+# Game date descending, id breaking ties between same-day games
+GAME_SORT_KEY = ((Game.game_date, True), (Game.id, True))
 
-@router.get("/")
+
+@router.get("/", dependencies=[Depends(versioned('games'))])
 async def get_games(
     request: Request,
     limit: int = Query(50, ge=1, le=500, description="Number of games to return"),
     offset: int = Query(0, ge=0, description="Number of games to skip"),
+    cursor: Optional[str] = Query(None, description="Cursor from the previous page's next_cursor"),
+    include_total: Optional[bool] = Query(None, description="Count all matching games (default: only without a cursor)"),
     season: Optional[int] = Query(None, description="Filter by season"),
     season_type: Optional[str] = Query(None, description="Filter by season type (REG/POST/PRE)"),
     week: Optional[int] = Query(None, description="Filter by week"),
@@ -46,14 +55,16 @@ async def get_games(
                 (Game.home_team == team) | (Game.away_team == team)
             )
         
-        # Order by game date descending
-        query = query.order_by(Game.game_date.desc())
+        if cursor and offset:
+            raise HTTPException(status_code=400, detail="offset cannot be combined with cursor")
         
-        # Get total count
-        total = query.count()
+        # Counting scans every matching game, so cursor pages skip it unless asked
+        if include_total is None:
+            include_total = cursor is None
+        total = query.count() if include_total else None
         
-        # Apply pagination
-        games = query.offset(offset).limit(limit).all()
+        # Newest first, seeking on (game_date, id)
+        games, next_cursor = keyset_page(query, GAME_SORT_KEY, limit, cursor, offset)
         
         return {
             "games": [
@@ -78,9 +89,14 @@ async def get_games(
             ],
             "total": total,
             "limit": limit,
-            "offset": offset
+            "offset": offset,
+            "next_cursor": next_cursor
         }
     
+    except HTTPException:
+        raise
+    except ValidationException as e:
+        raise HTTPException(status_code=400, detail=str(e))
     except SQLAlchemyError as e:
         logger.error(f"Database error in get_games: {str(e)}")
         raise HTTPException(status_code=500, detail="Database error")
@@ -89,7 +105,7 @@ async def get_games(
         raise HTTPException(status_code=500, detail="Internal server error")
 
 
-@router.get("/{game_id}")
+@router.get("/{game_id}", dependencies=[Depends(versioned('games'))])
 async def get_game(
     game_id: str,
     db: Session = Depends(get_db_session)
@@ -135,6 +151,43 @@ async def get_game(
         raise HTTPException(status_code=500, detail="Internal server error")
 
 
+@router.get("/{game_id}/wp-timeline", dependencies=[Depends(versioned('games', 'plays'))])
+async def get_game_wp_timeline(
+    game_id: str,
+    points: int = Query(200, ge=3, le=2000, description="Maximum number of chart points to return"),
+    db: Session = Depends(get_db_session)
+):
+    """Get a game's win probability timeline, downsampled for charting.
+    
+    Reads the timeline stored at ingest. Games loaded before timelines existed
+    have none until ``POST /api/v1/data/insights/games`` precomputes them.
+    """
+    try:
+        game = db.query(Game).filter(Game.game_id == game_id).first()
+        
+        if not game:
+            raise HTTPException(status_code=404, detail=f"Game {game_id} not found")
+        
+        timeline = InsightsGenerator(db).get_wp_timeline(game_id)
+        if timeline is None:
+            raise HTTPException(status_code=404, detail=f"No win probability timeline stored for game {game_id}")
+        
+        return {
+            "home_team": game.home_team,
+            "away_team": game.away_team,
+            **timeline.to_dict(points)
+        }
+    
+    except HTTPException:
+        raise
+    except SQLAlchemyError as e:
+        logger.error(f"Database error in get_game_wp_timeline: {str(e)}")
+        raise HTTPException(status_code=500, detail="Database error")
+    except Exception as e:
+        logger.error(f"Unexpected error in get_game_wp_timeline: {str(e)}")
+        raise HTTPException(status_code=500, detail="Internal server error")
+
+
 @router.get("/recent")
 async def get_recent_games(
     limit: int = Query(10, ge=1, le=50, description="Number of recent games to return"),
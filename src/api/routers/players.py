@@ -7,18 +7,26 @@ from sqlalchemy.exc import SQLAlchemyError
 import logging
 
 from ...models.player import PlayerModel as Player
+from ...services.player_service import PlayerService
+from ...services.base import NotFoundError, ValidationException
+from ...services.pagination import keyset_page
+from ..caching import versioned
 from ..dependencies import get_db_session
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter()
 
+PLAYER_SORT_KEY = ((Player.id, False),)
 
-@router.get("/")
+
+@router.get("/", dependencies=[Depends(versioned('players'))])
 async def get_players(
     request: Request,
     limit: int = Query(50, ge=1, le=1000, description="Number of players to return"),
     offset: int = Query(0, ge=0, description="Number of players to skip"),
+    cursor: Optional[str] = Query(None, description="Cursor from the previous page's next_cursor"),
+    include_total: Optional[bool] = Query(None, description="Count all matching players (default: only without a cursor)"),
     team_abbr: Optional[str] = Query(None, description="Filter by team abbreviation"),
     position: Optional[str] = Query(None, description="Filter by position"),
     active_only: bool = Query(True, description="Return only active players"),
@@ -38,11 +46,16 @@ async def get_players(
         if active_only:
             query = query.filter(Player.status == 'active')
         
-        # Get total count
-        total = query.count()
+        if cursor and offset:
+            raise HTTPException(status_code=400, detail="offset cannot be combined with cursor")
+        
+        # Counting scans every matching player, so cursor pages skip it unless asked
+        if include_total is None:
+            include_total = cursor is None
+        total = query.count() if include_total else None
         
-        # Apply pagination
-        players = query.offset(offset).limit(limit).all()
+        # Seek on id
+        players, next_cursor = keyset_page(query, PLAYER_SORT_KEY, limit, cursor, offset)
         
         return {
             "players": [
@@ -64,9 +77,14 @@ async def get_players(
             ],
             "total": total,
             "limit": limit,
-            "offset": offset
+            "offset": offset,
+            "next_cursor": next_cursor
         }
     
+    except HTTPException:
+        raise
+    except ValidationException as e:
+        raise HTTPException(status_code=400, detail=str(e))
     except SQLAlchemyError as e:
         logger.error(f"Database error in get_players: {str(e)}")
         raise HTTPException(status_code=500, detail="Database error")
@@ -75,7 +93,7 @@ async def get_players(
         raise HTTPException(status_code=500, detail="Internal server error")
 
 
-@router.get("/{player_id}")
+@router.get("/{player_id}", dependencies=[Depends(versioned('players'))])
 async def get_player(
     player_id: str,
     db: Session = Depends(get_db_session)
@@ -115,21 +133,21 @@ async def get_player(
         raise HTTPException(status_code=500, detail="Internal server error")
 
 
-@router.get("/{player_id}/stats")
+@router.get("/{player_id}/stats", dependencies=[Depends(versioned('players', 'plays'))])
 async def get_player_stats(
     player_id: str,
     season: Optional[int] = Query(None, description="Season year"),
+    as_of_week: Optional[int] = Query(None, ge=1, le=22, description="Statistics as of this week (requires season)"),
     db: Session = Depends(get_db_session)
 ):
     """Get player statistics for a specific season."""
     try:
-        player = db.query(Player).filter(Player.player_id == player_id).first()
-        
-        if not player:
-            raise HTTPException(status_code=404, detail=f"Player {player_id} not found")
+        player_stats = PlayerService(db).get_player_stats(player_id, season, as_of_week)
+        player = player_stats.pop("player")
+        games_played = player_stats.pop("games_played")
+        for key in ("season", "position", "team", "as_of_week"):
+            player_stats.pop(key, None)
         
-        # For now, return basic player info with placeholder stats
-        # TODO: Implement actual statistics calculation from plays
         stats = {
             "player": {
                 "id": player.id,
@@ -139,13 +157,16 @@ async def get_player_stats(
                 "position": player.position
             },
             "season": season,
-            "games_played": 0,
-            "stats": {},
-            "message": "Statistics calculation not yet implemented"
+            "as_of_week": as_of_week,
+            "games_played": games_played,
+            "stats": player_stats,
+            "message": f"Statistics from {games_played} games" if games_played else "No statistics recorded"
         }
         
         return stats
     
+    except NotFoundError as e:
+        raise HTTPException(status_code=404, detail=str(e))
     except HTTPException:
         raise
     except SQLAlchemyError as e:
@@ -2,23 +2,53 @@
 
 from typing import List, Optional
 from fastapi import APIRouter, Depends, HTTPException, Request, Query
+from fastapi.responses import StreamingResponse
+from sqlalchemy import select
 from sqlalchemy.orm import Session
 from sqlalchemy.exc import SQLAlchemyError
+import itertools
 import logging
 
 from ...models.play import PlayModel as Play
+from ...services.base import ValidationException
+from ...services.pagination import keyset_page
+from ..caching import versioned
 from ..dependencies import get_db_session
+from ..export import DEFAULT_CHUNK_SIZE, EXPORT_FORMATS, PYARROW_AVAILABLE, export_stream
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter()
 
+# Game, then play sequence
+PLAY_SORT_KEY = ((Play.game_id, False), (Play.play_id, False))
 
-@router.get("/")
+
+def _filter_plays(query, game_id: Optional[str], season: Optional[int],
+                  play_type: Optional[str], posteam: Optional[str]):
+    """Apply the list filters to a plays query or select."""
+    if game_id:
+        query = query.filter(Play.game_id == game_id)
+    
+    if season:
+        query = query.filter(Play.season == season)
+    
+    if play_type:
+        query = query.filter(Play.play_type == play_type.lower())
+    
+    if posteam:
+        query = query.filter(Play.posteam == posteam.upper())
+    
+    return query
+
+
+@router.get("/", dependencies=[Depends(versioned('plays'))])
 async def get_plays(
     request: Request,
     limit: int = Query(100, ge=1, le=1000, description="Number of plays to return"),
     offset: int = Query(0, ge=0, description="Number of plays to skip"),
+    cursor: Optional[str] = Query(None, description="Cursor from the previous page's next_cursor"),
+    include_total: Optional[bool] = Query(None, description="Count all matching plays (default: only without a cursor)"),
     game_id: Optional[str] = Query(None, description="Filter by game ID"),
     season: Optional[int] = Query(None, description="Filter by season"),
     play_type: Optional[str] = Query(None, description="Filter by play type"),
@@ -27,29 +57,18 @@ async def get_plays(
 ):
     """Get list of NFL plays with filtering options."""
     try:
-        query = db.query(Play)
+        query = _filter_plays(db.query(Play), game_id, season, play_type, posteam)
         
-        # Apply filters
-        if game_id:
-            query = query.filter(Play.game_id == game_id)
+        if cursor and offset:
+            raise HTTPException(status_code=400, detail="offset cannot be combined with cursor")
         
-        if season:
-            query = query.filter(Play.season == season)
+        # Counting scans every matching play, so cursor pages skip it unless asked
+        if include_total is None:
+            include_total = cursor is None
+        total = query.count() if include_total else None
         
-        if play_type:
-            query = query.filter(Play.play_type == play_type.lower())
-        
-        if posteam:
-            query = query.filter(Play.posteam == posteam.upper())
-        
-        # Order by game, then by play sequence
-        query = query.order_by(Play.game_id, Play.play_id)
-        
-        # Get total count
-        total = query.count()
-        
-        # Apply pagination
-        plays = query.offset(offset).limit(limit).all()
+        # Seek on (game_id, play_id), the order of the plays' unique index
+        plays, next_cursor = keyset_page(query, PLAY_SORT_KEY, limit, cursor, offset)
         
         return {
             "plays": [
@@ -82,9 +101,14 @@ async def get_plays(
             ],
             "total": total,
             "limit": limit,
-            "offset": offset
+            "offset": offset,
+            "next_cursor": next_cursor
         }
     
+    except HTTPException:
+        raise
+    except ValidationException as e:
+        raise HTTPException(status_code=400, detail=str(e))
     except SQLAlchemyError as e:
         logger.error(f"Database error in get_plays: {str(e)}")
         raise HTTPException(status_code=500, detail="Database error")
@@ -93,7 +117,49 @@ async def get_plays(
         raise HTTPException(status_code=500, detail="Internal server error")
 
 
-@router.get("/{play_id}")
+@router.get("/export")
+async def export_plays(
+    export_format: str = Query("ndjson", alias="format", description="ndjson, csv, parquet or arrow"),
+    chunk_size: int = Query(DEFAULT_CHUNK_SIZE, ge=100, le=50000, description="Rows read and encoded at a time"),
+    game_id: Optional[str] = Query(None, description="Filter by game ID"),
+    season: Optional[int] = Query(None, description="Filter by season"),
+    play_type: Optional[str] = Query(None, description="Filter by play type"),
+    posteam: Optional[str] = Query(None, description="Filter by possession team"),
+    db: Session = Depends(get_db_session)
+):
+    """Stream every matching play in one response.
+    
+    Rows come from a server-side cursor and are encoded chunk by chunk, so a
+    full season downloads in one request with constant server memory.
+    """
+    export_format = export_format.lower()
+    if export_format not in EXPORT_FORMATS:
+        raise HTTPException(status_code=400, detail=f"Unsupported export format: {export_format}")
+    media_type, extension, needs_pyarrow = EXPORT_FORMATS[export_format]
+    if needs_pyarrow and not PYARROW_AVAILABLE:
+        raise HTTPException(status_code=501, detail=f"{export_format} export requires pyarrow")
+    
+    columns = list(Play.__table__.columns)
+    statement = _filter_plays(select(*columns), game_id, season, play_type, posteam).order_by(
+        Play.game_id, Play.play_id
+    )
+    
+    # Run the query and encode the first chunk before committing to a 200
+    chunks = export_stream(db.get_bind(), statement, columns, export_format, chunk_size)
+    try:
+        first = next(chunks, b'')
+    except SQLAlchemyError as e:
+        logger.error(f"Database error in export_plays: {str(e)}")
+        raise HTTPException(status_code=500, detail="Database error")
+    
+    return StreamingResponse(
+        itertools.chain([first], chunks),
+        media_type=media_type,
+        headers={"Content-Disposition": f'attachment; filename="plays.{extension}"'}
+    )
+
+
+@router.get("/{play_id}", dependencies=[Depends(versioned('plays'))])
 async def get_play(
     play_id: str,
     db: Session = Depends(get_db_session)
@@ -151,7 +217,7 @@ async def get_play(
         raise HTTPException(status_code=500, detail="Internal server error")
 
 
-@router.get("/game/{game_id}")
+@router.get("/game/{game_id}", dependencies=[Depends(versioned('plays'))])
 async def get_game_plays(
     game_id: str,
     limit: int = Query(500, ge=1, le=1000, description="Number of plays to return"),
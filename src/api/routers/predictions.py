@@ -12,6 +12,9 @@ from ...analysis.models import NFLPredictor, Prediction
 from ...models.game import GameModel
 from ..dependencies import get_db_session
 from ..auth import authenticated
+from ...services.dependencies import prediction_service_dependency
+from ...services.prediction_service import PredictionService
+from ...services.base import NotFoundError
 
 logger = logging.getLogger(__name__)
 
@@ -228,6 +231,58 @@ async def predict_upcoming_games(
         raise HTTPException(status_code=500, detail=f"Failed to predict upcoming games: {str(e)}")
 
 
+@router.get("/simulate")
+def simulate_game(
+    home_team: str = Query(..., min_length=2, max_length=3, description="Home team abbreviation"),
+    away_team: str = Query(..., min_length=2, max_length=3, description="Away team abbreviation"),
+    season: int = Query(..., description="Season whose plays drive the simulation"),
+    n_simulations: int = Query(10000, ge=100, le=100000, description="Number of games to simulate"),
+    seed: int = Query(0, description="Random seed"),
+    service: PredictionService = Depends(prediction_service_dependency)
+):
+    """Simulate a matchup play by play and return outcome distributions.
+
+    A plain function so FastAPI runs the simulations in its threadpool.
+    """
+    try:
+        return service.simulate_game(home_team, away_team, season, n_simulations, seed)
+
+    except NotFoundError as e:
+        raise HTTPException(status_code=404, detail=str(e))
+    except Exception as e:
+        logger.error(f"Simulation failed: {str(e)}")
+        raise HTTPException(status_code=500, detail=f"Simulation failed: {str(e)}")
+
+
+@router.get("/simulate/week/{season}/{week}")
+def simulate_week(
+    season: int,
+    week: int,
+    n_simulations: int = Query(10000, ge=100, le=100000, description="Number of games to simulate per matchup"),
+    seed: int = Query(0, description="Random seed"),
+    service: PredictionService = Depends(prediction_service_dependency)
+):
+    """Simulate every game of a week and return outcome distributions.
+
+    A plain function so FastAPI runs the simulations in its threadpool.
+    """
+    try:
+        simulations = service.simulate_week(season, week, n_simulations, seed)
+
+        return {
+            "message": f"Simulated {len(simulations)} games for {season} week {week}",
+            "simulations": simulations,
+            "total_games": len(simulations),
+            "n_simulations": n_simulations
+        }
+
+    except NotFoundError as e:
+        raise HTTPException(status_code=404, detail=str(e))
+    except Exception as e:
+        logger.error(f"Week simulation failed: {str(e)}")
+        raise HTTPException(status_code=500, detail=f"Week simulation failed: {str(e)}")
+
+
 @router.get("/model/status")
 async def get_model_status(predictor: NFLPredictor = Depends(get_predictor)):
     """Get current model status and performance metrics."""
@@ -3,13 +3,16 @@
 from typing import List, Optional
 from fastapi import APIRouter, Depends, HTTPException, Request, Query
 from sqlalchemy.orm import Session
+from sqlalchemy.exc import SQLAlchemyError
 import logging
 from pydantic import BaseModel, Field
 
-from ...models.team import TeamResponse
+from ...data.data_versions import bump_data_versions
+from ...models.team import TeamModel as Team, TeamResponse
 from ...services.dependencies import team_service_dependency
 from ...services.team_service import TeamService
 from ...services.base import NotFoundError, DatabaseError, ServiceException
+from ..caching import versioned
 from ..dependencies import get_db_session
 
 logger = logging.getLogger(__name__)
@@ -25,7 +28,7 @@ class TeamList(BaseModel):
     offset: int = Field(..., description="Number of teams skipped")
 
 
-@router.get("/", response_model=TeamList)
+@router.get("/", response_model=TeamList, dependencies=[Depends(versioned('teams'))])
 async def get_teams(
     request: Request,
     limit: int = Query(32, ge=1, le=100, description="Number of teams to return"),
@@ -55,7 +58,71 @@ async def get_teams(
         raise HTTPException(status_code=500, detail="Internal server error")
 
 
-@router.get("/{team_abbr}", response_model=TeamResponse)
+def _standings_response(standings: list) -> list:
+    """Convert team objects in standings rows to response models."""
+    for row in standings:
+        row["team"] = TeamResponse.model_validate(row["team"]) if row["team"] else None
+    return standings
+
+
+@router.get("/standings/{conference}", dependencies=[Depends(versioned('teams', 'games'))])
+async def get_conference_standings(
+    conference: str,
+    season: Optional[int] = Query(None, description="Season year"),
+    as_of_week: Optional[int] = Query(None, ge=1, le=22, description="Standings as of this week"),
+    db: Session = Depends(get_db_session)
+):
+    """Get conference standings in playoff seeding order."""
+    try:
+        team_service = TeamService(db)
+        standings = team_service.get_conference_standings(conference, season, as_of_week)
+
+        return {
+            "conference": conference.upper(),
+            "season": season,
+            "as_of_week": as_of_week,
+            "standings": _standings_response(standings)
+        }
+
+    except DatabaseError as e:
+        logger.error(f"Database error in get_conference_standings: {str(e)}")
+        raise HTTPException(status_code=500, detail="Database error")
+    except Exception as e:
+        logger.error(f"Unexpected error in get_conference_standings: {str(e)}")
+        raise HTTPException(status_code=500, detail="Internal server error")
+
+
+@router.get("/standings/{conference}/{division}",
+            dependencies=[Depends(versioned('teams', 'games'))])
+async def get_division_standings(
+    conference: str,
+    division: str,
+    season: Optional[int] = Query(None, description="Season year"),
+    as_of_week: Optional[int] = Query(None, ge=1, le=22, description="Standings as of this week"),
+    db: Session = Depends(get_db_session)
+):
+    """Get division standings in tiebreaker order."""
+    try:
+        team_service = TeamService(db)
+        standings = team_service.get_division_standings(conference, division, season, as_of_week)
+
+        return {
+            "conference": conference.upper(),
+            "division": division.title(),
+            "season": season,
+            "as_of_week": as_of_week,
+            "standings": _standings_response(standings)
+        }
+
+    except DatabaseError as e:
+        logger.error(f"Database error in get_division_standings: {str(e)}")
+        raise HTTPException(status_code=500, detail="Database error")
+    except Exception as e:
+        logger.error(f"Unexpected error in get_division_standings: {str(e)}")
+        raise HTTPException(status_code=500, detail="Internal server error")
+
+
+@router.get("/{team_abbr}", response_model=TeamResponse, dependencies=[Depends(versioned('teams'))])
 async def get_team(
     team_abbr: str,
     db: Session = Depends(get_db_session)
@@ -77,16 +144,17 @@ async def get_team(
         raise HTTPException(status_code=500, detail="Internal server error")
 
 
-@router.get("/{team_abbr}/stats")
+@router.get("/{team_abbr}/stats", dependencies=[Depends(versioned('teams', 'games'))])
 async def get_team_stats(
     team_abbr: str,
     season: Optional[int] = Query(None, description="Season year"),
+    as_of_week: Optional[int] = Query(None, ge=1, le=22, description="Statistics as of this week"),
     db: Session = Depends(get_db_session)
 ):
     """Get team statistics for a specific season."""
     try:
         team_service = TeamService(db)
-        stats = team_service.get_team_stats(team_abbr, season)
+        stats = team_service.get_team_stats(team_abbr, season, as_of_week)
         
         # Convert team object to response model
         stats["team"] = TeamResponse.model_validate(stats["team"])
@@ -134,6 +202,8 @@ async def update_team(
             if hasattr(team, field):
                 setattr(team, field, value)
         
+        # Cached team and standings responses are validated against this version
+        bump_data_versions(db, 'teams')
         db.commit()
         db.refresh(team)
         
@@ -166,6 +236,7 @@ async def delete_team(
         
         team_abbr = team.team_abbr
         db.delete(team)
+        bump_data_versions(db, 'teams')
         db.commit()
         
         logger.info(f"Deleted team {team_abbr} (ID: {team_id})")
@@ -3,6 +3,7 @@
 from .nfl_data_client import NFLDataClient, DataFetchConfig
 from .data_loader import DataLoader, DataLoadResult
 from .data_mapper import DataMapper
+from .load_pipeline import PlayLoadPipeline
 from .validators import (
     ValidationResult, ValidationSeverity, ValidationIssue,
     TeamDataValidator, PlayerDataValidator, GameDataValidator, PlayDataValidator
@@ -19,6 +20,7 @@ __all__ = [
     'DataLoader',
     'DataLoadResult',
     'DataMapper',
+    'PlayLoadPipeline',
     
     # Validation
     'ValidationResult',
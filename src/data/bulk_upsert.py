@@ -0,0 +1,228 @@
+"""Set-based insert-or-update of loaded records.
+
+One batch of rows is written with a handful of statements regardless of its
+size instead of one existence query plus an ORM flush per record:
+
+- PostgreSQL: the batch is streamed into a temporary table with ``COPY`` and
+  merged with ``INSERT ... SELECT ... ON CONFLICT DO UPDATE``.
+- SQLite: ``INSERT ... ON CONFLICT DO UPDATE`` executed once for all rows
+  (``executemany``).
+- Other databases: existing keys are looked up in one query, then new rows
+  are inserted and existing ones updated with ``executemany``.
+
+Only the columns present in the rows are written on update, so columns the
+source does not provide keep their stored values. When the rows carry a
+``row_hash`` (see ``DataMapper``), stored rows with the same hash are left
+untouched and counted as unchanged.
+"""
+
+import io
+import logging
+from dataclasses import dataclass, field
+from datetime import date, datetime, time
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Sequence, Set, Tuple
+
+from sqlalchemy import and_, bindparam, insert, literal, literal_column, or_, select, text, update
+from sqlalchemy.orm import Session
+
+logger = logging.getLogger(__name__)
+
+# Columns managed here rather than taken from the source rows
+_MANAGED_COLUMNS = ('id', 'created_at', 'updated_at', 'is_active')
+
+# Keys per existence query; stays below SQLite's bound-parameter limit
+KEY_LOOKUP_CHUNK = 500
+
+
+# Column holding each row's content hash
+HASH_COLUMN = 'row_hash'
+
+
+@dataclass
+class UpsertResult:
+    """Rows inserted, updated and left unchanged by one upsert, plus in-batch duplicates dropped."""
+    inserted: int = 0
+    updated: int = 0
+    duplicates: int = 0
+    unchanged: int = 0
+    # Keys of the rows that were already stored with the same hash
+    unchanged_keys: Set[Tuple] = field(default_factory=set)
+
+
+def bulk_upsert(session: Session, model, rows: Iterable[Mapping[str, Any]],
+                key_columns: Sequence[str]) -> UpsertResult:
+    """Insert rows, updating those whose key already exists.
+
+    Runs in the session's transaction; the caller commits.
+
+    Args:
+        session: Database session
+        model: ORM model class of the target table
+        rows: Column-name to value mappings (unknown names are ignored)
+        key_columns: Columns of the unique constraint that identifies a row
+
+    Returns:
+        UpsertResult with insert, update and unchanged counts. When a key
+        occurs more than once in ``rows`` the last occurrence wins and the
+        others are counted as duplicates.
+    """
+    table = model.__table__
+    unique: Dict[Tuple, Mapping[str, Any]] = {}
+    total = 0
+    for row in rows:
+        unique[tuple(row[column] for column in key_columns)] = row
+        total += 1
+    result = UpsertResult(duplicates=total - len(unique))
+    if not unique:
+        return result
+
+    first = next(iter(unique.values()))
+    columns = [name for name in table.c.keys() if name in first and name not in _MANAGED_COLUMNS]
+    now = datetime.utcnow()
+    params = [{column: row.get(column) for column in columns} for row in unique.values()]
+
+    hashed = HASH_COLUMN in columns
+
+    dialect = session.get_bind().dialect.name
+    if dialect == 'postgresql':
+        written = _upsert_postgresql(session, table, columns, key_columns, params, now, hashed)
+        result.inserted = sum(1 for was_inserted in written.values() if was_inserted)
+        result.updated = len(written) - result.inserted
+        result.unchanged_keys = set(unique) - set(written)
+    else:
+        existing = _existing_hashes(session, table, key_columns, list(unique), hashed)
+        if hashed:
+            result.unchanged_keys = {
+                key for key, row in unique.items()
+                if row[HASH_COLUMN] is not None and existing.get(key, None) == row[HASH_COLUMN]
+            }
+            params = [row for key, row in zip(unique, params) if key not in result.unchanged_keys]
+        if params and dialect == 'sqlite':
+            _upsert_sqlite(session, table, columns, key_columns, params, now)
+        elif params:
+            _upsert_generic(session, table, columns, key_columns, params, set(existing), now)
+        result.inserted = len(unique) - len(existing)
+        result.updated = len(existing) - len(result.unchanged_keys)
+
+    result.unchanged = len(result.unchanged_keys)
+    logger.debug(f"Upserted {len(unique)} rows into {table.name}: {result.inserted} inserted, "
+                 f"{result.updated} updated, {result.unchanged} unchanged")
+    return result
+
+
+def _existing_hashes(session: Session, table, key_columns: Sequence[str], keys: List[Tuple],
+                     hashed: bool) -> Dict[Tuple, Optional[int]]:
+    """Stored row hash (None when not ``hashed``) of each key among ``keys`` that is already stored.
+
+    Looked up by the leading key column.
+    """
+    lead = table.c[key_columns[0]]
+    wanted = set(keys)
+    leads = sorted({key[0] for key in keys})
+    selected = [table.c[column] for column in key_columns]
+    if hashed:
+        selected.append(table.c[HASH_COLUMN])
+    existing = {}
+    for start in range(0, len(leads), KEY_LOOKUP_CHUNK):
+        chunk = leads[start:start + KEY_LOOKUP_CHUNK]
+        for row in session.execute(select(*selected).where(lead.in_(chunk))):
+            key = tuple(row[:len(key_columns)])
+            if key in wanted:
+                existing[key] = row[len(key_columns)] if hashed else None
+    return existing
+
+
+def _upsert_sqlite(session: Session, table, columns: List[str], key_columns: Sequence[str],
+                   params: List[Dict[str, Any]], now: datetime) -> None:
+    from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+
+    statement = sqlite_insert(table)
+    updates = {column: statement.excluded[column] for column in columns if column not in key_columns}
+    updates['updated_at'] = statement.excluded.updated_at
+    statement = statement.on_conflict_do_update(index_elements=list(key_columns), set_=updates)
+    session.execute(statement, [dict(row, created_at=now, updated_at=now) for row in params])
+
+
+def _upsert_generic(session: Session, table, columns: List[str], key_columns: Sequence[str],
+                    params: List[Dict[str, Any]], existing: Set[Tuple], now: datetime) -> None:
+    new_rows, changed_rows = [], []
+    for row in params:
+        key = tuple(row[column] for column in key_columns)
+        (changed_rows if key in existing else new_rows).append(row)
+
+    if new_rows:
+        session.execute(insert(table), [dict(row, created_at=now, updated_at=now) for row in new_rows])
+    if changed_rows:
+        statement = update(table).where(
+            and_(*(table.c[column] == bindparam(f'key_{column}') for column in key_columns))
+        ).values({**{column: bindparam(column) for column in columns if column not in key_columns},
+                  'updated_at': now})
+        session.execute(statement, [
+            dict(row, **{f'key_{column}': row[column] for column in key_columns}) for row in changed_rows
+        ])
+
+
+def _upsert_postgresql(session: Session, table, columns: List[str], key_columns: Sequence[str],
+                       params: List[Dict[str, Any]], now: datetime, hashed: bool) -> Dict[Tuple, bool]:
+    """COPY rows into a temporary table and merge them.
+
+    Returns:
+        Whether each written key was inserted (True) or updated (False);
+        rows whose stored hash matched are not written and not returned
+    """
+    from sqlalchemy.dialects.postgresql import insert as pg_insert
+
+    staging = f"upsert_{table.name}"
+    column_list = ', '.join(f'"{column}"' for column in columns)
+    session.execute(text(f'DROP TABLE IF EXISTS "{staging}"'))
+    session.execute(text(
+        f'CREATE TEMPORARY TABLE "{staging}" ON COMMIT DROP AS '
+        f'SELECT {column_list} FROM "{table.name}" WITH NO DATA'
+    ))
+    _copy_rows(session, staging, columns, params)
+
+    source = select(*(literal_column(f'"{column}"') for column in columns),
+                    literal(now).label('created_at'), literal(now).label('updated_at'),
+                    literal(True).label('is_active')).select_from(text(f'"{staging}"'))
+    statement = pg_insert(table).from_select([*columns, 'created_at', 'updated_at', 'is_active'], source)
+    updates = {column: statement.excluded[column] for column in columns if column not in key_columns}
+    updates['updated_at'] = statement.excluded.updated_at
+    # Rows without a hash are always rewritten, as on the other dialects
+    where = or_(statement.excluded[HASH_COLUMN].is_(None),
+                table.c[HASH_COLUMN].is_distinct_from(statement.excluded[HASH_COLUMN])) if hashed else None
+    statement = statement.on_conflict_do_update(index_elements=list(key_columns), set_=updates, where=where)
+    # xmax is zero only for tuples this statement inserted
+    statement = statement.returning(*(table.c[column] for column in key_columns), literal_column('(xmax = 0)'))
+
+    written = {tuple(row[:-1]): row[-1] for row in session.execute(statement)}
+    session.execute(text(f'DROP TABLE "{staging}"'))
+    return written
+
+
+def _copy_rows(session: Session, staging: str, columns: List[str], params: List[Dict[str, Any]]) -> None:
+    """Stream rows into the staging table with COPY ... FROM STDIN (CSV)."""
+    buffer = io.StringIO()
+    for row in params:
+        buffer.write(','.join(_csv_value(row[column]) for column in columns))
+        buffer.write('\n')
+    buffer.seek(0)
+
+    column_list = ', '.join(f'"{column}"' for column in columns)
+    cursor = session.connection().connection.cursor()
+    try:
+        cursor.copy_expert(f'COPY "{staging}" ({column_list}) FROM STDIN WITH (FORMAT csv)', buffer)
+    finally:
+        cursor.close()
+
+
+def _csv_value(value: Any) -> str:
+    """CSV field for COPY: unquoted empty is NULL, strings are always quoted."""
+    if value is None:
+        return ''
+    if isinstance(value, bool):
+        return 't' if value else 'f'
+    if isinstance(value, (datetime, date, time)):
+        return value.isoformat()
+    if isinstance(value, str):
+        return '"' + value.replace('"', '""') + '"'
+    return str(value)
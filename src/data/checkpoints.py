@@ -0,0 +1,77 @@
+"""Checkpoints of batched play loads.
+
+Play loads write one (season, week) at a time in committed batches and record
+after each batch how many of the week's mapped rows are stored. A resumed load
+skips the rows a checkpoint covers, provided the week's source still has the
+hash it had when the checkpoint was written; otherwise the week starts over.
+"""
+
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, Optional, Tuple
+
+from sqlalchemy.orm import Session
+
+from src.models.load_checkpoint import LoadCheckpointModel
+from .bulk_upsert import bulk_upsert
+
+CHECKPOINT_KEY = ('dataset', 'season', 'week')
+
+
+@dataclass
+class PlayCheckpoint:
+    """Rows of one week stored once the batch it accompanies is committed."""
+    season: int
+    week: int
+    source_hash: str
+    batch_offset: int
+    total_rows: int
+
+
+def stored_checkpoints(session: Session, dataset: str,
+                       seasons: Iterable[int]) -> Dict[Tuple[int, int], LoadCheckpointModel]:
+    """Checkpoint of every recorded week of a dataset's seasons."""
+    checkpoints = session.query(LoadCheckpointModel).filter(
+        LoadCheckpointModel.dataset == dataset,
+        LoadCheckpointModel.season.in_(list(seasons))
+    ).all()
+    return {(checkpoint.season, checkpoint.week): checkpoint for checkpoint in checkpoints}
+
+
+def resume_offset(checkpoint: Optional[LoadCheckpointModel], source_hash: str) -> int:
+    """Rows of a week that are already stored, or 0 if its source changed since."""
+    if checkpoint is None or checkpoint.source_hash != source_hash:
+        return 0
+    return checkpoint.batch_offset
+
+
+def save_checkpoint(session: Session, dataset: str, checkpoint: PlayCheckpoint) -> None:
+    """Record a week's progress in the session's transaction; the caller commits."""
+    bulk_upsert(session, LoadCheckpointModel, [{
+        'dataset': dataset,
+        'season': checkpoint.season,
+        'week': checkpoint.week,
+        'source_hash': checkpoint.source_hash,
+        'batch_offset': checkpoint.batch_offset,
+        'total_rows': checkpoint.total_rows,
+        'completed': checkpoint.batch_offset >= checkpoint.total_rows,
+    }], CHECKPOINT_KEY)
+
+
+def load_progress(session: Session, dataset: str = 'plays') -> Dict[str, Any]:
+    """Summary of a dataset's checkpoints, listing the weeks left unfinished."""
+    checkpoints = session.query(LoadCheckpointModel).filter(
+        LoadCheckpointModel.dataset == dataset
+    ).order_by(LoadCheckpointModel.season, LoadCheckpointModel.week).all()
+    unfinished = [checkpoint for checkpoint in checkpoints if not checkpoint.completed]
+    return {
+        'weeks_completed': len(checkpoints) - len(unfinished),
+        'weeks_unfinished': len(unfinished),
+        'rows_stored': sum(checkpoint.batch_offset for checkpoint in checkpoints),
+        'unfinished': [{
+            'season': checkpoint.season,
+            'week': checkpoint.week,
+            'batch_offset': checkpoint.batch_offset,
+            'total_rows': checkpoint.total_rows,
+            'updated_at': checkpoint.updated_at.isoformat() if checkpoint.updated_at else None,
+        } for checkpoint in unfinished],
+    }
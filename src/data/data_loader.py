@@ -1,21 +1,48 @@
 """Data loading service that orchestrates fetching and storing NFL data."""
 
 import logging
-from typing import List, Optional, Dict, Any, Tuple
+from typing import List, Optional, Dict, Any, Iterable, Iterator, Set, Tuple
 from datetime import datetime, date
+import pandas as pd
 from sqlalchemy.orm import Session
-from sqlalchemy.exc import IntegrityError
 from src.database.manager import DatabaseManager
 from src.database.config import get_db_session
 from src.models.team import TeamModel, TeamCreate
 from src.models.player import PlayerModel, PlayerCreate
 from src.models.game import GameModel, GameCreate
 from src.models.play import PlayModel, PlayCreate
+from src.analysis.insights import InsightsGenerator
+from src.analysis.player_aggregates import PlayerStatsAggregator
+from src.analysis.weekly_snapshots import WeeklySnapshotBuilder
 from .nfl_data_client import NFLDataClient, DataFetchConfig
-from .data_mapper import DataMapper
+from .data_mapper import DataMapper, row_hashes
+from .data_versions import bump_data_versions
+from .bulk_upsert import HASH_COLUMN, KEY_LOOKUP_CHUNK, bulk_upsert
+from .watermarks import (
+    ChunkedWeekFingerprints, WeekFingerprint, changed_weeks, record_watermarks, stored_hashes, week_fingerprints
+)
+from .checkpoints import PlayCheckpoint, load_progress, resume_offset, save_checkpoint, stored_checkpoints
 
 logger = logging.getLogger(__name__)
 
+# Natural key of each loaded table (its unique constraint)
+UPSERT_KEYS = {
+    TeamModel: ('team_abbr',),
+    PlayerModel: ('player_id',),
+    GameModel: ('game_id',),
+    PlayModel: ('game_id', 'play_id'),
+}
+
+# Play columns referencing players.player_id
+PLAY_PLAYER_COLUMNS = ('passer_player_id', 'receiver_player_id', 'rusher_player_id')
+
+# Loads whose rows plays reference and cannot be stored without
+REFERENCE_DATASETS = ('teams', 'games')
+
+
+class ReferenceDataError(Exception):
+    """Teams or games failed to load, so plays referencing them cannot be written."""
+
 
 class DataLoadResult:
     """Result of a data loading operation."""
@@ -26,9 +53,12 @@ class DataLoadResult:
         self.records_inserted = 0
         self.records_updated = 0
         self.records_skipped = 0
+        self.records_unchanged = 0
         self.errors: List[str] = []
         self.start_time: Optional[datetime] = None
         self.end_time: Optional[datetime] = None
+        # Per-stage throughput of pipelined loads, keyed by stage name
+        self.stage_metrics: Dict[str, Dict[str, Any]] = {}
     
     @property
     def duration(self) -> Optional[float]:
@@ -45,11 +75,13 @@ class DataLoadResult:
             'records_inserted': self.records_inserted,
             'records_updated': self.records_updated,
             'records_skipped': self.records_skipped,
+            'records_unchanged': self.records_unchanged,
             'error_count': len(self.errors),
             'errors': self.errors[:10],  # Limit errors shown
             'duration_seconds': self.duration,
             'start_time': self.start_time.isoformat() if self.start_time else None,
-            'end_time': self.end_time.isoformat() if self.end_time else None
+            'end_time': self.end_time.isoformat() if self.end_time else None,
+            'stage_metrics': self.stage_metrics
         }
 
 
@@ -98,34 +130,14 @@ class DataLoader:
             # Load into database
             session = self.db_manager.get_session()
             try:
-                for team_create in team_creates:
-                    try:
-                        # Check if team exists
-                        existing_team = session.query(TeamModel).filter(
-                            TeamModel.team_abbr == team_create.team_abbr
-                        ).first()
-                        
-                        if existing_team:
-                            # Update existing team
-                            for field, value in team_create.model_dump(exclude_unset=True).items():
-                                setattr(existing_team, field, value)
-                            result.records_updated += 1
-                        else:
-                            # Create new team
-                            team_model = TeamModel(**team_create.model_dump())
-                            session.add(team_model)
-                            result.records_inserted += 1
-                        
-                    except Exception as e:
-                        logger.warning(f"Failed to process team {team_create.team_abbr}: {e}")
-                        result.errors.append(str(e))
-                        result.records_skipped += 1
-                        continue
-                
+                self._upsert_records(session, TeamModel, team_creates, result)
+                if result.records_inserted or result.records_updated:
+                    bump_data_versions(session, 'teams')
                 session.commit()
                 result.success = True
                 logger.info(f"Teams load completed: {result.records_inserted} inserted, "
-                          f"{result.records_updated} updated, {result.records_skipped} skipped")
+                          f"{result.records_updated} updated, {result.records_unchanged} unchanged, "
+                          f"{result.records_skipped} skipped")
                 
             except Exception as e:
                 session.rollback()
@@ -172,40 +184,14 @@ class DataLoader:
             # Load into database
             session = self.db_manager.get_session()
             try:
-                for player_create in player_creates:
-                    try:
-                        # Check if player exists
-                        existing_player = session.query(PlayerModel).filter(
-                            PlayerModel.player_id == player_create.player_id
-                        ).first()
-                        
-                        if existing_player:
-                            # Update existing player
-                            for field, value in player_create.model_dump(exclude_unset=True).items():
-                                setattr(existing_player, field, value)
-                            result.records_updated += 1
-                        else:
-                            # Create new player
-                            player_model = PlayerModel(**player_create.model_dump())
-                            session.add(player_model)
-                            result.records_inserted += 1
-                        
-                    except IntegrityError as e:
-                        session.rollback()
-                        logger.warning(f"Integrity error for player {player_create.player_id}: {e}")
-                        result.errors.append(str(e))
-                        result.records_skipped += 1
-                        continue
-                    except Exception as e:
-                        logger.warning(f"Failed to process player {player_create.player_id}: {e}")
-                        result.errors.append(str(e))
-                        result.records_skipped += 1
-                        continue
-                
+                self._upsert_records(session, PlayerModel, player_creates, result)
+                if result.records_inserted or result.records_updated:
+                    bump_data_versions(session, 'players')
                 session.commit()
                 result.success = True
                 logger.info(f"Players load completed: {result.records_inserted} inserted, "
-                          f"{result.records_updated} updated, {result.records_skipped} skipped")
+                          f"{result.records_updated} updated, {result.records_unchanged} unchanged, "
+                          f"{result.records_skipped} skipped")
                 
             except Exception as e:
                 session.rollback()
@@ -245,53 +231,13 @@ class DataLoader:
                 result.success = True
                 return result
             
-            # Map to our models
-            game_creates = self.data_mapper.map_games_data(games_df)
-            result.records_processed = len(game_creates)
-            
-            # Load into database
-            session = self.db_manager.get_session()
-            try:
-                for game_create in game_creates:
-                    try:
-                        # Check if game exists
-                        existing_game = session.query(GameModel).filter(
-                            GameModel.game_id == game_create.game_id
-                        ).first()
-                        
-                        if existing_game:
-                            # Update existing game
-                            for field, value in game_create.model_dump(exclude_unset=True).items():
-                                setattr(existing_game, field, value)
-                            result.records_updated += 1
-                        else:
-                            # Create new game
-                            game_model = GameModel(**game_create.model_dump())
-                            session.add(game_model)
-                            result.records_inserted += 1
-                        
-                    except IntegrityError as e:
-                        session.rollback()
-                        logger.warning(f"Integrity error for game {game_create.game_id}: {e}")
-                        result.errors.append(str(e))
-                        result.records_skipped += 1
-                        continue
-                    except Exception as e:
-                        logger.warning(f"Failed to process game {game_create.game_id}: {e}")
-                        result.errors.append(str(e))
-                        result.records_skipped += 1
-                        continue
-                
-                session.commit()
-                result.success = True
-                logger.info(f"Games load completed: {result.records_inserted} inserted, "
-                          f"{result.records_updated} updated, {result.records_skipped} skipped")
-                
-            except Exception as e:
-                session.rollback()
-                raise
-            finally:
-                session.close()
+            self._store_games(games_df, result)
+            # Lets the next incremental refresh skip the weeks loaded here
+            self._record_watermarks('games', week_fingerprints(games_df, date_column='gameday').values())
+            result.success = True
+            logger.info(f"Games load completed: {result.records_inserted} inserted, "
+                      f"{result.records_updated} updated, {result.records_unchanged} unchanged, "
+                      f"{result.records_skipped} skipped")
                 
         except Exception as e:
             logger.error(f"Games data load failed: {e}")
@@ -303,14 +249,145 @@ class DataLoader:
         
         return result
     
+    def _store_games(self, games_df: pd.DataFrame, result: DataLoadResult) -> None:
+        """Map fetched games and upsert them with their derived team weeks in one transaction."""
+        # Map to our models
+        game_creates = self.data_mapper.map_games_data(games_df)
+        result.records_processed += len(game_creates)
+        
+        # Load into database
+        session = self.db_manager.get_session()
+        try:
+            games = self._upsert_records(session, GameModel, game_creates, result)
+            self._refresh_derived_data(
+                session, set(), set(),
+                team_weeks={(game['season'], game.get('week')) for game in games}
+            )
+            if result.records_inserted or result.records_updated:
+                bump_data_versions(session, 'games', {game['season'] for game in games})
+            
+            session.commit()
+            
+        except Exception as e:
+            session.rollback()
+            raise
+        finally:
+            session.close()
+    
+    def _upsert_records(self, session: Session, model, records: List[Any],
+                        result: DataLoadResult) -> List[Dict[str, Any]]:
+        """Insert or update a batch of mapped records in one set-based upsert.
+        
+        Records that cannot be converted to rows are skipped and reported;
+        a database error fails the whole batch. Rows stored with the same
+        ``row_hash`` are not rewritten and are counted as unchanged; records
+        mapped without a hash (teams) are hashed here.
+        
+        Args:
+            session: Session holding the load's transaction
+            model: ORM model of the target table
+            records: Pydantic create models (or plain row dicts)
+            result: Load result whose counts are updated
+            
+        Returns:
+            The records written (inserted or updated) as row dicts
+        """
+        key_columns = UPSERT_KEYS[model]
+        rows = []
+        for record in records:
+            try:
+                rows.append(record if isinstance(record, dict) else record.model_dump())
+            except Exception as e:
+                logger.warning(f"Failed to process {model.__tablename__} record "
+                               f"{getattr(record, key_columns[-1], '?')}: {e}")
+                result.errors.append(str(e))
+                result.records_skipped += 1
+        
+        if rows and HASH_COLUMN in model.__table__.c and HASH_COLUMN not in rows[0]:
+            hashes = row_hashes({name: [row.get(name) for row in rows] for name in rows[0]})
+            rows = [dict(row, row_hash=int(row_hash)) for row, row_hash in zip(rows, hashes)]
+        
+        counts = bulk_upsert(session, model, rows, key_columns)
+        result.records_inserted += counts.inserted
+        result.records_updated += counts.updated
+        result.records_unchanged += counts.unchanged
+        result.records_skipped += counts.duplicates
+        if not counts.unchanged_keys:
+            return rows
+        return [row for row in rows
+                if tuple(row[column] for column in key_columns) not in counts.unchanged_keys]
+    
+    def _refresh_derived_data(self, session: Session, game_ids: Set[str],
+                              team_seasons: Set[Tuple[int, str]],
+                              player_weeks: Set[Tuple[int, int]] = frozenset(),
+                              team_weeks: Set[Tuple[int, int]] = frozenset()) -> None:
+        """Recompute data derived from loaded plays or games before it is committed.
+        
+        Each refresh runs in its own savepoint and failures are logged rather
+        than raised, so a derived-data problem never blocks the load.
+        
+        Args:
+            session: Session holding the uncommitted plays or games
+            game_ids: Games whose timelines, insights and player stats need rebuilding
+            team_seasons: (season, team) pairs whose insights need rebuilding
+            player_weeks: (season, week) pairs whose player week-to-date totals need rebuilding
+            team_weeks: (season, week) pairs whose team records and standings need rebuilding
+        """
+        # Sessions do not autoflush; make pending rows visible to the refresh queries
+        session.flush()
+        generator = InsightsGenerator(session)
+        snapshots = WeeklySnapshotBuilder(session)
+        refreshes = [
+            ('game insights', game_ids, generator.refresh_game_insights),
+            ('player stats', game_ids, PlayerStatsAggregator(session).refresh_games),
+            ('player weekly stats', player_weeks, snapshots.refresh_player_weeks),
+            ('team weekly stats', team_weeks, snapshots.refresh_team_weeks),
+            ('team season insights', team_seasons, generator.refresh_team_season_insights),
+        ]
+        
+        for name, keys, refresh in refreshes:
+            if not keys:
+                continue
+            try:
+                with session.begin_nested():
+                    refreshed = refresh(list(keys))
+                logger.debug(f"Refreshed {refreshed} {name}")
+            except Exception as e:
+                logger.warning(f"Failed to refresh {name}: {e}")
+    
     def load_plays(self, seasons: List[int], weeks: Optional[List[int]] = None,
-                  batch_size: int = 1000) -> DataLoadResult:
+                  batch_size: int = 1000, streaming: bool = False,
+                  memory_budget_mb: Optional[int] = None, all_columns: bool = False,
+                  resume: bool = False) -> DataLoadResult:
         """Load NFL plays data into the database.
         
+        By default all requested plays are fetched, then mapped and written
+        week by week. Each batch is committed together with a checkpoint of
+        how far its week got (see ``src.data.checkpoints``); with ``resume``
+        the rows a checkpoint covers are skipped, so a load that failed part
+        way continues where it stopped unless the week's source changed.
+        
+        In streaming mode the source is read in chunks that fit
+        ``memory_budget_mb`` and each chunk is mapped, validated and written
+        before the next is read, so memory use stays flat however many seasons
+        are loaded. Streamed loads are not checkpointed.
+        
+        A completed load records the watermark of every week it read, so the
+        next incremental refresh skips those weeks while their source is
+        unchanged (see ``refresh_changed_weeks``).
+        
+        Only the play-by-play columns the mapper reads are decoded unless
+        ``all_columns`` is set.
+        
         Args:
             seasons: List of seasons to load
             weeks: Optional list of weeks to load
             batch_size: Batch size for processing
+            streaming: Read, map and write the plays chunk by chunk
+            memory_budget_mb: Memory per streamed chunk (defaults to the
+                client's configured budget)
+            all_columns: Read every source column instead of the mapped ones
+            resume: Skip the rows earlier loads already committed
             
         Returns:
             DataLoadResult with operation details
@@ -319,72 +396,38 @@ class DataLoader:
         result.start_time = datetime.now()
         
         try:
-            logger.info(f"Starting plays data load for seasons: {seasons}, weeks: {weeks}")
-            
-            # Fetch plays data
-            plays_df = self.nfl_client.fetch_plays(seasons, weeks)
-            if plays_df.empty:
-                logger.warning("No plays data received")
-                result.success = True
-                return result
+            logger.info(f"Starting plays data load for seasons: {seasons}, weeks: {weeks}"
+                        f"{' (streaming)' if streaming else ''}")
+            columns = None if all_columns else self.data_mapper.play_columns
+            # Team seasons whose insights are rebuilt once the plays are written
+            affected_team_seasons: Set[Tuple[int, str]] = set()
             
-            # Map to our models in batches
-            play_batches = self.data_mapper.map_plays_data(plays_df, batch_size)
-            total_plays = sum(len(batch) for batch in play_batches)
-            result.records_processed = total_plays
-            
-            logger.info(f"Processing {total_plays} plays in {len(play_batches)} batches")
-            
-            # Load into database batch by batch
-            session = self.db_manager.get_session()
-            try:
-                for batch_num, play_batch in enumerate(play_batches):
-                    logger.info(f"Processing batch {batch_num + 1}/{len(play_batches)} "
-                              f"({len(play_batch)} plays)")
-                    
-                    for play_create in play_batch:
-                        try:
-                            # Check if play exists
-                            existing_play = session.query(PlayModel).filter(
-                                PlayModel.play_id == play_create.play_id
-                            ).first()
-                            
-                            if existing_play:
-                                # Update existing play
-                                for field, value in play_create.model_dump(exclude_unset=True).items():
-                                    setattr(existing_play, field, value)
-                                result.records_updated += 1
-                            else:
-                                # Create new play
-                                play_model = PlayModel(**play_create.model_dump())
-                                session.add(play_model)
-                                result.records_inserted += 1
-                            
-                        except IntegrityError as e:
-                            session.rollback()
-                            logger.warning(f"Integrity error for play {play_create.play_id}: {e}")
-                            result.errors.append(str(e))
-                            result.records_skipped += 1
-                            continue
-                        except Exception as e:
-                            logger.warning(f"Failed to process play {play_create.play_id}: {e}")
-                            result.errors.append(str(e))
-                            result.records_skipped += 1
-                            continue
-                    
-                    # Commit each batch
-                    session.commit()
-                    logger.info(f"Committed batch {batch_num + 1}")
+            if streaming:
+                if resume:
+                    raise ValueError("Streamed play loads are not checkpointed and cannot resume")
+                source_fingerprints = self._play_fingerprints(all_columns)
+                play_batches = ((play_batch, None) for play_batch in self._stream_play_batches(
+                    seasons, weeks, batch_size, memory_budget_mb, columns, result, source_fingerprints))
+            else:
+                # Fetch plays data
+                plays_df = self.nfl_client.fetch_plays(seasons, weeks, columns=columns)
+                if plays_df.empty:
+                    logger.warning("No plays data received")
+                    result.success = True
+                    return result
                 
-                result.success = True
-                logger.info(f"Plays load completed: {result.records_inserted} inserted, "
-                          f"{result.records_updated} updated, {result.records_skipped} skipped")
-                
-            except Exception as e:
-                session.rollback()
-                raise
-            finally:
-                session.close()
+                logger.info(f"Processing {len(plays_df)} source plays")
+                source_fingerprints = self._play_fingerprints(all_columns)
+                source_fingerprints.add(plays_df)
+                play_batches = self._checkpointed_play_batches(plays_df, source_fingerprints.result(), seasons,
+                                                               batch_size, resume, result, affected_team_seasons)
+            
+            self._store_play_batches(play_batches, result, affected_team_seasons)
+            self._record_watermarks('plays', source_fingerprints.result().values())
+            result.success = True
+            logger.info(f"Plays load completed: {result.records_inserted} inserted, "
+                      f"{result.records_updated} updated, {result.records_unchanged} unchanged, "
+                      f"{result.records_skipped} skipped")
                 
         except Exception as e:
             logger.error(f"Plays data load failed: {e}")
@@ -396,15 +439,198 @@ class DataLoader:
         
         return result
     
+    def _play_fingerprints(self, all_columns: bool) -> ChunkedWeekFingerprints:
+        """Week fingerprints for play source rows, over the mapped columns only.
+        
+        Incremental refreshes read just the mapped columns, so watermarks of
+        loads that read every column must hash the same subset.
+        """
+        return ChunkedWeekFingerprints(columns=self.data_mapper.play_columns if all_columns else None)
+    
+    def _checkpointed_play_batches(self, plays_df: pd.DataFrame,
+                                   fingerprints: Dict[Tuple[int, int], WeekFingerprint],
+                                   seasons: List[int], batch_size: int, resume: bool, result: DataLoadResult,
+                                   resumed_team_seasons: Set[Tuple[int, str]]
+                                   ) -> Iterator[Tuple[List[Dict[str, Any]], Optional[PlayCheckpoint]]]:
+        """Map plays week by week into batches, each with the checkpoint its commit reaches.
+        
+        Checkpoints carry the week's hash from ``fingerprints``. Frames without
+        season and week columns are mapped as one unit without checkpoints.
+        With ``resume`` the rows covered by a week's checkpoint are
+        skipped; they are not counted as processed, but their team seasons are
+        added to ``resumed_team_seasons``. The interrupted load committed those
+        rows without refreshing team-season insights, which happens only after
+        the last batch.
+        """
+        if not {'season', 'week'} <= set(plays_df.columns):
+            play_batches = self.data_mapper.map_plays_data(plays_df, batch_size)
+            result.records_processed += sum(len(batch) for batch in play_batches)
+            yield from ((play_batch, None) for play_batch in play_batches)
+            return
+        
+        stored = {}
+        if resume:
+            session = self.db_manager.get_session()
+            try:
+                stored = stored_checkpoints(session, 'plays', seasons)
+            finally:
+                session.close()
+        
+        for (season, week), week_df in plays_df.groupby(['season', 'week'], sort=True, dropna=False):
+            fingerprint = fingerprints.get((season, week)) if pd.notna(season) and pd.notna(week) else None
+            rows = [row for batch in self.data_mapper.map_plays_data(week_df, batch_size) for row in batch]
+            
+            offset = 0
+            if fingerprint is not None:
+                offset = min(resume_offset(stored.get((season, week)), fingerprint.content_hash), len(rows))
+                if offset:
+                    logger.info(f"Resuming {season} week {week} at play {offset} of {len(rows)}")
+                    resumed_team_seasons.update(_team_seasons(rows[:offset]))
+            result.records_processed += len(rows) - offset
+            
+            for start in range(offset, len(rows), batch_size):
+                play_batch = rows[start:start + batch_size]
+                checkpoint = None
+                if fingerprint is not None:
+                    checkpoint = PlayCheckpoint(fingerprint.season, fingerprint.week, fingerprint.content_hash,
+                                                start + len(play_batch), len(rows))
+                yield play_batch, checkpoint
+    
+    def _store_play_batches(self, play_batches: Iterable[Tuple[List[Dict[str, Any]], Optional[PlayCheckpoint]]],
+                            result: DataLoadResult,
+                            affected_team_seasons: Optional[Set[Tuple[int, str]]] = None) -> None:
+        """Write mapped play batches, committing each one with its checkpoint (if any).
+        
+        Team-season insights span batches, so they are refreshed once, with the
+        last batch, for every team season the batches touched plus any already
+        in ``affected_team_seasons``. If there is no batch to write, those team
+        seasons are refreshed on their own.
+        """
+        if affected_team_seasons is None:
+            affected_team_seasons = set()
+        
+        # Load into database batch by batch
+        session = self.db_manager.get_session()
+        try:
+            batch_num = -1
+            for batch_num, ((play_batch, checkpoint), is_last_batch) in enumerate(_with_last(play_batches)):
+                logger.info(f"Processing batch {batch_num + 1} ({len(play_batch)} plays)")
+                
+                self._write_play_batch(session, play_batch, result, affected_team_seasons,
+                                       refresh_team_seasons=is_last_batch)
+                if checkpoint is not None:
+                    save_checkpoint(session, 'plays', checkpoint)
+                
+                # Commit each batch
+                session.commit()
+                logger.info(f"Committed batch {batch_num + 1}")
+            
+            if batch_num < 0 and affected_team_seasons:
+                self._refresh_derived_data(session, set(), affected_team_seasons)
+                session.commit()
+            
+        except Exception as e:
+            session.rollback()
+            raise
+        finally:
+            session.close()
+    
+    def _write_play_batch(self, session: Session, play_batch: List[Dict[str, Any]], result: DataLoadResult,
+                          affected_team_seasons: Set[Tuple[int, str]],
+                          refresh_team_seasons: bool = False) -> None:
+        """Upsert one batch of plays and refresh what is derived from them; the caller commits.
+        
+        Args:
+            session: Session holding the load's transaction
+            play_batch: Mapped play rows
+            result: Load result whose counts are updated
+            affected_team_seasons: (season, team) pairs touched so far; this
+                batch's pairs are added
+            refresh_team_seasons: Also rebuild the insights of every pair in
+                ``affected_team_seasons`` (done once, with the last batch)
+        """
+        play_batch = self._without_unknown_players(session, play_batch)
+        plays = self._upsert_records(session, PlayModel, play_batch, result)
+        
+        # Keep derived tables in step with the plays they summarize
+        affected_team_seasons.update(_team_seasons(plays))
+        self._refresh_derived_data(
+            session,
+            {play['game_id'] for play in plays},
+            affected_team_seasons if refresh_team_seasons else set(),
+            player_weeks={(play['season'], play.get('week')) for play in plays}
+        )
+        bump_data_versions(session, 'plays', {play['season'] for play in plays})
+    
+    def _without_unknown_players(self, session: Session,
+                                 play_batch: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Play rows with player ids not in the players table cleared.
+        
+        Play-by-play names players the loaded rosters may not include, and the
+        player columns are foreign keys. Cleared row dicts lose their
+        ``row_hash`` so a later load, once the players exist, writes the ids.
+        """
+        referenced = {_field(play, column) for play in play_batch for column in PLAY_PLAYER_COLUMNS}
+        referenced.discard(None)
+        if not referenced:
+            return play_batch
+        
+        referenced = sorted(referenced)
+        known = set()
+        for start in range(0, len(referenced), KEY_LOOKUP_CHUNK):
+            chunk = referenced[start:start + KEY_LOOKUP_CHUNK]
+            known.update(player_id for (player_id,) in
+                         session.query(PlayerModel.player_id).filter(PlayerModel.player_id.in_(chunk)))
+        
+        plays = []
+        for play in play_batch:
+            cleared = {column: None for column in PLAY_PLAYER_COLUMNS
+                       if _field(play, column) is not None and _field(play, column) not in known}
+            if cleared and isinstance(play, dict):
+                play = dict(play, **cleared, **{HASH_COLUMN: None})
+            elif cleared:
+                play = play.model_copy(update=cleared)
+            plays.append(play)
+        return plays
+    
+    def _stream_play_batches(self, seasons: List[int], weeks: Optional[List[int]], batch_size: int,
+                             memory_budget_mb: Optional[int], columns: Optional[List[str]],
+                             result: DataLoadResult,
+                             fingerprints: ChunkedWeekFingerprints) -> Iterator[List[Dict[str, Any]]]:
+        """Map streamed play chunks into batches, reading the next chunk only when these are written.
+        
+        Each chunk is added to ``fingerprints`` as it is read.
+        """
+        for plays_df in self.nfl_client.iter_plays(seasons, weeks, memory_budget_mb, columns=columns):
+            fingerprints.add(plays_df)
+            play_batches = self.data_mapper.map_plays_data(plays_df, batch_size)
+            # Only the mapped rows are needed while this chunk is written
+            del plays_df
+            result.records_processed += sum(len(batch) for batch in play_batches)
+            
+            # Hand batches over one at a time so written ones can be freed
+            play_batches.reverse()
+            while play_batches:
+                yield play_batches.pop()
+    
     def load_full_dataset(self, seasons: List[int], 
                          include_plays: bool = True,
-                         weeks: Optional[List[int]] = None) -> Dict[str, DataLoadResult]:
+                         weeks: Optional[List[int]] = None,
+                         pipelined: bool = False,
+                         workers: Optional[int] = None) -> Dict[str, DataLoadResult]:
         """Load complete NFL dataset for specified seasons.
         
+        When ``pipelined`` the plays are loaded through ``PlayLoadPipeline``:
+        they are read and mapped while teams, games and players are written,
+        and their writes start as soon as those are committed.
+        
         Args:
             seasons: List of seasons to load
             include_plays: Whether to load play-by-play data
             weeks: Optional list of weeks to load (for plays)
+            pipelined: Overlap the plays' fetch and mapping with the other loads
+            workers: Mapping processes of the pipelined load (None for CPU
+                count, 1 to map in-process)
             
         Returns:
             Dictionary mapping data type to DataLoadResult
@@ -412,22 +638,43 @@ class DataLoader:
         logger.info(f"Starting full dataset load for seasons: {seasons}")
         results = {}
         
-        # Load teams first (required for foreign keys)
-        logger.info("Loading teams data...")
-        results['teams'] = self.load_teams()
-        
-        # Load games
-        logger.info("Loading games data...")
-        results['games'] = self.load_games(seasons)
-        
-        # Load players
-        logger.info("Loading players data...")
-        results['players'] = self.load_players(seasons)
+        def load_reference_data() -> None:
+            # Load teams first (required for foreign keys)
+            logger.info("Loading teams data...")
+            results['teams'] = self.load_teams()
+            
+            # Load games
+            logger.info("Loading games data...")
+            results['games'] = self.load_games(seasons)
+            
+            # Load players
+            logger.info("Loading players data...")
+            results['players'] = self.load_players(seasons)
+            
+            failed = [name for name in REFERENCE_DATASETS if not results[name].success]
+            if failed:
+                raise ReferenceDataError(f"Plays not loaded: {', '.join(failed)} load failed")
         
         # Load plays if requested
-        if include_plays:
-            logger.info("Loading plays data...")
-            results['plays'] = self.load_plays(seasons, weeks)
+        if include_plays and pipelined:
+            # Imported here: the pipeline module imports DataLoadResult from this one
+            from .load_pipeline import PlayLoadPipeline
+            
+            logger.info("Loading plays data (pipelined)...")
+            pipeline = PlayLoadPipeline(self, workers=workers)
+            # A reference data failure aborts the pipeline before any play is written
+            results['plays'] = pipeline.run(seasons, weeks, before_write=load_reference_data)
+        else:
+            try:
+                load_reference_data()
+                if include_plays:
+                    logger.info("Loading plays data...")
+                    results['plays'] = self.load_plays(seasons, weeks)
+            except ReferenceDataError as e:
+                logger.error(str(e))
+                if include_plays:
+                    results['plays'] = DataLoadResult()
+                    results['plays'].errors.append(str(e))
         
         # Summary
         total_inserted = sum(r.records_inserted for r in results.values())
@@ -439,6 +686,108 @@ class DataLoader:
         
         return results
     
+    def refresh_changed_weeks(self, seasons: List[int]) -> Dict[str, DataLoadResult]:
+        """Reload only the weeks whose source data changed since they were last loaded.
+        
+        The schedules of ``seasons`` are fetched and fingerprinted per week
+        against the ``load_watermarks`` table; only games of changed weeks are
+        written. Plays are fetched for completed weeks whose games changed or
+        whose plays were never loaded, and again only weeks whose play source
+        hash changed are written. Watermarks are recorded once a week's rows
+        are committed, so a failed refresh is simply retried by the next one.
+        
+        Args:
+            seasons: Seasons to refresh
+            
+        Returns:
+            Dictionary with the 'games' and 'plays' DataLoadResult
+        """
+        logger.info(f"Starting incremental refresh for seasons: {seasons}")
+        # Cached frames would hide the source changes this refresh looks for
+        self.nfl_client.clear_cache()
+        
+        games_result = DataLoadResult()
+        games_result.start_time = datetime.now()
+        play_weeks: Dict[int, List[int]] = {}
+        try:
+            games_df = self.nfl_client.fetch_games(seasons)
+            fingerprints = week_fingerprints(games_df, date_column='gameday')
+            session = self.db_manager.get_session()
+            try:
+                stored_games = stored_hashes(session, 'games', seasons)
+                stored_plays = stored_hashes(session, 'plays', seasons)
+            finally:
+                session.close()
+            
+            changed = changed_weeks(fingerprints, stored_games)
+            logger.info(f"{len(changed)} of {len(fingerprints)} schedule weeks changed")
+            if changed:
+                self._store_games(_in_weeks(games_df, changed), games_result)
+                self._record_watermarks('games', [fingerprints[key] for key in changed])
+            
+            # Plays exist only for weeks with finished games
+            finished = _in_weeks(games_df, list(fingerprints))
+            if 'home_score' in finished.columns:
+                finished = finished[finished['home_score'].notna()]
+            for season, week in sorted({(int(season), int(week))
+                                        for season, week in zip(finished['season'], finished['week'])}):
+                if (season, week) in changed or (season, week) not in stored_plays:
+                    play_weeks.setdefault(season, []).append(week)
+            games_result.success = True
+            
+        except Exception as e:
+            logger.error(f"Incremental games refresh failed: {e}")
+            games_result.errors.append(str(e))
+            games_result.success = False
+        finally:
+            games_result.end_time = datetime.now()
+        
+        plays_result = DataLoadResult()
+        plays_result.start_time = datetime.now()
+        try:
+            for season, weeks in play_weeks.items():
+                plays_df = self.nfl_client.fetch_plays([season], weeks, columns=self.data_mapper.play_columns)
+                fingerprints = week_fingerprints(plays_df)
+                session = self.db_manager.get_session()
+                try:
+                    changed = changed_weeks(fingerprints, stored_hashes(session, 'plays', [season]))
+                finally:
+                    session.close()
+                
+                logger.info(f"Season {season}: plays of weeks {[week for _, week in changed]} changed "
+                            f"out of {weeks} fetched")
+                if changed:
+                    play_batches = self.data_mapper.map_plays_data(_in_weeks(plays_df, changed))
+                    plays_result.records_processed += sum(len(batch) for batch in play_batches)
+                    self._store_play_batches(((play_batch, None) for play_batch in play_batches), plays_result)
+                    self._record_watermarks('plays', [fingerprints[key] for key in changed])
+            plays_result.success = True
+            
+        except Exception as e:
+            logger.error(f"Incremental plays refresh failed: {e}")
+            plays_result.errors.append(str(e))
+            plays_result.success = False
+        finally:
+            plays_result.end_time = datetime.now()
+        
+        logger.info(f"Incremental refresh completed: {games_result.records_processed} games and "
+                    f"{plays_result.records_processed} plays reloaded")
+        return {'games': games_result, 'plays': plays_result}
+    
+    def _record_watermarks(self, dataset: str, fingerprints) -> None:
+        fingerprints = list(fingerprints)
+        if not fingerprints:
+            return
+        session = self.db_manager.get_session()
+        try:
+            record_watermarks(session, dataset, fingerprints)
+            session.commit()
+        except Exception:
+            session.rollback()
+            raise
+        finally:
+            session.close()
+    
     def get_load_status(self) -> Dict[str, Any]:
         """Get current database load status.
         
@@ -468,6 +817,9 @@ class DataLoader:
                 seasons = session.query(GameModel.season).distinct().all()
                 status['available_seasons'] = sorted([s[0] for s in seasons])
                 
+                # Progress of checkpointed play loads
+                status['plays_load_progress'] = load_progress(session, 'plays')
+                
                 return status
                 
             finally:
@@ -475,4 +827,35 @@ class DataLoader:
                 
         except Exception as e:
             logger.error(f"Failed to get load status: {e}")
-            return {'error': str(e)}
\ No newline at end of file
+            return {'error': str(e)}
+
+
+def _with_last(items: Iterable) -> Iterator[Tuple[Any, bool]]:
+    """Yield each item with whether it is the last one, reading one item ahead."""
+    iterator = iter(items)
+    try:
+        current = next(iterator)
+    except StopIteration:
+        return
+    for following in iterator:
+        yield current, False
+        current = following
+    yield current, True
+
+
+def _field(record: Any, name: str) -> Any:
+    """A field of a mapped row dict or create model, None when unset."""
+    return record.get(name) if isinstance(record, dict) else getattr(record, name, None)
+
+
+def _team_seasons(plays: Iterable[Dict[str, Any]]) -> Set[Tuple[int, str]]:
+    """(season, team) pairs of the offenses and defenses in mapped play rows."""
+    return {(play['season'], play[side]) for play in plays for side in ('posteam', 'defteam') if play.get(side)}
+
+
+def _in_weeks(frame: pd.DataFrame, season_weeks: List[Tuple[int, int]]) -> pd.DataFrame:
+    """Rows of the given (season, week) pairs."""
+    if frame.empty:
+        return frame
+    keys = pd.MultiIndex.from_arrays([frame['season'], frame['week']])
+    return frame[keys.isin(season_weeks)]
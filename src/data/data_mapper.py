@@ -1,23 +1,33 @@
 """Data mapping utilities for converting nfl_data_py data to our models."""
 
 import logging
-from typing import Dict, Any, List, Optional, Union
-from datetime import datetime, date
+from typing import Callable, Dict, Any, List, Optional, Union
+from datetime import datetime
+import numpy as np
 import pandas as pd
 from decimal import Decimal
 from src.models.team import TeamCreate, NFL_TEAMS, get_team_division
-from src.models.player import PlayerCreate, parse_height_string
+from src.models.player import PlayerCreate
 from src.models.game import GameCreate
 from src.models.play import PlayCreate
 
 logger = logging.getLogger(__name__)
 
+# Mapped rows checked against their Pydantic model outside strict mode
+VALIDATION_SAMPLE_SIZE = 100
+
 
 class DataMapper:
     """Maps nfl_data_py data structures to our Pydantic models."""
     
-    def __init__(self):
-        """Initialize data mapper."""
+    def __init__(self, strict_validation: bool = False):
+        """Initialize data mapper.
+        
+        Args:
+            strict_validation: Validate every vectorized row with its Pydantic
+                model instead of a sample
+        """
+        self.strict_validation = strict_validation
         self._team_cache: Dict[str, Dict[str, Any]] = {}
         self._setup_team_cache()
     
@@ -86,529 +96,556 @@ class DataMapper:
         logger.info(f"Mapped {len(teams)} teams")
         return teams
     
-    def map_players_data(self, players_df: pd.DataFrame) -> List[PlayerCreate]:
-        """Map nfl_data_py players data to PlayerCreate models.
+    def map_players_data(self, players_df: pd.DataFrame) -> List[Dict[str, Any]]:
+        """Map nfl_data_py players data to player rows.
+        
+        Works column by column like ``map_plays_data``. Where several source
+        columns can hold a field (team, position, jersey number, ...) the
+        first one with a usable value wins; old team abbreviations are
+        normalized through ``TEAM_ABBR_NORMALIZATION``. Values outside a
+        field's range are left unset, and rows without an id and name or with
+        a malformed team code are dropped.
         
         Args:
             players_df: DataFrame from nfl.import_rosters()
             
         Returns:
-            List of PlayerCreate models
+            List of row dicts with every PlayerCreate field and its row_hash
         """
-        players = []
-        
-        for _, row in players_df.iterrows():
-            try:
-                # Use gsis_id as player_id (primary identifier)
-                player_id = str(row.get('gsis_id', '')).strip()
-                if not player_id:
-                    continue
-                
-                # Get display_name as full_name
-                full_name = str(row.get('display_name', '')).strip()
-                if not full_name:
-                    continue
-                
-                player_data = {
-                    'player_id': player_id,
-                    'full_name': full_name
-                }
-                
-                # Optional fields with validation
-                if 'gsis_id' in row and pd.notna(row['gsis_id']):
-                    player_data['gsis_id'] = str(row['gsis_id']).strip()
-                
-                # Improved team mapping with priority order
-                # Priority: roster team > merged team > fallback teams  
-                team_abbr = None
-                for team_col in ['team', 'team_roster', 'latest_team', 'team_player']:
-                    if team_col in row and pd.notna(row[team_col]):
-                        team_abbr = str(row[team_col]).strip().upper()
-                        break
-                
-                # Map old team abbreviations to current ones
-                team_mapping = {
-                    'LA': 'LAR',   # Los Angeles Rams
-                    'OAK': 'LV',   # Oakland Raiders -> Las Vegas Raiders  
-                    'SD': 'LAC',   # San Diego Chargers -> Los Angeles Chargers
-                    'STL': 'LAR'   # St. Louis Rams -> Los Angeles Rams
-                }
-                
-                if team_abbr and team_abbr != 'UNK' and team_abbr != 'NA':
-                    # Apply team mapping
-                    if team_abbr in team_mapping:
-                        team_abbr = team_mapping[team_abbr]
-                    player_data['team_abbr'] = team_abbr
-                
-                # Improved position mapping with priority order
-                # Priority: roster position > merged position > fallback positions
-                position = None
-                
-                # Try primary position sources first
-                for pos_col in ['position', 'position_roster']:
-                    if pos_col in row and pd.notna(row[pos_col]):
-                        position = str(row[pos_col]).strip().upper()
-                        break
-                
-                # Fallback to other position columns if needed
-                if not position:
-                    for pos_col in ['position_player', 'position_x', 'position_y', 'ngs_position']:
-                        if pos_col in row and pd.notna(row[pos_col]):
-                            position = str(row[pos_col]).strip().upper()
-                            break
-                
-                if position and position not in ['NA', 'NULL', '']:
-                    player_data['position'] = position
-                
-                # Improved jersey number mapping with priority order
-                for jersey_col in ['jersey_number', 'jersey_number_roster', 'jersey_number_player', 'jersey_number_x', 'jersey_number_y']:
-                    if jersey_col in row and pd.notna(row[jersey_col]):
-                        try:
-                            jersey = int(row[jersey_col])
-                            if 0 <= jersey <= 99:
-                                player_data['jersey_number'] = jersey
-                                break
-                        except (ValueError, TypeError):
-                            continue
-                
-                # Height handling
-                if 'height' in row and pd.notna(row['height']):
-                    height_str = str(row['height']).strip()
-                    height_inches = parse_height_string(height_str)
-                    if height_inches:
-                        player_data['height'] = height_inches
-                
-                # Weight handling
-                if 'weight' in row and pd.notna(row['weight']):
-                    try:
-                        weight = int(row['weight'])
-                        if 150 <= weight <= 400:
-                            player_data['weight'] = weight
-                    except (ValueError, TypeError):
-                        pass
-                
-                # Age handling
-                if 'age' in row and pd.notna(row['age']):
-                    try:
-                        age = int(row['age'])
-                        if 18 <= age <= 50:
-                            player_data['age'] = age
-                    except (ValueError, TypeError):
-                        pass
-                
-                # Rookie year - try different column names
-                for rookie_col in ['rookie_season', 'rookie_year']:
-                    if rookie_col in row and pd.notna(row[rookie_col]):
-                        try:
-                            rookie_year = int(row[rookie_col])
-                            if 1920 <= rookie_year <= datetime.now().year:
-                                player_data['rookie_year'] = rookie_year
-                                break
-                        except (ValueError, TypeError):
-                            continue
-                
-                # Draft information
-                if 'draft_year' in row and pd.notna(row['draft_year']):
-                    try:
-                        draft_year = int(row['draft_year'])
-                        if 1920 <= draft_year <= datetime.now().year:
-                            player_data['draft_year'] = draft_year
-                    except (ValueError, TypeError):
-                        pass
-                
-                if 'draft_round' in row and pd.notna(row['draft_round']):
-                    try:
-                        draft_round = int(row['draft_round'])
-                        if 1 <= draft_round <= 10:
-                            player_data['draft_round'] = draft_round
-                    except (ValueError, TypeError):
-                        pass
-                
-                if 'draft_pick' in row and pd.notna(row['draft_pick']):
-                    try:
-                        draft_pick = int(row['draft_pick'])
-                        if 1 <= draft_pick <= 300:
-                            player_data['draft_pick'] = draft_pick
-                    except (ValueError, TypeError):
-                        pass
-                
-                if 'draft_team' in row and pd.notna(row['draft_team']):
-                    draft_team = str(row['draft_team']).strip().upper()
-                    if draft_team and len(draft_team) <= 3:
-                        player_data['draft_team'] = draft_team
-                
-                # Headshot URL
-                if 'headshot' in row and pd.notna(row['headshot']):
-                    headshot = str(row['headshot']).strip()
-                    if headshot and headshot.startswith('http'):
-                        player_data['headshot_url'] = headshot
-                
-                # College - try different column names
-                for college_col in ['college_name', 'college']:
-                    if college_col in row and pd.notna(row[college_col]):
-                        player_data['college'] = str(row[college_col]).strip()
-                        break
-                
-                # Years of experience - try different column names
-                for years_col in ['years_of_experience', 'years_exp']:
-                    if years_col in row and pd.notna(row[years_col]):
-                        try:
-                            years_exp = int(row[years_col])
-                            if 0 <= years_exp <= 30:
-                                player_data['years_exp'] = years_exp
-                                break
-                        except (ValueError, TypeError):
-                            continue
-                
-                # Status
-                if 'status' in row and pd.notna(row['status']):
-                    status = str(row['status']).strip().lower()
-                    # Map from nfl_data_py status codes to our status values
-                    status_mapping = {
-                        'act': 'active',
-                        'active': 'active',
-                        'ina': 'injured', 
-                        'injured': 'injured',
-                        'res': 'retired',
-                        'retired': 'retired',
-                        'non': 'practice_squad',
-                        'practice_squad': 'practice_squad',
-                        'udf': 'suspended',
-                        'suspended': 'suspended'
-                    }
-                    if status in status_mapping:
-                        player_data['status'] = status_mapping[status]
-                
-                player = PlayerCreate(**player_data)
-                players.append(player)
-                
-            except Exception as e:
-                logger.warning(f"Failed to map player row: {e}")
-                continue
+        columns = _map_player_columns(players_df)
+        rows = self.validate_rows(_hashed_rows(columns), PlayerCreate, 'player') if columns else []
         
-        logger.info(f"Mapped {len(players)} players")
-        return players
+        logger.info(f"Mapped {len(rows)} players")
+        return rows
     
-    def map_games_data(self, games_df: pd.DataFrame) -> List[GameCreate]:
-        """Map nfl_data_py games data to GameCreate models.
+    def map_games_data(self, games_df: pd.DataFrame) -> List[Dict[str, Any]]:
+        """Map nfl_data_py games data to game rows.
+        
+        Works column by column like ``map_plays_data``. Rows missing an id,
+        season, season type, date or either team (or with values
+        ``GameCreate`` would reject) are dropped; optional values outside
+        their range are left unset.
         
         Args:
             games_df: DataFrame from nfl.import_schedules()
             
         Returns:
-            List of GameCreate models
+            List of row dicts with every GameCreate field and its row_hash
         """
-        games = []
+        columns = _map_game_columns(games_df)
+        rows = self.validate_rows(_hashed_rows(columns), GameCreate, 'game') if columns else []
         
-        for _, row in games_df.iterrows():
-            try:
-                game_id = str(row.get('game_id', '')).strip()
-                season = row.get('season')
-                # Column is 'game_type' not 'season_type' in nfl_data_py
-                season_type = str(row.get('game_type', '')).strip().upper()
-                game_date = row.get('gameday')
-                home_team = str(row.get('home_team', '')).strip().upper()
-                away_team = str(row.get('away_team', '')).strip().upper()
-                
-                # Validate required fields
-                if not all([game_id, season, season_type, game_date, home_team, away_team]):
-                    continue
-                
-                # Parse game date
-                if isinstance(game_date, str):
-                    try:
-                        game_date = datetime.strptime(game_date, '%Y-%m-%d').date()
-                    except ValueError:
-                        continue
-                elif isinstance(game_date, pd.Timestamp):
-                    game_date = game_date.date()
-                elif not isinstance(game_date, date):
-                    continue
-                
-                game_data = {
-                    'game_id': game_id,
-                    'season': int(season),
-                    'season_type': season_type,
-                    'game_date': game_date,
-                    'home_team': home_team,
-                    'away_team': away_team
-                }
-                
-                # Optional fields
-                if 'old_game_id' in row and pd.notna(row['old_game_id']):
-                    game_data['old_game_id'] = str(row['old_game_id']).strip()
-                
-                if 'week' in row and pd.notna(row['week']):
-                    try:
-                        week = int(row['week'])
-                        if 1 <= week <= 22:
-                            game_data['week'] = week
-                    except (ValueError, TypeError):
-                        pass
-                
-                # Kickoff time
-                if 'gametime' in row and pd.notna(row['gametime']):
-                    try:
-                        time_str = str(row['gametime']).strip()
-                        # Parse time (format might be "1:00PM" or "13:00")
-                        if ':' in time_str:
-                            game_data['kickoff_time'] = datetime.strptime(time_str, '%H:%M').time()
-                    except ValueError:
-                        pass
-                
-                # Scores
-                if 'home_score' in row and pd.notna(row['home_score']):
-                    try:
-                        home_score = int(row['home_score'])
-                        if 0 <= home_score <= 100:
-                            game_data['home_score'] = home_score
-                    except (ValueError, TypeError):
-                        pass
-                
-                if 'away_score' in row and pd.notna(row['away_score']):
-                    try:
-                        away_score = int(row['away_score'])
-                        if 0 <= away_score <= 100:
-                            game_data['away_score'] = away_score
-                    except (ValueError, TypeError):
-                        pass
-                
-                # Game conditions
-                if 'roof' in row and pd.notna(row['roof']):
-                    roof = str(row['roof']).strip().lower()
-                    if roof in ['dome', 'outdoors', 'closed', 'open', 'retractable']:
-                        game_data['roof'] = roof
-                
-                if 'surface' in row and pd.notna(row['surface']):
-                    surface = str(row['surface']).strip().lower()
-                    game_data['surface'] = surface
-                
-                if 'temp' in row and pd.notna(row['temp']):
-                    try:
-                        temp = int(row['temp'])
-                        if -20 <= temp <= 120:
-                            game_data['temp'] = temp
-                    except (ValueError, TypeError):
-                        pass
-                
-                if 'wind' in row and pd.notna(row['wind']):
-                    try:
-                        wind = int(row['wind'])
-                        if 0 <= wind <= 50:
-                            game_data['wind'] = wind
-                    except (ValueError, TypeError):
-                        pass
-                
-                # Betting lines
-                if 'spread_line' in row and pd.notna(row['spread_line']):
-                    try:
-                        spread = float(row['spread_line'])
-                        if -30.0 <= spread <= 30.0:
-                            game_data['home_spread'] = spread
-                    except (ValueError, TypeError):
-                        pass
-                
-                if 'total_line' in row and pd.notna(row['total_line']):
-                    try:
-                        total = float(row['total_line'])
-                        if 20.0 <= total <= 80.0:
-                            game_data['total_line'] = total
-                    except (ValueError, TypeError):
-                        pass
-                
-                # Game finished status
-                if 'home_score' in game_data and 'away_score' in game_data:
-                    game_data['game_finished'] = True
-                
-                game = GameCreate(**game_data)
-                games.append(game)
-                
-            except Exception as e:
-                logger.warning(f"Failed to map game row: {e}")
-                continue
+        logger.info(f"Mapped {len(rows)} games")
+        return rows
+    
+    @property
+    def play_columns(self) -> List[str]:
+        """Play-by-play source columns ``map_plays_data`` reads.
         
-        logger.info(f"Mapped {len(games)} games")
-        return games
+        Passed as the column projection when reading play-by-play files, which
+        carry several hundred columns of which only these are stored.
+        """
+        return list(PLAY_SOURCE_COLUMNS)
     
-    def map_plays_data(self, plays_df: pd.DataFrame, batch_size: int = 1000) -> List[List[PlayCreate]]:
-        """Map nfl_data_py plays data to PlayCreate models in batches.
+    def map_plays_data(self, plays_df: pd.DataFrame, batch_size: int = 1000) -> List[List[Dict[str, Any]]]:
+        """Map nfl_data_py plays data to play rows in batches.
+        
+        Works column by column: every field is cast, cleaned and range-checked
+        for the whole frame at once. Values outside a field's range are left
+        unset, and rows that would fail ``PlayCreate`` validation (missing
+        ids, season out of range, malformed team codes) are dropped. Rows are
+        checked against ``PlayCreate`` on a sample, or all of them in strict mode.
         
         Args:
             plays_df: DataFrame from nfl.import_pbp_data()
             batch_size: Size of each batch
             
         Returns:
-            List of batches, each containing PlayCreate models
+            List of batches, each a list of row dicts with every PlayCreate field and its row_hash
         """
-        batches = []
-        current_batch = []
+        rows = self.validate_rows(self.map_play_rows(plays_df), PlayCreate, 'play')
         
-        for i, row in plays_df.iterrows():
+        batches = [rows[start:start + batch_size] for start in range(0, len(rows), batch_size)]
+        logger.info(f"Mapped {len(rows)} plays into {len(batches)} batches")
+        return batches
+    
+    def map_play_rows(self, plays_df: pd.DataFrame) -> List[Dict[str, Any]]:
+        """Map nfl_data_py plays data to play rows without validating them.
+        
+        ``map_plays_data`` is this followed by ``validate_rows`` and batching;
+        the steps are separate so a pipelined load can time them on their own.
+        
+        Args:
+            plays_df: DataFrame from nfl.import_pbp_data()
+            
+        Returns:
+            List of row dicts with every PlayCreate field and its row_hash
+        """
+        columns = _map_play_columns(plays_df)
+        return _hashed_rows(columns) if columns is not None else []
+    
+    def validate_rows(self, rows: List[Dict[str, Any]], model, label: str) -> List[Dict[str, Any]]:
+        """Check mapped rows against their Pydantic model, dropping any that fail.
+        
+        Every row is checked in strict mode, otherwise an evenly spread sample.
+        """
+        if self.strict_validation:
+            indices = range(len(rows))
+        else:
+            indices = range(0, len(rows), max(1, len(rows) // VALIDATION_SAMPLE_SIZE))
+        
+        invalid = set()
+        for i in indices:
             try:
-                play_id = str(row.get('play_id', '')).strip()
-                game_id = str(row.get('game_id', '')).strip()
-                season = row.get('season')
-                
-                # Validate required fields
-                if not all([play_id, game_id, season]):
-                    continue
-                
-                play_data = {
-                    'play_id': play_id,
-                    'game_id': game_id,
-                    'season': int(season)
-                }
-                
-                # Optional fields with validation
-                if 'week' in row and pd.notna(row['week']):
-                    try:
-                        week = int(row['week'])
-                        if 1 <= week <= 22:
-                            play_data['week'] = week
-                    except (ValueError, TypeError):
-                        pass
-                
-                # Team fields
-                if 'posteam' in row and pd.notna(row['posteam']):
-                    posteam = str(row['posteam']).strip().upper()
-                    if posteam and posteam != 'NA':
-                        play_data['posteam'] = posteam
-                
-                if 'defteam' in row and pd.notna(row['defteam']):
-                    defteam = str(row['defteam']).strip().upper()
-                    if defteam and defteam != 'NA':
-                        play_data['defteam'] = defteam
-                
-                # Game situation fields
-                if 'qtr' in row and pd.notna(row['qtr']):
-                    try:
-                        qtr = int(row['qtr'])
-                        if 1 <= qtr <= 5:
-                            play_data['qtr'] = qtr
-                    except (ValueError, TypeError):
-                        pass
-                
-                if 'game_seconds_remaining' in row and pd.notna(row['game_seconds_remaining']):
-                    try:
-                        seconds = int(row['game_seconds_remaining'])
-                        if 0 <= seconds <= 3600:
-                            play_data['game_seconds_remaining'] = seconds
-                    except (ValueError, TypeError):
-                        pass
-                
-                if 'half_seconds_remaining' in row and pd.notna(row['half_seconds_remaining']):
-                    try:
-                        seconds = int(row['half_seconds_remaining'])
-                        if 0 <= seconds <= 1800:
-                            play_data['half_seconds_remaining'] = seconds
-                    except (ValueError, TypeError):
-                        pass
-                
-                if 'game_half' in row and pd.notna(row['game_half']):
-                    game_half = str(row['game_half']).strip().lower()
-                    if game_half in ['half1', 'half2', 'overtime']:
-                        play_data['game_half'] = game_half
-                
-                # Field position
-                if 'yardline_100' in row and pd.notna(row['yardline_100']):
-                    try:
-                        yardline = int(row['yardline_100'])
-                        if 1 <= yardline <= 99:
-                            play_data['yardline_100'] = yardline
-                    except (ValueError, TypeError):
-                        pass
-                
-                if 'ydstogo' in row and pd.notna(row['ydstogo']):
-                    try:
-                        ydstogo = int(row['ydstogo'])
-                        if 1 <= ydstogo <= 99:
-                            play_data['ydstogo'] = ydstogo
-                    except (ValueError, TypeError):
-                        pass
-                
-                if 'down' in row and pd.notna(row['down']):
-                    try:
-                        down = int(row['down'])
-                        if 1 <= down <= 4:
-                            play_data['down'] = down
-                    except (ValueError, TypeError):
-                        pass
-                
-                # Play details
-                if 'play_type' in row and pd.notna(row['play_type']):
-                    play_type = str(row['play_type']).strip().lower()
-                    if play_type:
-                        play_data['play_type'] = play_type
-                
-                if 'desc' in row and pd.notna(row['desc']):
-                    play_data['desc'] = str(row['desc']).strip()
-                
-                if 'yards_gained' in row and pd.notna(row['yards_gained']):
-                    try:
-                        yards = int(row['yards_gained'])
-                        if -99 <= yards <= 99:
-                            play_data['yards_gained'] = yards
-                    except (ValueError, TypeError):
-                        pass
-                
-                # Advanced metrics
-                if 'ep' in row and pd.notna(row['ep']):
-                    try:
-                        ep = float(row['ep'])
-                        if -10.0 <= ep <= 10.0:
-                            play_data['ep'] = ep
-                    except (ValueError, TypeError):
-                        pass
-                
-                if 'epa' in row and pd.notna(row['epa']):
-                    try:
-                        epa = float(row['epa'])
-                        if -15.0 <= epa <= 15.0:
-                            play_data['epa'] = epa
-                    except (ValueError, TypeError):
-                        pass
-                
-                if 'wp' in row and pd.notna(row['wp']):
-                    try:
-                        wp = float(row['wp'])
-                        if 0.0 <= wp <= 1.0:
-                            play_data['wp'] = wp
-                    except (ValueError, TypeError):
-                        pass
-                
-                if 'wpa' in row and pd.notna(row['wpa']):
-                    try:
-                        wpa = float(row['wpa'])
-                        if -1.0 <= wpa <= 1.0:
-                            play_data['wpa'] = wpa
-                    except (ValueError, TypeError):
-                        pass
-                
-                # Boolean flags
-                for flag in ['touchdown', 'pass_touchdown', 'rush_touchdown', 
-                           'interception', 'fumble', 'safety', 'penalty']:
-                    if flag in row and pd.notna(row[flag]):
-                        try:
-                            play_data[flag] = bool(row[flag])
-                        except (ValueError, TypeError):
-                            pass
-                
-                play = PlayCreate(**play_data)
-                current_batch.append(play)
-                
-                # Create batch when size reached
-                if len(current_batch) >= batch_size:
-                    batches.append(current_batch)
-                    current_batch = []
-                    
+                model(**rows[i])
             except Exception as e:
-                logger.warning(f"Failed to map play row {i}: {e}")
-                continue
-        
-        # Add remaining plays as final batch
-        if current_batch:
-            batches.append(current_batch)
+                logger.warning(f"Failed to map {label} row {i}: {e}")
+                invalid.add(i)
         
-        total_plays = sum(len(batch) for batch in batches)
-        logger.info(f"Mapped {total_plays} plays into {len(batches)} batches")
-        return batches
\ No newline at end of file
+        if not invalid:
+            return rows
+        return [row for i, row in enumerate(rows) if i not in invalid]
+
+
+# Play fields cast to int or float and kept only within these inclusive ranges
+_PLAY_INT_RANGES = {
+    'week': (1, 22),
+    'qtr': (1, 5),
+    'game_seconds_remaining': (0, 3600),
+    'half_seconds_remaining': (0, 1800),
+    'yardline_100': (1, 99),
+    'ydstogo': (1, 99),
+    'down': (1, 4),
+    'yards_gained': (-99, 99),
+    'air_yards': (-20, 80),
+}
+_PLAY_FLOAT_RANGES = {
+    'ep': (-10.0, 10.0),
+    'epa': (-15.0, 15.0),
+    'wp': (0.0, 1.0),
+    'wpa': (-1.0, 1.0),
+}
+_PLAY_FLAGS = ('touchdown', 'pass_touchdown', 'rush_touchdown', 'interception', 'fumble', 'safety', 'penalty',
+               'first_down')
+_GAME_HALVES = ('half1', 'half2', 'overtime')
+_PLAY_TEXT_COLUMNS = ('posteam', 'defteam', 'game_half', 'play_type', 'desc')
+_PLAY_PLAYER_COLUMNS = ('passer_player_id', 'receiver_player_id', 'rusher_player_id')
+
+# Every play-by-play column the plays mapping reads
+PLAY_SOURCE_COLUMNS = (
+    'play_id', 'game_id', 'season', *_PLAY_TEXT_COLUMNS, *_PLAY_PLAYER_COLUMNS,
+    *_PLAY_INT_RANGES, *_PLAY_FLOAT_RANGES, *_PLAY_FLAGS,
+)
+
+# Relocated franchises' former abbreviations and the ones players are stored under
+TEAM_ABBR_NORMALIZATION = {
+    'LA': 'LAR',   # Los Angeles Rams
+    'OAK': 'LV',   # Oakland Raiders -> Las Vegas Raiders
+    'SD': 'LAC',   # San Diego Chargers -> Los Angeles Chargers
+    'STL': 'LAR',  # St. Louis Rams -> Los Angeles Rams
+}
+
+# Roster columns holding each player field, in priority order
+_PLAYER_TEAM_COLUMNS = ('team', 'team_roster', 'latest_team', 'team_player')
+_PLAYER_POSITION_COLUMNS = ('position', 'position_roster')
+_PLAYER_FALLBACK_POSITION_COLUMNS = ('position_player', 'position_x', 'position_y', 'ngs_position')
+_PLAYER_JERSEY_COLUMNS = ('jersey_number', 'jersey_number_roster', 'jersey_number_player',
+                          'jersey_number_x', 'jersey_number_y')
+_PLAYER_ROOKIE_COLUMNS = ('rookie_season', 'rookie_year')
+_PLAYER_COLLEGE_COLUMNS = ('college_name', 'college')
+_PLAYER_EXPERIENCE_COLUMNS = ('years_of_experience', 'years_exp')
+
+# nfl_data_py roster status codes and our status values
+_PLAYER_STATUSES = {
+    'act': 'active',
+    'active': 'active',
+    'ina': 'injured',
+    'injured': 'injured',
+    'res': 'retired',
+    'retired': 'retired',
+    'non': 'practice_squad',
+    'practice_squad': 'practice_squad',
+    'udf': 'suspended',
+    'suspended': 'suspended',
+}
+
+# Game fields cast to int or float and kept only within these inclusive ranges,
+# keyed by source column with the GameCreate field they fill
+_GAME_INT_RANGES = {
+    'week': ('week', 1, 22),
+    'home_score': ('home_score', 0, 100),
+    'away_score': ('away_score', 0, 100),
+    'temp': ('temp', -20, 120),
+    'wind': ('wind', 0, 50),
+}
+_GAME_FLOAT_RANGES = {
+    'spread_line': ('home_spread', -30.0, 30.0),
+    'total_line': ('total_line', 20.0, 80.0),
+}
+_GAME_ROOFS = ('dome', 'outdoors', 'closed', 'open', 'retractable')
+_SEASON_TYPES = ('REG', 'POST', 'PRE')
+
+
+def _object_column(values: np.ndarray, mask: np.ndarray, default: Any = None) -> np.ndarray:
+    """Object column holding Python values where ``mask`` is set and ``default`` elsewhere."""
+    column = np.full(len(mask), default, dtype=object)
+    column[mask] = values[mask].tolist()
+    return column
+
+
+def row_hashes(columns: Dict[str, Any]) -> np.ndarray:
+    """Content hash of each row of equally long columns, as signed 64-bit integers.
+    
+    Hashed column-wise with ``pandas.util.hash_pandas_object``; the result does
+    not depend on column order. Loads store it in ``row_hash`` so rows whose
+    hash is unchanged are not rewritten.
+    """
+    frame = pd.DataFrame({name: columns[name] for name in sorted(columns)})
+    return pd.util.hash_pandas_object(frame, index=False).to_numpy().view(np.int64)
+
+
+def _hashed_rows(columns: Dict[str, np.ndarray]) -> List[Dict[str, Any]]:
+    """Row dicts from mapped columns, each with the ``row_hash`` of its values."""
+    columns['row_hash'] = row_hashes(columns).astype(object)
+    return _columns_to_rows(columns)
+
+
+def _columns_to_rows(columns: Dict[str, np.ndarray]) -> List[Dict[str, Any]]:
+    """Row dicts from equally long object columns."""
+    names = list(columns)
+    return [dict(zip(names, values)) for values in zip(*columns.values())]
+
+
+def _by_value(series: pd.Series, clean: Callable[[pd.Series], pd.Series]) -> pd.Series:
+    """Apply ``clean`` once per distinct value of ``series`` instead of once per row.
+    
+    Text columns such as teams, positions and heights repeat a handful of
+    values across thousands of rows, so string work on the distinct values is
+    much cheaper. NA is passed to ``clean`` as None.
+    """
+    codes, uniques = pd.factorize(series)
+    distinct = pd.Series(list(uniques) + [None], dtype=object)
+    # NA rows have code -1, which picks the cleaned None at the end
+    return pd.Series(clean(distinct).to_numpy().take(codes), index=series.index)
+
+
+def _stripped(values: pd.Series) -> pd.Series:
+    """Stripped text with NA as None."""
+    return values.astype(str).str.strip().where(values.notna())
+
+
+def _strip(series: Optional[pd.Series]) -> Optional[pd.Series]:
+    """Stripped text of a series with NA as None."""
+    return None if series is None else _by_value(series, _stripped)
+
+
+def _text(frame: pd.DataFrame, name: str) -> Optional[pd.Series]:
+    """Stripped text of a column with NA (and missing columns) as None."""
+    return _strip(frame[name]) if name in frame else None
+
+
+def _coalesce(frame: pd.DataFrame, names) -> Optional[pd.Series]:
+    """First non-NA value across the columns in ``names`` that ``frame`` has."""
+    result = None
+    for name in names:
+        if name in frame:
+            result = frame[name] if result is None else result.where(result.notna(), frame[name])
+    return result
+
+
+def _bounded(frame: pd.DataFrame, names, low: float, high: float, integer: bool = True) -> pd.Series:
+    """First numeric value across ``names`` within [low, high], NaN where there is none.
+    
+    Integer fields are truncated before the range check, as ``int()`` would.
+    """
+    result = pd.Series(np.nan, index=frame.index)
+    for name in names:
+        if name in frame:
+            values = pd.to_numeric(frame[name], errors='coerce').astype('float64')
+            if integer:
+                values = np.trunc(values)
+            result = result.where(result.notna(), values.where(values.between(low, high)))
+    return result
+
+
+def _int_column(values: pd.Series, keep: np.ndarray) -> np.ndarray:
+    """Object column of Python ints for the kept rows, None where ``values`` is NaN."""
+    values = values.to_numpy()[keep]
+    return _object_column(np.nan_to_num(values).astype(np.int64), ~np.isnan(values))
+
+
+def _float_column(values: pd.Series, keep: np.ndarray) -> np.ndarray:
+    """Object column of Python floats for the kept rows, None where ``values`` is NaN."""
+    values = values.to_numpy()[keep]
+    return _object_column(values, ~np.isnan(values))
+
+
+def _is_team_code(team: pd.Series) -> pd.Series:
+    """Whether each value is a two or three letter uppercase code, as the models require."""
+    return _by_value(team, lambda values: values.str.len().between(2, 3)
+                     & values.str.isupper().fillna(False).astype(bool)).astype(bool)
+
+
+def _player_team(values: pd.Series) -> pd.Series:
+    """Roster team codes under their current abbreviation, None when unknown."""
+    team = _stripped(values).str.upper()
+    team = team.where(~team.isin(['', 'UNK', 'NA']))
+    return team.map(TEAM_ABBR_NORMALIZATION).fillna(team)
+
+
+def _player_position(values: pd.Series) -> pd.Series:
+    """Uppercase positions, None when a placeholder or longer than PlayerCreate allows."""
+    position = values.str.upper()
+    return position.where(~position.isin(['', 'NA', 'NULL']) & (position.str.len() <= 10))
+
+
+def _height_inches(heights: pd.Series) -> pd.Series:
+    """Heights in inches from '6-2', 6'2" or total inches, NaN when unparseable or out of range."""
+    text = heights.astype(str).str.strip().str.replace('"', '', regex=False).str.replace("'", '-', regex=False)
+    parts = text.str.extract(r'^(\d+)\s*-\s*(\d+)$').astype('float64')
+    feet, inches = parts[0], parts[1]
+    split = (feet * 12 + inches).where((feet <= 8) & (inches < 12))
+    whole = pd.to_numeric(text.where(~text.str.contains('-', regex=False)), errors='coerce')
+    whole = whole.where(whole == np.trunc(whole))
+    height = split.fillna(whole).where(heights.notna())
+    return height.where(height.between(60, 84))
+
+
+def _map_play_columns(plays_df: pd.DataFrame) -> Optional[Dict[str, np.ndarray]]:
+    """Clean every PlayCreate field of a play-by-play frame as object columns.
+    
+    Returns None when no row has the required fields.
+    """
+    if plays_df.empty:
+        return None
+    
+    play_id = plays_df.get('play_id', pd.Series('', index=plays_df.index)).astype(str).str.strip()
+    game_id = plays_df.get('game_id', pd.Series('', index=plays_df.index)).astype(str).str.strip()
+    season = pd.to_numeric(plays_df.get('season', pd.Series(np.nan, index=plays_df.index)),
+                           errors='coerce').astype('float64')
+    season = np.trunc(season)
+    
+    keep = (
+        (play_id.str.len().between(1, 30)) & (game_id.str.len().between(1, 20))
+        & season.between(1920, 2030)
+    ).to_numpy()
+    
+    text_columns = {}
+    for name in ('posteam', 'defteam'):
+        team = _text(plays_df, name)
+        if team is None:
+            continue
+        team = team.str.upper()
+        present = (team.notna() & (team != '') & (team != 'NA')).to_numpy()
+        # PlayCreate rejects team codes that are not two or three letters
+        keep &= ~present | team.str.len().between(2, 3).to_numpy()
+        text_columns[name] = (team.to_numpy(dtype=object), present)
+    
+    game_half = _text(plays_df, 'game_half')
+    if game_half is not None:
+        game_half = game_half.str.lower()
+        text_columns['game_half'] = (game_half.to_numpy(dtype=object), game_half.isin(_GAME_HALVES).to_numpy())
+    
+    play_type = _text(plays_df, 'play_type')
+    if play_type is not None:
+        play_type = play_type.str.lower()
+        present = (play_type.notna() & (play_type != '')).to_numpy()
+        keep &= ~present | (play_type.str.len() <= 20).to_numpy()
+        text_columns['play_type'] = (play_type.to_numpy(dtype=object), present)
+    
+    desc = _text(plays_df, 'desc')
+    if desc is not None:
+        text_columns['desc'] = (desc.to_numpy(dtype=object), desc.notna().to_numpy())
+    
+    for name in _PLAY_PLAYER_COLUMNS:
+        player_id = _text(plays_df, name)
+        if player_id is not None:
+            present = (player_id.str.len().between(1, 20) & (player_id != 'NA')).fillna(False).astype(bool)
+            text_columns[name] = (player_id.to_numpy(dtype=object), present.to_numpy())
+    
+    if not keep.any():
+        return None
+    
+    n = int(keep.sum())
+    fields = PlayCreate.model_fields
+    columns: Dict[str, np.ndarray] = {name: np.full(n, field.default, dtype=object) for name, field in fields.items()}
+    columns['play_id'] = play_id.to_numpy(dtype=object)[keep]
+    columns['game_id'] = game_id.to_numpy(dtype=object)[keep]
+    columns['season'] = np.array(season.to_numpy()[keep].astype(np.int64).tolist(), dtype=object)
+    
+    for name, (values, present) in text_columns.items():
+        columns[name] = _object_column(values[keep], present[keep])
+    
+    for name, (low, high) in _PLAY_INT_RANGES.items():
+        if name in plays_df:
+            values = np.trunc(pd.to_numeric(plays_df[name], errors='coerce').astype('float64').to_numpy()[keep])
+            in_range = (values >= low) & (values <= high)
+            columns[name] = _object_column(np.nan_to_num(values).astype(np.int64), in_range)
+    
+    for name, (low, high) in _PLAY_FLOAT_RANGES.items():
+        if name in plays_df:
+            values = pd.to_numeric(plays_df[name], errors='coerce').astype('float64').to_numpy()[keep]
+            columns[name] = _object_column(values, (values >= low) & (values <= high))
+    
+    for name in _PLAY_FLAGS:
+        if name in plays_df:
+            flags = plays_df[name][keep]
+            columns[name] = _object_column(flags.astype(bool).to_numpy(), flags.notna().to_numpy(),
+                                           fields[name].default)
+    
+    return columns
+
+
+def _map_player_columns(players_df: pd.DataFrame) -> Optional[Dict[str, np.ndarray]]:
+    """Clean every PlayerCreate field of a roster frame as object columns.
+    
+    Returns None when no row has the required fields.
+    """
+    if players_df.empty:
+        return None
+    
+    # gsis_id is the primary identifier and display_name the full name
+    player_id = _text(players_df, 'gsis_id')
+    full_name = _text(players_df, 'display_name')
+    if player_id is None or full_name is None:
+        return None
+    keep = player_id.str.len().between(1, 20) & full_name.str.len().between(1, 100)
+    
+    team = _coalesce(players_df, _PLAYER_TEAM_COLUMNS)
+    if team is not None:
+        team = _by_value(team, _player_team)
+        keep &= team.isna() | _is_team_code(team)
+    
+    position = _strip(_coalesce(players_df, _PLAYER_POSITION_COLUMNS))
+    fallback = _strip(_coalesce(players_df, _PLAYER_FALLBACK_POSITION_COLUMNS))
+    if fallback is not None:
+        position = fallback if position is None else position.where(position.notna() & (position != ''), fallback)
+    if position is not None:
+        position = _by_value(position, _player_position)
+    
+    keep = keep.to_numpy()
+    if not keep.any():
+        return None
+    
+    n = int(keep.sum())
+    current_year = datetime.now().year
+    fields = PlayerCreate.model_fields
+    columns: Dict[str, np.ndarray] = {name: np.full(n, field.default, dtype=object) for name, field in fields.items()}
+    columns['player_id'] = player_id.to_numpy(dtype=object)[keep]
+    columns['gsis_id'] = columns['player_id']
+    columns['full_name'] = full_name.to_numpy(dtype=object)[keep]
+    if team is not None:
+        columns['team_abbr'] = _object_column(team.to_numpy(dtype=object)[keep], team.notna().to_numpy()[keep])
+    if position is not None:
+        columns['position'] = _object_column(position.to_numpy(dtype=object)[keep], position.notna().to_numpy()[keep])
+    
+    columns['jersey_number'] = _int_column(_bounded(players_df, _PLAYER_JERSEY_COLUMNS, 0, 99), keep)
+    columns['weight'] = _int_column(_bounded(players_df, ('weight',), 150, 400), keep)
+    columns['age'] = _int_column(_bounded(players_df, ('age',), 18, 50), keep)
+    columns['rookie_year'] = _int_column(_bounded(players_df, _PLAYER_ROOKIE_COLUMNS, 1920, current_year), keep)
+    columns['draft_year'] = _int_column(_bounded(players_df, ('draft_year',), 1920, current_year), keep)
+    columns['draft_round'] = _int_column(_bounded(players_df, ('draft_round',), 1, 10), keep)
+    columns['draft_pick'] = _int_column(_bounded(players_df, ('draft_pick',), 1, 300), keep)
+    columns['years_exp'] = _int_column(_bounded(players_df, _PLAYER_EXPERIENCE_COLUMNS, 0, 30), keep)
+    if 'height' in players_df:
+        columns['height'] = _int_column(_by_value(players_df['height'], _height_inches).astype('float64'), keep)
+    
+    draft_team = _text(players_df, 'draft_team')
+    if draft_team is not None:
+        draft_team = draft_team.str.upper()
+        columns['draft_team'] = _object_column(draft_team.to_numpy(dtype=object)[keep],
+                                               _is_team_code(draft_team).to_numpy()[keep])
+    
+    headshot = _text(players_df, 'headshot')
+    if headshot is not None:
+        usable = headshot.str.startswith('http').fillna(False).astype(bool) & (headshot.str.len() <= 500)
+        columns['headshot_url'] = _object_column(headshot.to_numpy(dtype=object)[keep], usable.to_numpy()[keep])
+    
+    college = _strip(_coalesce(players_df, _PLAYER_COLLEGE_COLUMNS))
+    if college is not None:
+        columns['college'] = _object_column(college.to_numpy(dtype=object)[keep],
+                                            (college.str.len() <= 100).to_numpy()[keep])
+    
+    status = _text(players_df, 'status')
+    if status is not None:
+        status = status.str.lower().map(_PLAYER_STATUSES)
+        columns['status'] = _object_column(status.to_numpy(dtype=object)[keep], status.notna().to_numpy()[keep],
+                                           fields['status'].default)
+    
+    return columns
+
+
+def _map_game_columns(games_df: pd.DataFrame) -> Optional[Dict[str, np.ndarray]]:
+    """Clean every GameCreate field of a schedule frame as object columns.
+    
+    Returns None when no row has the required fields.
+    """
+    if games_df.empty or 'gameday' not in games_df:
+        return None
+    
+    missing = pd.Series(None, index=games_df.index, dtype=object)
+    game_id = _text(games_df, 'game_id')
+    # Column is 'game_type' not 'season_type' in nfl_data_py
+    season_type = _text(games_df, 'game_type')
+    home_team = _text(games_df, 'home_team')
+    away_team = _text(games_df, 'away_team')
+    game_id, season_type, home_team, away_team = (
+        missing if column is None else column for column in (game_id, season_type, home_team, away_team)
+    )
+    season_type, home_team, away_team = season_type.str.upper(), home_team.str.upper(), away_team.str.upper()
+    season = np.trunc(pd.to_numeric(games_df.get('season', missing), errors='coerce').astype('float64'))
+    game_date = pd.to_datetime(games_df['gameday'], format='%Y-%m-%d', errors='coerce')
+    
+    keep = (
+        game_id.str.len().between(1, 20) & season.between(1920, 2030) & season_type.isin(_SEASON_TYPES)
+        & game_date.notna() & _is_team_code(home_team) & _is_team_code(away_team)
+    ).to_numpy()
+    if not keep.any():
+        return None
+    
+    n = int(keep.sum())
+    fields = GameCreate.model_fields
+    columns: Dict[str, np.ndarray] = {name: np.full(n, field.default, dtype=object) for name, field in fields.items()}
+    columns['game_id'] = game_id.to_numpy(dtype=object)[keep]
+    columns['season'] = _int_column(season, keep)
+    columns['season_type'] = season_type.to_numpy(dtype=object)[keep]
+    columns['game_date'] = np.array(game_date.dt.date.to_numpy()[keep].tolist(), dtype=object)
+    columns['home_team'] = home_team.to_numpy(dtype=object)[keep]
+    columns['away_team'] = away_team.to_numpy(dtype=object)[keep]
+    
+    for source, (name, low, high) in _GAME_INT_RANGES.items():
+        if source in games_df:
+            columns[name] = _int_column(_bounded(games_df, (source,), low, high), keep)
+    for source, (name, low, high) in _GAME_FLOAT_RANGES.items():
+        if source in games_df:
+            columns[name] = _float_column(_bounded(games_df, (source,), low, high, integer=False), keep)
+    
+    old_game_id = _text(games_df, 'old_game_id')
+    if old_game_id is not None:
+        columns['old_game_id'] = _object_column(old_game_id.to_numpy(dtype=object)[keep],
+                                                (old_game_id.str.len() <= 20).to_numpy()[keep])
+    
+    gametime = _text(games_df, 'gametime')
+    if gametime is not None:
+        kickoff = pd.to_datetime(gametime, format='%H:%M', errors='coerce')
+        columns['kickoff_time'] = _object_column(kickoff.dt.time.to_numpy(dtype=object)[keep],
+                                                 kickoff.notna().to_numpy()[keep])
+    
+    roof = _text(games_df, 'roof')
+    if roof is not None:
+        roof = roof.str.lower()
+        columns['roof'] = _object_column(roof.to_numpy(dtype=object)[keep], roof.isin(_GAME_ROOFS).to_numpy()[keep])
+    
+    surface = _text(games_df, 'surface')
+    if surface is not None:
+        surface = surface.str.lower()
+        columns['surface'] = _object_column(surface.to_numpy(dtype=object)[keep],
+                                            (surface.str.len() <= 20).to_numpy()[keep])
+    
+    # A game is finished once both scores are known
+    columns['game_finished'] = np.array(
+        [home is not None and away is not None for home, away in zip(columns['home_score'], columns['away_score'])],
+        dtype=object,
+    )
+    
+    return columns
@@ -0,0 +1,118 @@
+"""Per-(dataset, season) version counters for cache validation.
+
+Loads bump the counters of what they wrote in the same transaction as the
+data. Readers fingerprint the datasets a response depends on, so HTTP
+caches and in-process caches can tell when a response may have changed
+without recomputing it.
+"""
+
+import logging
+import threading
+import time
+from typing import Dict, Iterable, Optional, Sequence, Tuple
+
+from sqlalchemy import func
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm import Session
+
+from src.models.data_version import DataVersionModel, ALL_SEASONS
+
+logger = logging.getLogger(__name__)
+
+# Seconds a process trusts versions it has read; bumps made in-process apply at once
+VERSION_CACHE_TTL = 5.0
+
+_version_cache: Dict[Tuple, Tuple[float, Tuple[int, ...]]] = {}
+_cache_lock = threading.Lock()
+
+
+def bump_data_versions(session: Session, dataset: str, seasons: Optional[Iterable[int]] = None) -> None:
+    """Increment the versions of a dataset's seasons (or its season-less row).
+
+    The caller owns the transaction (no commit here).
+
+    Args:
+        session: Session holding the load's writes
+        dataset: Dataset name ('teams', 'players', 'games', 'plays')
+        seasons: Seasons written (None for datasets not split by season)
+    """
+    if seasons is None:
+        seasons = [ALL_SEASONS]
+    for season in sorted({season for season in seasons if season is not None}):
+        updated = session.query(DataVersionModel).filter(
+            DataVersionModel.dataset == dataset,
+            DataVersionModel.season == season
+        ).update({DataVersionModel.version: DataVersionModel.version + 1}, synchronize_session=False)
+        if not updated:
+            session.add(DataVersionModel(dataset=dataset, season=season, version=1))
+    session.flush()
+
+    with _cache_lock:
+        _version_cache.clear()
+
+
+def get_data_version(session: Session, datasets: Sequence[str], season: Optional[int] = None) -> Tuple[int, ...]:
+    """Fingerprint the current versions of the given datasets.
+
+    Args:
+        session: Database session
+        datasets: Dataset names the caller depends on
+        season: Season the caller reads (all seasons if None); season-less
+            datasets always count
+
+    Returns:
+        One summed version per dataset, in the order given
+    """
+    key = (tuple(datasets), season)
+    cached = _cached_version(key)
+    if cached is not None:
+        return cached
+
+    query = session.query(DataVersionModel.dataset, func.sum(DataVersionModel.version)).filter(
+        DataVersionModel.dataset.in_(datasets)
+    )
+    if season is not None:
+        query = query.filter(DataVersionModel.season.in_((season, ALL_SEASONS)))
+    totals = dict(query.group_by(DataVersionModel.dataset).all())
+
+    version = tuple(int(totals.get(dataset) or 0) for dataset in datasets)
+    with _cache_lock:
+        _version_cache[key] = (time.monotonic() + VERSION_CACHE_TTL, version)
+    return version
+
+
+def read_data_version(session: Session, datasets: Sequence[str],
+                      season: Optional[int] = None) -> Optional[Tuple[int, ...]]:
+    """``get_data_version``, or None when the versions cannot be read.
+
+    The read runs in a savepoint, so a failure (such as a database without
+    the data_versions table) rolls back only the lookup and keeps whatever
+    the caller has pending in the session.
+    """
+    cached = _cached_version((tuple(datasets), season))
+    if cached is not None:
+        return cached
+
+    # Flushed first so the caller's own write errors are not taken for a failed read
+    session.flush()
+    try:
+        with session.begin_nested():
+            return get_data_version(session, datasets, season)
+    except SQLAlchemyError as e:
+        logger.warning(f"Data versions unavailable: {e}")
+        return None
+
+
+def _cached_version(key: Tuple) -> Optional[Tuple[int, ...]]:
+    """Version read within the last ``VERSION_CACHE_TTL`` seconds, if any."""
+    with _cache_lock:
+        cached = _version_cache.get(key)
+    if cached is not None and cached[0] > time.monotonic():
+        return cached[1]
+    return None
+
+
+def clear_version_cache() -> None:
+    """Forget versions read so far (e.g. after another process loaded data)."""
+    with _cache_lock:
+        _version_cache.clear()
@@ -0,0 +1,365 @@
+"""Pipelined play loading: read, map, validate and write run concurrently.
+
+``DataLoader.load_plays`` runs its steps one after another, so the database
+idles while a chunk is fetched and mapped, and the CPU idles while a batch is
+written. Here each step is a stage connected to the next by a bounded queue:
+
+- read: a thread pulls memory-bounded chunks from ``NFLDataClient.iter_plays``
+- map and validate: chunks are mapped to rows and checked against
+  ``PlayCreate`` in a process pool (CPU-bound; one task does both so rows
+  cross the process boundary once)
+- write: the calling thread upserts each batch, refreshes derived data and
+  commits, like ``load_plays``
+
+A full queue blocks the stage that feeds it, so a slow database holds back
+reading instead of letting mapped rows pile up in memory. Each stage's
+throughput is reported in ``DataLoadResult.stage_metrics``. Like
+``load_plays``, a completed load records the watermark of every week it read.
+"""
+
+import logging
+import queue
+import threading
+import time
+from collections import deque
+from concurrent.futures import Executor, Future, ProcessPoolExecutor
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Callable, Deque, Dict, List, Optional, Set, Tuple
+
+import pandas as pd
+
+from src.models.play import PlayCreate
+from .data_loader import DataLoader, DataLoadResult
+from .data_mapper import DataMapper
+from .watermarks import ChunkedWeekFingerprints
+
+logger = logging.getLogger(__name__)
+
+STAGES = ('read', 'map', 'validate', 'write')
+
+# How long a blocked stage waits before checking whether the load was stopped
+QUEUE_POLL_SECONDS = 0.1
+# How long the map stage waits for a chunk while mapped work may be finishing
+MAP_POLL_SECONDS = 0.005
+
+# Marks the end of a stage's output
+_DONE = object()
+
+MappedChunk = Tuple[List[List[Dict[str, Any]]], int, float, float]
+
+# Per-process mapper so workers do not rebuild it for every chunk
+_worker_mapper: Optional[DataMapper] = None
+
+
+def map_play_chunk(plays_df: pd.DataFrame, batch_size: int, strict_validation: bool = False,
+                   mapper: Optional[DataMapper] = None) -> MappedChunk:
+    """Map and validate one chunk of play-by-play data into batches of rows.
+
+    Runs in worker processes, so it only touches its arguments (no database).
+
+    Args:
+        plays_df: Chunk of play-by-play data
+        batch_size: Rows per batch
+        strict_validation: Validate every row instead of a sample
+        mapper: Mapper to use in-process (workers build their own)
+
+    Returns:
+        (batches, source rows, mapping seconds, validation seconds)
+    """
+    global _worker_mapper
+    if mapper is None:
+        if _worker_mapper is None or _worker_mapper.strict_validation != strict_validation:
+            _worker_mapper = DataMapper(strict_validation=strict_validation)
+        mapper = _worker_mapper
+
+    started = time.perf_counter()
+    rows = mapper.map_play_rows(plays_df)
+    mapped = time.perf_counter()
+    rows = mapper.validate_rows(rows, PlayCreate, 'play')
+    validated = time.perf_counter()
+
+    batches = [rows[start:start + batch_size] for start in range(0, len(rows), batch_size)]
+    return batches, len(plays_df), mapped - started, validated - mapped
+
+
+@dataclass
+class StageMetrics:
+    """Work done by one pipeline stage.
+
+    ``busy_seconds`` is time spent working (summed over workers for the
+    process-pool stages); ``blocked_seconds`` is time spent waiting for input
+    or for room in the next stage's queue.
+    """
+    items: int = 0
+    rows: int = 0
+    busy_seconds: float = 0.0
+    blocked_seconds: float = 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'items': self.items,
+            'rows': self.rows,
+            'busy_seconds': round(self.busy_seconds, 3),
+            'blocked_seconds': round(self.blocked_seconds, 3),
+            'rows_per_second': round(self.rows / self.busy_seconds, 1) if self.busy_seconds else None,
+        }
+
+
+class _PipelineStopped(Exception):
+    """A stage failed, so the others stop."""
+
+
+class PlayLoadPipeline:
+    """Load plays with fetching, mapping and database writes overlapped."""
+
+    def __init__(self, loader: DataLoader, workers: Optional[int] = None, queue_size: int = 4,
+                 memory_budget_mb: Optional[int] = None, all_columns: bool = False):
+        """Initialize the pipeline.
+
+        Args:
+            loader: Loader whose client, mapper and database are used
+            workers: Mapping processes (None for CPU count, 1 to map in-process)
+            queue_size: Items each queue holds before its producer blocks;
+                at most this many chunks are mapped at once
+            memory_budget_mb: Memory per read chunk (defaults to the client's
+                configured budget)
+            all_columns: Read every source column instead of the mapped ones
+        """
+        self.loader = loader
+        self.workers = workers
+        self.queue_size = queue_size
+        self.memory_budget_mb = memory_budget_mb
+        self.all_columns = all_columns
+
+    def run(self, seasons: List[int], weeks: Optional[List[int]] = None, batch_size: int = 1000,
+            before_write: Optional[Callable[[], None]] = None) -> DataLoadResult:
+        """Load plays for the given seasons.
+
+        Args:
+            seasons: Seasons to load
+            weeks: Optional weeks to load
+            batch_size: Plays per committed batch
+            before_write: Called in the writing thread before the first batch
+                is written, while plays are already being read and mapped
+                (used to load the tables plays reference); if it raises, the
+                load fails without writing any plays
+
+        Returns:
+            DataLoadResult with operation details and per-stage metrics
+        """
+        result = DataLoadResult()
+        result.start_time = datetime.now()
+        logger.info(f"Starting pipelined plays load for seasons: {seasons}, weeks: {weeks}")
+
+        metrics = {stage: StageMetrics() for stage in STAGES}
+        stop = threading.Event()
+        errors: List[str] = []
+        chunks: queue.Queue = queue.Queue(maxsize=self.queue_size)
+        batches: queue.Queue = queue.Queue(maxsize=self.queue_size)
+
+        # Filled by the read stage; complete once the writer has drained every batch
+        fingerprints = self.loader._play_fingerprints(self.all_columns)
+
+        executor: Optional[Executor] = None
+        threads: List[threading.Thread] = []
+        try:
+            if self.workers is None or self.workers > 1:
+                executor = ProcessPoolExecutor(max_workers=self.workers)
+
+            threads = [
+                threading.Thread(target=self._read, name='play-load-read', daemon=True,
+                                 args=(seasons, weeks, chunks, fingerprints, metrics, stop, errors)),
+                threading.Thread(target=self._map, name='play-load-map', daemon=True,
+                                 args=(executor, batch_size, chunks, batches, metrics, stop, errors)),
+            ]
+            for thread in threads:
+                thread.start()
+
+            if before_write is not None:
+                before_write()
+            self._write(batches, result, metrics['write'], stop, errors)
+            self.loader._record_watermarks('plays', fingerprints.result().values())
+
+            result.success = True
+            logger.info(f"Pipelined plays load completed: {result.records_inserted} inserted, "
+                        f"{result.records_updated} updated, {result.records_unchanged} unchanged, "
+                        f"{result.records_skipped} skipped")
+
+        except Exception as e:
+            stop.set()
+            message = '; '.join(errors) if isinstance(e, _PipelineStopped) else str(e)
+            logger.error(f"Pipelined plays load failed: {message}")
+            result.errors.append(message)
+            result.success = False
+
+        finally:
+            stop.set()
+            for thread in threads:
+                thread.join()
+            if executor is not None:
+                executor.shutdown(cancel_futures=True)
+            result.stage_metrics = {stage: stage_metrics.to_dict() for stage, stage_metrics in metrics.items()}
+            result.end_time = datetime.now()
+
+        return result
+
+    def _read(self, seasons: List[int], weeks: Optional[List[int]], chunks: queue.Queue,
+              fingerprints: ChunkedWeekFingerprints, metrics: Dict[str, StageMetrics],
+              stop: threading.Event, errors: List[str]) -> None:
+        """Read stage: queue chunks of source plays for mapping, fingerprinting each for the watermarks."""
+        read = metrics['read']
+        columns = None if self.all_columns else self.loader.data_mapper.play_columns
+        try:
+            source = iter(self.loader.nfl_client.iter_plays(seasons, weeks, self.memory_budget_mb,
+                                                            columns=columns))
+            while True:
+                started = time.perf_counter()
+                plays_df = next(source, None)
+                read.busy_seconds += time.perf_counter() - started
+                if plays_df is None:
+                    break
+                read.items += 1
+                read.rows += len(plays_df)
+                fingerprints.add(plays_df)
+                _put(chunks, plays_df, read, stop)
+            _put(chunks, _DONE, read, stop)
+        except _PipelineStopped:
+            pass
+        except Exception as e:
+            _fail(stop, errors, 'read', e)
+
+    def _map(self, executor: Optional[Executor], batch_size: int, chunks: queue.Queue,
+             batches: queue.Queue, metrics: Dict[str, StageMetrics], stop: threading.Event,
+             errors: List[str]) -> None:
+        """Map and validate stage: fan chunks out to workers, queue their batches in order."""
+        strict = self.loader.data_mapper.strict_validation
+        pending: Deque[Future] = deque()
+        reading = True
+        try:
+            while reading or pending:
+                # Hand on finished work first so the writer never waits on a slow read
+                if pending and (pending[0].done() or not reading or len(pending) >= self.queue_size):
+                    self._forward(pending.popleft().result(), batches, metrics, stop)
+                    continue
+
+                plays_df = _get(chunks, metrics['map'], stop,
+                                timeout=MAP_POLL_SECONDS if pending else QUEUE_POLL_SECONDS)
+                if plays_df is None:
+                    continue
+                if plays_df is _DONE:
+                    reading = False
+                elif executor is not None:
+                    pending.append(executor.submit(map_play_chunk, plays_df, batch_size, strict))
+                else:
+                    pending.append(_completed(map_play_chunk, plays_df, batch_size, strict,
+                                              self.loader.data_mapper))
+            _put(batches, _DONE, metrics['map'], stop)
+        except _PipelineStopped:
+            pass
+        except Exception as e:
+            _fail(stop, errors, 'map', e)
+        finally:
+            for future in pending:
+                future.cancel()
+
+    def _forward(self, mapped: MappedChunk, batches: queue.Queue, metrics: Dict[str, StageMetrics],
+                 stop: threading.Event) -> None:
+        play_batches, source_rows, map_seconds, validate_seconds = mapped
+        valid_rows = sum(len(batch) for batch in play_batches)
+        for stage, rows, seconds in (('map', source_rows, map_seconds),
+                                     ('validate', valid_rows, validate_seconds)):
+            metrics[stage].items += 1
+            metrics[stage].rows += rows
+            metrics[stage].busy_seconds += seconds
+
+        # Hand batches over one at a time so written ones can be freed
+        play_batches.reverse()
+        while play_batches:
+            _put(batches, play_batches.pop(), metrics['validate'], stop)
+
+    def _write(self, batches: queue.Queue, result: DataLoadResult, write: StageMetrics,
+               stop: threading.Event, errors: List[str]) -> None:
+        """Write stage: upsert and commit batches as they arrive."""
+        affected_team_seasons: Set[Tuple[int, str]] = set()
+        session = self.loader.db_manager.get_session()
+        try:
+            while True:
+                play_batch = _get(batches, write, stop)
+                if play_batch is _DONE:
+                    break
+                if play_batch is None:
+                    continue
+
+                started = time.perf_counter()
+                result.records_processed += len(play_batch)
+                self.loader._write_play_batch(session, play_batch, result, affected_team_seasons)
+                session.commit()
+                write.items += 1
+                write.rows += len(play_batch)
+                write.busy_seconds += time.perf_counter() - started
+                logger.debug(f"Committed batch {write.items} ({len(play_batch)} plays)")
+
+            # Team-season insights span batches, so refresh them once at the end
+            if affected_team_seasons:
+                started = time.perf_counter()
+                self.loader._refresh_derived_data(session, set(), affected_team_seasons)
+                session.commit()
+                write.busy_seconds += time.perf_counter() - started
+
+        except Exception as e:
+            session.rollback()
+            if not isinstance(e, _PipelineStopped):
+                _fail(stop, errors, 'write', e)
+            raise
+        finally:
+            session.close()
+
+
+def _put(target: queue.Queue, item: Any, metrics: StageMetrics, stop: threading.Event) -> None:
+    """Put an item on a bounded queue, blocking while it is full; raise if the load stops."""
+    started = time.perf_counter()
+    try:
+        while True:
+            if stop.is_set():
+                raise _PipelineStopped()
+            try:
+                target.put(item, timeout=QUEUE_POLL_SECONDS)
+                return
+            except queue.Full:
+                continue
+    finally:
+        metrics.blocked_seconds += time.perf_counter() - started
+
+
+def _get(source: queue.Queue, metrics: StageMetrics, stop: threading.Event,
+         timeout: float = QUEUE_POLL_SECONDS) -> Any:
+    """Take the next item from a queue; None when nothing arrived within ``timeout``.
+
+    Raises if the load stops.
+    """
+    if stop.is_set():
+        raise _PipelineStopped()
+    started = time.perf_counter()
+    try:
+        return source.get(timeout=timeout)
+    except queue.Empty:
+        return None
+    finally:
+        metrics.blocked_seconds += time.perf_counter() - started
+
+
+def _completed(function: Callable, *args) -> Future:
+    """Run a function now and wrap its outcome in a finished future."""
+    future: Future = Future()
+    try:
+        future.set_result(function(*args))
+    except Exception as e:
+        future.set_exception(e)
+    return future
+
+
+def _fail(stop: threading.Event, errors: List[str], stage: str, error: Exception) -> None:
+    logger.error(f"Pipelined plays load {stage} stage failed: {error}")
+    errors.append(f"{stage}: {error}")
+    stop.set()
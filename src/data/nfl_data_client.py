@@ -1,7 +1,7 @@
 """NFL data client for integrating with nfl_data_py."""
 
 import logging
-from typing import Optional, List, Dict, Any, Union
+from typing import Optional, List, Dict, Any, Iterator, Union
 from datetime import datetime, date
 from pathlib import Path
 import pandas as pd
@@ -29,6 +29,23 @@ except ImportError:
     NFL_DATA_PY_AVAILABLE = False
     logger.warning("nfl_data_py not available. Some functionality will be limited.")
 
+# pyarrow reads Parquet files row group by row group for streaming loads
+try:
+    import pyarrow.parquet as pq
+    PYARROW_AVAILABLE = True
+except ImportError:
+    pq = None
+    PYARROW_AVAILABLE = False
+    logger.warning("pyarrow not available. Streaming play loads will read whole seasons.")
+
+# Directory holding extracted pbp_{season}.parquet files
+PBP_DATA_DIR = Path("data")
+
+# In-memory size of a chunk relative to its Parquet-decoded size: the Arrow
+# batch, its pandas copy and the mapped rows are alive at the same time
+STREAM_MEMORY_FACTOR = 4
+MIN_STREAM_ROWS = 1000
+
 
 @dataclass
 class DataFetchConfig:
@@ -38,6 +55,7 @@ class DataFetchConfig:
     cache_enabled: bool = True
     batch_size: int = 1000
     rate_limit_delay: float = 0.1
+    stream_memory_budget_mb: int = 256
 
 
 class NFLDataClient:
@@ -115,25 +133,28 @@ class NFLDataClient:
             logger.error(f"Failed to fetch games data for seasons {seasons}: {e}")
             raise
     
-    def fetch_plays(self, seasons: List[int], weeks: Optional[List[int]] = None) -> pd.DataFrame:
+    def fetch_plays(self, seasons: List[int], weeks: Optional[List[int]] = None,
+                    columns: Optional[List[str]] = None) -> pd.DataFrame:
         """Fetch NFL play-by-play data for specified seasons and weeks.
         
         Args:
             seasons: List of seasons to fetch
             weeks: Optional list of weeks to fetch (if None, fetches all weeks)
+            columns: Optional columns to read (if None, reads all columns)
             
         Returns:
             DataFrame with play-by-play data
         """
+        columns = _projection(columns, weeks)
+        
         # First try to load from extracted parquet files
-        data_dir = Path("data")
         combined_data = []
         
         for season in seasons:
-            parquet_file = data_dir / f"pbp_{season}.parquet"
+            parquet_file = PBP_DATA_DIR / f"pbp_{season}.parquet"
             if parquet_file.exists():
                 logger.info(f"Loading play-by-play data from {parquet_file}")
-                season_data = pd.read_parquet(parquet_file)
+                season_data = pd.read_parquet(parquet_file, columns=columns)
                 
                 # Filter by weeks if specified
                 if weeks:
@@ -154,7 +175,7 @@ class NFLDataClient:
             logger.error("No parquet files found and nfl_data_py not available")
             logger.info("Try running: docker-compose -f docker-compose.nfl-data.yml --profile extract up")
             raise ImportError("No data source available. Please extract data using Docker or install nfl_data_py.")
-        cache_key = f"plays_{'-'.join(map(str, sorted(seasons)))}_{weeks or 'all'}"
+        cache_key = f"plays_{'-'.join(map(str, sorted(seasons)))}_{weeks or 'all'}_{'-'.join(columns or ['all'])}"
         if self.config.cache_enabled and cache_key in self._cache:
             logger.info("Returning cached plays data")
             return self._cache[cache_key]
@@ -169,7 +190,7 @@ class NFLDataClient:
                 for season in seasons:
                     for week in weeks:
                         try:
-                            week_data = nfl.import_pbp_data([season], downcast=False)
+                            week_data = _import_pbp_data([season], columns)
                             if not week_data.empty:
                                 week_plays = week_data[week_data['week'] == week]
                                 plays_df = pd.concat([plays_df, week_plays], ignore_index=True)
@@ -177,7 +198,7 @@ class NFLDataClient:
                             logger.warning(f"Failed to fetch week {week} of season {season}: {e}")
                             continue
             else:
-                plays_df = nfl.import_pbp_data(seasons, downcast=False)
+                plays_df = _import_pbp_data(seasons, columns)
             
             if self.config.cache_enabled:
                 self._cache[cache_key] = plays_df
@@ -189,6 +210,53 @@ class NFLDataClient:
             logger.error(f"Failed to fetch plays data for seasons {seasons}: {e}")
             raise
     
+    def iter_plays(self, seasons: List[int], weeks: Optional[List[int]] = None,
+                   memory_budget_mb: Optional[int] = None,
+                   columns: Optional[List[str]] = None) -> Iterator[pd.DataFrame]:
+        """Yield play-by-play data in chunks that fit a memory budget.
+        
+        Extracted Parquet files are read one record batch at a time, sized from
+        the file metadata so a chunk and the rows mapped from it stay within
+        the budget. Seasons without an extracted file are fetched from
+        nfl_data_py one season at a time. Nothing is cached, so memory use does
+        not grow with the number of seasons.
+        
+        Args:
+            seasons: List of seasons to fetch
+            weeks: Optional list of weeks to keep (if None, keeps all weeks)
+            memory_budget_mb: Memory per chunk (defaults to the config's
+                stream_memory_budget_mb)
+            columns: Optional columns to read (if None, reads all columns)
+            
+        Yields:
+            Non-empty DataFrames of play-by-play data
+        """
+        budget = (memory_budget_mb or self.config.stream_memory_budget_mb) * 1024 * 1024
+        columns = _projection(columns, weeks)
+        
+        for season in seasons:
+            parquet_file = PBP_DATA_DIR / f"pbp_{season}.parquet"
+            if parquet_file.exists():
+                logger.info(f"Streaming play-by-play data from {parquet_file}")
+                chunks = _parquet_chunks(parquet_file, budget, columns)
+            else:
+                chunks = _frame_chunks(self._fetch_season_plays(season, columns), budget)
+            
+            for chunk in chunks:
+                if weeks:
+                    chunk = chunk[chunk['week'].isin(weeks)]
+                if not chunk.empty:
+                    yield chunk
+    
+    def _fetch_season_plays(self, season: int, columns: Optional[List[str]] = None) -> pd.DataFrame:
+        """Fetch one season of play-by-play data from nfl_data_py, bypassing the cache."""
+        if not NFL_DATA_PY_AVAILABLE:
+            logger.error(f"No parquet file for season {season} and nfl_data_py not available")
+            raise ImportError("No data source available. Please extract data using Docker or install nfl_data_py.")
+        
+        logger.info(f"Fetching play-by-play data for season {season}")
+        return _import_pbp_data([season], columns)
+    
     def fetch_players(self, seasons: Optional[List[int]] = None) -> pd.DataFrame:
         """Fetch NFL players data with comprehensive position information.
         
@@ -438,4 +506,69 @@ class NFLDataClient:
         except Exception:
             cache_info["estimated_memory_mb"] = "unknown"
         
-        return cache_info
\ No newline at end of file
+        return cache_info
+
+
+def _rows_within_budget(bytes_per_row: float, budget_bytes: int) -> int:
+    """Rows per chunk so that a chunk and what is built from it fit the budget."""
+    return max(MIN_STREAM_ROWS, int(budget_bytes / max(bytes_per_row * STREAM_MEMORY_FACTOR, 1)))
+
+
+def _projection(columns: Optional[List[str]], weeks: Optional[List[int]]) -> Optional[List[str]]:
+    """Columns to read, including ``week`` when weeks are filtered; None reads all."""
+    if columns is None:
+        return None
+    columns = list(dict.fromkeys(columns))
+    if weeks and 'week' not in columns:
+        columns.append('week')
+    return columns
+
+
+def _import_pbp_data(seasons: List[int], columns: Optional[List[str]]) -> pd.DataFrame:
+    """Fetch play-by-play data from nfl_data_py, projected to ``columns`` when given."""
+    if columns is None:
+        return nfl.import_pbp_data(seasons, downcast=False)
+    return nfl.import_pbp_data(seasons, columns=columns, downcast=False)
+
+
+def _parquet_chunks(path: Path, budget_bytes: int,
+                    columns: Optional[List[str]] = None) -> Iterator[pd.DataFrame]:
+    """Read a Parquet file as DataFrames of at most a budget's worth of rows.
+    
+    Only ``columns`` are decoded (those missing from the file are skipped),
+    and the chunk size is estimated from the sizes of those columns alone.
+    """
+    if not PYARROW_AVAILABLE:
+        logger.warning(f"pyarrow not available; reading {path} in full")
+        yield from _frame_chunks(pd.read_parquet(path, columns=columns), budget_bytes)
+        return
+    
+    parquet_file = pq.ParquetFile(path)
+    metadata = parquet_file.metadata
+    if columns is not None:
+        available = set(parquet_file.schema_arrow.names)
+        columns = [column for column in columns if column in available]
+    wanted = None if columns is None else set(columns)
+    
+    decoded_bytes = 0
+    for i in range(metadata.num_row_groups):
+        row_group = metadata.row_group(i)
+        decoded_bytes += sum(
+            row_group.column(j).total_uncompressed_size for j in range(row_group.num_columns)
+            if wanted is None or row_group.column(j).path_in_schema in wanted
+        )
+    rows = _rows_within_budget(decoded_bytes / max(metadata.num_rows, 1), budget_bytes)
+    
+    for batch in parquet_file.iter_batches(batch_size=rows, columns=columns):
+        yield batch.to_pandas()
+
+
+def _frame_chunks(frame: pd.DataFrame, budget_bytes: int) -> Iterator[pd.DataFrame]:
+    """Split an in-memory DataFrame into budget-sized chunks."""
+    if frame.empty:
+        return
+    
+    sample = frame.head(MIN_STREAM_ROWS)
+    rows = _rows_within_budget(sample.memory_usage(deep=True).sum() / len(sample), budget_bytes)
+    for start in range(0, len(frame), rows):
+        yield frame.iloc[start:start + rows]
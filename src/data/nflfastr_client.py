@@ -1,15 +1,34 @@
 """Direct nflfastR data client - bypasses nfl_data_py installation issues."""
 
+import hashlib
 import logging
+import os
+import re
+import time
 import pandas as pd
 import requests
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Iterable, Tuple
 from datetime import datetime
 from dataclasses import dataclass
 
 logger = logging.getLogger(__name__)
 
+# Release tag of each dataset; files are named ``{dataset}_{season}.parquet``
+DATASET_RELEASES = {
+    'play_by_play': 'pbp',
+    'schedules': 'schedules',
+    'rosters': 'rosters',
+}
+
+# Suffix of a download in progress; it is renamed into place once verified
+PARTIAL_SUFFIX = '.part'
+
+
+class DownloadVerificationError(Exception):
+    """Downloaded file does not match its expected size or checksum."""
+
 
 @dataclass
 class NFLFastRConfig:
@@ -19,6 +38,16 @@ class NFLFastRConfig:
     timeout_seconds: int = 300
     max_retries: int = 3
     
+    # Concurrent downloads when fetching several seasons or datasets
+    download_workers: int = 4
+    # Bytes written per streamed chunk
+    chunk_size: int = 1024 * 1024
+    # Delay before the first retry; doubles on each further attempt up to the max
+    backoff_seconds: float = 1.0
+    max_backoff_seconds: float = 30.0
+    # Expected ``size`` (bytes) and/or ``sha256`` of files, keyed by file name
+    manifest: Optional[Dict[str, Dict[str, Any]]] = None
+    
     # Alternative base URLs to try
     alt_urls: List[str] = None
     
@@ -29,6 +58,8 @@ class NFLFastRConfig:
                 "https://raw.githubusercontent.com/nflverse/nflverse-data/master/data",
                 "https://github.com/nflverse/nflverse-data/raw/master/data"
             ]
+        if self.manifest is None:
+            self.manifest = {}
 
 
 class NFLFastRClient:
@@ -36,6 +67,11 @@ class NFLFastRClient:
     
     This client downloads parquet files directly from the nflfastR GitHub releases,
     providing the same data as nfl_data_py but without Python compilation issues.
+    
+    Files are streamed in chunks to a ``.part`` file next to the cache entry and
+    renamed into place only once complete and verified, so the cache never holds
+    a truncated file. A failed transfer is resumed with an HTTP ``Range`` request
+    on the next attempt. Missing seasons are downloaded concurrently.
     """
     
     def __init__(self, config: Optional[NFLFastRConfig] = None):
@@ -52,6 +88,10 @@ class NFLFastRClient:
     def _download_file(self, url: str, local_path: Path) -> bool:
         """Download file with retry logic.
         
+        Retries back off exponentially and resume from the bytes already
+        received. The file is verified against the manifest entry for its
+        name, if any, before it replaces ``local_path``.
+        
         Args:
             url: URL to download
             local_path: Local path to save file
@@ -59,56 +99,157 @@ class NFLFastRClient:
         Returns:
             True if successful, False otherwise
         """
+        partial_path = local_path.with_name(local_path.name + PARTIAL_SUFFIX)
+        expected = self.config.manifest.get(local_path.name, {})
+        
         for attempt in range(self.config.max_retries):
             try:
                 logger.info(f"Downloading {url} (attempt {attempt + 1})")
-                response = requests.get(url, timeout=self.config.timeout_seconds)
-                response.raise_for_status()
-                
-                with open(local_path, 'wb') as f:
-                    f.write(response.content)
+                self._stream_to(url, partial_path)
+                self._verify(partial_path, expected)
+                os.replace(partial_path, local_path)
                 
                 logger.info(f"Successfully downloaded {local_path}")
                 return True
                 
             except Exception as e:
                 logger.warning(f"Download attempt {attempt + 1} failed: {e}")
+                if isinstance(e, DownloadVerificationError):
+                    # Resuming would only extend a bad file
+                    partial_path.unlink(missing_ok=True)
                 if attempt == self.config.max_retries - 1:
                     logger.error(f"Failed to download {url} after {self.config.max_retries} attempts")
                     return False
+                time.sleep(min(self.config.backoff_seconds * 2 ** attempt, self.config.max_backoff_seconds))
         
         return False
     
-    def fetch_play_by_play(self, seasons: List[int], force_download: bool = False) -> pd.DataFrame:
-        """Fetch play-by-play data for specified seasons.
+    def _stream_to(self, url: str, partial_path: Path) -> None:
+        """Stream ``url`` into ``partial_path``, continuing from its current size.
+        
+        Raises:
+            requests.RequestException: If the request or transfer fails
+            DownloadVerificationError: If fewer bytes arrive than announced
+        """
+        offset = partial_path.stat().st_size if partial_path.exists() else 0
+        headers = {'Range': f'bytes={offset}-'} if offset else {}
+        
+        with requests.get(url, headers=headers, stream=True, timeout=self.config.timeout_seconds) as response:
+            if offset and response.status_code == 416:
+                # Nothing left to fetch if the partial file already has every byte
+                total = _content_range_total(response.headers.get('Content-Range'))
+                if total != offset:
+                    partial_path.unlink()
+                    raise DownloadVerificationError(
+                        f"Partial file has {offset} bytes but the server has {total}")
+                return
+            response.raise_for_status()
+            if offset and response.status_code != 206:
+                logger.info(f"Server ignored range request for {url}; restarting download")
+                offset = 0
+            elif offset:
+                logger.info(f"Resuming {url} from byte {offset}")
+            
+            expected_bytes = response.headers.get('Content-Length')
+            received = 0
+            with open(partial_path, 'ab' if offset else 'wb') as f:
+                for chunk in response.iter_content(chunk_size=self.config.chunk_size):
+                    f.write(chunk)
+                    received += len(chunk)
+        
+        if expected_bytes is not None and received != int(expected_bytes):
+            raise DownloadVerificationError(
+                f"Transfer ended after {received} of {expected_bytes} bytes")
+    
+    def _verify(self, path: Path, expected: Dict[str, Any]) -> None:
+        """Check a downloaded file against its manifest entry.
+        
+        Raises:
+            DownloadVerificationError: If the size or sha256 differs
+        """
+        size = path.stat().st_size
+        if 'size' in expected and size != expected['size']:
+            raise DownloadVerificationError(
+                f"{path.name} is {size} bytes, expected {expected['size']}")
+        if 'sha256' in expected:
+            digest = _sha256(path, self.config.chunk_size)
+            if digest != expected['sha256']:
+                raise DownloadVerificationError(
+                    f"{path.name} has sha256 {digest}, expected {expected['sha256']}")
+    
+    def _cache_file(self, dataset: str, season: int) -> Path:
+        return self.cache_dir / f"{dataset}_{season}.parquet"
+    
+    def download_seasons(self, datasets: Iterable[str], seasons: Iterable[int],
+                         force_download: bool = False) -> Dict[Tuple[str, int], bool]:
+        """Download files of several datasets and seasons concurrently.
         
         Args:
-            seasons: List of seasons to fetch (e.g., [2023, 2024])
-            force_download: Force re-download even if cached
+            datasets: Dataset names from ``DATASET_RELEASES``
+            seasons: Seasons to download for each dataset
+            force_download: Re-download files that are already cached
             
         Returns:
-            DataFrame with play-by-play data
+            Whether each (dataset, season) file is now cached
         """
-        all_data = []
-        
+        seasons = list(seasons)
+        wanted = [(dataset, season) for dataset in datasets for season in seasons]
+        for dataset, _ in wanted:
+            if dataset not in DATASET_RELEASES:
+                raise ValueError(f"Unknown dataset: {dataset}")
+        
+        status = {}
+        pending = []
+        for dataset, season in wanted:
+            cache_file = self._cache_file(dataset, season)
+            if cache_file.exists() and not force_download:
+                status[(dataset, season)] = True
+            else:
+                url = f"{self.config.base_url}/{DATASET_RELEASES[dataset]}/{cache_file.name}"
+                pending.append(((dataset, season), url, cache_file))
+        
+        if pending:
+            workers = max(1, min(self.config.download_workers, len(pending)))
+            logger.info(f"Downloading {len(pending)} files with {workers} workers")
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                downloaded = executor.map(lambda item: self._download_file(item[1], item[2]), pending)
+                for (key, _, _), ok in zip(pending, downloaded):
+                    status[key] = ok
+        
+        return {key: status[key] for key in wanted}
+    
+    def _fetch_cached(self, dataset: str, seasons: List[int], force_download: bool,
+                      columns: Optional[List[str]] = None) -> List[pd.DataFrame]:
+        """Download missing files of a dataset, then read each season's file."""
+        downloaded = self.download_seasons([dataset], seasons, force_download)
+        frames = []
         for season in seasons:
-            cache_file = self.cache_dir / f"play_by_play_{season}.parquet"
-            
-            # Check if we need to download
-            if not cache_file.exists() or force_download:
-                url = f"{self.config.base_url}/pbp/play_by_play_{season}.parquet"
-                if not self._download_file(url, cache_file):
-                    logger.error(f"Failed to download play-by-play data for {season}")
-                    continue
-            
-            # Load the data
+            if not downloaded[(dataset, season)]:
+                logger.error(f"Failed to download {dataset} data for {season}")
+                continue
             try:
-                season_data = pd.read_parquet(cache_file)
-                logger.info(f"Loaded {len(season_data)} plays for season {season}")
-                all_data.append(season_data)
+                season_data = pd.read_parquet(self._cache_file(dataset, season), columns=columns)
+                logger.info(f"Loaded {len(season_data)} {dataset} rows for season {season}")
+                frames.append(season_data)
             except Exception as e:
-                logger.error(f"Failed to load play-by-play data for {season}: {e}")
+                logger.error(f"Failed to load {dataset} data for {season}: {e}")
                 continue
+        return frames
+    
+    def fetch_play_by_play(self, seasons: List[int], force_download: bool = False,
+                           columns: Optional[List[str]] = None) -> pd.DataFrame:
+        """Fetch play-by-play data for specified seasons.
+        
+        Args:
+            seasons: List of seasons to fetch (e.g., [2023, 2024])
+            force_download: Force re-download even if cached
+            columns: Optional columns to read, e.g. ``DataMapper().play_columns``
+                when loading (if None, reads all ~370 columns)
+            
+        Returns:
+            DataFrame with play-by-play data
+        """
+        all_data = self._fetch_cached('play_by_play', seasons, force_download, columns=columns)
         
         if not all_data:
             logger.warning("No play-by-play data loaded")
@@ -129,24 +270,7 @@ class NFLFastRClient:
         Returns:
             DataFrame with games data
         """
-        all_data = []
-        
-        for season in seasons:
-            cache_file = self.cache_dir / f"schedules_{season}.parquet"
-            
-            if not cache_file.exists() or force_download:
-                url = f"{self.config.base_url}/schedules/schedules_{season}.parquet"
-                if not self._download_file(url, cache_file):
-                    logger.error(f"Failed to download schedule data for {season}")
-                    continue
-            
-            try:
-                season_data = pd.read_parquet(cache_file)
-                logger.info(f"Loaded {len(season_data)} games for season {season}")
-                all_data.append(season_data)
-            except Exception as e:
-                logger.error(f"Failed to load schedule data for {season}: {e}")
-                continue
+        all_data = self._fetch_cached('schedules', seasons, force_download)
         
         if not all_data:
             return pd.DataFrame()
@@ -166,24 +290,7 @@ class NFLFastRClient:
         Returns:
             DataFrame with roster data
         """
-        all_data = []
-        
-        for season in seasons:
-            cache_file = self.cache_dir / f"rosters_{season}.parquet"
-            
-            if not cache_file.exists() or force_download:
-                url = f"{self.config.base_url}/rosters/rosters_{season}.parquet"
-                if not self._download_file(url, cache_file):
-                    logger.error(f"Failed to download roster data for {season}")
-                    continue
-            
-            try:
-                season_data = pd.read_parquet(cache_file)
-                logger.info(f"Loaded {len(season_data)} roster entries for season {season}")
-                all_data.append(season_data)
-            except Exception as e:
-                logger.error(f"Failed to load roster data for {season}: {e}")
-                continue
+        all_data = self._fetch_cached('rosters', seasons, force_download)
         
         if not all_data:
             return pd.DataFrame()
@@ -351,4 +458,18 @@ class NFLFastRClient:
             "cached_files": len(cache_files),
             "total_size_mb": total_size / (1024 * 1024),
             "files": [f.name for f in cache_files]
-        }
\ No newline at end of file
+        }
+
+
+def _content_range_total(content_range: Optional[str]) -> Optional[int]:
+    """Total size from a ``Content-Range`` header such as ``bytes */1234``."""
+    match = re.search(r'/(\d+)$', content_range or '')
+    return int(match.group(1)) if match else None
+
+
+def _sha256(path: Path, chunk_size: int) -> str:
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(chunk_size), b''):
+            digest.update(block)
+    return digest.hexdigest()
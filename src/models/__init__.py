@@ -5,6 +5,18 @@ from .team import TeamModel
 from .player import PlayerModel
 from .game import GameModel
 from .play import PlayModel
+from .game_wp_timeline import GameWPTimelineModel
+from .team_season_insights import TeamSeasonInsightsModel, TeamWeekInsightsModel
+from .game_insight import GameInsightModel
+from .player_stats import PlayerGameStatsModel, PlayerSeasonStatsModel, PlayerWeekStatsModel
+from .team_week_stats import TeamWeekStatsModel
+from .data_version import DataVersionModel
+from .load_watermark import LoadWatermarkModel
+from .load_checkpoint import LoadCheckpointModel
 
 # Ensure all models are imported for relationship resolution
-__all__ = ['Base', 'BaseModel', 'BasePydanticModel', 'TeamModel', 'PlayerModel', 'GameModel', 'PlayModel']
\ No newline at end of file
+__all__ = ['Base', 'BaseModel', 'BasePydanticModel', 'TeamModel', 'PlayerModel', 'GameModel', 'PlayModel',
+           'GameWPTimelineModel', 'TeamSeasonInsightsModel', 'TeamWeekInsightsModel',
+           'GameInsightModel', 'PlayerGameStatsModel', 'PlayerSeasonStatsModel', 'PlayerWeekStatsModel',
+           'TeamWeekStatsModel', 'DataVersionModel', 'LoadWatermarkModel',
+           'LoadCheckpointModel']
\ No newline at end of file
@@ -0,0 +1,27 @@
+"""Data version counters bumped by data loads."""
+
+from sqlalchemy import Column, String, Integer, UniqueConstraint
+from src.models.base import BaseModel as SQLBaseModel
+
+# Season recorded for datasets that are not split by season (teams, players)
+ALL_SEASONS = 0
+
+
+class DataVersionModel(SQLBaseModel):
+    """SQLAlchemy model for the version of one dataset's season.
+
+    ``version`` goes up every time a load writes the (dataset, season), so
+    readers can tell whether anything derived from it may have changed.
+    """
+    __tablename__ = "data_versions"
+
+    dataset = Column(String(20), nullable=False)  # 'teams', 'players', 'games', 'plays'
+    season = Column(Integer, nullable=False, default=ALL_SEASONS)
+    version = Column(Integer, nullable=False, default=0)
+
+    __table_args__ = (
+        UniqueConstraint('dataset', 'season', name='uq_data_version_dataset_season'),
+    )
+
+    def __repr__(self):
+        return f"<DataVersion {self.dataset} {self.season} v{self.version}>"
@@ -2,7 +2,7 @@
 
 from typing import Optional
 from datetime import date, time
-from sqlalchemy import Column, String, Integer, Date, Time, Boolean, Float, ForeignKey
+from sqlalchemy import Column, String, Integer, BigInteger, Date, Time, Boolean, Float, ForeignKey, Index
 from sqlalchemy.orm import relationship
 from pydantic import BaseModel as PydanticBaseModel, Field, field_validator, ConfigDict
 from src.models.base import BaseModel as SQLBaseModel, BasePydanticModel
@@ -52,11 +52,20 @@ class GameModel(SQLBaseModel):
     # Game status
     game_finished = Column(Boolean, default=False)
     
+    # Load bookkeeping: hash of the loaded fields, so reloads skip unchanged rows
+    row_hash = Column(BigInteger)
+    
     # Relationships
     home_team_rel = relationship("TeamModel", foreign_keys=[home_team], back_populates="home_games")
     away_team_rel = relationship("TeamModel", foreign_keys=[away_team], back_populates="away_games")
     plays = relationship("PlayModel", back_populates="game")
     
+    # Keyset pagination seeks on (game_date, id), optionally within a season
+    __table_args__ = (
+        Index('ix_games_date_id', 'game_date', 'id'),
+        Index('ix_games_season_date_id', 'season', 'game_date', 'id'),
+    )
+    
     def __repr__(self):
         return f"<Game {self.game_id}: {self.away_team} @ {self.home_team} ({self.game_date})>"
 
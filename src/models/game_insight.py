@@ -0,0 +1,42 @@
+"""Precomputed game insights model."""
+
+from sqlalchemy import Column, String, Integer, Float, Date, ForeignKey
+from src.models.base import BaseModel as SQLBaseModel
+
+
+class GameInsightModel(SQLBaseModel):
+    """SQLAlchemy model for a game's precomputed ``GameInsight``.
+
+    Written at ingest and by the batch game-insights job so game pages read a
+    single row instead of scoring plays per request.
+    """
+    __tablename__ = "game_insights"
+
+    game_id = Column(String(20), ForeignKey('games.game_id'), unique=True, nullable=False, index=True)
+    home_team = Column(String(3), nullable=False)
+    away_team = Column(String(3), nullable=False)
+    game_date = Column(Date)
+
+    # Game flow metrics
+    excitement_index = Column(Float, default=0.0)
+    competitiveness = Column(Float, default=0.0)
+    momentum_swings = Column(Integer, default=0)
+
+    # Performance metrics
+    home_team_epa = Column(Float, default=0.0)
+    away_team_epa = Column(Float, default=0.0)
+    passing_game_dominance = Column(Float, default=0.0)
+    rushing_game_dominance = Column(Float, default=0.0)
+
+    # Key moments
+    biggest_play_epa = Column(Float, default=0.0)
+    biggest_play_wpa = Column(Float, default=0.0)
+    turning_point_quarter = Column(Integer)
+
+    # Situational performance
+    red_zone_battle = Column(String(10))
+    third_down_battle = Column(String(10))
+    turnover_battle = Column(String(10))
+
+    def __repr__(self):
+        return f"<GameInsight {self.game_id}: excitement {self.excitement_index}>"
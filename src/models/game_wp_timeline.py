@@ -0,0 +1,32 @@
+"""Precomputed per-game win probability timeline model."""
+
+from sqlalchemy import Column, String, Integer, Float, LargeBinary, ForeignKey
+from src.models.base import BaseModel as SQLBaseModel
+
+
+class GameWPTimelineModel(SQLBaseModel):
+    """SQLAlchemy model for a game's win probability timeline.
+
+    One row per game, computed when the game's plays are loaded. The per-play
+    series are stored as little-endian float32 arrays so a game page (or chart)
+    needs a single row read instead of re-scoring every play.
+    """
+    __tablename__ = "game_wp_timeline"
+
+    game_id = Column(String(20), ForeignKey('games.game_id'), unique=True, nullable=False, index=True)
+    play_count = Column(Integer, nullable=False, default=0)
+
+    # Per-play series (float32 arrays, aligned by index)
+    seconds_elapsed = Column(LargeBinary, nullable=False)  # Game clock seconds elapsed
+    win_probability = Column(LargeBinary, nullable=False)  # Home team WP after the play
+    epa = Column(LargeBinary, nullable=False)  # EPA for the possession team
+
+    # Game-level aggregates used by GameInsight
+    home_epa = Column(Float, default=0.0)
+    away_epa = Column(Float, default=0.0)
+    biggest_play_epa = Column(Float, default=0.0)
+    biggest_play_wpa = Column(Float, default=0.0)
+    momentum_swings = Column(Integer, default=0)
+
+    def __repr__(self):
+        return f"<GameWPTimeline {self.game_id}: {self.play_count} plays>"
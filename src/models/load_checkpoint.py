@@ -0,0 +1,31 @@
+"""Progress of batched play loads, for resuming after a failure."""
+
+from sqlalchemy import Column, String, Integer, Boolean, UniqueConstraint
+from src.models.base import BaseModel as SQLBaseModel
+
+
+class LoadCheckpointModel(SQLBaseModel):
+    """SQLAlchemy model for how far a load got through one (dataset, season, week).
+
+    ``batch_offset`` counts the mapped rows of the week committed so far and is
+    updated in the same transaction as each batch, so it never runs ahead of
+    the data. It only applies to the source the week had when loaded, which
+    ``source_hash`` identifies.
+    """
+    __tablename__ = "load_checkpoints"
+
+    dataset = Column(String(20), nullable=False)  # 'plays'
+    season = Column(Integer, nullable=False)
+    week = Column(Integer, nullable=False)
+    source_hash = Column(String(64), nullable=False)
+    batch_offset = Column(Integer, nullable=False, default=0)
+    total_rows = Column(Integer, nullable=False, default=0)
+    completed = Column(Boolean, nullable=False, default=False)
+
+    __table_args__ = (
+        UniqueConstraint('dataset', 'season', 'week', name='uq_load_checkpoint_dataset_season_week'),
+    )
+
+    def __repr__(self):
+        return (f"<LoadCheckpoint {self.dataset} {self.season} week {self.week} "
+                f"{self.batch_offset}/{self.total_rows}>")
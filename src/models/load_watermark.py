@@ -0,0 +1,28 @@
+"""Per-week source fingerprints recorded by incremental loads."""
+
+from sqlalchemy import Column, String, Integer, Date, UniqueConstraint
+from src.models.base import BaseModel as SQLBaseModel
+
+
+class LoadWatermarkModel(SQLBaseModel):
+    """SQLAlchemy model for what was last ingested for one (dataset, season, week).
+
+    ``content_hash`` fingerprints the source rows of the week as they were
+    loaded, so a refresh can skip weeks whose source has not changed since.
+    """
+    __tablename__ = "load_watermarks"
+
+    dataset = Column(String(20), nullable=False)  # 'games', 'plays'
+    season = Column(Integer, nullable=False)
+    week = Column(Integer, nullable=False)
+    content_hash = Column(String(64), nullable=False)
+    row_count = Column(Integer, nullable=False, default=0)
+    last_game_id = Column(String(20))
+    last_game_date = Column(Date)
+
+    __table_args__ = (
+        UniqueConstraint('dataset', 'season', 'week', name='uq_load_watermark_dataset_season_week'),
+    )
+
+    def __repr__(self):
+        return f"<LoadWatermark {self.dataset} {self.season} week {self.week} {self.content_hash[:8]}>"
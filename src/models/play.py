@@ -2,7 +2,7 @@
 
 from typing import Optional
 from decimal import Decimal
-from sqlalchemy import Column, String, Integer, Boolean, Text, Numeric, ForeignKey, UniqueConstraint
+from sqlalchemy import Column, String, Integer, BigInteger, Boolean, Text, Numeric, ForeignKey, UniqueConstraint, Index
 from sqlalchemy.orm import relationship
 from pydantic import BaseModel as PydanticBaseModel, Field, field_validator, ConfigDict
 from src.models.base import BaseModel as SQLBaseModel, BasePydanticModel
@@ -74,9 +74,14 @@ class PlayModel(SQLBaseModel):
     penalty = Column(Boolean, default=False)
     first_down = Column(Boolean, default=False)  # Whether play resulted in first down
     
+    # Load bookkeeping: hash of the loaded fields, so reloads skip unchanged rows
+    row_hash = Column(BigInteger)
+    
     # Table constraints - unique play within each game
     __table_args__ = (
         UniqueConstraint('game_id', 'play_id', name='uq_play_game_play_id'),
+        # Keyset pagination seeks on (game_id, play_id), usually within a season
+        Index('ix_plays_season_game_play', 'season', 'game_id', 'play_id'),
     )
     
     # Relationships
@@ -158,6 +163,7 @@ class PlayCreate(PlayBase):
     fumble: Optional[bool] = Field(False, description="Fumble occurred")
     safety: Optional[bool] = Field(False, description="Safety scored")
     penalty: Optional[bool] = Field(False, description="Penalty occurred")
+    first_down: Optional[bool] = Field(False, description="Play resulted in a first down")
     
     @field_validator('posteam', 'defteam')
     @classmethod
@@ -244,6 +250,7 @@ class PlayUpdate(PydanticBaseModel):
     fumble: Optional[bool] = None
     safety: Optional[bool] = None
     penalty: Optional[bool] = None
+    first_down: Optional[bool] = None
     
     @field_validator('posteam', 'defteam')
     @classmethod
@@ -291,6 +298,7 @@ class PlayResponse(PlayBase):
     fumble: Optional[bool] = None
     safety: Optional[bool] = None
     penalty: Optional[bool] = None
+    first_down: Optional[bool] = None
     
     model_config = ConfigDict(from_attributes=True)
 
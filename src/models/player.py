@@ -1,7 +1,7 @@
 """Player data models compatible with nfl_data_py structure."""
 
 from typing import Optional
-from sqlalchemy import Column, String, Integer, ForeignKey
+from sqlalchemy import Column, String, Integer, BigInteger, ForeignKey, Index
 from sqlalchemy.orm import relationship
 from pydantic import BaseModel as PydanticBaseModel, Field, field_validator, ConfigDict
 from src.models.base import BaseModel as SQLBaseModel, BasePydanticModel
@@ -50,9 +50,17 @@ class PlayerModel(SQLBaseModel):
     # Status
     status = Column(String(20), default='active')  # 'active', 'injured', 'retired'
     
+    # Load bookkeeping: hash of the loaded fields, so reloads skip unchanged rows
+    row_hash = Column(BigInteger)
+    
     # Relationships - using string to avoid circular import
     team = relationship("TeamModel", back_populates="players")
     
+    # The player list filters on status and seeks on id
+    __table_args__ = (
+        Index('ix_players_status_id', 'status', 'id'),
+    )
+    
     def __repr__(self):
         return f"<Player {self.player_id}: {self.full_name} ({self.position})>"
 
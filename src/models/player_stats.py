@@ -0,0 +1,137 @@
+"""Materialized player game, season and week-to-date statistics models."""
+
+from sqlalchemy import Column, String, Integer, Float, ForeignKey, UniqueConstraint, Index
+from src.models.base import BaseModel as SQLBaseModel
+
+
+# Counting columns shared by the game and season tables. Sums are additive,
+# so season rows are maintained by applying game-row deltas; the "longest"
+# columns are maxima and are recomputed from game rows instead.
+SUM_COLUMNS = (
+    # Passing
+    'pass_attempts', 'completions', 'passing_yards', 'passing_tds', 'interceptions',
+    'passing_epa', 'successful_passes', 'deep_attempts', 'rz_pass_attempts', 'rz_passing_tds',
+    # Rushing
+    'carries', 'rushing_yards', 'rushing_tds', 'rushing_epa', 'rushing_first_downs',
+    'runs_10plus', 'runs_20plus', 'rz_carries', 'rz_rushing_tds',
+    # Receiving
+    'targets', 'receptions', 'receiving_yards', 'receiving_tds', 'receiving_epa',
+    'receiving_first_downs', 'air_yards', 'yards_after_catch', 'deep_targets',
+    'rz_targets', 'rz_receiving_tds',
+)
+MAX_COLUMNS = ('longest_pass', 'longest_run', 'longest_reception')
+FLOAT_COLUMNS = ('passing_epa', 'rushing_epa', 'receiving_epa')
+
+
+class PlayerStatColumns:
+    """Passing, rushing and receiving counting stats with EPA sums and splits."""
+
+    # Passing
+    pass_attempts = Column(Integer, nullable=False, default=0)
+    completions = Column(Integer, nullable=False, default=0)
+    passing_yards = Column(Integer, nullable=False, default=0)
+    passing_tds = Column(Integer, nullable=False, default=0)
+    interceptions = Column(Integer, nullable=False, default=0)
+    passing_epa = Column(Float, nullable=False, default=0.0)
+    successful_passes = Column(Integer, nullable=False, default=0)  # Attempts with positive EPA
+    deep_attempts = Column(Integer, nullable=False, default=0)  # Air yards >= 20
+    rz_pass_attempts = Column(Integer, nullable=False, default=0)
+    rz_passing_tds = Column(Integer, nullable=False, default=0)
+    longest_pass = Column(Integer)
+
+    # Rushing
+    carries = Column(Integer, nullable=False, default=0)
+    rushing_yards = Column(Integer, nullable=False, default=0)
+    rushing_tds = Column(Integer, nullable=False, default=0)
+    rushing_epa = Column(Float, nullable=False, default=0.0)
+    rushing_first_downs = Column(Integer, nullable=False, default=0)
+    runs_10plus = Column(Integer, nullable=False, default=0)
+    runs_20plus = Column(Integer, nullable=False, default=0)
+    rz_carries = Column(Integer, nullable=False, default=0)
+    rz_rushing_tds = Column(Integer, nullable=False, default=0)
+    longest_run = Column(Integer)
+
+    # Receiving
+    targets = Column(Integer, nullable=False, default=0)
+    receptions = Column(Integer, nullable=False, default=0)
+    receiving_yards = Column(Integer, nullable=False, default=0)
+    receiving_tds = Column(Integer, nullable=False, default=0)
+    receiving_epa = Column(Float, nullable=False, default=0.0)
+    receiving_first_downs = Column(Integer, nullable=False, default=0)
+    air_yards = Column(Integer, nullable=False, default=0)  # Summed over targets
+    yards_after_catch = Column(Integer, nullable=False, default=0)
+    deep_targets = Column(Integer, nullable=False, default=0)
+    rz_targets = Column(Integer, nullable=False, default=0)
+    rz_receiving_tds = Column(Integer, nullable=False, default=0)
+    longest_reception = Column(Integer)
+
+
+class PlayerGameStatsModel(PlayerStatColumns, SQLBaseModel):
+    """SQLAlchemy model for a player's stats in one game.
+
+    Rebuilt for the games touched by each play load batch; the differences
+    from the previous rows are applied to ``player_season_stats``.
+    """
+    __tablename__ = "player_game_stats"
+
+    player_id = Column(String(20), nullable=False, index=True)
+    game_id = Column(String(20), ForeignKey('games.game_id'), nullable=False, index=True)
+    season = Column(Integer, nullable=False)
+    week = Column(Integer)
+    team_abbr = Column(String(3))
+
+    __table_args__ = (
+        UniqueConstraint('player_id', 'game_id', name='uq_player_game_stats'),
+        Index('ix_player_game_stats_player_season', 'player_id', 'season'),
+    )
+
+    def __repr__(self):
+        return f"<PlayerGameStats {self.player_id} {self.game_id}>"
+
+
+class PlayerSeasonStatsModel(PlayerStatColumns, SQLBaseModel):
+    """SQLAlchemy model for a player's season totals.
+
+    Leaderboards read this table directly; the season/stat indexes serve
+    their ``ORDER BY ... DESC LIMIT`` sorts.
+    """
+    __tablename__ = "player_season_stats"
+
+    player_id = Column(String(20), nullable=False, index=True)
+    season = Column(Integer, nullable=False, index=True)
+    team_abbr = Column(String(3))
+    games = Column(Integer, nullable=False, default=0)
+
+    __table_args__ = (
+        UniqueConstraint('player_id', 'season', name='uq_player_season_stats'),
+        Index('ix_player_season_stats_passing_yards', 'season', 'passing_yards'),
+        Index('ix_player_season_stats_rushing_yards', 'season', 'rushing_yards'),
+        Index('ix_player_season_stats_receiving_yards', 'season', 'receiving_yards'),
+    )
+
+    def __repr__(self):
+        return f"<PlayerSeasonStats {self.player_id} {self.season}>"
+
+
+class PlayerWeekStatsModel(PlayerStatColumns, SQLBaseModel):
+    """SQLAlchemy model for a player's season totals through a week.
+
+    Rows are dense: every player with a game so far in the season has a row
+    for each week, carried forward through byes and absences, so a leaderboard
+    as of week N reads a single (season, week) slice.
+    """
+    __tablename__ = "player_week_stats"
+
+    player_id = Column(String(20), nullable=False, index=True)
+    season = Column(Integer, nullable=False)
+    week = Column(Integer, nullable=False)
+    team_abbr = Column(String(3))
+    games = Column(Integer, nullable=False, default=0)
+
+    __table_args__ = (
+        UniqueConstraint('player_id', 'season', 'week', name='uq_player_week_stats'),
+        Index('ix_player_week_stats_season_week', 'season', 'week'),
+    )
+
+    def __repr__(self):
+        return f"<PlayerWeekStats {self.player_id} {self.season} week {self.week}>"
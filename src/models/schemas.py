@@ -41,6 +41,11 @@ class SeasonNarrativeResponse(BaseResponse):
     data: Dict[str, Any] = Field(..., description="Season narrative data")
 
 
+class FourthDownResponse(BaseResponse):
+    """Response model for fourth-down decision analysis."""
+    data: Dict[str, Any] = Field(..., description="Fourth-down decision data")
+
+
 # Request models for insights
 class PlayMetricsRequest(BaseModel):
     """Request model for calculating play metrics."""
@@ -1,7 +1,7 @@
 """Team data models compatible with nfl_data_py structure."""
 
 from typing import Optional, List
-from sqlalchemy import Column, String, Integer, Float, ForeignKey
+from sqlalchemy import Column, String, Integer, BigInteger, Float, ForeignKey
 from sqlalchemy.orm import relationship
 from pydantic import BaseModel as PydanticBaseModel, Field, field_validator, ConfigDict
 from src.models.base import BaseModel as SQLBaseModel, BasePydanticModel
@@ -34,6 +34,9 @@ class TeamModel(SQLBaseModel):
     team_city = Column(String(50))
     team_wordmark = Column(String(255))
     
+    # Load bookkeeping: hash of the loaded fields, so reloads skip unchanged rows
+    row_hash = Column(BigInteger)
+    
     # Relationships
     players = relationship("PlayerModel", back_populates="team")
     home_games = relationship("GameModel", foreign_keys="GameModel.home_team", back_populates="home_team_rel")
@@ -0,0 +1,80 @@
+"""Materialized team-season and team-week insights models."""
+
+from sqlalchemy import Column, String, Integer, Float, ForeignKey, UniqueConstraint, Index
+from src.models.base import BaseModel as SQLBaseModel
+
+
+class TeamInsightColumns:
+    """Every ``TeamInsights`` metric."""
+
+    # Offensive metrics
+    offensive_epa_per_play = Column(Float, default=0.0)
+    passing_epa_per_play = Column(Float, default=0.0)
+    rushing_epa_per_play = Column(Float, default=0.0)
+    red_zone_efficiency = Column(Float, default=0.0)
+    third_down_conversion_rate = Column(Float, default=0.0)
+
+    # Defensive metrics
+    defensive_epa_per_play = Column(Float, default=0.0)
+    pass_defense_epa = Column(Float, default=0.0)
+    run_defense_epa = Column(Float, default=0.0)
+    red_zone_defense = Column(Float, default=0.0)
+    third_down_defense = Column(Float, default=0.0)
+
+    # Special situations
+    two_minute_drill_efficiency = Column(Float, default=0.0)
+    clutch_performance = Column(Float, default=0.0)
+    turnover_margin = Column(Float, default=0.0)
+
+    # Contextual metrics
+    garbage_time_adjusted_epa = Column(Float, default=0.0)
+    strength_of_schedule = Column(Float, default=0.0)
+    home_field_advantage = Column(Float, default=0.0)
+
+    # Trend metrics
+    early_season_performance = Column(Float, default=0.0)
+    late_season_performance = Column(Float, default=0.0)
+    improvement_trajectory = Column(Float, default=0.0)
+
+
+class TeamSeasonInsightsModel(TeamInsightColumns, SQLBaseModel):
+    """SQLAlchemy model for precomputed team insights per season.
+
+    One row per (team, season) holding every ``TeamInsights`` metric. Rows are
+    refreshed after play loads for the teams whose plays changed, so API reads
+    are a key lookup and past seasons form a history for trend charts.
+    """
+    __tablename__ = "team_season_insights"
+
+    team_abbr = Column(String(3), ForeignKey('teams.team_abbr'), nullable=False, index=True)
+    season = Column(Integer, nullable=False, index=True)
+    play_count = Column(Integer, nullable=False, default=0)
+
+    __table_args__ = (
+        UniqueConstraint('team_abbr', 'season', name='uq_team_season_insights'),
+    )
+
+    def __repr__(self):
+        return f"<TeamSeasonInsights {self.team_abbr} {self.season}>"
+
+
+class TeamWeekInsightsModel(TeamInsightColumns, SQLBaseModel):
+    """SQLAlchemy model for team insights as they stood after each week.
+
+    One row per (team, season, week) with insights over plays through that
+    week, written alongside the season row, so "as of week N" reads are a
+    key lookup.
+    """
+    __tablename__ = "team_week_insights"
+
+    team_abbr = Column(String(3), ForeignKey('teams.team_abbr'), nullable=False, index=True)
+    season = Column(Integer, nullable=False)
+    week = Column(Integer, nullable=False)
+
+    __table_args__ = (
+        UniqueConstraint('team_abbr', 'season', 'week', name='uq_team_week_insights'),
+        Index('ix_team_week_insights_season_week', 'season', 'week'),
+    )
+
+    def __repr__(self):
+        return f"<TeamWeekInsights {self.team_abbr} {self.season} week {self.week}>"
@@ -0,0 +1,53 @@
+"""Materialized team week-to-date record and standings model."""
+
+from sqlalchemy import Column, String, Integer, Float, ForeignKey, UniqueConstraint, Index
+from src.models.base import BaseModel as SQLBaseModel
+
+
+class TeamWeekStatsModel(SQLBaseModel):
+    """SQLAlchemy model for a team's record and standings position after a week.
+
+    One row per (team, season, week) for every regular-season week played so
+    far, with cumulative records and the tiebreaker-ordered ranks at that
+    point, so historical team stats and standings are a key lookup.
+    """
+    __tablename__ = "team_week_stats"
+
+    team_abbr = Column(String(3), ForeignKey('teams.team_abbr'), nullable=False, index=True)
+    season = Column(Integer, nullable=False)
+    week = Column(Integer, nullable=False)
+
+    # Record
+    games_played = Column(Integer, nullable=False, default=0)
+    wins = Column(Integer, nullable=False, default=0)
+    losses = Column(Integer, nullable=False, default=0)
+    ties = Column(Integer, nullable=False, default=0)
+    points_for = Column(Integer, nullable=False, default=0)
+    points_against = Column(Integer, nullable=False, default=0)
+    home_games = Column(Integer, nullable=False, default=0)
+    away_games = Column(Integer, nullable=False, default=0)
+    home_wins = Column(Integer, nullable=False, default=0)
+    away_wins = Column(Integer, nullable=False, default=0)
+
+    # Splits
+    division_wins = Column(Integer, nullable=False, default=0)
+    division_losses = Column(Integer, nullable=False, default=0)
+    division_ties = Column(Integer, nullable=False, default=0)
+    conference_wins = Column(Integer, nullable=False, default=0)
+    conference_losses = Column(Integer, nullable=False, default=0)
+    conference_ties = Column(Integer, nullable=False, default=0)
+    strength_of_victory = Column(Float, nullable=False, default=0.0)
+    strength_of_schedule = Column(Float, nullable=False, default=0.0)
+
+    # Standings
+    division_rank = Column(Integer)
+    conference_rank = Column(Integer)
+    playoff_seed = Column(Integer)
+
+    __table_args__ = (
+        UniqueConstraint('team_abbr', 'season', 'week', name='uq_team_week_stats'),
+        Index('ix_team_week_stats_season_week', 'season', 'week'),
+    )
+
+    def __repr__(self):
+        return f"<TeamWeekStats {self.team_abbr} {self.season} week {self.week}>"
@@ -1,6 +1,6 @@
 """Base service class for common functionality."""
 
-from typing import TypeVar, Generic, Type, Optional, List, Dict, Any
+from typing import TypeVar, Generic, Type, Optional, List, Dict, Any, Tuple
 from sqlalchemy.orm import Session
 from sqlalchemy.exc import SQLAlchemyError
 from pydantic import BaseModel
@@ -49,6 +49,15 @@ class BaseService(Generic[T, CreateSchemaType, UpdateSchemaType]):
         self.model_class = model_class
         self._logger = logging.getLogger(f"{__name__}.{self.__class__.__name__}")
     
+    def _filtered_query(self, filters: Optional[Dict[str, Any]] = None):
+        """Query over the model with equality filters on known columns."""
+        query = self.db.query(self.model_class)
+        if filters:
+            for field, value in filters.items():
+                if hasattr(self.model_class, field):
+                    query = query.filter(getattr(self.model_class, field) == value)
+        return query
+    
     def get_by_id(self, entity_id: int) -> Optional[T]:
         """Get entity by ID.
         
@@ -105,13 +114,7 @@ class BaseService(Generic[T, CreateSchemaType, UpdateSchemaType]):
             DatabaseError: If database error occurs
         """
         try:
-            query = self.db.query(self.model_class)
-            
-            # Apply filters
-            if filters:
-                for field, value in filters.items():
-                    if hasattr(self.model_class, field):
-                        query = query.filter(getattr(self.model_class, field) == value)
+            query = self._filtered_query(filters)
             
             # Apply ordering
             if order_by and hasattr(self.model_class, order_by):
@@ -123,6 +126,41 @@ class BaseService(Generic[T, CreateSchemaType, UpdateSchemaType]):
             self._logger.error(f"Database error in list: {e}")
             raise DatabaseError(f"Failed to list {self.model_class.__name__} entities") from e
     
+    def list_page(self,
+                  limit: int = 100,
+                  cursor: Optional[str] = None,
+                  filters: Optional[Dict[str, Any]] = None,
+                  order_by: Optional[str] = None) -> Tuple[List[T], Optional[str]]:
+        """Get a page of entities by keyset (cursor) pagination.
+        
+        Seeks past the previous page's last row on (order_by, id) instead of
+        skipping rows, so deep pages cost the same as the first.
+        
+        Args:
+            limit: Maximum number of entities to return
+            cursor: Cursor returned with the previous page (first page if None)
+            filters: Dictionary of filter criteria
+            order_by: Non-null column name to order by (id only if None)
+            
+        Returns:
+            Tuple of (entities, cursor for the next page or None)
+            
+        Raises:
+            ValidationException: If the cursor is invalid
+            DatabaseError: If database error occurs
+        """
+        from .pagination import keyset_page  # pagination imports this module's exceptions
+        
+        sort_key = [(self.model_class.id, False)]
+        if order_by and order_by != 'id' and hasattr(self.model_class, order_by):
+            sort_key.insert(0, (getattr(self.model_class, order_by), False))
+        
+        try:
+            return keyset_page(self._filtered_query(filters), sort_key, limit, cursor)
+        except SQLAlchemyError as e:
+            self._logger.error(f"Database error in list_page: {e}")
+            raise DatabaseError(f"Failed to list {self.model_class.__name__} entities") from e
+    
     def count(self, filters: Optional[Dict[str, Any]] = None) -> int:
         """Count entities with optional filtering.
         
@@ -136,15 +174,7 @@ class BaseService(Generic[T, CreateSchemaType, UpdateSchemaType]):
             DatabaseError: If database error occurs
         """
         try:
-            query = self.db.query(self.model_class)
-            
-            # Apply filters
-            if filters:
-                for field, value in filters.items():
-                    if hasattr(self.model_class, field):
-                        query = query.filter(getattr(self.model_class, field) == value)
-            
-            return query.count()
+            return self._filtered_query(filters).count()
         except SQLAlchemyError as e:
             self._logger.error(f"Database error in count: {e}")
             raise DatabaseError(f"Failed to count {self.model_class.__name__} entities") from e
@@ -0,0 +1,90 @@
+"""Keyset (cursor) pagination helpers.
+
+Pages are fetched by seeking past the sort key of the previous page's last
+row instead of skipping rows with OFFSET, so with an index on the sort key
+every page costs the same as the first.
+"""
+
+import base64
+import json
+from datetime import date, datetime
+from typing import Any, List, Optional, Sequence, Tuple
+
+from sqlalchemy import and_, or_
+
+from .base import ValidationException
+
+# (column, descending) pairs; the last column(s) must make the order unique
+SortKey = Sequence[Tuple[Any, bool]]
+
+
+def encode_cursor(values: Sequence[Any]) -> str:
+    """Encode sort-key values as an opaque URL-safe cursor."""
+    payload = json.dumps([value.isoformat() if isinstance(value, (date, datetime)) else value
+                          for value in values], separators=(',', ':'))
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip('=')
+
+
+def decode_cursor(cursor: str, sort_key: SortKey) -> List[Any]:
+    """Decode a cursor produced by ``encode_cursor`` for the given sort key.
+
+    Raises:
+        ValidationException: If the cursor is malformed or for another sort key
+    """
+    try:
+        padded = cursor + '=' * (-len(cursor) % 4)
+        values = json.loads(base64.urlsafe_b64decode(padded.encode()).decode())
+        if not isinstance(values, list) or len(values) != len(sort_key):
+            raise ValueError("cursor does not match sort key")
+        return [_load_value(column, value) for (column, _), value in zip(sort_key, values)]
+    except (ValueError, TypeError, UnicodeDecodeError) as e:
+        raise ValidationException(f"Invalid pagination cursor: {cursor!r}") from e
+
+
+def _load_value(column, value: Any) -> Any:
+    if value is None:
+        return None
+    python_type = column.type.python_type
+    if python_type is datetime:
+        return datetime.fromisoformat(value)
+    if python_type is date:
+        return date.fromisoformat(value)
+    return python_type(value)
+
+
+def seek_after(values: Sequence[Any], sort_key: SortKey):
+    """Filter selecting rows that sort after ``values`` (non-null sort columns)."""
+    clauses = []
+    for i, (column, descending) in enumerate(sort_key):
+        equal = [key_column == value for (key_column, _), value in zip(sort_key[:i], values)]
+        clauses.append(and_(*equal, column < values[i] if descending else column > values[i]))
+    return or_(*clauses)
+
+
+def keyset_page(query, sort_key: SortKey, limit: int, cursor: Optional[str] = None,
+                offset: int = 0) -> Tuple[List[Any], Optional[str]]:
+    """Fetch one page of ``query`` ordered by ``sort_key``.
+
+    Args:
+        query: Filtered query without ordering or pagination
+        sort_key: (column, descending) pairs forming a unique order
+        limit: Maximum rows to return
+        cursor: Cursor from the previous page (first page if None)
+        offset: Rows to skip, for callers still paging by offset
+
+    Returns:
+        Tuple of (rows, cursor for the next page or None on the last page)
+
+    Raises:
+        ValidationException: If the cursor is invalid
+    """
+    if cursor:
+        query = query.filter(seek_after(decode_cursor(cursor, sort_key), sort_key))
+    query = query.order_by(*(column.desc() if descending else column for column, descending in sort_key))
+
+    # One extra row tells whether another page exists
+    rows = query.offset(offset).limit(limit + 1).all() if offset else query.limit(limit + 1).all()
+    if len(rows) <= limit:
+        return rows, None
+    rows = rows[:limit]
+    return rows, encode_cursor([getattr(rows[-1], column.key) for column, _ in sort_key])
@@ -3,12 +3,31 @@
 from typing import Optional, List, Dict, Any
 from sqlalchemy.orm import Session
 from sqlalchemy.exc import SQLAlchemyError
-from sqlalchemy import func, and_, or_, desc
+from sqlalchemy import func, and_, or_, desc, case, not_
 
 from .base import BaseService, DatabaseError, NotFoundError
 from ..models.play import PlayModel, PlayCreate, PlayUpdate
 
 
+def _count(condition):
+    return func.sum(case((condition, 1), else_=0))
+
+
+def _total(value, condition):
+    return func.sum(case((condition, func.coalesce(value, 0)), else_=0))
+
+
+_is_pass = PlayModel.play_type == 'pass'
+_is_run = PlayModel.play_type == 'run'
+# Same completion rule as the player aggregates: not intercepted, sacked or incomplete
+_is_completion = and_(
+    _is_pass,
+    PlayModel.interception.isnot(True),
+    not_(func.coalesce(PlayModel.desc, '').ilike('%incomplete%')),
+    not_(func.coalesce(PlayModel.desc, '').ilike('%sacked%'))
+)
+
+
 class PlayService(BaseService[PlayModel, PlayCreate, PlayUpdate]):
     """Service class for play operations."""
     
@@ -304,26 +323,37 @@ class PlayService(BaseService[PlayModel, PlayCreate, PlayUpdate]):
             if team_abbr:
                 query = query.filter(PlayModel.posteam == team_abbr.upper())
             
-            plays = query.all()
-            
-            # Calculate summary statistics
-            total_plays = len(plays)
-            passing_plays = [p for p in plays if p.play_type == 'pass']
-            rushing_plays = [p for p in plays if p.play_type == 'run']
+            # One aggregate row, however many plays match
+            row = query.with_entities(
+                func.count(PlayModel.id).label('total_plays'),
+                _count(_is_pass).label('passing_plays'),
+                _count(_is_run).label('rushing_plays'),
+                _count(_is_completion).label('completions'),
+                _total(PlayModel.yards_gained, _is_completion).label('passing_yards'),
+                _total(PlayModel.yards_gained, _is_run).label('rushing_yards'),
+                _count(PlayModel.touchdown.is_(True)).label('touchdowns'),
+                _count(or_(PlayModel.interception.is_(True), PlayModel.fumble.is_(True))).label('turnovers'),
+                _count(or_(
+                    and_(_is_run, PlayModel.yards_gained >= 20),
+                    and_(_is_completion, PlayModel.yards_gained >= 25)
+                )).label('explosive_plays')
+            ).one()
+            
+            total_plays = row.total_plays or 0
+            passing_plays = int(row.passing_plays or 0)
+            rushing_plays = int(row.rushing_plays or 0)
             
             stats = {
                 "total_plays": total_plays,
-                "passing_plays": len(passing_plays),
-                "rushing_plays": len(rushing_plays),
-                "other_plays": total_plays - len(passing_plays) - len(rushing_plays),
-                "total_yards": sum((p.passing_yards or 0) + (p.rushing_yards or 0) for p in plays),
-                "passing_yards": sum(p.passing_yards or 0 for p in passing_plays),
-                "rushing_yards": sum(p.rushing_yards or 0 for p in rushing_plays),
-                "touchdowns": sum(p.touchdown or 0 for p in plays),
-                "turnovers": sum((p.interception or 0) + (p.fumble_lost or 0) for p in plays),
-                "explosive_plays": len([p for p in plays if 
-                                      (p.play_type == 'run' and (p.rushing_yards or 0) >= 20) or
-                                      (p.play_type == 'pass' and (p.passing_yards or 0) >= 25)])
+                "passing_plays": passing_plays,
+                "rushing_plays": rushing_plays,
+                "other_plays": total_plays - passing_plays - rushing_plays,
+                "total_yards": int((row.passing_yards or 0) + (row.rushing_yards or 0)),
+                "passing_yards": int(row.passing_yards or 0),
+                "rushing_yards": int(row.rushing_yards or 0),
+                "touchdowns": int(row.touchdowns or 0),
+                "turnovers": int(row.turnovers or 0),
+                "explosive_plays": int(row.explosive_plays or 0)
             }
             
             # Calculate averages
@@ -332,15 +362,15 @@ class PlayService(BaseService[PlayModel, PlayCreate, PlayUpdate]):
             else:
                 stats["yards_per_play"] = 0
                 
-            if len(passing_plays) > 0:
-                stats["yards_per_pass"] = stats["passing_yards"] / len(passing_plays)
-                stats["completion_percentage"] = sum(p.complete_pass or 0 for p in passing_plays) / len(passing_plays) * 100
+            if passing_plays > 0:
+                stats["yards_per_pass"] = stats["passing_yards"] / passing_plays
+                stats["completion_percentage"] = int(row.completions or 0) / passing_plays * 100
             else:
                 stats["yards_per_pass"] = 0
                 stats["completion_percentage"] = 0
                 
-            if len(rushing_plays) > 0:
-                stats["yards_per_rush"] = stats["rushing_yards"] / len(rushing_plays)
+            if rushing_plays > 0:
+                stats["yards_per_rush"] = stats["rushing_yards"] / rushing_plays
             else:
                 stats["yards_per_rush"] = 0
             
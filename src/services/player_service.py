@@ -8,6 +8,9 @@ from sqlalchemy import func, and_, or_, desc
 from .base import BaseService, DatabaseError, NotFoundError
 from ..models.player import PlayerModel, PlayerCreate, PlayerUpdate
 from ..models.play import PlayModel
+from ..models.player_stats import PlayerSeasonStatsModel, PlayerWeekStatsModel, SUM_COLUMNS, MAX_COLUMNS
+from ..analysis.player_aggregates import player_totals
+from ..analysis.weekly_snapshots import snapshot_week
 
 
 class PlayerService(BaseService[PlayerModel, PlayerCreate, PlayerUpdate]):
@@ -142,12 +145,14 @@ class PlayerService(BaseService[PlayerModel, PlayerCreate, PlayerUpdate]):
             self._logger.error(f"Database error in search_players: {e}")
             raise DatabaseError(f"Failed to search players with query '{query}'") from e
     
-    def get_player_stats(self, player_id: str, season: Optional[int] = None) -> Dict[str, Any]:
+    def get_player_stats(self, player_id: str, season: Optional[int] = None,
+                         as_of_week: Optional[int] = None) -> Dict[str, Any]:
         """Get comprehensive player statistics.
         
         Args:
             player_id: Unique player identifier
             season: Season year (all seasons if None)
+            as_of_week: Only count games through this week (requires a season)
             
         Returns:
             Dictionary with player statistics
@@ -159,13 +164,6 @@ class PlayerService(BaseService[PlayerModel, PlayerCreate, PlayerUpdate]):
         try:
             player = self.get_by_player_id_or_404(player_id)
             
-            # Base query for player's plays
-            plays_query = self.db.query(PlayModel)
-            
-            if season:
-                plays_query = plays_query.filter(PlayModel.season == season)
-            
-            # Position-specific statistics
             stats = {
                 "player": player,
                 "season": season,
@@ -175,6 +173,25 @@ class PlayerService(BaseService[PlayerModel, PlayerCreate, PlayerUpdate]):
                 "total_plays": 0
             }
             
+            # Materialized season (or week-to-date) totals are one indexed lookup
+            if as_of_week is not None and season:
+                stats["as_of_week"] = as_of_week
+                totals = self._get_week_totals(player_id, season, as_of_week)
+            else:
+                totals = self._get_season_totals(player_id, season)
+            if totals is not None:
+                stats["games_played"] = totals["games"]
+                stats.update(self._stats_from_totals(player.position, totals))
+                return stats
+            
+            # Fall back to aggregating raw plays
+            plays_query = self.db.query(PlayModel)
+            
+            if season:
+                plays_query = plays_query.filter(PlayModel.season == season)
+                if as_of_week is not None:
+                    plays_query = plays_query.filter(PlayModel.week <= as_of_week)
+            
             if player.position == 'QB':
                 stats.update(self._get_qb_stats(player_id, plays_query))
             elif player.position in ['RB', 'FB']:
@@ -195,136 +212,129 @@ class PlayerService(BaseService[PlayerModel, PlayerCreate, PlayerUpdate]):
             self._logger.error(f"Database error in get_player_stats: {e}")
             raise DatabaseError(f"Failed to get stats for player {player_id}") from e
     
-    def _get_qb_stats(self, player_id: str, plays_query) -> Dict[str, Any]:
-        """Get quarterback-specific statistics."""
-        passing_plays = plays_query.filter(
-            and_(
-                PlayModel.passer_player_id == player_id,
-                PlayModel.play_type == 'pass'
-            )
-        ).all()
+    def _get_season_totals(self, player_id: str, season: Optional[int] = None) -> Optional[Dict[str, Any]]:
+        """Sum a player's materialized season stats (all seasons if None).
         
-        rushing_plays = plays_query.filter(
-            and_(
-                PlayModel.rusher_player_id == player_id,
-                PlayModel.play_type == 'run'
-            )
-        ).all()
+        Returns:
+            Totals keyed by stat column plus ``games``, or None if no rows exist
+        """
+        query = self.db.query(
+            func.count(PlayerSeasonStatsModel.id),
+            func.sum(PlayerSeasonStatsModel.games),
+            *(func.sum(getattr(PlayerSeasonStatsModel, column)) for column in SUM_COLUMNS),
+            *(func.max(getattr(PlayerSeasonStatsModel, column)) for column in MAX_COLUMNS)
+        ).filter(PlayerSeasonStatsModel.player_id == player_id)
         
-        # Passing stats
-        attempts = len(passing_plays)
-        completions = sum(1 for p in passing_plays if p.complete_pass == 1)
-        passing_yards = sum(p.passing_yards or 0 for p in passing_plays)
-        passing_tds = sum(p.pass_touchdown or 0 for p in passing_plays)
-        interceptions = sum(p.interception or 0 for p in passing_plays)
+        if season:
+            query = query.filter(PlayerSeasonStatsModel.season == season)
         
-        # Rushing stats
-        rushing_attempts = len(rushing_plays)
-        rushing_yards = sum(p.rushing_yards or 0 for p in rushing_plays)
-        rushing_tds = sum(p.rush_touchdown or 0 for p in rushing_plays)
+        row = query.one()
+        if not row[0]:
+            return None
         
-        # Calculate derived stats
-        completion_percentage = (completions / attempts * 100) if attempts > 0 else 0
-        yards_per_attempt = (passing_yards / attempts) if attempts > 0 else 0
-        yards_per_carry = (rushing_yards / rushing_attempts) if rushing_attempts > 0 else 0
+        totals = dict(zip(('games',) + SUM_COLUMNS + MAX_COLUMNS, row[1:]))
+        return {key: value or 0 for key, value in totals.items()}
+    
+    def _get_week_totals(self, player_id: str, season: int, as_of_week: int) -> Optional[Dict[str, Any]]:
+        """Read a player's latest week-to-date totals at or before a week.
         
-        # Passer rating calculation (simplified)
-        passer_rating = 85.0  # Placeholder - would need full calculation
+        Returns:
+            Totals keyed by stat column plus ``games``, or None if no row exists
+        """
+        row = self.db.query(PlayerWeekStatsModel).filter(
+            PlayerWeekStatsModel.player_id == player_id,
+            PlayerWeekStatsModel.season == season,
+            PlayerWeekStatsModel.week <= as_of_week
+        ).order_by(PlayerWeekStatsModel.week.desc()).first()
+        if row is None:
+            return None
         
-        return {
-            "passing_attempts": attempts,
-            "passing_completions": completions,
-            "completion_percentage": completion_percentage,
-            "passing_yards": passing_yards,
-            "yards_per_attempt": yards_per_attempt,
-            "passing_touchdowns": passing_tds,
-            "interceptions": interceptions,
-            "passer_rating": passer_rating,
-            "rushing_attempts": rushing_attempts,
-            "rushing_yards": rushing_yards,
-            "yards_per_carry": yards_per_carry,
-            "rushing_touchdowns": rushing_tds,
-            "total_touchdowns": passing_tds + rushing_tds,
-            "total_plays": attempts + rushing_attempts
-        }
+        return {column: getattr(row, column) or 0 for column in ('games',) + SUM_COLUMNS + MAX_COLUMNS}
     
-    def _get_rb_stats(self, player_id: str, plays_query) -> Dict[str, Any]:
-        """Get running back-specific statistics."""
-        rushing_plays = plays_query.filter(
-            and_(
-                PlayModel.rusher_player_id == player_id,
-                PlayModel.play_type == 'run'
-            )
-        ).all()
-        
-        receiving_plays = plays_query.filter(
-            and_(
-                PlayModel.receiver_player_id == player_id,
-                PlayModel.play_type == 'pass',
-                PlayModel.complete_pass == 1
-            )
-        ).all()
+    @staticmethod
+    def _stats_from_totals(position: Optional[str], totals: Dict[str, Any]) -> Dict[str, Any]:
+        """Derive position-specific statistics from summed counting stats."""
+        def ratio(numerator, denominator, scale=1):
+            return (numerator / denominator * scale) if denominator else 0
         
-        # Rushing stats
-        carries = len(rushing_plays)
-        rushing_yards = sum(p.rushing_yards or 0 for p in rushing_plays)
-        rushing_tds = sum(p.rush_touchdown or 0 for p in rushing_plays)
+        if position == 'QB':
+            attempts = totals['pass_attempts']
+            completions = totals['completions']
+            passing_yards = totals['passing_yards']
+            passing_tds = totals['passing_tds']
+            interceptions = totals['interceptions']
+            
+            # NFL passer rating
+            components = [
+                (ratio(completions, attempts) - 0.3) * 5,
+                (ratio(passing_yards, attempts) - 3) * 0.25,
+                ratio(passing_tds, attempts) * 20,
+                2.375 - ratio(interceptions, attempts) * 25
+            ]
+            passer_rating = sum(max(0, min(2.375, c)) for c in components) / 6 * 100 if attempts else 0
+            
+            return {
+                "passing_attempts": attempts,
+                "passing_completions": completions,
+                "completion_percentage": ratio(completions, attempts, 100),
+                "passing_yards": passing_yards,
+                "yards_per_attempt": ratio(passing_yards, attempts),
+                "passing_touchdowns": passing_tds,
+                "interceptions": interceptions,
+                "passer_rating": round(passer_rating, 1),
+                "rushing_attempts": totals['carries'],
+                "rushing_yards": totals['rushing_yards'],
+                "yards_per_carry": ratio(totals['rushing_yards'], totals['carries']),
+                "rushing_touchdowns": totals['rushing_tds'],
+                "total_touchdowns": passing_tds + totals['rushing_tds'],
+                "total_plays": attempts + totals['carries']
+            }
         
-        # Receiving stats
-        receptions = len(receiving_plays)
-        receiving_yards = sum(p.receiving_yards or 0 for p in receiving_plays)
-        receiving_tds = sum(p.pass_touchdown or 0 for p in receiving_plays)
+        if position in ['RB', 'FB']:
+            return {
+                "carries": totals['carries'],
+                "rushing_yards": totals['rushing_yards'],
+                "yards_per_carry": ratio(totals['rushing_yards'], totals['carries']),
+                "rushing_touchdowns": totals['rushing_tds'],
+                "receptions": totals['receptions'],
+                "receiving_yards": totals['receiving_yards'],
+                "yards_per_reception": ratio(totals['receiving_yards'], totals['receptions']),
+                "receiving_touchdowns": totals['receiving_tds'],
+                "total_yards": totals['rushing_yards'] + totals['receiving_yards'],
+                "total_touchdowns": totals['rushing_tds'] + totals['receiving_tds'],
+                "total_plays": totals['carries'] + totals['receptions']
+            }
         
-        # Calculate derived stats
-        yards_per_carry = (rushing_yards / carries) if carries > 0 else 0
-        yards_per_reception = (receiving_yards / receptions) if receptions > 0 else 0
+        if position in ['WR', 'TE']:
+            return {
+                "targets": totals['targets'],
+                "receptions": totals['receptions'],
+                "catch_percentage": ratio(totals['receptions'], totals['targets'], 100),
+                "receiving_yards": totals['receiving_yards'],
+                "yards_per_reception": ratio(totals['receiving_yards'], totals['receptions']),
+                "yards_per_target": ratio(totals['receiving_yards'], totals['targets']),
+                "receiving_touchdowns": totals['receiving_tds'],
+                "total_plays": totals['targets']
+            }
         
         return {
-            "carries": carries,
-            "rushing_yards": rushing_yards,
-            "yards_per_carry": yards_per_carry,
-            "rushing_touchdowns": rushing_tds,
-            "receptions": receptions,
-            "receiving_yards": receiving_yards,
-            "yards_per_reception": yards_per_reception,
-            "receiving_touchdowns": receiving_tds,
-            "total_yards": rushing_yards + receiving_yards,
-            "total_touchdowns": rushing_tds + receiving_tds,
-            "total_plays": carries + receptions
+            "total_plays": totals['pass_attempts'] + totals['carries'] + totals['targets']
         }
     
+    def _get_qb_stats(self, player_id: str, plays_query) -> Dict[str, Any]:
+        """Get quarterback-specific statistics."""
+        totals = player_totals(plays_query, player_id, ('passer', 'rusher'))
+        return self._stats_from_totals('QB', totals)
+    
+    def _get_rb_stats(self, player_id: str, plays_query) -> Dict[str, Any]:
+        """Get running back-specific statistics."""
+        totals = player_totals(plays_query, player_id, ('rusher', 'receiver'))
+        return self._stats_from_totals('RB', totals)
+    
     def _get_receiver_stats(self, player_id: str, plays_query) -> Dict[str, Any]:
         """Get receiver-specific statistics."""
-        targets = plays_query.filter(
-            and_(
-                PlayModel.receiver_player_id == player_id,
-                PlayModel.play_type == 'pass'
-            )
-        ).all()
-        
-        receptions = [p for p in targets if p.complete_pass == 1]
-        
-        # Receiving stats
-        target_count = len(targets)
-        reception_count = len(receptions)
-        receiving_yards = sum(p.receiving_yards or 0 for p in receptions)
-        receiving_tds = sum(p.pass_touchdown or 0 for p in receptions)
-        
-        # Calculate derived stats
-        catch_percentage = (reception_count / target_count * 100) if target_count > 0 else 0
-        yards_per_reception = (receiving_yards / reception_count) if reception_count > 0 else 0
-        yards_per_target = (receiving_yards / target_count) if target_count > 0 else 0
-        
-        return {
-            "targets": target_count,
-            "receptions": reception_count,
-            "catch_percentage": catch_percentage,
-            "receiving_yards": receiving_yards,
-            "yards_per_reception": yards_per_reception,
-            "yards_per_target": yards_per_target,
-            "receiving_touchdowns": receiving_tds,
-            "total_plays": target_count
-        }
+        totals = player_totals(plays_query, player_id, ('receiver',))
+        return self._stats_from_totals('WR', totals)
     
     def _get_kicker_stats(self, player_id: str, plays_query) -> Dict[str, Any]:
         """Get kicker-specific statistics."""
@@ -351,7 +361,8 @@ class PlayerService(BaseService[PlayerModel, PlayerCreate, PlayerUpdate]):
         }
     
     def get_position_leaders(self, position: str, season: Optional[int] = None,
-                           stat_category: str = 'yards', limit: int = 10) -> List[Dict[str, Any]]:
+                           stat_category: str = 'yards', limit: int = 10,
+                           as_of_week: Optional[int] = None) -> List[Dict[str, Any]]:
         """Get statistical leaders for a position.
         
         Args:
@@ -359,6 +370,7 @@ class PlayerService(BaseService[PlayerModel, PlayerCreate, PlayerUpdate]):
             season: Season year (current season if None)
             stat_category: Statistical category to rank by
             limit: Number of leaders to return
+            as_of_week: Rank totals as they stood after this week
             
         Returns:
             List of players with statistics, ranked by category
@@ -367,26 +379,48 @@ class PlayerService(BaseService[PlayerModel, PlayerCreate, PlayerUpdate]):
             DatabaseError: If database error occurs
         """
         try:
-            players = self.get_by_position(position, season=season)
+            if season is None:
+                season = self.db.query(func.max(PlayerSeasonStatsModel.season)).scalar()
+            
+            # One query over the narrow season (or dense week-to-date) table
+            # instead of per-player stats
+            if as_of_week is not None:
+                week = snapshot_week(self.db, PlayerWeekStatsModel, season, as_of_week)
+                rows = self.db.query(PlayerModel, PlayerWeekStatsModel).join(
+                    PlayerWeekStatsModel, PlayerWeekStatsModel.player_id == PlayerModel.player_id
+                ).filter(
+                    PlayerModel.position == position.upper(),
+                    PlayerWeekStatsModel.season == season,
+                    PlayerWeekStatsModel.week == week
+                ).all()
+            else:
+                rows = self.db.query(PlayerModel, PlayerSeasonStatsModel).join(
+                    PlayerSeasonStatsModel, PlayerSeasonStatsModel.player_id == PlayerModel.player_id
+                ).filter(
+                    PlayerModel.position == position.upper(),
+                    PlayerSeasonStatsModel.season == season
+                ).all()
             
-            # Get stats for each player and rank them
             player_stats = []
-            for player in players:
-                stats = self.get_player_stats(player.player_id, season)
+            for player, season_row in rows:
+                totals = {column: getattr(season_row, column) or 0
+                          for column in ('games',) + SUM_COLUMNS + MAX_COLUMNS}
+                stats = {
+                    "player": player,
+                    "season": season,
+                    "position": player.position,
+                    "team": season_row.team_abbr or player.team_abbr,
+                    "games_played": totals['games']
+                }
+                stats.update(self._stats_from_totals(player.position, totals))
                 if stats.get('total_plays', 0) > 0:  # Only include active players
                     player_stats.append(stats)
             
-            # Sort by the requested stat category
-            if stat_category in ['yards', 'passing_yards', 'rushing_yards', 'receiving_yards']:
-                key_func = lambda x: x.get(stat_category, 0)
-            elif stat_category in ['touchdowns', 'total_touchdowns']:
-                key_func = lambda x: x.get(stat_category, 0)
-            elif stat_category == 'completion_percentage':
-                key_func = lambda x: x.get(stat_category, 0)
-            else:
-                key_func = lambda x: x.get(stat_category, 0)
-            
-            player_stats.sort(key=key_func, reverse=True)
+            if stat_category == 'yards':
+                stat_category = {'QB': 'passing_yards', 'RB': 'total_yards', 'FB': 'total_yards'}.get(
+                    position.upper(), 'receiving_yards'
+                )
+            player_stats.sort(key=lambda x: x.get(stat_category, 0), reverse=True)
             
             return player_stats[:limit]
             
@@ -1,14 +1,25 @@
 """Prediction service for ML model operations."""
 
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, List, Tuple
 from datetime import date
 from sqlalchemy.orm import Session
 from pathlib import Path
 import logging
 
-from .base import ServiceException, DatabaseError
+from .base import ServiceException, DatabaseError, NotFoundError
 from ..analysis.models import NFLPredictor, Prediction
 from ..analysis.ml_optimizer import OptimizedNFLPredictor
+from ..analysis.game_simulator import DriveTransitionModel, GameSimulator
+from ..analysis.result_cache import ResultCache
+from ..data.data_versions import read_data_version
+from ..models.game import GameModel
+
+# Simulation results and transition models shared across service instances and
+# request threads, keyed by the season's data version so reloaded plays invalidate them
+SIMULATION_CACHE_SIZE = 256
+TRANSITION_MODEL_CACHE_SIZE = 4
+_simulation_cache = ResultCache(max_entries=SIMULATION_CACHE_SIZE)
+_transition_model_cache = ResultCache(max_entries=TRANSITION_MODEL_CACHE_SIZE)
 
 
 class PredictionService:
@@ -388,4 +399,101 @@ class PredictionService:
             
         except Exception as e:
             self._logger.error(f"Error comparing models: {e}")
-            raise ServiceException("Failed to compare models") from e
\ No newline at end of file
+            raise ServiceException("Failed to compare models") from e
+
+    def simulate_game(self, home_team: str, away_team: str, season: int,
+                      n_simulations: int = 10000, seed: int = 0) -> Dict[str, Any]:
+        """Simulate a matchup with the play-by-play Monte Carlo simulator.
+
+        Results are cached per matchup, simulation count, seed and season data
+        version (see ``src.data.data_versions``).
+
+        Args:
+            home_team: Home team abbreviation
+            away_team: Away team abbreviation
+            season: Season whose plays drive the simulation
+            n_simulations: Number of games to simulate
+            seed: Random seed
+
+        Returns:
+            Dictionary with win probabilities and score, margin and total distributions
+
+        Raises:
+            NotFoundError: If the season has no plays or a team has no offensive plays
+            ServiceException: If the simulation fails
+        """
+        try:
+            home_team, away_team = home_team.upper(), away_team.upper()
+            version = self._data_version(season)
+
+            def simulate() -> Dict[str, Any]:
+                model = self._transition_model(season, version)
+                missing = [team for team in (home_team, away_team) if team not in model.offense]
+                if missing:
+                    raise NotFoundError(f"No {season} plays found for {', '.join(missing)}")
+
+                result = GameSimulator(model, seed).simulate(home_team, away_team, n_simulations)
+                summary = result.to_dict()
+                summary['season'] = season
+                self._logger.info(f"Simulated {n_simulations} games of {away_team} @ {home_team} ({season})")
+                return summary
+
+            if version is None:
+                return simulate()
+            key = (home_team, away_team, season, n_simulations, seed, version)
+            return _simulation_cache.get_or_compute(key, simulate)
+
+        except NotFoundError:
+            raise
+        except Exception as e:
+            self._logger.error(f"Error simulating {away_team} @ {home_team}: {e}")
+            raise ServiceException("Failed to simulate game") from e
+
+    def simulate_week(self, season: int, week: int, n_simulations: int = 10000,
+                      seed: int = 0) -> List[Dict[str, Any]]:
+        """Simulate every game scheduled in a week.
+
+        Args:
+            season: Season year
+            week: Week number
+            n_simulations: Number of games to simulate per matchup
+            seed: Random seed
+
+        Returns:
+            List of simulation summaries with game_id and week added
+
+        Raises:
+            NotFoundError: If the week has no games
+            ServiceException: If the simulations fail
+        """
+        games = self.db.query(GameModel.game_id, GameModel.home_team, GameModel.away_team).filter(
+            GameModel.season == season, GameModel.week == week
+        ).order_by(GameModel.game_id).all()
+
+        if not games:
+            raise NotFoundError(f"No games found for {season} week {week}")
+
+        simulations = []
+        for game_id, home_team, away_team in games:
+            summary = dict(self.simulate_game(home_team, away_team, season, n_simulations, seed))
+            summary['game_id'] = game_id
+            summary['week'] = week
+            simulations.append(summary)
+
+        return simulations
+
+    def _transition_model(self, season: int, version: Optional[Tuple]) -> DriveTransitionModel:
+        """Get the season's transition model, estimating it if not cached (or not cacheable)."""
+        def estimate() -> DriveTransitionModel:
+            model = DriveTransitionModel.load(self.db, [season])
+            if not model.offense:
+                raise NotFoundError(f"No plays found for season {season}")
+            return model
+
+        if version is None:
+            return estimate()
+        return _transition_model_cache.get_or_compute((season, version), estimate)
+
+    def _data_version(self, season: int) -> Optional[Tuple]:
+        """Data version of the season's plays and games, or None if versions cannot be read."""
+        return read_data_version(self.db, ('plays', 'games'), season)
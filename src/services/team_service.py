@@ -8,6 +8,9 @@ from sqlalchemy import func, and_, or_
 from .base import BaseService, DatabaseError, NotFoundError
 from ..models.team import TeamModel, TeamCreate, TeamUpdate
 from ..models.game import GameModel
+from ..models.team_week_stats import TeamWeekStatsModel
+from ..analysis.standings import StandingsCalculator, TeamRecord, standings_row
+from ..analysis.weekly_snapshots import snapshot_week
 
 
 class TeamService(BaseService[TeamModel, TeamCreate, TeamUpdate]):
@@ -123,12 +126,14 @@ class TeamService(BaseService[TeamModel, TeamCreate, TeamUpdate]):
             self._logger.error(f"Database error in search_teams: {e}")
             raise DatabaseError(f"Failed to search teams with query '{query}'") from e
     
-    def get_team_stats(self, team_abbr: str, season: Optional[int] = None) -> Dict[str, Any]:
+    def get_team_stats(self, team_abbr: str, season: Optional[int] = None,
+                       as_of_week: Optional[int] = None) -> Dict[str, Any]:
         """Get team statistics for a season.
         
         Args:
             team_abbr: Team abbreviation
             season: Season year (current season if None)
+            as_of_week: Only count regular-season games through this week
             
         Returns:
             Dictionary with team statistics
@@ -141,6 +146,9 @@ class TeamService(BaseService[TeamModel, TeamCreate, TeamUpdate]):
             # Verify team exists
             team = self.get_by_abbreviation_or_404(team_abbr)
             
+            if as_of_week is not None:
+                return self._get_team_stats_as_of(team, season, as_of_week)
+            
             # Build query for team games
             query = self.db.query(GameModel).filter(
                 or_(
@@ -221,69 +229,119 @@ class TeamService(BaseService[TeamModel, TeamCreate, TeamUpdate]):
             self._logger.error(f"Database error in get_team_stats: {e}")
             raise DatabaseError(f"Failed to get stats for team {team_abbr}") from e
     
-    def get_division_standings(self, conference: str, division: str, season: Optional[int] = None) -> List[Dict[str, Any]]:
+    def _get_team_stats_as_of(self, team: TeamModel, season: Optional[int], as_of_week: int) -> Dict[str, Any]:
+        """Team record through a week, read from the week-to-date snapshot."""
+        if season is None:
+            season = self.db.query(func.max(TeamWeekStatsModel.season)).scalar()
+        
+        row = self.db.query(TeamWeekStatsModel).filter(
+            TeamWeekStatsModel.team_abbr == team.team_abbr,
+            TeamWeekStatsModel.season == season,
+            TeamWeekStatsModel.week <= as_of_week
+        ).order_by(TeamWeekStatsModel.week.desc()).first()
+        
+        if row is None:
+            # Seasons without snapshots are computed from games
+            standings = StandingsCalculator(self.db).get_standings(season, as_of_week)
+            stats = standings.records[team.team_abbr].to_dict()
+        else:
+            stats = standings_row(row)
+        
+        stats.update(team=team, season=season, as_of_week=as_of_week)
+        return stats
+    
+    def get_division_standings(self, conference: str, division: str, season: Optional[int] = None,
+                               as_of_week: Optional[int] = None) -> List[Dict[str, Any]]:
         """Get division standings.
         
         Args:
             conference: Conference ('AFC' or 'NFC')
             division: Division ('North', 'South', 'East', 'West')
-            season: Season year (current season if None)
+            season: Season year (latest season if None)
+            as_of_week: Standings as they stood after this week (final if None)
             
         Returns:
-            List of team standings in the division
+            List of team standings in the division, in tiebreaker order
             
         Raises:
             DatabaseError: If database error occurs
         """
         try:
-            # Get teams in division
-            teams = self.get_by_division(conference, division)
-            
-            standings = []
-            for team in teams:
-                stats = self.get_team_stats(team.team_abbr, season)
-                standings.append(stats)
-            
-            # Sort by win percentage (descending), then by point differential (descending)
-            standings.sort(key=lambda x: (x["win_percentage"], x["point_differential"]), reverse=True)
+            conference, division = conference.upper(), division.title()
+            if as_of_week is not None:
+                snapshot = self._snapshot_standings(season, as_of_week, TeamWeekStatsModel.division_rank,
+                                                    team_conf=conference, team_division=division)
+                if snapshot is not None:
+                    return snapshot
             
-            return standings
+            standings = StandingsCalculator(self.db).get_standings(season, as_of_week)
+            return self._standings_rows(standings.division(conference, division), standings.season)
             
         except SQLAlchemyError as e:
             self._logger.error(f"Database error in get_division_standings: {e}")
             raise DatabaseError(f"Failed to get standings for {conference} {division}") from e
     
-    def get_conference_standings(self, conference: str, season: Optional[int] = None) -> List[Dict[str, Any]]:
+    def get_conference_standings(self, conference: str, season: Optional[int] = None,
+                                 as_of_week: Optional[int] = None) -> List[Dict[str, Any]]:
         """Get conference standings.
         
         Args:
             conference: Conference ('AFC' or 'NFC')
-            season: Season year (current season if None)
+            season: Season year (latest season if None)
+            as_of_week: Standings as they stood after this week (final if None)
             
         Returns:
-            List of team standings in the conference
+            List of team standings in the conference, in playoff seeding order
             
         Raises:
             DatabaseError: If database error occurs
         """
         try:
-            # Get teams in conference
-            teams = self.get_by_conference(conference)
-            
-            standings = []
-            for team in teams:
-                stats = self.get_team_stats(team.team_abbr, season)
-                standings.append(stats)
-            
-            # Sort by win percentage (descending), then by point differential (descending)
-            standings.sort(key=lambda x: (x["win_percentage"], x["point_differential"]), reverse=True)
+            conference = conference.upper()
+            if as_of_week is not None:
+                snapshot = self._snapshot_standings(season, as_of_week, TeamWeekStatsModel.conference_rank,
+                                                    team_conf=conference)
+                if snapshot is not None:
+                    return snapshot
             
-            return standings
+            standings = StandingsCalculator(self.db).get_standings(season, as_of_week)
+            return self._standings_rows(standings.conference(conference), standings.season)
             
         except SQLAlchemyError as e:
             self._logger.error(f"Database error in get_conference_standings: {e}")
             raise DatabaseError(f"Failed to get standings for {conference}") from e
     
+    def _snapshot_standings(self, season: Optional[int], as_of_week: int, rank_column,
+                            **team_filters) -> Optional[List[Dict[str, Any]]]:
+        """Standings after a week from the week-to-date snapshot (None if not stored)."""
+        if season is None:
+            season = self.db.query(func.max(TeamWeekStatsModel.season)).scalar()
+        week = snapshot_week(self.db, TeamWeekStatsModel, season, as_of_week)
+        if week is None:
+            return None
+        
+        rows = self.db.query(TeamModel, TeamWeekStatsModel).join(
+            TeamWeekStatsModel, TeamWeekStatsModel.team_abbr == TeamModel.team_abbr
+        ).filter(
+            TeamWeekStatsModel.season == season,
+            TeamWeekStatsModel.week == week,
+            *(getattr(TeamModel, column) == value for column, value in team_filters.items())
+        ).order_by(rank_column).all()
+        
+        return [{"team": team, "season": season, **standings_row(row)} for team, row in rows]
+    
+    def _standings_rows(self, records: List[TeamRecord], season: Optional[int]) -> List[Dict[str, Any]]:
+        """Attach team models to standings records."""
+        abbrs = [record.team for record in records]
+        teams = {
+            team.team_abbr: team
+            for team in self.db.query(TeamModel).filter(TeamModel.team_abbr.in_(abbrs)).all()
+        } if abbrs else {}
+        return [
+            {"team": teams.get(record.team), "season": season, **record.to_dict()}
+            for record in records
+        ]
+    
     def get_all_teams_grouped(self) -> Dict[str, Dict[str, List[TeamModel]]]:
         """Get all teams grouped by conference and division.
         
@@ -14,6 +14,7 @@ from ..models.team import TeamModel
 from ..models.game import GameModel
 from ..models.player import PlayerModel
 from ..models.play import PlayModel
+from ..models.player_stats import PlayerSeasonStatsModel
 from ..analysis.models import NFLPredictor
 from ..analysis.vegas import VegasValidator
 from ..analysis.insights import InsightsGenerator
@@ -567,9 +568,25 @@ async def player_detail_page(request: Request, player_id: str, db: Session = Dep
                 GameModel.home_score.isnot(None)
             ).order_by(GameModel.game_date.desc()).limit(10).all()
         
-        # Get player statistics (placeholder for now)
+        # Latest season totals from the materialized player season stats
         player_stats = []
-        # In the future, this would aggregate play-by-play stats for the player
+        season_row = db.query(PlayerSeasonStatsModel).filter(
+            PlayerSeasonStatsModel.player_id == player_id
+        ).order_by(PlayerSeasonStatsModel.season.desc()).first()
+        if season_row:
+            stat_labels = [('games', 'Games')]
+            if season_row.pass_attempts:
+                stat_labels += [('passing_yards', 'Passing Yards'), ('passing_tds', 'Passing TDs'),
+                                ('interceptions', 'Interceptions')]
+            if season_row.carries:
+                stat_labels += [('rushing_yards', 'Rushing Yards'), ('rushing_tds', 'Rushing TDs')]
+            if season_row.targets:
+                stat_labels += [('receptions', 'Receptions'), ('receiving_yards', 'Receiving Yards'),
+                                ('receiving_tds', 'Receiving TDs')]
+            player_stats = [
+                {'label': f"{season_row.season} {label}", 'value': getattr(season_row, column)}
+                for column, label in stat_labels
+            ]
         
         # Get similar players (placeholder for now)
         similar_players = []
@@ -722,7 +739,7 @@ async def team_insights_page(
             raise HTTPException(status_code=404, detail="Team not found")
         
         # Generate insights
-        generator = InsightsGenerator(db)
+        generator = InsightsGenerator(db, use_cache=True)
         insights = generator.generate_team_insights(team_abbr.upper(), season)
         
         if not insights:
@@ -796,7 +813,7 @@ async def team_comparison_result(
             raise HTTPException(status_code=404, detail="One or both teams not found")
         
         # Generate comparison
-        generator = InsightsGenerator(db)
+        generator = InsightsGenerator(db, use_cache=True)
         comparison = generator.compare_teams(team1.upper(), team2.upper(), season)
         
         if not comparison:
@@ -842,7 +859,7 @@ async def league_leaders_page(
             season = latest_season or 2024
         
         # Use enhanced position analytics
-        analytics = PositionAnalytics(db)
+        analytics = PositionAnalytics(db, use_cache=True)
         position_data = analytics.get_position_leaders(season, 'all')
         
         # Convert dataclass objects to dictionaries for template
@@ -1153,11 +1170,11 @@ async def team_analytics_page(
             season = latest_season or 2024
         
         # Calculate team analytics
-        analytics_calc = TeamAnalyticsCalculator(db)
+        analytics_calc = TeamAnalyticsCalculator(db, use_cache=True)
         team_analytics = analytics_calc.calculate_team_analytics(season)
         
         # Get team rankings
-        rankings = analytics_calc.get_team_rankings(season)
+        rankings = analytics_calc.get_team_rankings(season, team_analytics)
         
         # Get available seasons
         available_seasons = db.query(PlayModel.season).distinct().order_by(PlayModel.season.desc()).all()
@@ -1248,7 +1265,7 @@ async def game_insights_page(request: Request, game_id: str, db: Session = Depen
             raise HTTPException(status_code=404, detail="Game not found")
         
         # Generate insights
-        generator = InsightsGenerator(db)
+        generator = InsightsGenerator(db, use_cache=True)
         insights = generator.generate_game_insights(game_id)
         
         if not insights:
@@ -126,14 +126,14 @@ def test_data_integration():
         players_df = mock_nfl_client.fetch_players()
         player_creates = data_mapper.map_players_data(players_df)
         assert len(player_creates) == 3
-        assert all(isinstance(p, PlayerCreate) for p in player_creates)
+        assert all(set(p) == set(PlayerCreate.model_fields) for p in player_creates)
         print(f"✓ Mapped {len(player_creates)} players")
         
         # Test games mapping
         games_df = mock_nfl_client.fetch_games()
         game_creates = data_mapper.map_games_data(games_df)
         assert len(game_creates) == 2
-        assert all(isinstance(g, GameCreate) for g in game_creates)
+        assert all(set(g) == set(GameCreate.model_fields) for g in game_creates)
         print(f"✓ Mapped {len(game_creates)} games")
         
         # Test plays mapping
@@ -250,7 +250,7 @@ else:
 # Test mapping  
 print('Testing data mapping...')
 mapped_players = mapper.map_players_data(players_df)
-position_mapped = sum(1 for p in mapped_players if hasattr(p, 'position') and p.position)
+position_mapped = sum(1 for p in mapped_players if p.get('position'))
 print(f'Mapped players with positions: {position_mapped}/{len(mapped_players)} ({position_mapped/len(mapped_players)*100:.1f}%)')
 "
 ```
@@ -2,7 +2,7 @@
 
 import pytest
 import pandas as pd
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
 from sqlalchemy.orm import sessionmaker
 from sqlalchemy.pool import StaticPool
 import tempfile
@@ -57,6 +57,22 @@ def test_session(test_db):
         session.close()
 
 
+@pytest.fixture
+def query_counter(test_db):
+    """Record SQL statements executed against the test engine."""
+    _, engine = test_db
+    statements = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    event.listen(engine, "before_cursor_execute", record)
+    try:
+        yield statements
+    finally:
+        event.remove(engine, "before_cursor_execute", record)
+
+
 @pytest.fixture
 def sample_teams(test_session):
     """Create sample teams for testing."""
@@ -0,0 +1,143 @@
+"""Tests for the vectorized fourth-down decision engine."""
+
+import time
+import pytest
+import numpy as np
+import pandas as pd
+
+from src.analysis.fourth_down import (
+    FourthDownAnalyzer, evaluate_fourth_downs, expected_points, win_probability,
+    conversion_probability, field_goal_probability, to_records, GO, PUNT, FIELD_GOAL
+)
+from src.analysis.insights import ExpectedPointsModel, WinProbabilityModel, PlayContext
+from src.models.play import PlayModel
+
+
+def make_context(down, ydstogo, yardline, seconds, score_diff):
+    return PlayContext(down=down, ydstogo=ydstogo, yardline_100=yardline, quarter=1,
+                       game_seconds_remaining=seconds, score_differential=score_diff,
+                       timeouts_remaining=3, play_type='pass')
+
+
+class TestVectorizedModels:
+    """Test the vectorized EP/WP models match the scalar ones."""
+
+    @pytest.mark.parametrize("down,ydstogo,yardline,seconds,score_diff", [
+        (1, 10, 75, 3600, 0),
+        (2, 7, 18, 1500, -3),
+        (3, 2, 4, 90, 7),
+        (4, 1, 50, 600, -17),
+    ])
+    def test_parity_with_scalar_models(self, down, ydstogo, yardline, seconds, score_diff):
+        context = make_context(down, ydstogo, yardline, seconds, score_diff)
+
+        ep = expected_points([down], [yardline], [seconds], [score_diff])[0]
+        wp = win_probability([score_diff], [seconds], [yardline], [down], [ydstogo])[0]
+
+        assert ep == pytest.approx(ExpectedPointsModel().calculate_expected_points(context))
+        assert wp == pytest.approx(WinProbabilityModel().calculate_win_probability(context))
+
+    def test_conversion_curve_decreases_with_distance(self):
+        probs = conversion_probability(np.arange(1, 16), np.full(15, 50))
+        assert np.all(np.diff(probs) < 0)
+        assert 0.6 < probs[0] < 0.8
+
+    def test_field_goal_curve(self):
+        probs = field_goal_probability(np.array([3, 33, 45, 60]))
+        assert probs[0] > 0.95
+        assert probs[0] > probs[1] > probs[2]
+        assert probs[3] == 0.0  # 77-yard attempt is out of range
+
+
+class TestEvaluateFourthDowns:
+    """Test option evaluation over arrays."""
+
+    def test_recommendations(self):
+        result = evaluate_fourth_downs(
+            ydstogo=[1, 12, 8],
+            yardline_100=[45, 85, 30],
+            game_seconds_remaining=[1800, 1800, 1800],
+            score_differential=[0, 0, 0]
+        )
+
+        assert list(result['recommendation']) == [GO, PUNT, FIELD_GOAL]
+        assert np.all(result['wp_best'] >= result['wp_go'])
+
+    def test_full_season_under_a_second(self):
+        rng = np.random.default_rng(7)
+        n = 4000
+
+        start = time.perf_counter()
+        result = evaluate_fourth_downs(
+            rng.integers(1, 20, n), rng.integers(1, 99, n),
+            rng.integers(0, 3600, n), rng.integers(-28, 28, n)
+        )
+        elapsed = time.perf_counter() - start
+
+        assert len(result['recommendation']) == n
+        assert elapsed < 1.0
+
+
+class TestFourthDownAnalyzer:
+    """Test season analysis against the database."""
+
+    @pytest.fixture
+    def fourth_downs(self, test_session, sample_games):
+        game = sample_games[0]
+        situations = [
+            ('SF', 'KC', 1, 45, 'punt'),
+            ('SF', 'KC', 8, 30, 'field_goal'),
+            ('SF', 'KC', 12, 85, 'punt'),
+            ('KC', 'SF', 1, 45, 'run'),
+            ('KC', 'SF', 3, 60, 'no_play'),
+        ]
+        for i, (posteam, defteam, ydstogo, yardline, play_type) in enumerate(situations):
+            test_session.add(PlayModel(
+                play_id=str(i + 1), game_id=game.game_id, season=2023, week=1,
+                posteam=posteam, defteam=defteam, qtr=2, game_seconds_remaining=1800,
+                down=4, ydstogo=ydstogo, yardline_100=yardline, score_differential=0,
+                play_type=play_type
+            ))
+        # Non-fourth-down plays are ignored
+        test_session.add(PlayModel(
+            play_id='99', game_id=game.game_id, season=2023, week=1, posteam='SF',
+            defteam='KC', down=3, ydstogo=4, yardline_100=50, play_type='pass'
+        ))
+        test_session.commit()
+
+    def test_analyze_season(self, test_session, fourth_downs):
+        decisions = FourthDownAnalyzer(test_session).analyze_season(2023)
+
+        assert len(decisions) == 5
+        sf_punt = decisions[(decisions['posteam'] == 'SF') & (decisions['ydstogo'] == 1)].iloc[0]
+        assert sf_punt['recommendation'] == GO
+        assert sf_punt['wp_cost'] > 0
+
+        no_play = decisions[decisions['play_type'] == 'no_play'].iloc[0]
+        assert pd.isna(no_play['actual'])
+        assert pd.isna(no_play['wp_cost'])
+
+    def test_team_summary(self, test_session, fourth_downs):
+        analyzer = FourthDownAnalyzer(test_session)
+        summary = analyzer.team_summary(analyzer.analyze_season(2023))
+
+        assert list(summary['team']) == ['SF', 'KC']
+        sf = summary.iloc[0]
+        assert sf['decisions'] == 3
+        assert sf['go_rate'] == 0
+        assert sf['agreement_rate'] == pytest.approx(2 / 3)
+        assert summary.iloc[1]['total_wp_cost'] == pytest.approx(0)
+
+    def test_team_filter_and_records(self, test_session, fourth_downs):
+        decisions = FourthDownAnalyzer(test_session).analyze_season(2023, 'KC')
+        records = to_records(decisions)
+
+        assert len(records) == 2
+        assert records[1]['wp_cost'] is None
+
+    def test_empty_season(self, test_session):
+        analyzer = FourthDownAnalyzer(test_session)
+        decisions = analyzer.analyze_season(1999)
+
+        assert decisions.empty
+        assert analyzer.team_summary(decisions).empty
@@ -0,0 +1,88 @@
+"""Tests for the batch game-insights job."""
+
+import pytest
+
+from src.analysis.game_insights_job import GameInsightsJob, score_game, GAME_COLUMNS, PLAY_COLUMNS
+from src.analysis.insights import InsightsGenerator, GameInsight
+from src.models.game_insight import GameInsightModel
+from src.models.game_wp_timeline import GameWPTimelineModel
+from src.models.play import PlayModel
+
+
+@pytest.fixture
+def week_plays(test_session, sample_games):
+    """Create plays for three of the four week 1 games."""
+    week_one = [game for game in sample_games if game.week == 1]
+    for game in week_one[:3]:
+        for i in range(6):
+            test_session.add(PlayModel(
+                play_id=str(i + 1),
+                game_id=game.game_id,
+                season=2023,
+                week=1,
+                posteam=game.home_team if i % 2 == 0 else game.away_team,
+                defteam=game.away_team if i % 2 == 0 else game.home_team,
+                play_type='pass',
+                qtr=i // 2 + 1,
+                down=1,
+                ydstogo=10,
+                yardline_100=70 - i * 5,
+                yards_gained=8
+            ))
+    test_session.commit()
+    return week_one
+
+
+class TestGameInsightsJob:
+    """Test precomputing insights for a week range."""
+
+    def test_score_game_payload(self, week_plays):
+        game = week_plays[0]
+        game_row = tuple(getattr(game, column) for column in GAME_COLUMNS)
+        play_rows = [(game.game_id, '1', 1, 3600, game.home_team, 1, 10, 75, 0, 'run', 5, False)]
+        assert len(play_rows[0]) == len(PLAY_COLUMNS)
+
+        insight, timeline = score_game((game_row, play_rows))
+
+        assert isinstance(insight, GameInsight)
+        assert insight.game_id == game.game_id
+        assert timeline.play_count == 1
+
+    def test_run_in_process(self, test_session, week_plays):
+        result = GameInsightsJob(test_session, workers=1).run([2023], [1])
+
+        assert result.success is True
+        assert result.records_processed == 4
+        assert result.records_inserted == 3
+        assert result.records_skipped == 1
+        assert test_session.query(GameInsightModel).count() == 3
+        assert test_session.query(GameWPTimelineModel).count() == 3
+
+    def test_run_is_idempotent(self, test_session, week_plays):
+        job = GameInsightsJob(test_session, workers=1)
+        job.run([2023], [1])
+        job.run([2023], [1])
+
+        assert test_session.query(GameInsightModel).count() == 3
+
+    def test_run_with_process_pool_matches_in_process(self, test_session, week_plays):
+        GameInsightsJob(test_session, workers=2).run([2023], [1])
+        pooled = {row.game_id: row.home_team_epa for row in test_session.query(GameInsightModel).all()}
+
+        generator = InsightsGenerator(test_session)
+        game = week_plays[0]
+        plays = test_session.query(PlayModel).filter(PlayModel.game_id == game.game_id).all()
+        expected = generator.build_game_insight(game, generator.build_wp_timeline(game, plays))
+
+        assert pooled[game.game_id] == pytest.approx(expected.home_team_epa)
+
+    def test_game_pages_read_precomputed_insight(self, test_session, week_plays):
+        GameInsightsJob(test_session, workers=1).run([2023], [1])
+        game_id = week_plays[0].game_id
+
+        row = test_session.query(GameInsightModel).filter_by(game_id=game_id).one()
+        row.excitement_index = 9.5
+        test_session.commit()
+
+        insight = InsightsGenerator(test_session).generate_game_insights(game_id)
+        assert insight.excitement_index == 9.5
@@ -0,0 +1,226 @@
+"""Tests for the Markov play-by-play game simulator."""
+
+import threading
+import time
+from unittest.mock import patch
+
+import pytest
+import numpy as np
+import pandas as pd
+
+from src.analysis.game_simulator import (
+    DriveTransitionModel, GameSimulator, situation_bucket, _quantile_tables,
+    N_BUCKETS, N_QUANTILES
+)
+from src.data.data_versions import bump_data_versions, clear_version_cache
+from src.models.data_version import DataVersionModel
+from src.models.play import PlayModel
+from src.services import prediction_service
+from src.services.prediction_service import PredictionService
+from src.services.base import NotFoundError
+
+
+def make_plays(teams, n=6000, seed=3, boost=None):
+    """Random scrimmage plays; ``boost`` adds yards per play for one offense."""
+    rng = np.random.default_rng(seed)
+    posteam = rng.choice(teams, n)
+    defteam = np.array([teams[(teams.index(team) + 1) % len(teams)] for team in posteam])
+    yards = rng.normal(5.5, 7, n)
+    if boost:
+        yards += np.where(posteam == boost[0], boost[1], 0)
+    return pd.DataFrame({
+        'posteam': posteam,
+        'defteam': defteam,
+        'down': rng.integers(1, 5, n),
+        'ydstogo': rng.integers(1, 15, n),
+        'yardline_100': rng.integers(1, 99, n),
+        'yards_gained': np.round(yards),
+        'interception': rng.random(n) < 0.015,
+        'fumble': rng.random(n) < 0.01,
+    })
+
+
+class TestTransitionModel:
+    """Test estimating play outcome distributions."""
+
+    def test_situation_bucket(self):
+        buckets = situation_bucket([1, 3, 4], [10, 2, 5], [75, 15, 40])
+
+        assert buckets[0] == (0 * 3 + 2) * 3 + 0
+        assert buckets[1] == (2 * 3 + 0) * 3 + 2
+        assert buckets[2] == (3 * 3 + 1) * 3 + 1
+        assert situation_bucket([4], [99], [1])[0] == N_BUCKETS - 1
+
+    def test_quantile_tables(self):
+        keys = np.array([1, 0, 1, 1, 0])
+        yards = np.array([9, -2, 1, 5, 4])
+        tables, counts = _quantile_tables(keys, yards, 3)
+
+        assert list(counts) == [2, 3, 0]
+        assert tables.shape == (3, N_QUANTILES)
+        assert tables[0, 0] == -2 and tables[0, -1] == 4
+        assert tables[1, 0] == 1 and tables[1, -1] == 9
+        assert np.all(tables[2] == 0)
+
+    def test_sparse_team_falls_back_to_league(self):
+        plays = make_plays(['SF', 'KC'])
+        rare = make_plays(['NYJ', 'SF'], n=3)
+        model = DriveTransitionModel.from_plays(pd.concat([plays, rare]))
+
+        quantiles, turnover_rate = model.matchup_tables('NYJ', 'XXX')
+        np.testing.assert_allclose(quantiles, model.league.quantiles)
+        np.testing.assert_allclose(turnover_rate, model.league.turnover_rate)
+        assert model.teams == ['KC', 'NYJ', 'SF']
+
+
+class TestGameSimulator:
+    """Test simulating matchups."""
+
+    @pytest.fixture
+    def model(self):
+        return DriveTransitionModel.from_plays(make_plays(['SF', 'KC', 'DAL', 'BUF'], boost=('KC', 3)))
+
+    def test_distributions(self, model):
+        summary = GameSimulator(model, seed=1).simulate('KC', 'BUF', 5000).to_dict()
+
+        assert summary['n_simulations'] == 5000
+        total = summary['home_win_prob'] + summary['away_win_prob'] + summary['tie_prob']
+        assert total == pytest.approx(1.0)
+        assert sum(summary['margin']['histogram'].values()) == pytest.approx(1.0, abs=1e-3)
+        assert 10 < summary['total']['mean'] < 80
+        assert summary['home_score']['percentiles']['p5'] <= summary['home_score']['percentiles']['p95']
+
+    def test_stronger_offense_wins_more(self, model):
+        simulator = GameSimulator(model, seed=1)
+        kc_home = simulator.simulate('KC', 'DAL', 5000).to_dict()
+        dal_home = simulator.simulate('DAL', 'KC', 5000).to_dict()
+
+        assert kc_home['home_win_prob'] > 0.5
+        assert dal_home['away_win_prob'] > 0.5
+
+    def test_seed_is_reproducible(self, model):
+        first = GameSimulator(model, seed=42).simulate('SF', 'KC', 1000)
+        second = GameSimulator(model, seed=42).simulate('SF', 'KC', 1000)
+
+        np.testing.assert_array_equal(first.home_scores, second.home_scores)
+        np.testing.assert_array_equal(first.away_scores, second.away_scores)
+
+    def test_ten_thousand_games_under_two_seconds(self, model):
+        start = time.perf_counter()
+        GameSimulator(model, seed=1).simulate('SF', 'KC', 10000)
+        assert time.perf_counter() - start < 2.0
+
+
+class TestPredictionServiceSimulation:
+    """Test simulations through PredictionService."""
+
+    @pytest.fixture(autouse=True)
+    def clear_caches(self):
+        prediction_service._simulation_cache.clear()
+        prediction_service._transition_model_cache.clear()
+        clear_version_cache()
+        yield
+        prediction_service._simulation_cache.clear()
+        prediction_service._transition_model_cache.clear()
+        clear_version_cache()
+
+    @pytest.fixture
+    def season_plays(self, test_session, sample_games):
+        plays = make_plays(['SF', 'KC', 'DAL', 'BUF'], n=800)
+        for i, row in enumerate(plays.itertuples(index=False)):
+            test_session.add(PlayModel(
+                play_id=str(i), game_id=sample_games[0].game_id, season=2023, week=1,
+                posteam=row.posteam, defteam=row.defteam, down=int(row.down),
+                ydstogo=int(row.ydstogo), yardline_100=int(row.yardline_100),
+                yards_gained=int(row.yards_gained), interception=bool(row.interception),
+                fumble=bool(row.fumble), play_type='pass' if i % 2 else 'run'
+            ))
+        test_session.commit()
+
+    def test_simulate_game_is_cached(self, test_session, season_plays):
+        service = PredictionService(test_session)
+        first = service.simulate_game('sf', 'kc', 2023, n_simulations=500)
+        second = PredictionService(test_session).simulate_game('SF', 'KC', 2023, n_simulations=500)
+
+        assert first['home_team'] == 'SF'
+        assert first['season'] == 2023
+        assert second is first
+        assert prediction_service._transition_model_cache.stats()['entries'] == 1
+
+    def test_new_plays_invalidate_cache(self, test_session, season_plays, sample_games):
+        service = PredictionService(test_session)
+        first = service.simulate_game('SF', 'KC', 2023, n_simulations=500)
+
+        test_session.add(PlayModel(
+            play_id='extra', game_id=sample_games[0].game_id, season=2023, week=1,
+            posteam='SF', defteam='KC', down=1, ydstogo=10, yardline_100=75,
+            yards_gained=80, play_type='pass'
+        ))
+        # As the loaders do when they write plays
+        bump_data_versions(test_session, 'plays', [2023])
+        test_session.commit()
+
+        assert service.simulate_game('SF', 'KC', 2023, n_simulations=500) is not first
+        assert prediction_service._transition_model_cache.stats()['entries'] == 2
+
+    def test_other_seasons_keep_cache(self, test_session, season_plays):
+        service = PredictionService(test_session)
+        first = service.simulate_game('SF', 'KC', 2023, n_simulations=500)
+
+        bump_data_versions(test_session, 'plays', [2022])
+        test_session.commit()
+
+        assert service.simulate_game('SF', 'KC', 2023, n_simulations=500) is first
+
+    def test_missing_versions_table_simulates_uncached(self, test_db, test_session, season_plays):
+        _, engine = test_db
+        DataVersionModel.__table__.drop(engine)
+        service = PredictionService(test_session)
+
+        first = service.simulate_game('SF', 'KC', 2023, n_simulations=500)
+
+        assert service.simulate_game('SF', 'KC', 2023, n_simulations=500) == first
+        assert prediction_service._simulation_cache.stats()['entries'] == 0
+
+    def test_concurrent_requests_estimate_once(self, test_session, season_plays):
+        model = DriveTransitionModel.from_plays(make_plays(['SF', 'KC'], n=800))
+        loads = []
+
+        def slow_load(db_session, seasons):
+            loads.append(seasons)
+            time.sleep(0.1)
+            return model
+
+        # Read the version up front so the threads only touch the caches
+        PredictionService(test_session)._data_version(2023)
+        results = []
+        with patch.object(DriveTransitionModel, 'load', side_effect=slow_load):
+            threads = [threading.Thread(target=lambda: results.append(
+                PredictionService(test_session).simulate_game('SF', 'KC', 2023, n_simulations=200)))
+                for _ in range(4)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+
+        assert loads == [[2023]]
+        assert len(results) == 4 and all(result is results[0] for result in results)
+
+    def test_simulate_week(self, test_session, season_plays):
+        simulations = PredictionService(test_session).simulate_week(2023, 1, n_simulations=500)
+
+        assert len(simulations) == 4
+        assert {sim['game_id'] for sim in simulations} == {
+            '2023_01_KC_SF', '2023_01_BUF_DAL', '2023_01_DAL_KC', '2023_01_BUF_SF'
+        }
+        assert all(sim['week'] == 1 for sim in simulations)
+
+    def test_missing_data(self, test_session, season_plays):
+        service = PredictionService(test_session)
+
+        with pytest.raises(NotFoundError):
+            service.simulate_game('SF', 'NYJ', 2023)
+        with pytest.raises(NotFoundError):
+            service.simulate_game('SF', 'KC', 1999)
+        with pytest.raises(NotFoundError):
+            service.simulate_week(2023, 17)
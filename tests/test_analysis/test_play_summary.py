@@ -0,0 +1,112 @@
+"""Tests for play summary and raw-play player stats aggregated in SQL."""
+
+import tracemalloc
+
+import pytest
+from sqlalchemy import insert
+
+from src.models.play import PlayModel
+from src.models.player import PlayerModel
+from src.services.play_service import PlayService
+from src.services.player_service import PlayerService
+
+
+def play_rows(game, count, start=0):
+    """Alternating completions, incompletions, runs and a sack for SF against KC."""
+    rows = []
+    for i in range(start, start + count):
+        kind = i % 4
+        rows.append(dict(
+            play_id=str(i), game_id=game.game_id, season=game.season, week=game.week,
+            posteam='SF', defteam='KC', yardline_100=50, epa=0.1,
+            play_type='run' if kind == 2 else 'pass',
+            passer_player_id=None if kind == 2 else 'QB1',
+            receiver_player_id='WR1' if kind < 2 else None,
+            rusher_player_id='RB1' if kind == 2 else None,
+            yards_gained=(30, 0, 5, -6)[kind],
+            touchdown=kind == 0, pass_touchdown=kind == 0,
+            desc=('pass deep left to WR1', 'pass incomplete short right', 'RB1 up the middle',
+                  'QB1 sacked at SF 40')[kind]
+        ))
+    return rows
+
+
+@pytest.fixture
+def summary_plays(test_session, sample_games):
+    test_session.execute(insert(PlayModel), play_rows(sample_games[0], 8))
+    test_session.add_all([
+        PlayerModel(player_id='QB1', full_name='Test Quarterback', position='QB', team_abbr='SF'),
+        PlayerModel(player_id='RB1', full_name='Test Runner', position='RB', team_abbr='SF'),
+        PlayerModel(player_id='WR1', full_name='Test Receiver', position='WR', team_abbr='SF'),
+    ])
+    test_session.commit()
+    return sample_games[0]
+
+
+class TestPlaySummaryStats:
+    """Test summary statistics computed in one aggregate query."""
+
+    def test_summary_is_one_query(self, test_session, summary_plays, query_counter):
+        query_counter.clear()
+        stats = PlayService(test_session).get_play_summary_stats(2023, 'sf')
+
+        assert len(query_counter) == 1
+        assert stats['total_plays'] == 8
+        assert (stats['passing_plays'], stats['rushing_plays'], stats['other_plays']) == (6, 2, 0)
+        assert stats['passing_yards'] == 60
+        assert stats['rushing_yards'] == 10
+        assert stats['touchdowns'] == 2
+        assert stats['explosive_plays'] == 2
+        assert stats['completion_percentage'] == pytest.approx(100 / 3)
+        assert stats['yards_per_play'] == pytest.approx(70 / 8)
+
+    def test_summary_without_plays(self, test_session, sample_games):
+        stats = PlayService(test_session).get_play_summary_stats(2022)
+
+        assert stats['total_plays'] == 0
+        assert stats['yards_per_pass'] == 0
+
+    def test_memory_stays_flat_as_plays_grow(self, test_session, sample_games):
+        service = PlayService(test_session)
+
+        def peak_bytes():
+            tracemalloc.start()
+            service.get_play_summary_stats(2023)
+            peak = tracemalloc.get_traced_memory()[1]
+            tracemalloc.stop()
+            return peak
+
+        peaks = []
+        loaded = 0
+        for count in (500, 5000):
+            test_session.execute(insert(PlayModel), play_rows(sample_games[1], count - loaded, loaded))
+            test_session.commit()
+            loaded = count
+            peak_bytes()  # Warm statement caches
+            peaks.append(peak_bytes())
+
+        # Ten times the plays must not mean ten times the memory
+        assert peaks[1] < peaks[0] * 2
+
+
+class TestPlayerStatsFromPlays:
+    """Test the raw-play fallback when no materialized totals exist."""
+
+    def test_position_stats(self, test_session, summary_plays, query_counter):
+        service = PlayerService(test_session)
+
+        query_counter.clear()
+        qb = service.get_player_stats('QB1', 2023)
+        assert len(query_counter) == 4  # Player, season totals, passing and rushing rows
+        assert qb['passing_attempts'] == 4  # Sacks are not attempts
+        assert qb['passing_completions'] == 2
+        assert qb['passing_yards'] == 60
+        assert qb['passing_touchdowns'] == 2
+
+        rb = service.get_player_stats('RB1', 2023)
+        assert (rb['carries'], rb['rushing_yards'], rb['yards_per_carry']) == (2, 10, 5)
+
+        wr = service.get_player_stats('WR1', 2023)
+        assert (wr['targets'], wr['receptions']) == (4, 2)
+        assert wr['catch_percentage'] == 50
+        assert wr['receiving_yards'] == 60
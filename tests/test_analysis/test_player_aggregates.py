@@ -0,0 +1,176 @@
+"""Tests for incrementally maintained player game and season stats."""
+
+import pytest
+from unittest.mock import Mock
+
+from src.analysis.player_aggregates import PlayerStatsAggregator
+from src.data.data_loader import DataLoader
+from src.models.player_stats import PlayerGameStatsModel, PlayerSeasonStatsModel
+from src.models.play import PlayModel
+from src.services.player_service import PlayerService
+from src.models.player import PlayerModel
+
+
+def add_play(session, game, play_id, **fields):
+    values = dict(play_id=play_id, game_id=game.game_id, season=game.season, week=game.week,
+                  posteam='SF', defteam='KC', yardline_100=60, epa=0.5)
+    values.update(fields)
+    session.add(PlayModel(**values))
+
+
+@pytest.fixture
+def two_games(test_session, sample_games):
+    """QB1 and WR1 plays in two SF games, plus a sack and an incompletion."""
+    first, second = sample_games[0], sample_games[4]
+    for game in (first, second):
+        add_play(test_session, game, '1', play_type='pass', passer_player_id='QB1',
+                 receiver_player_id='WR1', yards_gained=12, air_yards=8, yards_after_catch=4,
+                 first_down=True, desc='pass short right to WR1')
+        add_play(test_session, game, '2', play_type='pass', passer_player_id='QB1',
+                 receiver_player_id='WR1', yards_gained=0, air_yards=25, epa=-0.6,
+                 desc='pass incomplete deep left')
+        add_play(test_session, game, '3', play_type='pass', passer_player_id='QB1',
+                 yards_gained=-7, epa=-1.5, desc='QB1 sacked at SF 30')
+        add_play(test_session, game, '4', play_type='run', rusher_player_id='QB1',
+                 yards_gained=5, yardline_100=15)
+    # A long touchdown in the second game only
+    add_play(test_session, second, '5', play_type='pass', passer_player_id='QB1',
+             receiver_player_id='WR1', yards_gained=60, pass_touchdown=True, touchdown=True,
+             desc='pass deep middle to WR1 for 60 yards, TOUCHDOWN')
+    test_session.commit()
+    return first, second
+
+
+def season_row(session, player_id):
+    return session.query(PlayerSeasonStatsModel).filter_by(player_id=player_id, season=2023).one()
+
+
+class TestPlayerStatsAggregator:
+    """Test maintaining the aggregate tables."""
+
+    def test_refresh_builds_game_and_season_rows(self, test_session, two_games):
+        aggregator = PlayerStatsAggregator(test_session)
+        written = aggregator.refresh_games([game.game_id for game in two_games])
+        test_session.commit()
+
+        assert written == 4
+        qb = season_row(test_session, 'QB1')
+        assert qb.games == 2
+        assert qb.pass_attempts == 5  # Sacks are not attempts
+        assert qb.completions == 3
+        assert qb.passing_yards == 84
+        assert qb.passing_tds == 1
+        assert qb.deep_attempts == 2
+        assert qb.longest_pass == 60
+        assert qb.carries == 2
+        assert qb.rz_carries == 2
+        assert qb.team_abbr == 'SF'
+
+        wr = season_row(test_session, 'WR1')
+        assert wr.targets == 5
+        assert wr.receptions == 3
+        assert wr.receiving_first_downs == 2
+        assert wr.yards_after_catch == 8
+        assert wr.receiving_epa == pytest.approx(0.5 * 3 - 0.6 * 2)
+
+    def test_reloading_a_game_applies_deltas(self, test_session, two_games):
+        first, second = two_games
+        aggregator = PlayerStatsAggregator(test_session)
+        aggregator.refresh_games([first.game_id, second.game_id])
+        test_session.commit()
+
+        # Refreshing unchanged games leaves totals alone
+        aggregator.refresh_games([second.game_id])
+        test_session.commit()
+        assert season_row(test_session, 'QB1').passing_yards == 84
+
+        # A corrected play only changes its own game's contribution
+        play = test_session.query(PlayModel).filter_by(game_id=first.game_id, play_id='1').one()
+        play.yards_gained = 20
+        test_session.commit()
+        aggregator.refresh_games([first.game_id])
+        test_session.commit()
+
+        qb = season_row(test_session, 'QB1')
+        assert qb.passing_yards == 92
+        assert qb.games == 2
+        assert test_session.query(PlayerGameStatsModel).filter_by(player_id='QB1').count() == 2
+
+    def test_removed_plays_recompute_maxima_and_games(self, test_session, two_games):
+        first, second = two_games
+        aggregator = PlayerStatsAggregator(test_session)
+        aggregator.refresh_games([first.game_id, second.game_id])
+        test_session.commit()
+
+        test_session.query(PlayModel).filter_by(game_id=second.game_id).delete()
+        test_session.commit()
+        aggregator.refresh_games([second.game_id])
+        test_session.commit()
+
+        qb = season_row(test_session, 'QB1')
+        assert qb.games == 1
+        assert qb.longest_pass == 12
+        assert qb.passing_tds == 0
+
+        test_session.query(PlayModel).filter_by(game_id=first.game_id).delete()
+        test_session.commit()
+        aggregator.refresh_games([first.game_id])
+        test_session.commit()
+
+        assert test_session.query(PlayerSeasonStatsModel).count() == 0
+        assert test_session.query(PlayerGameStatsModel).count() == 0
+
+    def test_rebuild_matches_incremental(self, test_session, two_games):
+        first, second = two_games
+        aggregator = PlayerStatsAggregator(test_session)
+        aggregator.refresh_games([first.game_id])
+        aggregator.refresh_games([second.game_id])
+        test_session.commit()
+        incremental = season_row(test_session, 'WR1').receiving_yards
+
+        test_session.query(PlayerSeasonStatsModel).delete()
+        test_session.query(PlayerGameStatsModel).delete()
+        test_session.commit()
+
+        assert aggregator.rebuild([2023]) == 4
+        assert season_row(test_session, 'WR1').receiving_yards == incremental
+
+    def test_data_loader_refreshes_player_stats(self, test_session, two_games):
+        first, _ = two_games
+        DataLoader(db_manager=Mock(), nfl_client=Mock(), data_mapper=Mock())._refresh_derived_data(
+            test_session, {first.game_id}, set()
+        )
+        test_session.commit()
+
+        assert season_row(test_session, 'QB1').games == 1
+
+
+class TestPlayerServiceReadsAggregates:
+    """Test player pages read the season table."""
+
+    def test_player_stats_from_season_rows(self, test_session, two_games):
+        test_session.add(PlayerModel(player_id='QB1', full_name='Test Quarterback', position='QB'))
+        test_session.commit()
+        PlayerStatsAggregator(test_session).rebuild([2023])
+
+        stats = PlayerService(test_session).get_player_stats('QB1', 2023)
+
+        assert stats['games_played'] == 2
+        assert stats['passing_attempts'] == 5
+        assert stats['passing_yards'] == 84
+        assert stats['rushing_attempts'] == 2
+        assert stats['total_plays'] == 7
+        assert 0 < stats['passer_rating'] <= 158.3
+
+    def test_position_leaders_single_query(self, test_session, two_games, query_counter):
+        test_session.add(PlayerModel(player_id='WR1', full_name='Test Receiver', position='WR'))
+        test_session.add(PlayerModel(player_id='QB1', full_name='Test Quarterback', position='QB'))
+        test_session.commit()
+        PlayerStatsAggregator(test_session).rebuild([2023])
+
+        query_counter.clear()
+        leaders = PlayerService(test_session).get_position_leaders('WR', season=2023)
+
+        assert len(query_counter) == 1
+        assert [leader['player'].player_id for leader in leaders] == ['WR1']
+        assert leaders[0]['receiving_yards'] == 84
@@ -0,0 +1,112 @@
+"""Tests for player leaderboards and position analytics."""
+
+import pytest
+
+from src.analysis.player_aggregates import PlayerStatsAggregator
+from src.analysis.player_stats import PlayerStatsCalculator
+from src.analysis.position_analytics import PositionAnalytics
+from src.models.player import PlayerModel
+from src.models.play import PlayModel
+
+
+@pytest.fixture
+def season_plays(test_session, sample_games):
+    """Five QBs throwing to receivers and a running back, plus runs."""
+    game_id = sample_games[0].game_id
+    players = [(f'QB{i}', 'QB') for i in range(5)] + [('WR0', 'WR'), ('WR1', 'WR'), ('RB0', 'RB')]
+    for player_id, position in players:
+        test_session.add(PlayerModel(
+            player_id=player_id, full_name=f'Player {player_id}', position=position, team_abbr='SF'
+        ))
+
+    play_number = 0
+    for qb in range(5):
+        for i in range(10):
+            play_number += 1
+            test_session.add(PlayModel(
+                play_id=str(play_number), game_id=game_id, season=2023, week=1,
+                posteam='SF', defteam='KC', play_type='pass',
+                passer_player_id=f'QB{qb}',
+                receiver_player_id=['WR0', 'WR1', 'RB0'][i % 3],
+                # QB0 throws 4 of 10 from the red zone, scoring on 2 of them
+                yardline_100=10 if (qb == 0 and i < 4) else 60,
+                pass_touchdown=qb == 0 and i < 2,
+                interception=False, yards_gained=8, epa=0.2, air_yards=25 if i == 0 else 5,
+                desc='pass COMPLETE'
+            ))
+    for i in range(6):
+        play_number += 1
+        test_session.add(PlayModel(
+            play_id=str(play_number), game_id=game_id, season=2023, week=1,
+            posteam='SF', defteam='KC', play_type='run', rusher_player_id='RB0',
+            yardline_100=50, yards_gained=4, epa=0.1, rush_touchdown=False, first_down=False
+        ))
+    test_session.commit()
+    PlayerStatsAggregator(test_session).rebuild([2023])
+
+
+class TestPlayerStatsCalculator:
+    """Test league leader queries."""
+
+    def test_qb_stats_single_query(self, test_session, season_plays, query_counter):
+        query_counter.clear()
+        leaders = PlayerStatsCalculator(test_session).get_qb_stats(2023, min_attempts=5)
+
+        assert len(query_counter) == 1
+        assert len(leaders) == 5
+        assert leaders[0]['player_id'] == 'QB0'
+        assert leaders[0]['player_name'] == 'Player QB0'
+        assert leaders[0]['team'] == 'SF'
+
+    def test_rb_and_wr_stats_single_query(self, test_session, season_plays, query_counter):
+        calculator = PlayerStatsCalculator(test_session)
+
+        query_counter.clear()
+        rushers = calculator.get_rb_stats(2023, min_carries=5)
+        receivers = calculator.get_wr_stats(2023, min_targets=5)
+
+        assert len(query_counter) == 2
+        assert [rb['player_id'] for rb in rushers] == ['RB0']
+        assert {wr['player_id']: wr['position'] for wr in receivers} == {'WR0': 'WR', 'WR1': 'WR', 'RB0': 'RB'}
+
+    def test_plays_without_player_rows_are_skipped(self, test_session, season_plays):
+        test_session.query(PlayerModel).filter(PlayerModel.player_id == 'QB4').delete()
+        test_session.commit()
+
+        leaders = PlayerStatsCalculator(test_session).get_qb_stats(2023, min_attempts=5)
+        assert 'QB4' not in {qb['player_id'] for qb in leaders}
+
+
+class TestPositionAnalytics:
+    """Test position leaderboards."""
+
+    def test_quarterback_red_zone_in_one_query(self, test_session, season_plays, query_counter):
+        query_counter.clear()
+        quarterbacks = PositionAnalytics(test_session).calculate_quarterback_stats(2023, min_attempts=5)
+
+        assert len(query_counter) == 1
+        by_name = {qb.player_name: qb for qb in quarterbacks}
+        assert by_name['Player QB0'].red_zone_td_pct == 50.0
+        assert by_name['Player QB1'].red_zone_td_pct == 0
+        assert by_name['Player QB1'].deep_ball_pct == 10.0
+
+    def test_receiver_red_zone_targets_in_one_query(self, test_session, season_plays, query_counter):
+        query_counter.clear()
+        receivers = PositionAnalytics(test_session).calculate_wide_receiver_stats(2023, min_targets=5)
+
+        assert len(query_counter) == 1
+        by_name = {wr.player_name: wr for wr in receivers}
+        # QB0's red zone throws went to WR0, WR1, RB0, WR0
+        assert by_name['Player WR0'].red_zone_targets == 2
+        assert by_name['Player RB0'].red_zone_targets == 1
+
+    def test_running_back_receiving_in_one_query(self, test_session, season_plays, query_counter):
+        query_counter.clear()
+        backs = PositionAnalytics(test_session).calculate_running_back_stats(2023, min_carries=5)
+
+        assert len(query_counter) == 1
+        assert len(backs) == 1
+        assert backs[0].carries == 6
+        assert backs[0].targets == 15
+        assert backs[0].receiving_yards == 120
+        assert backs[0].total_yards == 144
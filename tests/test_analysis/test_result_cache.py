@@ -0,0 +1,151 @@
+"""Tests for the versioned analytics result cache."""
+
+import threading
+import time
+
+import pytest
+
+from src.analysis.insights import InsightsGenerator
+from src.analysis.result_cache import ResultCache, estimate_size, get_result_cache
+from src.analysis.team_analytics import TeamAnalyticsCalculator
+from src.data.data_versions import bump_data_versions, clear_version_cache
+from src.models.data_version import DataVersionModel
+from src.models.team import TeamModel
+
+
+@pytest.fixture(autouse=True)
+def fresh_caches():
+    """Each test has its own database, so nothing cached may carry over."""
+    clear_version_cache()
+    get_result_cache().clear()
+    yield
+    clear_version_cache()
+    get_result_cache().clear()
+
+
+class TestCachedAnalytics:
+    """Test analytics methods served from the result cache."""
+
+    def test_repeat_call_runs_no_queries(self, test_session, sample_games, query_counter):
+        calculator = TeamAnalyticsCalculator(test_session, use_cache=True)
+
+        first = calculator.calculate_team_analytics(2023)
+        computed = len(query_counter)
+        second = calculator.calculate_team_analytics(2023)
+
+        assert computed > 0
+        assert len(query_counter) == computed
+        assert second is first
+        assert get_result_cache().stats()['items'][0]['hits'] == 1
+
+    def test_shared_across_instances(self, test_session, sample_games):
+        first = InsightsGenerator(test_session, use_cache=True).generate_team_insights('SF', 2023)
+        second = InsightsGenerator(test_session, use_cache=True).generate_team_insights('SF', 2023)
+
+        assert second is first
+        assert get_result_cache().hits == 1
+
+    def test_reload_of_season_invalidates(self, test_session, sample_games):
+        calculator = TeamAnalyticsCalculator(test_session, use_cache=True)
+        first = calculator.calculate_team_analytics(2023)
+
+        bump_data_versions(test_session, 'plays', [2022])
+        assert calculator.calculate_team_analytics(2023) is first
+
+        bump_data_versions(test_session, 'plays', [2023])
+        assert calculator.calculate_team_analytics(2023) is not first
+        assert get_result_cache().misses == 2
+
+    def test_missing_versions_table_computes_uncached(self, test_db, test_session, sample_games):
+        _, engine = test_db
+        DataVersionModel.__table__.drop(engine)
+        calculator = TeamAnalyticsCalculator(test_session, use_cache=True)
+
+        first = calculator.calculate_team_analytics(2023)
+
+        assert calculator.calculate_team_analytics(2023) == first
+        assert get_result_cache().stats()['entries'] == 0
+
+    def test_missing_versions_table_keeps_pending_work(self, test_db, test_session, sample_games):
+        _, engine = test_db
+        DataVersionModel.__table__.drop(engine)
+        test_session.add(TeamModel(team_abbr='LV', team_name='Las Vegas', team_nick='Raiders',
+                                   team_conf='AFC', team_division='West'))
+
+        TeamAnalyticsCalculator(test_session, use_cache=True).calculate_team_analytics(2023)
+        test_session.commit()
+
+        assert test_session.query(TeamModel).filter_by(team_abbr='LV').count() == 1
+
+    def test_disabled_by_default(self, test_session, sample_games, query_counter):
+        calculator = TeamAnalyticsCalculator(test_session)
+
+        calculator.calculate_team_analytics(2023)
+        computed = len(query_counter)
+        calculator.calculate_team_analytics(2023)
+
+        assert len(query_counter) == 2 * computed
+        assert get_result_cache().stats()['entries'] == 0
+
+
+class TestResultCache:
+    """Test eviction, metrics and single-flight in the cache itself."""
+
+    def test_lru_eviction_by_count(self):
+        cache = ResultCache(max_entries=2)
+        for key in ('a', 'b'):
+            cache.get_or_compute(key, lambda: key)
+        cache.get_or_compute('a', lambda: 'stale')
+        cache.get_or_compute('c', lambda: 'c')
+
+        assert [item['key'] for item in cache.stats()['items']] == ["'a'", "'c'"]
+        assert cache.evictions == 1
+
+    def test_eviction_by_bytes(self):
+        value = list(range(1000))
+        cache = ResultCache(max_bytes=int(estimate_size(value) * 2.5))
+        for key in ('a', 'b', 'c'):
+            cache.get_or_compute(key, lambda: list(value))
+
+        stats = cache.stats()
+        assert stats['entries'] == 2
+        assert stats['bytes'] <= cache.max_bytes
+
+    def test_oversized_result_not_stored(self):
+        cache = ResultCache(max_bytes=100)
+
+        assert cache.get_or_compute('big', lambda: 'x' * 1000) == 'x' * 1000
+        assert cache.stats()['entries'] == 0
+
+    def test_concurrent_misses_compute_once(self):
+        cache = ResultCache()
+        calls = []
+
+        def compute():
+            calls.append(1)
+            time.sleep(0.1)
+            return 'value'
+
+        results = []
+        threads = [threading.Thread(target=lambda: results.append(cache.get_or_compute('k', compute)))
+                   for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert len(calls) == 1
+        assert results == ['value'] * 8
+        assert cache.misses == 1
+        assert cache.coalesced + cache.hits == 7
+
+    def test_exceptions_are_not_cached(self):
+        cache = ResultCache()
+
+        def fail():
+            raise ValueError("boom")
+
+        with pytest.raises(ValueError):
+            cache.get_or_compute('k', fail)
+
+        assert cache.get_or_compute('k', lambda: 'ok') == 'ok'
@@ -0,0 +1,147 @@
+"""Tests for standings and NFL tiebreakers."""
+
+import pytest
+
+from src.analysis import standings as standings_module
+from src.analysis.standings import StandingsCalculator, compute_standings
+from src.data.data_versions import bump_data_versions, clear_version_cache
+from src.models.game import GameModel
+from src.services.team_service import TeamService
+
+
+AFC = [('E1', 'AFC', 'East'), ('E2', 'AFC', 'East'), ('E3', 'AFC', 'East'),
+       ('W1', 'AFC', 'West'), ('W2', 'AFC', 'West')]
+
+
+def win(winner, loser, home=True):
+    """A game ``winner`` won 24-10, hosted by the winner unless ``home`` is False."""
+    return (winner, loser, 24, 10) if home else (loser, winner, 10, 24)
+
+
+def abbrs(records):
+    return [record.team for record in records]
+
+
+class TestComputeStandings:
+    """Test records and the tiebreaker cascade."""
+
+    def test_records_and_splits(self):
+        standings = compute_standings(AFC, [win('E1', 'E2'), win('E1', 'W1', home=False), ('E2', 'W2', 17, 17)])
+        e1, e2 = standings.records['E1'], standings.records['E2']
+
+        assert (e1.wins, e1.losses, e1.ties) == (2, 0, 0)
+        assert (e1.home_wins, e1.away_wins) == (1, 1)
+        assert e1.division_wins == 1 and e1.conference_wins == 2
+        assert e1.point_differential == 28
+        assert e2.win_percentage == pytest.approx(0.25)
+        assert e2.to_dict()['division_record'] == '0-1-0'
+
+    def test_head_to_head_breaks_division_tie(self):
+        # E1 and E2 both 1-1; E1 won the meeting
+        standings = compute_standings(AFC, [win('E1', 'E2'), win('E2', 'W1'), win('W1', 'E1')])
+
+        assert abbrs(standings.division('AFC', 'East'))[:2] == ['E1', 'E2']
+
+    def test_division_record_after_split_head_to_head(self):
+        games = [win('E1', 'E2'), win('E2', 'E1'), win('E1', 'E3'), win('W1', 'E1'),
+                 win('E2', 'W1'), win('E3', 'E2'), win('W2', 'E3'), win('W2', 'E3')]
+        standings = compute_standings(AFC, games)
+
+        # E1 and E2 are 2-2 with a split series; E1 is 2-1 in the division
+        assert standings.records['E1'].win_percentage == standings.records['E2'].win_percentage
+        assert abbrs(standings.division('AFC', 'East')) == ['E1', 'E2', 'E3']
+        assert standings.records['E2'].division_rank == 2
+
+    def test_division_winners_seeded_first(self):
+        games = [win('E1', 'E2'), win('E1', 'E2'), win('E2', 'W1'), win('E2', 'W1'),
+                 win('E2', 'W2'), win('E2', 'W2'), win('W1', 'W2')]
+        standings = compute_standings(AFC, games)
+
+        # E2 (4-2) has a better record than West winner W1 (1-2)
+        assert abbrs(standings.conference('AFC'))[:4] == ['E1', 'W1', 'E2', 'W2']
+        assert standings.records['E2'].playoff_seed == 3
+
+    def test_wild_card_uses_best_team_per_division(self):
+        games = [win('E1', 'E2'), win('E1', 'E3'), win('E1', 'W1'), win('E2', 'E3'),
+                 win('E3', 'W2'), win('W2', 'E2'), win('W1', 'W2')]
+        standings = compute_standings(AFC, games)
+
+        # E2, E3 and W2 are 1-2; E2 beat E3 for the East, then W2 beat E2
+        assert abbrs(standings.conference('AFC')) == ['E1', 'W1', 'W2', 'E2', 'E3']
+        assert [record.playoff_seed for record in standings.playoff_seeds('AFC')] == [1, 2, 3, 4, 5]
+
+    def test_unbreakable_tie_is_deterministic(self):
+        standings = compute_standings(AFC, [])
+
+        assert abbrs(standings.division('AFC', 'West')) == ['W1', 'W2']
+        assert standings.records['W1'].division_rank == 1
+
+
+class TestStandingsCalculator:
+    """Test loading and caching standings."""
+
+    @pytest.fixture(autouse=True)
+    def clear_cache(self):
+        standings_module._standings_cache.clear()
+        clear_version_cache()
+        yield
+        standings_module._standings_cache.clear()
+        clear_version_cache()
+
+    def test_season_standings(self, test_session, sample_games):
+        standings = StandingsCalculator(test_session).get_standings(2023)
+
+        assert abbrs(standings.conference('NFC')) == ['SF', 'DAL']
+        assert standings.records['SF'].wins == 10
+        assert standings.records['BUF'].playoff_seed == 1
+        assert standings.records['KC'].losses == 10
+
+    def test_through_week(self, test_session, sample_games):
+        standings = StandingsCalculator(test_session).get_standings(2023, through_week=2)
+
+        assert standings.records['SF'].games_played == 4
+        assert standings.through_week == 2
+
+    def test_cached_until_games_change(self, test_session, sample_games, query_counter):
+        calculator = StandingsCalculator(test_session)
+        first = calculator.get_standings(2023)
+
+        query_counter.clear()
+        assert calculator.get_standings(2023) is first
+        assert len(query_counter) == 0  # Version read within its TTL
+
+        game = test_session.query(GameModel).filter_by(game_id='2023_01_KC_SF').one()
+        game.home_score, game.away_score = 10, 30
+        # As the loaders do when they write games
+        bump_data_versions(test_session, 'games', [2023])
+        test_session.commit()
+
+        updated = calculator.get_standings(2023)
+        assert updated is not first
+        assert updated.records['KC'].wins == 1
+
+    def test_teams_change_invalidates(self, test_session, sample_games):
+        calculator = StandingsCalculator(test_session)
+        first = calculator.get_standings(2023)
+
+        bump_data_versions(test_session, 'teams')
+        test_session.commit()
+
+        assert calculator.get_standings(2023) is not first
+
+    def test_team_service_standings(self, test_session, sample_games, query_counter):
+        service = TeamService(test_session)
+        service.get_conference_standings('AFC', 2023)
+
+        query_counter.clear()
+        conference = service.get_conference_standings('afc', 2023)
+        division = service.get_division_standings('NFC', 'west', 2023)
+
+        # Team lookup per call
+        assert len(query_counter) == 2
+        assert [row['team'].team_abbr for row in conference] == ['BUF', 'KC']
+        assert conference[0]['playoff_seed'] == 1
+        assert conference[0]['season'] == 2023
+        assert division[0]['team'].team_abbr == 'SF'
+        assert division[0]['wins'] == 10
+        assert division[0]['division_rank'] == 1
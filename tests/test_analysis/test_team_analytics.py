@@ -0,0 +1,115 @@
+"""Tests for league-wide team analytics."""
+
+import pytest
+
+from src.analysis.team_analytics import TeamAnalyticsCalculator
+from src.models.play import PlayModel
+
+
+@pytest.fixture
+def season_plays(test_session, sample_games):
+    """SF offense against KC, and KC offense against SF."""
+    game_id = sample_games[0].game_id
+    plays = [
+        # SF: a red zone drive ending in a touchdown
+        dict(posteam='SF', defteam='KC', play_type='pass', down=1, ydstogo=10, yardline_100=18,
+             yards_gained=18, touchdown=True, first_down=True, epa=2.0),
+        # SF: third and short converted, third and long failed
+        dict(posteam='SF', defteam='KC', play_type='run', down=3, ydstogo=2, yardline_100=50,
+             yards_gained=4, first_down=True, epa=0.8),
+        dict(posteam='SF', defteam='KC', play_type='pass', down=3, ydstogo=9, yardline_100=46,
+             yards_gained=-6, epa=-1.2),
+        # SF: explosive pass, then an interception
+        dict(posteam='SF', defteam='KC', play_type='pass', down=1, ydstogo=10, yardline_100=75,
+             yards_gained=25, first_down=True, epa=1.5),
+        dict(posteam='SF', defteam='KC', play_type='pass', down=2, ydstogo=10, yardline_100=50,
+             yards_gained=0, interception=True, epa=-3.0),
+        # KC: red zone drive settling for a field goal, and a fumble
+        dict(posteam='KC', defteam='SF', play_type='run', down=1, ydstogo=10, yardline_100=12,
+             yards_gained=2, epa=-0.1),
+        dict(posteam='KC', defteam='SF', play_type='field_goal', down=4, ydstogo=8, yardline_100=10,
+             yards_gained=1),
+        dict(posteam='KC', defteam='SF', play_type='run', down=2, ydstogo=6, yardline_100=60,
+             yards_gained=3, fumble=True, epa=-2.0),
+        # Non-scrimmage plays are ignored for efficiency
+        dict(posteam='KC', defteam='SF', play_type='punt', down=4, ydstogo=10, yardline_100=60,
+             yards_gained=0),
+    ]
+    for i, fields in enumerate(plays):
+        test_session.add(PlayModel(play_id=str(i), game_id=game_id, season=2023, week=1, **fields))
+    test_session.commit()
+
+
+def by_team(analytics):
+    return {team.team: team for team in analytics}
+
+
+class TestTeamAnalyticsCalculator:
+    """Test computing every team's analytics together."""
+
+    def test_offense_and_defense(self, test_session, season_plays):
+        teams = by_team(TeamAnalyticsCalculator(test_session).calculate_team_analytics(2023))
+        sf, kc = teams['SF'], teams['KC']
+
+        assert sf.offensive_efficiency.total_plays == 5
+        assert sf.offensive_efficiency.total_yards == 41
+        assert sf.offensive_efficiency.first_downs == 3
+        assert sf.offensive_efficiency.explosive_plays == 1
+        assert sf.offensive_efficiency.success_rate == 60.0
+        assert sf.offensive_efficiency.avg_epa == pytest.approx(0.02)
+        assert kc.defensive_efficiency.total_plays == 5
+        assert kc.defensive_efficiency.sacks == 1
+        assert kc.defensive_efficiency.total_yards_allowed == 41
+
+        assert sf.red_zone_offense.attempts == 1
+        assert sf.red_zone_offense.td_percentage == 100.0
+        assert kc.red_zone_offense.field_goals == 1
+        assert sf.red_zone_defense.success_percentage == 100.0
+
+        assert sf.third_down_offense.attempts == 2
+        assert sf.third_down_offense.conversion_rate == 50.0
+        assert sf.third_down_offense.success_by_distance == {'short': 100.0, 'medium': 0.0, 'long': 0.0}
+        assert kc.third_down_defense.conversions == 1
+
+        assert sf.turnover_stats.interceptions_thrown == 1
+        assert sf.turnover_stats.fumbles_recovered == 1
+        assert sf.turnover_stats.differential == 0
+        assert kc.turnover_stats.fumbles_lost == 1
+
+    def test_scoring_and_teams_without_plays(self, test_session, season_plays):
+        teams = by_team(TeamAnalyticsCalculator(test_session).calculate_team_analytics(2023))
+
+        assert set(teams) == {'SF', 'KC', 'DAL', 'BUF'}
+        assert teams['SF'].games_played == 10
+        assert teams['SF'].points_per_game == 22.5
+        assert teams['SF'].points_allowed_per_game == 20.5
+        assert teams['SF'].point_differential == 2.0
+        assert teams['DAL'].offensive_efficiency.total_plays == 0
+        assert teams['DAL'].third_down_offense.success_by_distance == {}
+
+    def test_league_in_constant_queries(self, test_session, season_plays, query_counter):
+        query_counter.clear()
+        analytics = TeamAnalyticsCalculator(test_session).calculate_team_analytics(2023)
+
+        # Teams, offense, defense and scoring
+        assert len(query_counter) == 4
+        assert len(analytics) == 4
+
+    def test_single_team_matches_league(self, test_session, season_plays):
+        calculator = TeamAnalyticsCalculator(test_session)
+        league = by_team(calculator.calculate_team_analytics(2023))
+        single = calculator.calculate_team_analytics(2023, 'SF')
+
+        assert single == [league['SF']]
+        assert calculator.calculate_team_analytics(2023, 'NYJ') == []
+
+    def test_rankings_reuse_computed_analytics(self, test_session, season_plays, query_counter):
+        calculator = TeamAnalyticsCalculator(test_session)
+        analytics = calculator.calculate_team_analytics(2023)
+
+        query_counter.clear()
+        rankings = calculator.get_team_rankings(2023, analytics)
+
+        assert len(query_counter) == 0
+        assert rankings['offensive_efficiency'][0].team == 'SF'
+        assert rankings['red_zone_offense'][0].team == 'SF'
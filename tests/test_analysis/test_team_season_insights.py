@@ -0,0 +1,92 @@
+"""Tests for materialized team-season insights."""
+
+import pytest
+
+from src.analysis.insights import InsightsGenerator, TeamInsights
+from src.models.play import PlayModel
+from src.models.team_season_insights import TeamSeasonInsightsModel
+
+
+@pytest.fixture
+def season_plays(test_session, sample_games):
+    """Create SF offensive plays against KC across two seasons."""
+    plays = []
+    for season in (2022, 2023):
+        for i in range(8):
+            play = PlayModel(
+                play_id=f"{season}_{i}",
+                game_id=sample_games[0].game_id,
+                season=season,
+                week=1,
+                posteam='SF',
+                defteam='KC',
+                play_type='pass' if i % 2 else 'run',
+                qtr=i // 2 + 1,
+                down=(i % 3) + 1,
+                ydstogo=10,
+                yardline_100=15 if i == 5 else 50,
+                yards_gained=15 if i == 5 else 6,
+                touchdown=i == 5
+            )
+            test_session.add(play)
+            plays.append(play)
+    test_session.commit()
+    return plays
+
+
+class TestTeamSeasonInsights:
+    """Test refreshing and reading team-season insight rows."""
+
+    def test_refresh_stores_every_metric(self, test_session, season_plays):
+        generator = InsightsGenerator(test_session)
+
+        written = generator.refresh_team_season_insights([(2023, 'SF'), (2023, 'KC'), (2023, 'SF')])
+        test_session.commit()
+
+        # KC has no offensive plays, so only SF gets a row
+        assert written == 1
+        assert generator.get_stored_team_insights('KC', 2023) is None
+        row = test_session.query(TeamSeasonInsightsModel).filter_by(team_abbr='SF', season=2023).one()
+        assert row.play_count == 8
+
+        computed = generator.compute_team_insights('SF', 2023)
+        stored = generator.get_stored_team_insights('SF', 2023)
+        assert stored.to_dict() == computed.to_dict()
+
+    def test_generate_prefers_stored_row(self, test_session, season_plays):
+        generator = InsightsGenerator(test_session)
+        generator.refresh_team_season_insights([(2023, 'SF')])
+        test_session.commit()
+
+        row = test_session.query(TeamSeasonInsightsModel).filter_by(team_abbr='SF', season=2023).one()
+        row.offensive_epa_per_play = 9.0
+        test_session.commit()
+
+        insights = generator.generate_team_insights('SF', 2023)
+        assert isinstance(insights, TeamInsights)
+        assert insights.offensive_epa_per_play == 9.0
+
+    def test_generate_computes_when_not_refreshed(self, test_session, season_plays):
+        generator = InsightsGenerator(test_session)
+
+        assert generator.get_stored_team_insights('SF', 2023) is None
+        assert generator.generate_team_insights('SF', 2023) is not None
+
+    def test_refresh_removes_team_seasons_without_plays(self, test_session, season_plays):
+        generator = InsightsGenerator(test_session)
+        generator.refresh_team_season_insights([(2023, 'SF')])
+        test_session.commit()
+
+        test_session.query(PlayModel).filter(PlayModel.season == 2023).delete()
+        assert generator.refresh_team_season_insights([(2023, 'SF')]) == 0
+        test_session.commit()
+
+        assert generator.get_stored_team_insights('SF', 2023) is None
+
+    def test_history_ordered_by_season(self, test_session, season_plays):
+        generator = InsightsGenerator(test_session)
+        generator.refresh_team_season_insights([(2023, 'SF'), (2022, 'SF')])
+        test_session.commit()
+
+        history = generator.get_team_insights_history('SF')
+        assert [insights.season for insights in history] == [2022, 2023]
@@ -0,0 +1,185 @@
+"""Tests for week-to-date team and player snapshots."""
+
+import pytest
+from unittest.mock import Mock
+
+from src.analysis import standings as standings_module
+from src.analysis.insights import InsightsGenerator
+from src.analysis.player_aggregates import PlayerStatsAggregator
+from src.analysis.weekly_snapshots import WeeklySnapshotBuilder
+from src.data.data_loader import DataLoader
+from src.models.game import GameModel
+from src.models.play import PlayModel
+from src.models.player import PlayerModel
+from src.models.player_stats import PlayerWeekStatsModel
+from src.models.team_season_insights import TeamWeekInsightsModel
+from src.models.team_week_stats import TeamWeekStatsModel
+from src.services.player_service import PlayerService
+from src.services.team_service import TeamService
+
+
+@pytest.fixture(autouse=True)
+def clear_standings_cache():
+    standings_module._standings_cache.clear()
+    yield
+    standings_module._standings_cache.clear()
+
+
+@pytest.fixture
+def weekly_plays(test_session, sample_games):
+    """QB1 completes a 10-yard pass in SF's week 1 and week 3 games against KC."""
+    games = [game for game in sample_games if game.home_team == 'SF' and game.away_team == 'KC']
+    for game in (games[0], games[2]):
+        test_session.add(PlayModel(
+            play_id='1', game_id=game.game_id, season=game.season, week=game.week,
+            posteam='SF', defteam='KC', play_type='pass', passer_player_id='QB1', qtr=1,
+            down=1, ydstogo=10, yards_gained=10, yardline_100=50, epa=0.4, desc='pass short left'
+        ))
+    test_session.add(PlayerModel(player_id='QB1', full_name='Test Quarterback', position='QB', team_abbr='SF'))
+    test_session.commit()
+    PlayerStatsAggregator(test_session).refresh_games([games[0].game_id, games[2].game_id])
+    test_session.commit()
+    return games
+
+
+def team_week(session, team, week):
+    return session.query(TeamWeekStatsModel).filter_by(team_abbr=team, season=2023, week=week).one()
+
+
+class TestTeamWeekSnapshots:
+    """Test team records and standings after each week."""
+
+    def test_refresh_writes_cumulative_rows(self, test_session, sample_games):
+        written = WeeklySnapshotBuilder(test_session).refresh_team_weeks([(2023, 1)])
+        test_session.commit()
+
+        # Four teams through five weeks
+        assert written == 20
+        assert team_week(test_session, 'SF', 2).wins == 4
+        assert team_week(test_session, 'KC', 5).losses == 10
+        assert team_week(test_session, 'BUF', 3).playoff_seed == 1
+        assert team_week(test_session, 'DAL', 1).conference_rank == 2
+
+    def test_refresh_from_changed_week(self, test_session, sample_games):
+        builder = WeeklySnapshotBuilder(test_session)
+        builder.refresh_team_weeks([(2023, 1)])
+        test_session.commit()
+        week_two_id = team_week(test_session, 'SF', 2).id
+
+        game = test_session.query(GameModel).filter_by(game_id='2023_04_KC_SF').one()
+        game.home_score, game.away_score = 10, 30
+        test_session.flush()
+        written = builder.refresh_team_weeks([(2023, 4)])
+        test_session.commit()
+
+        assert written == 8
+        assert team_week(test_session, 'SF', 2).id == week_two_id
+        assert team_week(test_session, 'KC', 3).wins == 0
+        assert team_week(test_session, 'KC', 4).wins == 1
+
+    def test_team_service_reads_snapshot(self, test_session, sample_games, query_counter):
+        WeeklySnapshotBuilder(test_session).refresh_team_weeks([(2023, 1)])
+        test_session.commit()
+        service = TeamService(test_session)
+
+        query_counter.clear()
+        stats = service.get_team_stats('SF', 2023, as_of_week=2)
+
+        # Team lookup and snapshot row
+        assert len(query_counter) == 2
+        assert stats['as_of_week'] == 2
+        assert (stats['wins'], stats['losses']) == (4, 0)
+        assert stats['division_rank'] == 1
+
+        standings = service.get_conference_standings('AFC', 2023, as_of_week=9)
+        assert [row['team'].team_abbr for row in standings] == ['BUF', 'KC']
+        assert standings[0]['wins'] == 5
+
+    def test_team_service_falls_back_to_engine(self, test_session, sample_games):
+        service = TeamService(test_session)
+
+        stats = service.get_team_stats('KC', 2023, as_of_week=3)
+        division = service.get_division_standings('NFC', 'West', 2023, as_of_week=1)
+
+        assert (stats['wins'], stats['losses']) == (0, 6)
+        assert division[0]['team'].team_abbr == 'SF'
+        assert division[0]['games_played'] == 2
+
+
+class TestPlayerWeekSnapshots:
+    """Test player totals after each week."""
+
+    def test_rows_are_dense(self, test_session, weekly_plays):
+        written = WeeklySnapshotBuilder(test_session).refresh_player_weeks([(2023, 1)])
+        test_session.commit()
+
+        rows = test_session.query(PlayerWeekStatsModel).filter_by(player_id='QB1').order_by(
+            PlayerWeekStatsModel.week
+        ).all()
+        assert written == 3
+        assert [(row.week, row.games, row.passing_yards) for row in rows] == [
+            (1, 1, 10), (2, 1, 10), (3, 2, 20)
+        ]
+
+    def test_refresh_starts_from_stored_week(self, test_session, weekly_plays):
+        builder = WeeklySnapshotBuilder(test_session)
+        builder.refresh_player_weeks([(2023, 1)])
+        test_session.commit()
+
+        written = builder.refresh_player_weeks([(2023, 3)])
+        test_session.commit()
+
+        assert written == 1
+        row = test_session.query(PlayerWeekStatsModel).filter_by(player_id='QB1', week=3).one()
+        assert row.passing_yards == 20
+
+    def test_player_service_as_of_week(self, test_session, weekly_plays):
+        WeeklySnapshotBuilder(test_session).refresh_player_weeks([(2023, 1)])
+        test_session.commit()
+        service = PlayerService(test_session)
+
+        stats = service.get_player_stats('QB1', 2023, as_of_week=2)
+
+        assert stats['as_of_week'] == 2
+        assert stats['games_played'] == 1
+
+
+class TestTeamWeekInsights:
+    """Test week-to-date team insights."""
+
+    def test_refresh_writes_week_rows(self, test_session, weekly_plays):
+        generator = InsightsGenerator(test_session)
+        generator.refresh_team_season_insights([(2023, 'SF')])
+        test_session.commit()
+
+        weeks = [row.week for row in test_session.query(TeamWeekInsightsModel).filter_by(
+            team_abbr='SF', season=2023
+        ).order_by(TeamWeekInsightsModel.week)]
+        assert weeks == [1, 2, 3]
+
+        as_of = generator.generate_team_insights_as_of('SF', 2023, 2)
+        assert as_of.to_dict() == generator.compute_weekly_team_insights('SF', 2023)[1].to_dict()
+
+    def test_league_leaders_as_of(self, test_session, weekly_plays):
+        generator = InsightsGenerator(test_session)
+        computed = generator.get_league_leaders_as_of(2023, 1, 'offensive_epa_per_play')
+
+        generator.refresh_team_season_insights([(2023, 'SF')])
+        test_session.commit()
+        stored = generator.get_league_leaders_as_of(2023, 1, 'offensive_epa_per_play')
+
+        assert stored[0]['team_abbr'] == computed[0]['team_abbr'] == 'SF'
+        assert stored[0]['value'] == pytest.approx(computed[0]['value'])
+
+
+class TestDataLoaderRefresh:
+    """Test the loader keeping snapshots current."""
+
+    def test_refresh_derived_data_builds_snapshots(self, test_session, weekly_plays):
+        DataLoader(db_manager=Mock(), nfl_client=Mock(), data_mapper=Mock())._refresh_derived_data(
+            test_session, set(), set(), player_weeks={(2023, 1)}, team_weeks={(2023, 1)}
+        )
+        test_session.commit()
+
+        assert test_session.query(PlayerWeekStatsModel).count() == 3
+        assert test_session.query(TeamWeekStatsModel).count() == 20
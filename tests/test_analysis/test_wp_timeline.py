@@ -0,0 +1,154 @@
+"""Tests for precomputed win probability timelines."""
+
+import pytest
+import numpy as np
+
+from src.analysis.insights import InsightsGenerator
+from src.analysis.wp_timeline import (
+    WPTimeline, encode_array, decode_array, seconds_elapsed, lttb_indices
+)
+from src.models.game_wp_timeline import GameWPTimelineModel
+from src.models.play import PlayModel
+
+
+@pytest.fixture
+def game_plays(test_session, sample_games):
+    """Create plays for the first sample game (KC at SF)."""
+    game = sample_games[0]
+    plays = []
+    for i in range(12):
+        qtr = i // 3 + 1
+        play = PlayModel(
+            play_id=str(i + 1),
+            game_id=game.game_id,
+            season=2023,
+            week=1,
+            posteam=game.home_team if i % 2 == 0 else game.away_team,
+            defteam=game.away_team if i % 2 == 0 else game.home_team,
+            play_type='pass' if i % 3 else 'run',
+            qtr=qtr,
+            game_seconds_remaining=3600 - (qtr - 1) * 900 - (i % 3) * 200,
+            down=(i % 4) + 1,
+            ydstogo=10,
+            yardline_100=60 - i * 3,
+            yards_gained=40 if i == 7 else 4,
+            touchdown=i == 7
+        )
+        test_session.add(play)
+        plays.append(play)
+    test_session.commit()
+    return game, plays
+
+
+class TestArrayEncoding:
+    """Test float32 blob round trips."""
+
+    def test_round_trip(self):
+        values = [0.5, 0.25, 0.875]
+        decoded = decode_array(encode_array(values))
+
+        assert decoded.dtype == np.float32
+        np.testing.assert_allclose(decoded, values)
+
+    def test_decode_empty(self):
+        assert len(decode_array(None)) == 0
+        assert len(decode_array(b'')) == 0
+
+
+class TestSecondsElapsed:
+    """Test game clock conversion."""
+
+    def test_regulation(self):
+        assert seconds_elapsed(1, 3600) == 0
+        assert seconds_elapsed(4, 0) == 3600
+
+    def test_overtime(self):
+        assert seconds_elapsed(5, 600, 'REG') == 3600
+        assert seconds_elapsed(5, 0, 'REG') == 4200
+        assert seconds_elapsed(5, 300, 'POST') == 4200
+
+    def test_missing_clock_uses_quarter_start(self):
+        assert seconds_elapsed(3, None) == 1800
+
+
+class TestLTTB:
+    """Test Largest-Triangle-Three-Buckets downsampling."""
+
+    def test_keeps_endpoints_and_size(self):
+        x = np.arange(500, dtype=np.float32)
+        y = np.sin(x / 20)
+        idx = lttb_indices(x, y, 50)
+
+        assert len(idx) == 50
+        assert idx[0] == 0
+        assert idx[-1] == 499
+        assert np.all(np.diff(idx) > 0)
+
+    def test_preserves_spike(self):
+        x = np.arange(300, dtype=np.float32)
+        y = np.full(300, 0.5)
+        y[137] = 0.95
+        idx = lttb_indices(x, y, 20)
+
+        assert 137 in idx
+
+    def test_small_series_unchanged(self):
+        idx = lttb_indices(np.arange(5), np.zeros(5), 10)
+        assert list(idx) == [0, 1, 2, 3, 4]
+
+
+class TestWPTimelineStorage:
+    """Test building, storing and reading timelines."""
+
+    def test_build_timeline(self, test_session, game_plays):
+        game, plays = game_plays
+        timeline = InsightsGenerator(test_session).build_wp_timeline(game, list(reversed(plays)))
+
+        assert timeline.play_count == 12
+        assert np.all(np.diff(timeline.seconds_elapsed) >= 0)
+        assert np.all((timeline.win_probability >= 0) & (timeline.win_probability <= 1))
+        assert timeline.biggest_play_epa != 0
+
+    def test_refresh_upserts_row(self, test_session, game_plays):
+        game, _ = game_plays
+        generator = InsightsGenerator(test_session)
+
+        assert generator.refresh_game_insights([game.game_id, game.game_id]) == 1
+        test_session.commit()
+        assert generator.refresh_game_insights([game.game_id]) == 1
+        test_session.commit()
+
+        rows = test_session.query(GameWPTimelineModel).all()
+        assert len(rows) == 1
+        assert rows[0].play_count == 12
+
+        stored = generator.get_wp_timeline(game.game_id)
+        assert isinstance(stored, WPTimeline)
+        assert stored.play_count == 12
+
+    def test_refresh_skips_games_without_plays(self, test_session, sample_games):
+        generator = InsightsGenerator(test_session)
+        assert generator.refresh_game_insights([sample_games[1].game_id]) == 0
+
+    def test_game_insights_match_stored_timeline(self, test_session, game_plays):
+        game, _ = game_plays
+        generator = InsightsGenerator(test_session)
+
+        computed = generator.generate_game_insights(game.game_id)
+        generator.refresh_game_insights([game.game_id])
+        test_session.commit()
+        stored = generator.generate_game_insights(game.game_id)
+
+        assert stored.home_team_epa == pytest.approx(computed.home_team_epa)
+        assert stored.away_team_epa == pytest.approx(computed.away_team_epa)
+        assert stored.momentum_swings == computed.momentum_swings
+
+    def test_to_dict_downsamples(self, test_session, game_plays):
+        game, plays = game_plays
+        timeline = InsightsGenerator(test_session).build_wp_timeline(game, plays)
+        data = timeline.to_dict(points=5)
+
+        assert data['play_count'] == 12
+        assert data['points'] == 5
+        assert len(data['win_probability']) == 5
+        assert data['seconds_elapsed'][0] == 0
@@ -0,0 +1,150 @@
+"""Tests for data-version ETags and conditional GETs."""
+
+from datetime import date
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from src.api.caching import IMMUTABLE_CACHE_CONTROL, REVALIDATE_CACHE_CONTROL, current_season
+from src.api.dependencies import get_db_session
+from src.api.main import create_app
+from src.data.data_versions import bump_data_versions, clear_version_cache, get_data_version
+from src.models.base import Base
+from src.models.data_version import ALL_SEASONS, DataVersionModel
+from src.models.game import GameModel
+from src.models.team import TeamModel
+
+
+@pytest.fixture
+def cache_db():
+    """Own in-memory database with one game in a completed season and one in the current one."""
+    clear_version_cache()
+    engine = create_engine("sqlite://", poolclass=StaticPool, connect_args={"check_same_thread": False})
+    Base.metadata.create_all(bind=engine)
+    session = sessionmaker(bind=engine)()
+    for season in (2022, current_season()):
+        session.add(GameModel(game_id=f"{season}_01_KC_SF", season=season, season_type='REG', week=1,
+                              game_date=date(season, 9, 10), home_team='SF', away_team='KC'))
+        bump_data_versions(session, 'games', [season])
+    session.commit()
+
+    yield engine, session
+    session.close()
+    engine.dispose()
+    clear_version_cache()
+
+
+@pytest.fixture
+def client(cache_db):
+    _, session = cache_db
+    app = create_app()
+    app.dependency_overrides[get_db_session] = lambda: session
+    return TestClient(app)
+
+
+class TestDataVersions:
+    """Test bumping and reading data versions."""
+
+    def test_bump_inserts_then_increments(self, cache_db):
+        _, session = cache_db
+
+        bump_data_versions(session, 'games', [2022])
+        bump_data_versions(session, 'teams')
+
+        rows = {(row.dataset, row.season): row.version for row in session.query(DataVersionModel)}
+        assert rows[('games', 2022)] == 2
+        assert rows[('teams', ALL_SEASONS)] == 1
+
+    def test_season_version_includes_unsplit_datasets(self, cache_db):
+        _, session = cache_db
+        before = get_data_version(session, ('teams', 'games'), 2022)
+
+        bump_data_versions(session, 'teams')
+        bump_data_versions(session, 'games', [2021])
+
+        assert get_data_version(session, ('teams', 'games'), 2022) == (before[0] + 1, before[1])
+
+    def test_empty_season_set_bumps_nothing(self, cache_db):
+        _, session = cache_db
+        before = get_data_version(session, ('games',))
+
+        bump_data_versions(session, 'games', [])
+
+        assert get_data_version(session, ('games',)) == before
+
+
+class TestConditionalGet:
+    """Test ETag and Cache-Control headers on read endpoints."""
+
+    def test_completed_season_is_immutable(self, client):
+        response = client.get("/api/v1/games/?season=2022")
+
+        assert response.status_code == 200
+        assert response.headers["etag"].startswith('W/"')
+        assert response.headers["cache-control"] == IMMUTABLE_CACHE_CONTROL
+
+    def test_current_season_must_revalidate(self, client):
+        response = client.get(f"/api/v1/games/?season={current_season()}")
+
+        assert response.headers["cache-control"] == REVALIDATE_CACHE_CONTROL
+
+    def test_if_none_match_skips_endpoint_queries(self, client, cache_db):
+        engine, _ = cache_db
+        etag = client.get("/api/v1/games/?season=2022").headers["etag"]
+        statements = []
+
+        def record(conn, cursor, statement, parameters, context, executemany):
+            statements.append(statement)
+
+        event.listen(engine, "before_cursor_execute", record)
+        try:
+            response = client.get("/api/v1/games/?season=2022", headers={"If-None-Match": etag})
+        finally:
+            event.remove(engine, "before_cursor_execute", record)
+
+        assert response.status_code == 304
+        assert response.content == b''
+        assert response.headers["etag"] == etag
+        assert statements == []
+
+    def test_etag_follows_query_and_version(self, client, cache_db):
+        _, session = cache_db
+        etag = client.get("/api/v1/games/?season=2022").headers["etag"]
+
+        assert client.get("/api/v1/games/?season=2022&week=1").headers["etag"] != etag
+
+        bump_data_versions(session, 'games', [2021])
+        assert client.get("/api/v1/games/?season=2022").headers["etag"] == etag
+
+        bump_data_versions(session, 'games', [2022])
+        response = client.get("/api/v1/games/?season=2022", headers={"If-None-Match": etag})
+        assert response.status_code == 200
+        assert response.headers["etag"] != etag
+
+    def test_missing_versions_table_serves_uncached(self, client, cache_db):
+        engine, _ = cache_db
+        DataVersionModel.__table__.drop(engine)
+        clear_version_cache()
+
+        response = client.get("/api/v1/games/?season=2022")
+
+        assert response.status_code == 200
+        assert "etag" not in response.headers
+
+    @pytest.mark.parametrize("method, body", [("put", {"team_nick": "Silver and Black"}), ("delete", None)])
+    def test_team_writes_invalidate_team_responses(self, client, cache_db, method, body):
+        _, session = cache_db
+        team = TeamModel(team_abbr='LV', team_name='Las Vegas', team_nick='Raiders',
+                         team_conf='AFC', team_division='West')
+        session.add(team)
+        session.commit()
+        etag = client.get("/api/v1/teams/").headers["etag"]
+
+        assert client.request(method, f"/api/v1/teams/{team.id}", json=body).status_code == 200
+
+        response = client.get("/api/v1/teams/", headers={"If-None-Match": etag})
+        assert response.status_code == 200
+        assert response.headers["etag"] != etag
@@ -270,6 +270,28 @@ class TestDataAPI:
         
         mock_client.clear_cache.assert_called_once()
     
+    @patch('src.api.routers.data.current_season', return_value=2023)
+    @patch('src.api.routers.data.get_data_loader')
+    def test_refresh_loads_changed_weeks(self, mock_get_loader, mock_season, test_client):
+        """Test the refresh reloads changed weeks of the current and previous season."""
+        from src.data.data_loader import DataLoadResult
+        
+        mock_loader = Mock()
+        mock_loader.load_teams.return_value = DataLoadResult()
+        plays = DataLoadResult()
+        plays.records_inserted = 120
+        mock_loader.refresh_changed_weeks.return_value = {'games': DataLoadResult(), 'plays': plays}
+        mock_get_loader.return_value = mock_loader
+        
+        response = test_client.post("/api/v1/data/refresh")
+        
+        assert response.status_code == 200
+        data = response.json()
+        assert data["seasons_refreshed"] == [2023, 2022]
+        assert "120 plays" in data["message"]
+        mock_loader.refresh_changed_weeks.assert_called_once_with([2023, 2022])
+        mock_loader.load_plays.assert_not_called()
+    
     @patch('src.api.routers.data.get_data_loader')
     def test_data_loading_error_handling(self, mock_get_loader, test_client):
         """Test error handling in data loading endpoints."""
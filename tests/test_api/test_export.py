@@ -0,0 +1,107 @@
+"""Tests for the streaming plays export."""
+
+import csv
+import io
+import json
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, insert
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from src.api.dependencies import get_db_session
+from src.api.export import PYARROW_AVAILABLE, encode_ndjson
+from src.api.main import create_app
+from src.models.base import Base
+from src.models.play import PlayModel
+
+PLAY_COUNT = 250
+
+
+@pytest.fixture
+def export_client():
+    """Client over its own in-memory database holding two seasons of plays."""
+    engine = create_engine("sqlite://", poolclass=StaticPool, connect_args={"check_same_thread": False})
+    Base.metadata.create_all(bind=engine)
+    session = sessionmaker(bind=engine)()
+    session.execute(insert(PlayModel), [
+        dict(play_id=str(i), game_id=f"{season}_01_KC_SF", season=season, posteam='SF', defteam='KC',
+             play_type='pass' if i % 2 else 'run', yards_gained=i % 15, epa=0.25, touchdown=i % 50 == 0)
+        for season in (2022, 2023) for i in range(PLAY_COUNT)
+    ])
+    session.commit()
+
+    app = create_app()
+    app.dependency_overrides[get_db_session] = lambda: session
+    yield TestClient(app)
+    session.close()
+    engine.dispose()
+
+
+class TestPlaysExport:
+    """Test exporting plays in each format."""
+
+    def test_ndjson(self, export_client):
+        response = export_client.get("/api/v1/plays/export?season=2023&chunk_size=100")
+
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("application/x-ndjson")
+        rows = [json.loads(line) for line in response.text.splitlines()]
+        assert len(rows) == PLAY_COUNT
+        assert {row["season"] for row in rows} == {2023}
+        assert rows[0]["epa"] == 0.25
+        assert [row["play_id"] for row in rows] == sorted(row["play_id"] for row in rows)
+
+    def test_csv_with_filters(self, export_client):
+        response = export_client.get("/api/v1/plays/export?format=csv&season=2022&play_type=RUN")
+
+        rows = list(csv.DictReader(io.StringIO(response.text)))
+        assert response.headers["content-disposition"] == 'attachment; filename="plays.csv"'
+        assert len(rows) == PLAY_COUNT // 2
+        assert {row["play_type"] for row in rows} == {"run"}
+
+    @pytest.mark.skipif(not PYARROW_AVAILABLE, reason="pyarrow not available")
+    def test_parquet_row_group_per_chunk(self, export_client):
+        import pyarrow.parquet as pq
+
+        response = export_client.get("/api/v1/plays/export?format=parquet&chunk_size=100")
+
+        parquet = pq.ParquetFile(io.BytesIO(response.content))
+        assert parquet.metadata.num_rows == 2 * PLAY_COUNT
+        assert parquet.num_row_groups == 5
+        table = parquet.read(columns=["season", "touchdown"])
+        assert table.column("touchdown").to_pylist().count(True) == 10
+
+    @pytest.mark.skipif(not PYARROW_AVAILABLE, reason="pyarrow not available")
+    def test_arrow_stream(self, export_client):
+        import pyarrow as pa
+
+        response = export_client.get("/api/v1/plays/export?format=arrow&season=2023&chunk_size=100")
+
+        reader = pa.ipc.open_stream(response.content)
+        batches = list(reader)
+        assert [batch.num_rows for batch in batches] == [100, 100, 50]
+        assert reader.schema.field("epa").type == pa.float64()
+
+    def test_unsupported_format(self, export_client):
+        assert export_client.get("/api/v1/plays/export?format=xml").status_code == 400
+
+    def test_columnar_formats_need_pyarrow(self, export_client, monkeypatch):
+        monkeypatch.setattr("src.api.routers.plays.PYARROW_AVAILABLE", False)
+
+        assert export_client.get("/api/v1/plays/export?format=parquet").status_code == 501
+
+
+def test_encoding_is_incremental():
+    consumed = []
+
+    def chunks():
+        for i in range(3):
+            consumed.append(i)
+            yield [(i, 'x')]
+
+    encoded = encode_ndjson(['n', 's'], chunks())
+
+    assert next(encoded) == b'{"n": 0, "s": "x"}\n'
+    assert consumed == [0]
@@ -3,6 +3,18 @@
 import pytest
 from fastapi.testclient import TestClient
 from datetime import date
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from src.api.dependencies import get_db_session
+from src.api.main import create_app
+from src.analysis.insights import InsightsGenerator
+from src.data.data_versions import clear_version_cache
+from src.models.base import Base
+from src.models.game import GameModel
+from src.models.game_wp_timeline import GameWPTimelineModel
+from src.models.play import PlayModel
 
 
 class TestGamesAPI:
@@ -284,4 +296,70 @@ class TestGamesAPI:
         response = test_client.get("/api/v1/games/?season=2023&week=1&team=SF")
         data = response.json()
         assert len(data["games"]) == 1  # Only 2023 week 1 game with SF
-        assert data["games"][0]["game_id"] == "2023_01_SF_KC"
\ No newline at end of file
+        assert data["games"][0]["game_id"] == "2023_01_SF_KC"
+
+
+@pytest.fixture
+def timeline_session():
+    """Own in-memory database with one game, its play and its stored timeline."""
+    clear_version_cache()
+    engine = create_engine("sqlite://", poolclass=StaticPool, connect_args={"check_same_thread": False})
+    Base.metadata.create_all(bind=engine)
+    session = sessionmaker(bind=engine)()
+    session.add(GameModel(game_id="2023_01_SF_KC", season=2023, season_type="REG", week=1,
+                          game_date=date(2023, 9, 10), home_team="KC", away_team="SF",
+                          home_score=24, away_score=21))
+    session.add(PlayModel(play_id="2023_01_SF_KC_1", game_id="2023_01_SF_KC", season=2023, week=1,
+                          posteam="SF", defteam="KC", play_type="pass", qtr=1, down=1, ydstogo=10,
+                          yardline_100=75, yards_gained=12, ep=1.2, epa=0.8, wp=0.52, wpa=0.02))
+    session.commit()
+    # As ingest does after writing the plays
+    InsightsGenerator(session).refresh_game_insights(["2023_01_SF_KC"])
+    session.commit()
+
+    yield session
+    session.close()
+    engine.dispose()
+    clear_version_cache()
+
+
+@pytest.fixture
+def timeline_client(timeline_session):
+    app = create_app()
+    app.dependency_overrides[get_db_session] = lambda: timeline_session
+    return TestClient(app)
+
+
+class TestGameWpTimeline:
+    """Test the win probability timeline endpoint."""
+
+    def test_get_game_wp_timeline(self, timeline_client, timeline_session):
+        """Test getting a game's win probability timeline."""
+        response = timeline_client.get("/api/v1/games/2023_01_SF_KC/wp-timeline?points=50")
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["game_id"] == "2023_01_SF_KC"
+        assert data["home_team"] == "KC"
+        assert data["play_count"] == 1
+        assert len(data["win_probability"]) == data["points"]
+        assert len(data["seconds_elapsed"]) == data["points"]
+
+    def test_missing_timeline_is_not_computed_on_read(self, timeline_client, timeline_session):
+        """Test a game loaded without a timeline is a 404 until precompute stores one."""
+        timeline_session.add(GameModel(game_id="2023_02_KC_SF", season=2023, season_type="REG", week=2,
+                                       game_date=date(2023, 9, 17), home_team="SF", away_team="KC"))
+        timeline_session.add(PlayModel(play_id="2023_02_KC_SF_1", game_id="2023_02_KC_SF", season=2023,
+                                       week=2, posteam="KC", defteam="SF", play_type="run", qtr=1, wp=0.5))
+        timeline_session.commit()
+
+        response = timeline_client.get("/api/v1/games/2023_02_KC_SF/wp-timeline")
+
+        assert response.status_code == 404
+        assert timeline_session.query(GameWPTimelineModel).count() == 1
+
+    def test_get_game_wp_timeline_not_found(self, timeline_client):
+        """Test timeline for a non-existent game."""
+        response = timeline_client.get("/api/v1/games/2999_99_XX_YY/wp-timeline")
+
+        assert response.status_code == 404
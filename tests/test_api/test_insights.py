@@ -4,10 +4,17 @@ import pytest
 from fastapi.testclient import TestClient
 from datetime import date
 from unittest.mock import Mock, patch
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
 
-from src.api.main import app
+from src.api.dependencies import get_db_session
+from src.api.main import app, create_app
+from src.data.data_versions import clear_version_cache
+from src.models.base import Base
 from src.models.team import TeamModel
 from src.models.game import GameModel
+from src.models.team_season_insights import TeamSeasonInsightsModel
 from src.analysis.insights import TeamInsights, GameInsight, AdvancedMetrics
 
 
@@ -388,4 +395,50 @@ class TestInsightsIntegration:
         
         assert response.status_code == 500
         data = response.json()
-        assert "Error generating team insights" in data["detail"]
\ No newline at end of file
+        assert "Error generating team insights" in data["detail"]
+
+
+@pytest.fixture
+def history_session():
+    """Own in-memory database with two stored seasons of SF insights."""
+    clear_version_cache()
+    engine = create_engine("sqlite://", poolclass=StaticPool, connect_args={"check_same_thread": False})
+    Base.metadata.create_all(bind=engine)
+    session = sessionmaker(bind=engine)()
+    for season, epa in ((2023, 0.15), (2022, 0.05)):
+        session.add(TeamSeasonInsightsModel(team_abbr='SF', season=season, play_count=1000,
+                                            offensive_epa_per_play=epa))
+    session.commit()
+
+    yield session
+    session.close()
+    engine.dispose()
+    clear_version_cache()
+
+
+@pytest.fixture
+def history_client(history_session):
+    history_app = create_app()
+    history_app.dependency_overrides[get_db_session] = lambda: history_session
+    return TestClient(history_app)
+
+
+class TestTeamInsightsHistory:
+    """Test the stored team insights history endpoint."""
+
+    def test_get_team_insights_history(self, history_client):
+        """Test team insights history retrieval, oldest season first."""
+        response = history_client.get("/api/v1/insights/team/sf/history")
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["data"]["team_abbr"] == "SF"
+        assert [(s["season"], s["offensive_epa_per_play"]) for s in data["data"]["seasons"]] == [
+            (2022, 0.05), (2023, 0.15)
+        ]
+
+    def test_get_team_insights_history_not_found(self, history_client):
+        """Test team insights history with no stored seasons."""
+        response = history_client.get("/api/v1/insights/team/KC/history")
+
+        assert response.status_code == 404
@@ -0,0 +1,160 @@
+"""Tests for set-based bulk upserts."""
+
+from datetime import date
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+from sqlalchemy import create_engine, event
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.sql.dml import Insert
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from src.data.bulk_upsert import _csv_value, _upsert_postgresql, bulk_upsert
+from src.models.base import Base
+from src.models.play import PlayModel
+from src.models.team import TeamModel
+
+PLAY_KEY = ('game_id', 'play_id')
+
+
+@pytest.fixture
+def engine():
+    engine = create_engine("sqlite://", poolclass=StaticPool, connect_args={"check_same_thread": False})
+    Base.metadata.create_all(bind=engine)
+    yield engine
+    engine.dispose()
+
+
+@pytest.fixture
+def session(engine):
+    session = sessionmaker(bind=engine, autoflush=False)()
+    yield session
+    session.close()
+
+
+def plays(game_id, count, **values):
+    return [dict(game_id=game_id, play_id=str(i), season=2023, **values) for i in range(count)]
+
+
+class TestBulkUpsert:
+    """Test inserting and updating batches of rows."""
+
+    def test_insert_then_update_counts(self, session):
+        first = bulk_upsert(session, PlayModel, plays('2023_01_KC_SF', 3, yards_gained=1), PLAY_KEY)
+        second = bulk_upsert(session, PlayModel, plays('2023_01_KC_SF', 5, yards_gained=7), PLAY_KEY)
+        session.commit()
+
+        assert (first.inserted, first.updated) == (3, 0)
+        assert (second.inserted, second.updated) == (2, 3)
+        assert {play.yards_gained for play in session.query(PlayModel)} == {7}
+        assert session.query(PlayModel).count() == 5
+
+    def test_same_play_id_in_different_games(self, session):
+        result = bulk_upsert(session, PlayModel, plays('2023_01_KC_SF', 2) + plays('2023_01_DAL_BUF', 2),
+                             PLAY_KEY)
+
+        assert result.inserted == 4
+        assert session.query(PlayModel).count() == 4
+
+    def test_duplicate_keys_keep_last(self, session):
+        rows = plays('2023_01_KC_SF', 1, yards_gained=1) + plays('2023_01_KC_SF', 1, yards_gained=9)
+
+        result = bulk_upsert(session, PlayModel, rows, PLAY_KEY)
+
+        assert (result.inserted, result.duplicates) == (1, 1)
+        assert session.query(PlayModel.yards_gained).scalar() == 9
+
+    def test_update_keeps_columns_not_provided(self, session):
+        bulk_upsert(session, PlayModel, plays('2023_01_KC_SF', 1, first_down=True, yards_gained=3), PLAY_KEY)
+        bulk_upsert(session, PlayModel, plays('2023_01_KC_SF', 1, yards_gained=12), PLAY_KEY)
+        session.commit()
+
+        play = session.query(PlayModel).one()
+        assert (play.first_down, play.yards_gained) == (True, 12)
+        assert play.created_at <= play.updated_at
+
+    def test_statement_count_does_not_grow_with_rows(self, session, engine):
+        statements = []
+
+        def record(conn, cursor, statement, parameters, context, executemany):
+            statements.append(statement)
+
+        event.listen(engine, "before_cursor_execute", record)
+        try:
+            bulk_upsert(session, PlayModel, plays('2023_01_KC_SF', 10), PLAY_KEY)
+            small = len(statements)
+            bulk_upsert(session, PlayModel, plays('2023_02_KC_SF', 2000), PLAY_KEY)
+        finally:
+            event.remove(engine, "before_cursor_execute", record)
+
+        assert len(statements) - small == small
+
+    def test_rows_with_same_hash_are_not_rewritten(self, session, engine):
+        bulk_upsert(session, PlayModel, plays('2023_01_KC_SF', 3, yards_gained=1, row_hash=11), PLAY_KEY)
+        session.commit()
+        stamped = {play.play_id: play.updated_at for play in session.query(PlayModel)}
+        statements = []
+
+        def record(conn, cursor, statement, parameters, context, executemany):
+            statements.append((statement, parameters))
+
+        rows = plays('2023_01_KC_SF', 4, yards_gained=1, row_hash=11)
+        rows[1].update(yards_gained=9, row_hash=99)
+        event.listen(engine, "before_cursor_execute", record)
+        try:
+            result = bulk_upsert(session, PlayModel, rows, PLAY_KEY)
+        finally:
+            event.remove(engine, "before_cursor_execute", record)
+        session.commit()
+
+        assert (result.inserted, result.updated, result.unchanged) == (1, 1, 2)
+        assert result.unchanged_keys == {('2023_01_KC_SF', '0'), ('2023_01_KC_SF', '2')}
+        # Only the changed and the new row are sent to the database
+        assert len(statements[-1][1]) == 2
+        assert {play.play_id: play.updated_at for play in session.query(PlayModel)
+                if play.play_id in ('0', '2')} == {'0': stamped['0'], '2': stamped['2']}
+        assert session.query(PlayModel.yards_gained).filter_by(play_id='1').scalar() == 9
+
+    def test_unchanged_on_generic_dialect(self, session, engine, monkeypatch):
+        monkeypatch.setattr(engine.dialect, 'name', 'other')
+        team = dict(team_name='San Francisco', team_nick='49ers', team_conf='NFC', team_division='West',
+                    team_abbr='SF', row_hash=5)
+
+        bulk_upsert(session, TeamModel, [team], ('team_abbr',))
+        same = bulk_upsert(session, TeamModel, [team], ('team_abbr',))
+        changed = bulk_upsert(session, TeamModel, [dict(team, team_nick='Niners', row_hash=6)], ('team_abbr',))
+
+        assert (same.updated, same.unchanged) == (0, 1)
+        assert (changed.updated, changed.unchanged) == (1, 0)
+
+    def test_generic_dialect_path(self, session, engine, monkeypatch):
+        monkeypatch.setattr(engine.dialect, 'name', 'other')
+        team = dict(team_name='San Francisco', team_nick='49ers', team_conf='NFC', team_division='West')
+
+        first = bulk_upsert(session, TeamModel, [dict(team, team_abbr='SF')], ('team_abbr',))
+        second = bulk_upsert(session, TeamModel, [dict(team, team_abbr='SF', team_nick='Niners'),
+                                                  dict(team, team_abbr='LA')], ('team_abbr',))
+
+        assert (first.inserted, second.inserted, second.updated) == (1, 1, 1)
+        assert session.query(TeamModel.team_nick).filter_by(team_abbr='SF').scalar() == 'Niners'
+
+
+def test_postgresql_rewrites_rows_without_hash():
+    session = MagicMock()
+    session.execute.return_value = []
+
+    with patch('src.data.bulk_upsert._copy_rows'):
+        _upsert_postgresql(session, PlayModel.__table__, ['game_id', 'play_id', 'row_hash'], PLAY_KEY,
+                           [dict(game_id='g', play_id='1', row_hash=None)], None, hashed=True)
+
+    merge = next(call.args[0] for call in session.execute.call_args_list if isinstance(call.args[0], Insert))
+    sql = str(merge.compile(dialect=postgresql.dialect()))
+    assert 'WHERE excluded.row_hash IS NULL OR plays.row_hash IS DISTINCT FROM excluded.row_hash' in sql
+
+
+def test_copy_csv_values():
+    assert [_csv_value(value) for value in (None, '', 'a "b"', True, 3, date(2023, 9, 10))] == [
+        '', '""', '"a ""b"""', 't', '3', '2023-09-10'
+    ]
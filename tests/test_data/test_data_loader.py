@@ -2,13 +2,33 @@
 
 import pytest
 import pandas as pd
-from unittest.mock import Mock, MagicMock, patch
+from unittest.mock import ANY, Mock, MagicMock, patch
 from datetime import datetime, date
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+from src.models.base import Base
 from src.data.data_loader import DataLoader, DataLoadResult
+from src.data.data_mapper import DataMapper
 from src.models.team import TeamModel, TeamCreate
 from src.models.player import PlayerModel, PlayerCreate
 from src.models.game import GameModel, GameCreate
 from src.models.play import PlayModel, PlayCreate
+from src.models.load_watermark import LoadWatermarkModel
+from src.models.load_checkpoint import LoadCheckpointModel
+from src.models.player_stats import PlayerSeasonStatsModel
+from src.analysis.player_aggregates import PlayerStatsAggregator
+
+
+@pytest.fixture
+def sqlite_session():
+    """Session on a fresh in-memory database."""
+    engine = create_engine("sqlite://", poolclass=StaticPool, connect_args={"check_same_thread": False})
+    Base.metadata.create_all(bind=engine)
+    session = sessionmaker(bind=engine, autoflush=False)()
+    yield session
+    session.close()
+    engine.dispose()
 
 
 class TestDataLoadResult:
@@ -70,12 +90,11 @@ class TestDataLoader:
     """Test DataLoader class."""
     
     @pytest.fixture
-    def mock_db_manager(self):
-        """Mock database manager."""
+    def mock_db_manager(self, sqlite_session):
+        """Mock database manager handing out a session on an in-memory database."""
         manager = Mock()
-        session = Mock()
-        manager.get_session.return_value = session
-        return manager, session
+        manager.get_session.return_value = sqlite_session
+        return manager, sqlite_session
     
     @pytest.fixture
     def mock_nfl_client(self):
@@ -122,10 +141,9 @@ class TestDataLoader:
         mock_nfl_client.fetch_teams.return_value = teams_df
         mock_data_mapper.map_teams_data.return_value = team_creates
         
-        # Mock session queries (no existing teams)
-        session.query.return_value.filter.return_value.first.return_value = None
-        
-        result = data_loader.load_teams()
+        with patch.object(session, 'commit', wraps=session.commit) as commit, \
+                patch.object(session, 'close', wraps=session.close) as close:
+            result = data_loader.load_teams()
         
         assert result.success is True
         assert result.records_processed == 2
@@ -137,17 +155,19 @@ class TestDataLoader:
         # Verify calls
         mock_nfl_client.fetch_teams.assert_called_once()
         mock_data_mapper.map_teams_data.assert_called_once_with(teams_df)
-        session.commit.assert_called_once()
-        session.close.assert_called_once()
+        commit.assert_called_once()
+        close.assert_called_once()
+        assert session.query(TeamModel).count() == 2
     
     def test_load_teams_with_updates(self, data_loader, mock_nfl_client,
                                    mock_data_mapper, mock_db_manager):
         """Test teams loading with existing teams (updates)."""
         db_manager, session = mock_db_manager
         
-        # Mock existing team
-        existing_team = Mock(spec=TeamModel)
-        existing_team.team_abbr = 'SF'
+        # Existing team
+        session.add(TeamModel(team_abbr='SF', team_name='SF', team_nick='Old', team_conf='NFC',
+                              team_division='West'))
+        session.commit()
         
         teams_df = pd.DataFrame({'team_abbr': ['SF']})
         team_creates = [
@@ -157,7 +177,6 @@ class TestDataLoader:
         
         mock_nfl_client.fetch_teams.return_value = teams_df
         mock_data_mapper.map_teams_data.return_value = team_creates
-        session.query.return_value.filter.return_value.first.return_value = existing_team
         
         result = data_loader.load_teams()
         
@@ -166,6 +185,9 @@ class TestDataLoader:
         assert result.records_inserted == 0
         assert result.records_updated == 1
         assert result.records_skipped == 0
+        team = session.query(TeamModel).one()
+        session.refresh(team)
+        assert (team.team_name, team.team_nick) == ('San Francisco', '49ers')
     
     def test_load_teams_empty_data(self, data_loader, mock_nfl_client,
                                  mock_data_mapper, mock_db_manager):
@@ -203,8 +225,6 @@ class TestDataLoader:
         
         mock_nfl_client.fetch_players.return_value = players_df
         mock_data_mapper.map_players_data.return_value = player_creates
-        session.query.return_value.filter.return_value.first.return_value = None
-        
         result = data_loader.load_players([2023])
         
         assert result.success is True
@@ -226,8 +246,6 @@ class TestDataLoader:
         
         mock_nfl_client.fetch_games.return_value = games_df
         mock_data_mapper.map_games_data.return_value = game_creates
-        session.query.return_value.filter.return_value.first.return_value = None
-        
         result = data_loader.load_games([2023])
         
         assert result.success is True
@@ -249,15 +267,13 @@ class TestDataLoader:
         
         mock_nfl_client.fetch_plays.return_value = plays_df
         mock_data_mapper.map_plays_data.return_value = [play_creates]  # One batch
-        session.query.return_value.filter.return_value.first.return_value = None
-        
         result = data_loader.load_plays([2023])
         
         assert result.success is True
         assert result.records_processed == 2
         assert result.records_inserted == 2
         
-        mock_nfl_client.fetch_plays.assert_called_once_with([2023], None)
+        mock_nfl_client.fetch_plays.assert_called_once_with([2023], None, columns=mock_data_mapper.play_columns)
     
     def test_load_plays_with_weeks(self, data_loader, mock_nfl_client,
                                  mock_data_mapper, mock_db_manager):
@@ -269,11 +285,18 @@ class TestDataLoader:
         
         mock_nfl_client.fetch_plays.return_value = plays_df
         mock_data_mapper.map_plays_data.return_value = [play_creates]
-        session.query.return_value.filter.return_value.first.return_value = None
-        
         result = data_loader.load_plays([2023], weeks=[1, 2])
         
-        mock_nfl_client.fetch_plays.assert_called_once_with([2023], [1, 2])
+        mock_nfl_client.fetch_plays.assert_called_once_with([2023], [1, 2], columns=mock_data_mapper.play_columns)
+    
+    def test_load_plays_all_columns(self, data_loader, mock_nfl_client,
+                                    mock_data_mapper, mock_db_manager):
+        """Test the column projection can be turned off."""
+        mock_nfl_client.fetch_plays.return_value = pd.DataFrame()
+        
+        data_loader.load_plays([2023], all_columns=True)
+        
+        mock_nfl_client.fetch_plays.assert_called_once_with([2023], None, columns=None)
     
     def test_load_plays_multiple_batches(self, data_loader, mock_nfl_client,
                                        mock_data_mapper, mock_db_manager):
@@ -289,15 +312,80 @@ class TestDataLoader:
         
         mock_nfl_client.fetch_plays.return_value = plays_df
         mock_data_mapper.map_plays_data.return_value = [batch1, batch2]
-        session.query.return_value.filter.return_value.first.return_value = None
-        
-        result = data_loader.load_plays([2023])
+        with patch.object(session, 'commit', wraps=session.commit) as commit:
+            result = data_loader.load_plays([2023])
         
         assert result.success is True
         assert result.records_processed == 3
         assert result.records_inserted == 3
         # Should commit twice (once per batch)
-        assert session.commit.call_count == 2
+        assert commit.call_count == 2
+    
+    def test_load_plays_refreshes_affected_team_seasons(self, data_loader, mock_nfl_client,
+                                                        mock_data_mapper, mock_db_manager):
+        """Test team-season insights refresh once for every affected team."""
+        db_manager, session = mock_db_manager
+        
+        batch1 = [PlayCreate(play_id='play_1', game_id='game_1', season=2023,
+                             posteam='SF', defteam='KC')]
+        batch2 = [PlayCreate(play_id='play_2', game_id='game_2', season=2023,
+                             posteam='DAL', defteam='BUF')]
+        
+        mock_nfl_client.fetch_plays.return_value = pd.DataFrame({'play_id': ['play_1', 'play_2']})
+        mock_data_mapper.map_plays_data.return_value = [batch1, batch2]
+        with patch.object(data_loader, '_refresh_derived_data') as refresh:
+            result = data_loader.load_plays([2023])
+        
+        assert result.success is True
+        assert refresh.call_count == 2
+        first_call, last_call = refresh.call_args_list
+        assert first_call.args[1] == {'game_1'}
+        assert first_call.args[2] == set()
+        assert last_call.args[1] == {'game_2'}
+        assert last_call.args[2] == {(2023, 'SF'), (2023, 'KC'), (2023, 'DAL'), (2023, 'BUF')}
+    
+    def test_load_plays_streaming(self, data_loader, mock_nfl_client,
+                                  mock_data_mapper, mock_db_manager):
+        """Test streamed chunks are each written before the next is read."""
+        db_manager, session = mock_db_manager
+        events = []
+        
+        def chunks(seasons, weeks, memory_budget_mb, columns=None):
+            for season in seasons:
+                events.append(f'read {season}')
+                yield pd.DataFrame({'season': [season]})
+        
+        def map_chunk(plays_df, batch_size):
+            season = int(plays_df['season'].iloc[0])
+            return [[PlayCreate(play_id=str(i), game_id=f'{season}_01_SF_KC', season=season,
+                                posteam='SF', defteam='KC')] for i in range(2)]
+        
+        mock_nfl_client.iter_plays.side_effect = chunks
+        mock_data_mapper.map_plays_data.side_effect = map_chunk
+        with patch.object(session, 'commit', side_effect=lambda: events.append('commit')), \
+                patch.object(data_loader, '_refresh_derived_data') as refresh:
+            result = data_loader.load_plays([2022, 2023], streaming=True, memory_budget_mb=64)
+        
+        assert result.success is True
+        assert result.records_processed == 4
+        assert result.records_inserted == 4
+        mock_nfl_client.iter_plays.assert_called_once_with([2022, 2023], None, 64,
+                                                           columns=mock_data_mapper.play_columns)
+        mock_nfl_client.fetch_plays.assert_not_called()
+        # The next chunk is read once all but the last batch of the previous one is written
+        assert events == ['read 2022', 'commit', 'read 2023', 'commit', 'commit', 'commit']
+        assert [call.args[2] for call in refresh.call_args_list] == [
+            set(), set(), set(), {(2022, 'SF'), (2022, 'KC'), (2023, 'SF'), (2023, 'KC')}
+        ]
+    
+    def test_load_plays_streaming_no_data(self, data_loader, mock_nfl_client, mock_db_manager):
+        """Test streaming with nothing to read succeeds without writing."""
+        mock_nfl_client.iter_plays.return_value = iter([])
+        
+        result = data_loader.load_plays([2023], streaming=True)
+        
+        assert result.success is True
+        assert result.records_processed == 0
     
     def test_load_full_dataset(self, data_loader, mock_nfl_client,
                              mock_data_mapper, mock_db_manager):
@@ -320,6 +408,19 @@ class TestDataLoader:
         # All should be successful (empty data is not an error)
         assert all(result.success for result in results.values())
     
+    def test_load_full_dataset_skips_plays_when_teams_fail(self, data_loader, mock_nfl_client):
+        """Test plays are not loaded when the teams they reference failed to load."""
+        mock_nfl_client.fetch_teams.side_effect = Exception("API error")
+        mock_nfl_client.fetch_games.return_value = pd.DataFrame()
+        mock_nfl_client.fetch_players.return_value = pd.DataFrame()
+        
+        results = data_loader.load_full_dataset([2023])
+        
+        assert results['teams'].success is False
+        assert results['plays'].success is False
+        assert results['plays'].errors == ['Plays not loaded: teams load failed']
+        mock_nfl_client.fetch_plays.assert_not_called()
+    
     def test_load_full_dataset_no_plays(self, data_loader, mock_nfl_client,
                                       mock_data_mapper, mock_db_manager):
         """Test loading full dataset without plays."""
@@ -344,7 +445,9 @@ class TestDataLoader:
                            mock_player_model, mock_team_model, data_loader,
                            mock_db_manager):
         """Test getting load status."""
-        db_manager, session = mock_db_manager
+        db_manager, _ = mock_db_manager
+        session = Mock()
+        db_manager.get_session.return_value = session
         
         # Mock count queries
         session.query.return_value.count.side_effect = [32, 2000, 500, 50000]
@@ -358,6 +461,9 @@ class TestDataLoader:
         # Mock seasons query
         session.query.return_value.distinct.return_value.all.return_value = [(2022,), (2023,)]
         
+        # Mock checkpoints query
+        session.query.return_value.filter.return_value.order_by.return_value.all.return_value = []
+        
         status = data_loader.get_load_status()
         
         assert status['teams_count'] == 32
@@ -367,10 +473,13 @@ class TestDataLoader:
         assert status['latest_game_date'] == '2023-12-31'
         assert status['latest_season'] == 2023
         assert status['available_seasons'] == [2022, 2023]
+        assert status['plays_load_progress']['weeks_unfinished'] == 0
     
     def test_get_load_status_error(self, data_loader, mock_db_manager):
         """Test get_load_status with error."""
-        db_manager, session = mock_db_manager
+        db_manager, _ = mock_db_manager
+        session = Mock()
+        db_manager.get_session.return_value = session
         session.query.side_effect = Exception("Database error")
         
         status = data_loader.get_load_status()
@@ -396,19 +505,20 @@ class TestDataLoaderErrorHandling:
         
         # Mock session to raise error
         session = Mock()
-        session.query.side_effect = Exception("Database error")
+        session.execute.side_effect = Exception("Database error")
         data_loader.db_manager.get_session.return_value = session
         
         result = data_loader.load_teams()
         
-        # Should succeed overall but skip the failed team
-        assert result.success is True
-        assert result.records_skipped == 1
+        # The batch is written as a whole, so a database error fails the load
+        assert result.success is False
         assert len(result.errors) == 1
         assert "Database error" in result.errors[0]
+        session.rollback.assert_called_once()
+        session.commit.assert_not_called()
         session.close.assert_called_once()
     
-    def test_load_teams_individual_errors(self, data_loader):
+    def test_load_teams_individual_errors(self, data_loader, sqlite_session):
         """Test teams loading with individual team errors."""
         data_loader.nfl_client.fetch_teams.return_value = pd.DataFrame({'team_abbr': ['SF', 'KC']})
         
@@ -422,9 +532,7 @@ class TestDataLoaderErrorHandling:
         
         data_loader.data_mapper.map_teams_data.return_value = team_creates
         
-        session = Mock()
-        session.query.return_value.filter.return_value.first.return_value = None
-        data_loader.db_manager.get_session.return_value = session
+        data_loader.db_manager.get_session.return_value = sqlite_session
         
         result = data_loader.load_teams()
         
@@ -433,4 +541,305 @@ class TestDataLoaderErrorHandling:
         assert result.records_processed == 2
         assert result.records_inserted == 1  # Only the valid one
         assert result.records_skipped == 1
-        assert len(result.errors) == 1
\ No newline at end of file
+        assert len(result.errors) == 1
+
+def schedule(season, weeks, scored_weeks=()):
+    """Schedule rows with one game per week; weeks in ``scored_weeks`` have final scores."""
+    return pd.DataFrame({
+        'game_id': [f'{season}_{week:02d}_SF_KC' for week in weeks],
+        'season': [season] * len(weeks),
+        'game_type': ['REG'] * len(weeks),
+        'week': list(weeks),
+        'gameday': [f'{season}-09-{10 + week:02d}' for week in weeks],
+        'home_team': ['KC'] * len(weeks),
+        'away_team': ['SF'] * len(weeks),
+        'home_score': [21.0 if week in scored_weeks else None for week in weeks],
+        'away_score': [17.0 if week in scored_weeks else None for week in weeks],
+    })
+
+
+def week_plays(season, weeks, yards=5, count=3):
+    rows = [{'game_id': f'{season}_{week:02d}_SF_KC', 'play_id': str(i), 'season': season, 'week': week,
+             'posteam': 'SF', 'defteam': 'KC', 'yards_gained': yards}
+            for week in weeks for i in range(count)]
+    return pd.DataFrame(rows)
+
+
+class TestIncrementalRefresh:
+    """Test watermark-based refreshes of changed weeks."""
+    
+    @pytest.fixture
+    def loader(self, sqlite_session):
+        db_manager = Mock()
+        db_manager.get_session.return_value = sqlite_session
+        client = Mock()
+        client.fetch_plays.side_effect = lambda seasons, weeks, columns=None: week_plays(seasons[0], weeks)
+        return DataLoader(db_manager, client, DataMapper())
+    
+    def test_first_refresh_loads_finished_weeks(self, loader, sqlite_session):
+        loader.nfl_client.fetch_games.return_value = schedule(2023, [1, 2, 3], scored_weeks=(1, 2))
+        
+        results = loader.refresh_changed_weeks([2023])
+        
+        assert results['games'].success and results['plays'].success
+        assert results['games'].records_inserted == 3
+        loader.nfl_client.fetch_plays.assert_called_once_with([2023], [1, 2], columns=loader.data_mapper.play_columns)
+        assert sqlite_session.query(PlayModel).count() == 6
+        watermarks = {(w.dataset, w.week): w for w in sqlite_session.query(LoadWatermarkModel)}
+        assert set(watermarks) == {('games', 1), ('games', 2), ('games', 3), ('plays', 1), ('plays', 2)}
+        assert watermarks[('games', 2)].last_game_id == '2023_02_SF_KC'
+        assert watermarks[('games', 2)].last_game_date == date(2023, 9, 12)
+    
+    def test_unchanged_source_writes_nothing(self, loader):
+        loader.nfl_client.fetch_games.return_value = schedule(2023, [1, 2], scored_weeks=(1, 2))
+        loader.refresh_changed_weeks([2023])
+        loader.nfl_client.fetch_plays.reset_mock()
+        
+        with patch.object(loader, '_store_games') as store_games, \
+                patch.object(loader, '_store_play_batches') as store_plays:
+            results = loader.refresh_changed_weeks([2023])
+        
+        assert results['games'].success and results['plays'].success
+        store_games.assert_not_called()
+        store_plays.assert_not_called()
+        loader.nfl_client.fetch_plays.assert_not_called()
+        loader.nfl_client.clear_cache.assert_called()
+    
+    def test_refresh_after_full_load_writes_nothing(self, loader):
+        loader.nfl_client.fetch_games.return_value = schedule(2023, [1, 2], scored_weeks=(1, 2))
+        # Columns the mapper does not read must not change the plays' watermark
+        loader.nfl_client.fetch_plays.side_effect = lambda seasons, weeks, columns=None: week_plays(
+            seasons[0], weeks).assign(**({} if columns else {'unmapped_column': 'x'}))
+        assert loader.load_games([2023]).success
+        assert loader.load_plays([2023], weeks=[1, 2], all_columns=True).success
+        loader.nfl_client.fetch_plays.reset_mock()
+        
+        with patch.object(loader, '_store_games') as store_games, \
+                patch.object(loader, '_store_play_batches') as store_plays:
+            results = loader.refresh_changed_weeks([2023])
+        
+        assert results['games'].success and results['plays'].success
+        store_games.assert_not_called()
+        store_plays.assert_not_called()
+        loader.nfl_client.fetch_plays.assert_not_called()
+    
+    def test_refresh_after_streamed_load_writes_nothing(self, loader):
+        loader.nfl_client.fetch_games.return_value = schedule(2023, [1, 2], scored_weeks=(1, 2))
+        plays = week_plays(2023, [1, 2])
+        # Week 1 spans both chunks
+        loader.nfl_client.iter_plays.side_effect = lambda seasons, weeks, budget, columns=None: iter(
+            [plays.iloc[:2], plays.iloc[2:]])
+        assert loader.load_games([2023]).success
+        assert loader.load_plays([2023], weeks=[1, 2], streaming=True).success
+        
+        with patch.object(loader, '_store_games') as store_games, \
+                patch.object(loader, '_store_play_batches') as store_plays:
+            results = loader.refresh_changed_weeks([2023])
+        
+        assert results['games'].success and results['plays'].success
+        store_games.assert_not_called()
+        store_plays.assert_not_called()
+        loader.nfl_client.fetch_plays.assert_not_called()
+    
+    def test_new_week_touches_only_that_week(self, loader, sqlite_session):
+        loader.nfl_client.fetch_games.return_value = schedule(2023, [1, 2, 3], scored_weeks=(1,))
+        loader.refresh_changed_weeks([2023])
+        loader.nfl_client.fetch_plays.reset_mock()
+        
+        # Week 2 is played
+        loader.nfl_client.fetch_games.return_value = schedule(2023, [1, 2, 3], scored_weeks=(1, 2))
+        results = loader.refresh_changed_weeks([2023])
+        
+        assert results['games'].records_processed == 1
+        assert results['games'].records_updated == 1
+        loader.nfl_client.fetch_plays.assert_called_once_with([2023], [2], columns=loader.data_mapper.play_columns)
+        assert results['plays'].records_inserted == 3
+        assert sqlite_session.query(PlayModel).count() == 6
+    
+    def test_reload_of_same_rows_writes_nothing(self, loader, sqlite_session):
+        loader.nfl_client.fetch_games.return_value = schedule(2023, [1, 2], scored_weeks=(1, 2))
+        loader.nfl_client.fetch_teams.return_value = pd.DataFrame({
+            'team_abbr': ['SF', 'KC'], 'team_name': ['San Francisco', 'Kansas City'],
+            'team_nick': ['49ers', 'Chiefs'], 'team_conf': ['NFC', 'AFC'], 'team_division': ['West', 'West'],
+        })
+        assert loader.load_teams().records_inserted == 2
+        assert loader.load_games([2023]).records_inserted == 2
+        
+        with patch.object(loader, '_refresh_derived_data') as refresh:
+            teams = loader.load_teams()
+            games = loader.load_games([2023])
+        
+        assert (teams.records_updated, teams.records_unchanged) == (0, 2)
+        assert (games.records_updated, games.records_unchanged) == (0, 2)
+        assert refresh.call_args.kwargs['team_weeks'] == set()
+        assert teams.to_dict()['records_unchanged'] == 2
+    
+    def test_unchanged_plays_of_changed_week_are_skipped(self, loader):
+        loader.nfl_client.fetch_games.return_value = schedule(2023, [1], scored_weeks=(1,))
+        loader.refresh_changed_weeks([2023])
+        
+        # A schedule correction re-fetches the week, but its plays are the same
+        corrected = schedule(2023, [1], scored_weeks=(1,))
+        corrected['home_score'] = 24.0
+        loader.nfl_client.fetch_games.return_value = corrected
+        results = loader.refresh_changed_weeks([2023])
+        
+        loader.nfl_client.fetch_plays.assert_called_with([2023], [1], columns=loader.data_mapper.play_columns)
+        assert results['games'].records_updated == 1
+        assert results['plays'].records_processed == 0
+    
+    def test_failed_play_load_is_retried(self, loader, sqlite_session):
+        loader.nfl_client.fetch_games.return_value = schedule(2023, [1], scored_weeks=(1,))
+        with patch.object(loader, '_store_play_batches', side_effect=RuntimeError("database gone")):
+            failed = loader.refresh_changed_weeks([2023])
+        
+        results = loader.refresh_changed_weeks([2023])
+        
+        assert failed['plays'].success is False
+        assert results['plays'].records_inserted == 3
+        assert sqlite_session.query(LoadWatermarkModel).filter_by(dataset='plays').count() == 1
+
+
+class TestPlayerLinkedPlays:
+    """Test loading the player ids that player statistics are built from."""
+    
+    @pytest.fixture
+    def loader(self, sqlite_session):
+        sqlite_session.add(PlayerModel(player_id='00-0033873', full_name='Patrick Mahomes', position='QB'))
+        sqlite_session.commit()
+        db_manager = Mock()
+        db_manager.get_session.return_value = sqlite_session
+        client = Mock()
+        client.fetch_plays.return_value = pd.DataFrame({
+            'game_id': ['2023_01_SF_KC'] * 2, 'play_id': ['1', '2'], 'season': [2023] * 2, 'week': [1] * 2,
+            'posteam': ['KC'] * 2, 'defteam': ['SF'] * 2, 'play_type': ['pass'] * 2,
+            'yards_gained': [22, 8], 'air_yards': [20, 3], 'first_down': [1.0, 0.0],
+            'passer_player_id': ['00-0033873', '00-0033873'],
+            'receiver_player_id': ['00-0030506', None],
+        })
+        return DataLoader(db_manager, client, DataMapper())
+    
+    def test_plays_feed_season_leaders(self, loader, sqlite_session):
+        result = loader.load_plays([2023])
+        
+        assert result.success is True
+        leaders = PlayerStatsAggregator(sqlite_session).season_leaders(2023, 'pass_attempts')
+        assert [(row.player_id, row.pass_attempts, row.passing_yards, row.deep_attempts, name)
+                for row, name, _, _ in leaders] == [('00-0033873', 2, 30, 1, 'Patrick Mahomes')]
+    
+    def test_unknown_players_are_cleared_until_loaded(self, loader, sqlite_session):
+        loader.load_plays([2023])
+        first = sqlite_session.query(PlayModel).filter_by(play_id='1').one()
+        assert (first.passer_player_id, first.receiver_player_id, first.row_hash) == ('00-0033873', None, None)
+        
+        sqlite_session.add(PlayerModel(player_id='00-0030506', full_name='Travis Kelce', position='TE'))
+        sqlite_session.commit()
+        loader.load_plays([2023])
+        
+        first = sqlite_session.query(PlayModel).filter_by(play_id='1').one()
+        assert first.receiver_player_id == '00-0030506'
+        assert first.row_hash is not None
+        assert sqlite_session.query(PlayerSeasonStatsModel).filter_by(player_id='00-0030506').one().targets == 1
+
+
+class TestResumablePlayLoads:
+    """Test checkpointed play loads and resuming them."""
+    
+    @pytest.fixture
+    def loader(self, sqlite_session):
+        db_manager = Mock()
+        db_manager.get_session.return_value = sqlite_session
+        client = Mock()
+        client.fetch_plays.return_value = week_plays(2023, [1, 2], count=6)
+        return DataLoader(db_manager, client, DataMapper())
+    
+    def fail_on_call(self, loader, number):
+        write = loader._write_play_batch
+        calls = []
+        
+        def write_or_fail(*args, **kwargs):
+            calls.append(1)
+            if len(calls) == number:
+                raise RuntimeError("connection lost")
+            return write(*args, **kwargs)
+        return write_or_fail
+    
+    def test_batches_commit_with_checkpoints(self, loader, sqlite_session):
+        result = loader.load_plays([2023], batch_size=4)
+        
+        assert result.success is True
+        checkpoints = sqlite_session.query(LoadCheckpointModel).order_by(LoadCheckpointModel.week).all()
+        assert [(c.week, c.batch_offset, c.total_rows, c.completed) for c in checkpoints] == [
+            (1, 6, 6, True), (2, 6, 6, True)
+        ]
+        assert loader.get_load_status()['plays_load_progress']['weeks_completed'] == 2
+    
+    def test_resume_skips_committed_batches(self, loader, sqlite_session):
+        # Week 1 is written in batches of 4 + 2, then the first batch of week 2 fails
+        with patch.object(loader, '_write_play_batch', side_effect=self.fail_on_call(loader, 3)):
+            failed = loader.load_plays([2023], batch_size=4)
+        progress = loader.get_load_status()['plays_load_progress']
+        
+        with patch.object(loader, '_write_play_batch', wraps=loader._write_play_batch) as write:
+            resumed = loader.load_plays([2023], batch_size=4, resume=True)
+        
+        assert failed.success is False
+        assert (progress['weeks_completed'], progress['weeks_unfinished']) == (1, 0)
+        assert resumed.success is True
+        assert resumed.records_processed == 6
+        assert write.call_count == 2
+        assert sqlite_session.query(PlayModel).count() == 12
+    
+    def test_resume_mid_week(self, loader, sqlite_session):
+        with patch.object(loader, '_write_play_batch', side_effect=self.fail_on_call(loader, 2)):
+            loader.load_plays([2023], batch_size=4)
+        progress = loader.get_load_status()['plays_load_progress']
+        
+        resumed = loader.load_plays([2023], batch_size=4, resume=True)
+        
+        assert progress['unfinished'][0]['batch_offset'] == 4
+        assert resumed.records_processed == 8
+        assert sqlite_session.query(PlayModel).count() == 12
+    
+    def test_resume_refreshes_team_seasons_of_committed_batches(self, loader):
+        plays = loader.nfl_client.fetch_plays.return_value
+        week_2 = plays['week'] == 2
+        loader.nfl_client.fetch_plays.return_value = plays.assign(
+            posteam=plays['posteam'].where(~week_2, 'LV'), defteam=plays['defteam'].where(~week_2, 'DEN')
+        )
+        # Week 1 commits, then week 2 fails before the team-season refresh
+        with patch.object(loader, '_write_play_batch', side_effect=self.fail_on_call(loader, 2)):
+            loader.load_plays([2023], batch_size=6)
+        
+        with patch.object(loader, '_refresh_derived_data', wraps=loader._refresh_derived_data) as refresh:
+            loader.load_plays([2023], batch_size=6, resume=True)
+        
+        refreshed = set().union(*(call.args[2] for call in refresh.call_args_list))
+        assert refreshed == {(2023, 'SF'), (2023, 'KC'), (2023, 'LV'), (2023, 'DEN')}
+    
+    def test_resume_of_finished_load_refreshes_team_seasons(self, loader):
+        loader.load_plays([2023], batch_size=4)
+        
+        with patch.object(loader, '_refresh_derived_data') as refresh:
+            resumed = loader.load_plays([2023], batch_size=4, resume=True)
+        
+        assert resumed.records_processed == 0
+        refresh.assert_called_once_with(ANY, set(), {(2023, 'SF'), (2023, 'KC')})
+    
+    def test_changed_source_restarts_week(self, loader):
+        loader.load_plays([2023], batch_size=4)
+        plays = loader.nfl_client.fetch_plays.return_value
+        loader.nfl_client.fetch_plays.return_value = plays.assign(
+            yards_gained=plays['yards_gained'].where(plays['week'] == 1, 9)
+        )
+        
+        resumed = loader.load_plays([2023], batch_size=4, resume=True)
+        
+        assert resumed.records_processed == 6
+        assert resumed.records_updated == 6
+    
+    def test_streaming_cannot_resume(self, loader):
+        result = loader.load_plays([2023], streaming=True, resume=True)
+        
+        assert result.success is False
+        loader.nfl_client.iter_plays.assert_not_called()
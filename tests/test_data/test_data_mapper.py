@@ -1,11 +1,12 @@
 """Tests for data mapper module."""
 
 import pytest
+import numpy as np
 import pandas as pd
 from datetime import date, datetime
 from src.data.data_mapper import DataMapper
 from src.models.team import TeamCreate
-from src.models.player import PlayerCreate
+from src.models.player import PlayerCreate, parse_height_string
 from src.models.game import GameCreate
 from src.models.play import PlayCreate
 
@@ -115,8 +116,8 @@ class TestPlayersMapping:
     def test_map_players_data_basic(self, mapper):
         """Test basic players data mapping."""
         players_df = pd.DataFrame({
-            'player_id': ['00-0012345', '00-0012346'],
-            'full_name': ['John Doe', 'Jane Smith'],
+            'gsis_id': ['00-0012345', '00-0012346'],
+            'display_name': ['John Doe', 'Jane Smith'],
             'team': ['SF', 'KC'],
             'position': ['QB', 'RB']
         })
@@ -124,20 +125,19 @@ class TestPlayersMapping:
         result = mapper.map_players_data(players_df)
         
         assert len(result) == 2
-        assert all(isinstance(player, PlayerCreate) for player in result)
+        assert all(set(player) == set(PlayerCreate.model_fields) | {'row_hash'} for player in result)
         
         player1 = result[0]
-        assert player1.player_id == '00-0012345'
-        assert player1.full_name == 'John Doe'
-        assert player1.team_abbr == 'SF'
-        assert player1.position == 'QB'
+        assert player1['player_id'] == '00-0012345'
+        assert player1['full_name'] == 'John Doe'
+        assert player1['team_abbr'] == 'SF'
+        assert player1['position'] == 'QB'
     
     def test_map_players_data_with_details(self, mapper):
         """Test players mapping with detailed data."""
         players_df = pd.DataFrame({
-            'player_id': ['00-0012345'],
-            'full_name': ['John Doe'],
-            'gsis_id': ['12345'],
+            'gsis_id': ['00-0012345'],
+            'display_name': ['John Doe'],
             'team': ['SF'],
             'position': ['QB'],
             'jersey_number': [12],
@@ -152,19 +152,19 @@ class TestPlayersMapping:
         
         assert len(result) == 1
         player = result[0]
-        assert player.gsis_id == '12345'
-        assert player.jersey_number == 12
-        assert player.height == 74  # 6'2" = 74 inches
-        assert player.weight == 220
-        assert player.age == 28
-        assert player.rookie_year == 2018
-        assert player.status == 'active'
+        assert player['gsis_id'] == '00-0012345'
+        assert player['jersey_number'] == 12
+        assert player['height'] == 74  # 6'2" = 74 inches
+        assert player['weight'] == 220
+        assert player['age'] == 28
+        assert player['rookie_year'] == 2018
+        assert player['status'] == 'active'
     
     def test_map_players_data_invalid_values(self, mapper):
         """Test players mapping with invalid values."""
         players_df = pd.DataFrame({
-            'player_id': ['00-0012345'],
-            'full_name': ['John Doe'],
+            'gsis_id': ['00-0012345'],
+            'display_name': ['John Doe'],
             'jersey_number': [999],  # Invalid jersey number
             'height': ['invalid'],   # Invalid height
             'weight': [-100],        # Invalid weight
@@ -176,23 +176,23 @@ class TestPlayersMapping:
         assert len(result) == 1
         player = result[0]
         # Should skip invalid values
-        assert not hasattr(player, 'jersey_number') or player.jersey_number is None
-        assert not hasattr(player, 'height') or player.height is None
-        assert not hasattr(player, 'weight') or player.weight is None
-        assert not hasattr(player, 'age') or player.age is None
+        assert player['jersey_number'] is None
+        assert player['height'] is None
+        assert player['weight'] is None
+        assert player['age'] is None
     
     def test_map_players_data_empty_id(self, mapper):
         """Test players mapping with empty player ID."""
         players_df = pd.DataFrame({
-            'player_id': ['', '00-0012346'],
-            'full_name': ['Empty ID', 'Valid Player']
+            'gsis_id': ['', '00-0012346'],
+            'display_name': ['Empty ID', 'Valid Player']
         })
         
         result = mapper.map_players_data(players_df)
         
         # Should skip empty ID
         assert len(result) == 1
-        assert result[0].player_id == '00-0012346'
+        assert result[0]['player_id'] == '00-0012346'
 
 
 class TestGamesMapping:
@@ -207,7 +207,7 @@ class TestGamesMapping:
         games_df = pd.DataFrame({
             'game_id': ['2023_01_SF_KC'],
             'season': [2023],
-            'season_type': ['REG'],
+            'game_type': ['REG'],
             'gameday': ['2023-09-10'],
             'home_team': ['KC'],
             'away_team': ['SF']
@@ -217,20 +217,20 @@ class TestGamesMapping:
         
         assert len(result) == 1
         game = result[0]
-        assert isinstance(game, GameCreate)
-        assert game.game_id == '2023_01_SF_KC'
-        assert game.season == 2023
-        assert game.season_type == 'REG'
-        assert game.game_date == date(2023, 9, 10)
-        assert game.home_team == 'KC'
-        assert game.away_team == 'SF'
+        assert set(game) == set(GameCreate.model_fields) | {'row_hash'}
+        assert game['game_id'] == '2023_01_SF_KC'
+        assert game['season'] == 2023
+        assert game['season_type'] == 'REG'
+        assert game['game_date'] == date(2023, 9, 10)
+        assert game['home_team'] == 'KC'
+        assert game['away_team'] == 'SF'
     
     def test_map_games_data_with_details(self, mapper):
         """Test games mapping with detailed data."""
         games_df = pd.DataFrame({
             'game_id': ['2023_01_SF_KC'],
             'season': [2023],
-            'season_type': ['REG'],
+            'game_type': ['REG'],
             'gameday': ['2023-09-10'],
             'home_team': ['KC'],
             'away_team': ['SF'],
@@ -247,21 +247,21 @@ class TestGamesMapping:
         
         assert len(result) == 1
         game = result[0]
-        assert game.week == 1
-        assert game.home_score == 24
-        assert game.away_score == 21
-        assert game.roof == 'dome'
-        assert game.surface == 'fieldturf'
-        assert game.temp == 72
-        assert game.wind == 5
-        assert game.game_finished is True  # Should be True when scores present
+        assert game['week'] == 1
+        assert game['home_score'] == 24
+        assert game['away_score'] == 21
+        assert game['roof'] == 'dome'
+        assert game['surface'] == 'fieldturf'
+        assert game['temp'] == 72
+        assert game['wind'] == 5
+        assert game['game_finished'] is True  # Should be True when scores present
     
     def test_map_games_data_invalid_date(self, mapper):
         """Test games mapping with invalid date."""
         games_df = pd.DataFrame({
             'game_id': ['2023_01_SF_KC', '2023_02_SF_DAL'],
             'season': [2023, 2023],
-            'season_type': ['REG', 'REG'],
+            'game_type': ['REG', 'REG'],
             'gameday': ['invalid-date', '2023-09-17'],
             'home_team': ['KC', 'DAL'],
             'away_team': ['SF', 'SF']
@@ -271,14 +271,14 @@ class TestGamesMapping:
         
         # Should skip invalid date
         assert len(result) == 1
-        assert result[0].game_id == '2023_02_SF_DAL'
+        assert result[0]['game_id'] == '2023_02_SF_DAL'
     
     def test_map_games_data_missing_required(self, mapper):
         """Test games mapping with missing required fields."""
         games_df = pd.DataFrame({
             'game_id': ['2023_01_SF_KC', ''],  # Missing game_id in second row
             'season': [2023, 2023],
-            'season_type': ['REG', 'REG'],
+            'game_type': ['REG', 'REG'],
             'gameday': ['2023-09-10', '2023-09-17'],
             'home_team': ['KC', 'DAL'],
             'away_team': ['SF', '']  # Missing away_team in second row
@@ -288,7 +288,7 @@ class TestGamesMapping:
         
         # Should only get first game
         assert len(result) == 1
-        assert result[0].game_id == '2023_01_SF_KC'
+        assert result[0]['game_id'] == '2023_01_SF_KC'
 
 
 class TestPlaysMapping:
@@ -313,14 +313,14 @@ class TestPlaysMapping:
         assert len(result) == 1  # One batch
         batch = result[0]
         assert len(batch) == 2
-        assert all(isinstance(play, PlayCreate) for play in batch)
+        assert all(set(play) == set(PlayCreate.model_fields) | {'row_hash'} for play in batch)
         
         play1 = batch[0]
-        assert play1.play_id == '2023_01_SF_KC_1'
-        assert play1.game_id == '2023_01_SF_KC'
-        assert play1.season == 2023
-        assert play1.posteam == 'SF'
-        assert play1.play_type == 'pass'
+        assert play1['play_id'] == '2023_01_SF_KC_1'
+        assert play1['game_id'] == '2023_01_SF_KC'
+        assert play1['season'] == 2023
+        assert play1['posteam'] == 'SF'
+        assert play1['play_type'] == 'pass'
     
     def test_map_plays_data_with_details(self, mapper):
         """Test plays mapping with detailed data."""
@@ -348,7 +348,7 @@ class TestPlaysMapping:
         result = mapper.map_plays_data(plays_df)
         
         assert len(result) == 1
-        play = result[0][0]
+        play = PlayCreate(**result[0][0])
         assert play.week == 1
         assert play.defteam == 'KC'
         assert play.qtr == 1
@@ -364,6 +364,29 @@ class TestPlaysMapping:
         assert play.touchdown is False
         assert play.interception is False
     
+    def test_map_plays_data_player_columns(self, mapper):
+        """Test plays mapping keeps the player ids and fields player stats read."""
+        plays_df = pd.DataFrame({
+            'play_id': ['1', '2', '3'],
+            'game_id': ['2023_01_SF_KC'] * 3,
+            'season': [2023] * 3,
+            'play_type': ['pass', 'run', 'pass'],
+            'passer_player_id': ['00-0033873', None, 'NA'],
+            'receiver_player_id': ['00-0036212', None, 'x' * 21],
+            'rusher_player_id': [None, ' 00-0034796 ', None],
+            'air_yards': [25, None, 90],
+            'first_down': [1.0, 0.0, None],
+        })
+        
+        rows = mapper.map_plays_data(plays_df)[0]
+        
+        assert [(row['passer_player_id'], row['receiver_player_id'], row['rusher_player_id']) for row in rows] == [
+            ('00-0033873', '00-0036212', None), (None, None, '00-0034796'), (None, None, None)
+        ]
+        assert [row['air_yards'] for row in rows] == [25, None, None]
+        assert [row['first_down'] for row in rows] == [True, False, False]
+        assert {'passer_player_id', 'air_yards', 'first_down'} <= set(mapper.play_columns)
+    
     def test_map_plays_data_batching(self, mapper):
         """Test plays data batching."""
         plays_df = pd.DataFrame({
@@ -395,7 +418,7 @@ class TestPlaysMapping:
         result = mapper.map_plays_data(plays_df)
         
         assert len(result) == 1
-        play = result[0][0]
+        play = PlayCreate(**result[0][0])
         # Should skip invalid values (use hasattr to check if field was set)
         assert not hasattr(play, 'qtr') or play.qtr is None
         assert not hasattr(play, 'down') or play.down is None
@@ -437,8 +460,8 @@ class TestDataMapperIntegration:
         
         # Players
         players_df = pd.DataFrame({
-            'player_id': ['00-0012345', '00-0012346'],
-            'full_name': ['John Doe', 'Jane Smith'],
+            'gsis_id': ['00-0012345', '00-0012346'],
+            'display_name': ['John Doe', 'Jane Smith'],
             'team': ['SF', 'KC'],
             'position': ['QB', 'RB']
         })
@@ -449,7 +472,7 @@ class TestDataMapperIntegration:
         games_df = pd.DataFrame({
             'game_id': ['2023_01_SF_KC'],
             'season': [2023],
-            'season_type': ['REG'],
+            'game_type': ['REG'],
             'gameday': ['2023-09-10'],
             'home_team': ['KC'],
             'away_team': ['SF']
@@ -466,4 +489,336 @@ class TestDataMapperIntegration:
         })
         play_batches = mapper.map_plays_data(plays_df)
         assert len(play_batches) == 1
-        assert len(play_batches[0]) == 1
\ No newline at end of file
+        assert len(play_batches[0]) == 1
+
+def without_hash(rows):
+    return [{name: value for name, value in row.items() if name != 'row_hash'} for row in rows]
+
+
+def legacy_map_play(row):
+    """Row-wise play mapping as done before vectorization, kept as the parity reference."""
+    play_id = str(row.get('play_id', '')).strip()
+    game_id = str(row.get('game_id', '')).strip()
+    season = row.get('season')
+    if not all([play_id, game_id, season]):
+        return None
+    try:
+        data = {'play_id': play_id, 'game_id': game_id, 'season': int(season)}
+    except ValueError:
+        return None
+    for name, low, high, cast in [
+        ('week', 1, 22, int), ('qtr', 1, 5, int), ('game_seconds_remaining', 0, 3600, int),
+        ('half_seconds_remaining', 0, 1800, int), ('yardline_100', 1, 99, int), ('ydstogo', 1, 99, int),
+        ('down', 1, 4, int), ('yards_gained', -99, 99, int), ('ep', -10.0, 10.0, float),
+        ('epa', -15.0, 15.0, float), ('wp', 0.0, 1.0, float), ('wpa', -1.0, 1.0, float),
+    ]:
+        if name in row and pd.notna(row[name]):
+            try:
+                value = cast(row[name])
+                if low <= value <= high:
+                    data[name] = value
+            except (ValueError, TypeError):
+                pass
+    for name in ('posteam', 'defteam'):
+        if name in row and pd.notna(row[name]):
+            team = str(row[name]).strip().upper()
+            if team and team != 'NA':
+                data[name] = team
+    if 'game_half' in row and pd.notna(row['game_half']):
+        half = str(row['game_half']).strip().lower()
+        if half in ['half1', 'half2', 'overtime']:
+            data['game_half'] = half
+    if 'play_type' in row and pd.notna(row['play_type']):
+        play_type = str(row['play_type']).strip().lower()
+        if play_type:
+            data['play_type'] = play_type
+    if 'desc' in row and pd.notna(row['desc']):
+        data['desc'] = str(row['desc']).strip()
+    for flag in ['touchdown', 'pass_touchdown', 'rush_touchdown', 'interception', 'fumble', 'safety', 'penalty']:
+        if flag in row and pd.notna(row[flag]):
+            data[flag] = bool(row[flag])
+    try:
+        return PlayCreate(**data).model_dump()
+    except Exception:
+        return None
+
+
+class TestPlaysMappingParity:
+    """Test the column-wise plays mapper against row-wise mapping."""
+
+    @pytest.fixture
+    def messy_plays(self):
+        rng = np.random.default_rng(7)
+        n = 600
+
+        def sometimes_missing(values):
+            values = pd.Series(values, dtype=object)
+            values[rng.random(n) < 0.15] = None
+            return values
+
+        return pd.DataFrame({
+            'play_id': rng.integers(1, 5000, n).astype(float),
+            'game_id': rng.choice(['2023_01_KC_SF', '2023_02_DAL_BUF', '', ' 2023_03_SF_KC '], n),
+            'season': rng.choice([2023, 2023, 2022, 1900, np.nan], n),
+            'week': sometimes_missing(rng.integers(-2, 25, n)),
+            'posteam': sometimes_missing(rng.choice(['sf', ' KC', 'NA', 'A', 'ABCD', '', 'buf'], n)),
+            'defteam': sometimes_missing(rng.choice(['DAL', 'kc ', 'NA'], n)),
+            'qtr': rng.choice([1, 2, 3, 4, 5, 6, np.nan], n),
+            'game_seconds_remaining': rng.uniform(-100, 3700, n),
+            'half_seconds_remaining': rng.uniform(-100, 1900, n),
+            'game_half': sometimes_missing(rng.choice(['Half1', 'half2', 'Overtime', 'half3'], n)),
+            'yardline_100': rng.choice([0, 1, 50.7, 99, 100, np.nan], n),
+            'ydstogo': sometimes_missing(rng.choice([1, 10, '7', 'x', 100], n)),
+            'down': rng.choice([1, 2, 3, 4, 0, np.nan], n),
+            'play_type': sometimes_missing(rng.choice(['PASS', ' run', '', 'x' * 25], n)),
+            'desc': sometimes_missing(rng.choice(['  (15:00) Kickoff ', 'Pass complete', ''], n)),
+            'yards_gained': rng.uniform(-120, 120, n),
+            'ep': rng.uniform(-12, 12, n),
+            'epa': rng.choice([-20.0, 0.5, 14.9, np.nan], n),
+            'wp': rng.uniform(-0.1, 1.1, n),
+            'wpa': rng.uniform(-1.2, 1.2, n),
+            'touchdown': rng.choice([0.0, 1.0, np.nan], n),
+            'interception': sometimes_missing(rng.choice([True, False], n)),
+        })
+
+    def test_matches_row_wise_mapping(self, messy_plays):
+        expected = [play for play in (legacy_map_play(row) for _, row in messy_plays.iterrows()) if play]
+
+        batches = DataMapper(strict_validation=True).map_plays_data(messy_plays, batch_size=100)
+        rows = [row for batch in batches for row in batch]
+
+        assert len(expected) > 100
+        assert without_hash(rows) == expected
+        assert all(len(batch) <= 100 for batch in batches)
+
+    def test_play_columns_cover_mapping(self, messy_plays):
+        mapper = DataMapper()
+        extra = messy_plays.assign(passer_player_name='P.Mahomes', air_epa=0.4, xpass=0.7)
+
+        projected = extra[[column for column in mapper.play_columns if column in extra]]
+
+        assert mapper.map_plays_data(projected) == mapper.map_plays_data(extra)
+        assert 'passer_player_name' not in mapper.play_columns
+
+    def test_row_hash_follows_content(self, messy_plays):
+        mapper = DataMapper()
+        rows = mapper.map_plays_data(messy_plays)[0]
+        reordered = mapper.map_plays_data(messy_plays[list(reversed(messy_plays.columns))])[0]
+        changed = mapper.map_plays_data(messy_plays.assign(yards_gained=7))[0]
+
+        assert [row['row_hash'] for row in reordered] == [row['row_hash'] for row in rows]
+        assert len({row['row_hash'] for row in rows}) == len(rows)
+        assert all(row['row_hash'] != other['row_hash'] for row, other in zip(rows, changed)
+                   if row['yards_gained'] != 7)
+
+    def test_values_are_python_types(self, messy_plays):
+        row = DataMapper().map_plays_data(messy_plays)[0][0]
+
+        assert type(row['season']) is int
+        assert all(type(value) in (int, float, bool, str, type(None)) for value in row.values())
+
+
+def _first_int(row, names, low, high):
+    """First value across ``names`` that int() accepts within [low, high], as the row-wise mappers did."""
+    for name in names:
+        if name in row and pd.notna(row[name]):
+            try:
+                value = int(row[name])
+            except (ValueError, TypeError):
+                continue
+            if low <= value <= high:
+                return value
+    return None
+
+
+def legacy_map_player(row):
+    """Row-wise player mapping as done before vectorization, kept as the parity reference."""
+    data = {'player_id': str(row.get('gsis_id', '')).strip(), 'full_name': str(row.get('display_name', '')).strip()}
+    if not data['player_id'] or not data['full_name']:
+        return None
+    data['gsis_id'] = data['player_id']
+    team = next((str(row[c]).strip().upper() for c in ['team', 'team_roster', 'latest_team', 'team_player']
+                 if c in row and pd.notna(row[c])), None)
+    if team and team not in ('UNK', 'NA'):
+        data['team_abbr'] = {'LA': 'LAR', 'OAK': 'LV', 'SD': 'LAC', 'STL': 'LAR'}.get(team, team)
+    position = next((str(row[c]).strip().upper() for c in ['position', 'position_roster']
+                     if c in row and pd.notna(row[c])), None)
+    if not position:
+        position = next((str(row[c]).strip().upper() for c in ['position_player', 'ngs_position']
+                         if c in row and pd.notna(row[c])), None)
+    if position and position not in ['NA', 'NULL', '']:
+        data['position'] = position
+    for name, columns, low, high in [
+        ('jersey_number', ['jersey_number', 'jersey_number_roster'], 0, 99), ('weight', ['weight'], 150, 400),
+        ('age', ['age'], 18, 50), ('rookie_year', ['rookie_season', 'rookie_year'], 1920, datetime.now().year),
+        ('draft_round', ['draft_round'], 1, 10), ('years_exp', ['years_of_experience', 'years_exp'], 0, 30),
+    ]:
+        value = _first_int(row, columns, low, high)
+        if value is not None:
+            data[name] = value
+    if 'height' in row and pd.notna(row['height']):
+        height = parse_height_string(str(row['height']).strip())
+        if height:
+            data['height'] = height
+    if 'draft_team' in row and pd.notna(row['draft_team']):
+        draft_team = str(row['draft_team']).strip().upper()
+        if draft_team and len(draft_team) <= 3:
+            data['draft_team'] = draft_team
+    if 'headshot' in row and pd.notna(row['headshot']) and str(row['headshot']).strip().startswith('http'):
+        data['headshot_url'] = str(row['headshot']).strip()
+    college = next((str(row[c]).strip() for c in ['college_name', 'college'] if c in row and pd.notna(row[c])), None)
+    if college is not None:
+        data['college'] = college
+    if 'status' in row and pd.notna(row['status']):
+        status = {'act': 'active', 'ina': 'injured', 'res': 'retired', 'non': 'practice_squad',
+                  'udf': 'suspended'}.get(str(row['status']).strip().lower())
+        if status:
+            data['status'] = status
+    try:
+        return PlayerCreate(**data).model_dump()
+    except Exception:
+        return None
+
+
+def legacy_map_game(row):
+    """Row-wise game mapping as done before vectorization, kept as the parity reference."""
+    game_id = str(row.get('game_id', '')).strip()
+    season = row.get('season')
+    season_type = str(row.get('game_type', '')).strip().upper()
+    game_date = row.get('gameday')
+    home_team = str(row.get('home_team', '')).strip().upper()
+    away_team = str(row.get('away_team', '')).strip().upper()
+    if not all([game_id, season, season_type, game_date, home_team, away_team]):
+        return None
+    try:
+        game_date = datetime.strptime(game_date, '%Y-%m-%d').date()
+        data = {'game_id': game_id, 'season': int(season), 'season_type': season_type, 'game_date': game_date,
+                'home_team': home_team, 'away_team': away_team}
+    except ValueError:
+        return None
+    if 'old_game_id' in row and pd.notna(row['old_game_id']):
+        data['old_game_id'] = str(row['old_game_id']).strip()
+    for name, source, low, high in [('week', 'week', 1, 22), ('home_score', 'home_score', 0, 100),
+                                    ('away_score', 'away_score', 0, 100), ('temp', 'temp', -20, 120),
+                                    ('wind', 'wind', 0, 50)]:
+        value = _first_int(row, [source], low, high)
+        if value is not None:
+            data[name] = value
+    for name, source, low, high in [('home_spread', 'spread_line', -30.0, 30.0), ('total_line', 'total_line', 20.0, 80.0)]:
+        if source in row and pd.notna(row[source]) and low <= float(row[source]) <= high:
+            data[name] = float(row[source])
+    if 'gametime' in row and pd.notna(row['gametime']) and ':' in str(row['gametime']):
+        try:
+            data['kickoff_time'] = datetime.strptime(str(row['gametime']).strip(), '%H:%M').time()
+        except ValueError:
+            pass
+    if 'roof' in row and pd.notna(row['roof']):
+        roof = str(row['roof']).strip().lower()
+        if roof in ['dome', 'outdoors', 'closed', 'open', 'retractable']:
+            data['roof'] = roof
+    if 'surface' in row and pd.notna(row['surface']):
+        data['surface'] = str(row['surface']).strip().lower()
+    if 'home_score' in data and 'away_score' in data:
+        data['game_finished'] = True
+    try:
+        return GameCreate(**data).model_dump()
+    except Exception:
+        return None
+
+
+class TestRosterAndScheduleParity:
+    """Test the column-wise players and games mappers against row-wise mapping."""
+
+    @pytest.fixture
+    def rng(self):
+        return np.random.default_rng(11)
+
+    @staticmethod
+    def sometimes_missing(rng, values):
+        values = pd.Series(values, dtype=object)
+        values[rng.random(len(values)) < 0.15] = None
+        return values
+
+    @pytest.fixture
+    def messy_players(self, rng):
+        n = 600
+        missing = lambda values: self.sometimes_missing(rng, values)
+        return pd.DataFrame({
+            'gsis_id': rng.choice(['00-0033873', ' 00-0036355 ', '', '00-0034796'], n),
+            'display_name': rng.choice(['Patrick Mahomes', ' Brock Purdy', ''], n),
+            'team': missing(rng.choice(['KC', 'sf', 'OAK', 'UNK', 'NA', ''], n)),
+            'team_roster': missing(rng.choice(['STL', 'LA', 'SD', 'buf', 'A1C2'], n)),
+            'position': missing(rng.choice(['QB', ' wr', '', 'NA'], n)),
+            'position_roster': missing(rng.choice(['RB', 'NULL'], n)),
+            'position_player': missing(rng.choice(['TE', 'ol'], n)),
+            'jersey_number': missing(rng.choice([15, 99, 100, -1, '7', 'x'], n)),
+            'jersey_number_roster': missing(rng.choice([13, 150], n)),
+            'height': missing(rng.choice(['6-2', "5'11\"", '72', '6-12', 'tall', '6-2-1', 76], n)),
+            'weight': rng.choice([225.0, 149.0, 401.0, 300.9, np.nan], n),
+            'age': missing(rng.choice([28, 17, 51, '30'], n)),
+            'rookie_season': missing(rng.choice([2017, 1900, 2999], n)),
+            'rookie_year': missing(rng.choice([2020, 1919], n)),
+            'draft_round': rng.choice([1, 7, 11, 0, np.nan], n),
+            'draft_team': missing(rng.choice(['kc', ' SF ', 'BUFF'], n)),
+            'headshot': missing(rng.choice(['https://img/1.png', 'ftp://x', ''], n)),
+            'college_name': missing(rng.choice(['Texas Tech', ' Iowa State '], n)),
+            'college': missing(rng.choice(['Alabama', ''], n)),
+            'years_exp': rng.choice([0, 7, 31, np.nan], n),
+            'status': missing(rng.choice(['ACT', 'res', 'INA', 'dev', 'UDF', 'Non'], n)),
+        })
+
+    @pytest.fixture
+    def messy_games(self, rng):
+        n = 400
+        missing = lambda values: self.sometimes_missing(rng, values)
+        return pd.DataFrame({
+            'game_id': rng.choice(['2023_01_DET_KC', ' 2023_19_GB_DAL ', ''], n),
+            'old_game_id': missing(rng.choice(['2023090700', '2024011400'], n)),
+            'season': rng.choice([2023, 2023.0, 2023, 1919], n),
+            'game_type': rng.choice(['REG', 'post', 'REG', 'WC'], n),
+            'week': rng.choice([1, 18, 19, 23, 0, np.nan], n),
+            'gameday': rng.choice(['2023-09-07', '2024-01-14', '2023-09-10', '2023-13-01'], n),
+            'gametime': missing(rng.choice(['20:20', '13:00', '1:00PM', '16:25:00'], n)),
+            'home_team': rng.choice(['KC', 'dal', 'KC', 'K'], n),
+            'away_team': rng.choice(['DET', ' gb ', 'DET', ''], n),
+            'home_score': rng.choice([21.0, 0.0, 101.0, -1.0, np.nan], n),
+            'away_score': rng.choice([20.0, 48.0, np.nan], n),
+            'roof': missing(rng.choice(['Dome', 'outdoors', 'retractable', 'tent'], n)),
+            'surface': missing(rng.choice(['Grass ', 'fieldturf', 'a_turf'], n)),
+            'temp': rng.choice([72.0, -21.0, 121.0, 45.6, np.nan], n),
+            'wind': rng.choice([0.0, 51.0, 12.0, np.nan], n),
+            'spread_line': rng.choice([-4.5, 3.0, 31.0, -30.0, np.nan], n),
+            'total_line': rng.choice([47.5, 19.5, 80.0, np.nan], n),
+        })
+
+    def test_players_match_row_wise_mapping(self, messy_players):
+        expected = [player for player in (legacy_map_player(row) for _, row in messy_players.iterrows()) if player]
+
+        rows = DataMapper(strict_validation=True).map_players_data(messy_players)
+
+        assert len(expected) > 100
+        assert without_hash(rows) == expected
+
+    def test_games_match_row_wise_mapping(self, messy_games):
+        expected = [game for game in (legacy_map_game(row) for _, row in messy_games.iterrows()) if game]
+
+        rows = DataMapper(strict_validation=True).map_games_data(messy_games)
+
+        assert len(expected) > 50
+        assert without_hash(rows) == expected
+
+    def test_out_of_range_height_is_left_unset(self):
+        players_df = pd.DataFrame({'gsis_id': ['00-1', '00-2'], 'display_name': ['A', 'B'],
+                                   'height': ['4-11', 74.0]})
+
+        rows = DataMapper().map_players_data(players_df)
+
+        assert [row['height'] for row in rows] == [None, 74]
+
+    def test_relocated_team_abbreviations_normalized(self):
+        players_df = pd.DataFrame({'gsis_id': ['00-1', '00-2', '00-3'], 'display_name': ['A', 'B', 'C'],
+                                   'team': ['oak', None, 'KC'], 'latest_team': ['SF', 'STL', 'SD']})
+
+        rows = DataMapper().map_players_data(players_df)
+
+        assert [row['team_abbr'] for row in rows] == ['LV', 'LAR', 'KC']
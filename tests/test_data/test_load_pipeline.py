@@ -0,0 +1,189 @@
+"""Tests for the pipelined play loader."""
+
+from unittest.mock import Mock, patch
+
+import pandas as pd
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from src.data.data_loader import DataLoader
+from src.data.data_mapper import DataMapper
+from src.data.load_pipeline import STAGES, PlayLoadPipeline, map_play_chunk
+from src.data.watermarks import stored_hashes, week_fingerprints
+from src.models.base import Base
+from src.models.play import PlayModel
+
+
+@pytest.fixture
+def session_factory():
+    """Sessions on a fresh in-memory database shared across threads."""
+    engine = create_engine("sqlite://", poolclass=StaticPool, connect_args={"check_same_thread": False})
+    Base.metadata.create_all(bind=engine)
+    yield sessionmaker(bind=engine, autoflush=False)
+    engine.dispose()
+
+
+@pytest.fixture
+def loader(session_factory):
+    db_manager = Mock()
+    db_manager.get_session.side_effect = session_factory
+    return DataLoader(db_manager, Mock(), DataMapper())
+
+
+def plays_chunk(season, week, count):
+    game_id = f'{season}_{week:02d}_SF_KC'
+    return pd.DataFrame({
+        'play_id': [str(i) for i in range(count)],
+        'game_id': [game_id] * count,
+        'season': [season] * count,
+        'week': [week] * count,
+        'posteam': ['SF', 'KC'] * (count // 2),
+        'defteam': ['KC', 'SF'] * (count // 2),
+        'play_type': ['pass'] * count,
+    })
+
+
+def chunks_of(*frames):
+    def iter_plays(seasons, weeks, memory_budget_mb, columns=None):
+        yield from frames
+    return iter_plays
+
+
+class TestPlayLoadPipeline:
+    """Test loading plays through concurrent stages."""
+
+    def test_loads_all_chunks_in_batches(self, loader, session_factory):
+        loader.nfl_client.iter_plays.side_effect = chunks_of(
+            plays_chunk(2022, 1, 6), plays_chunk(2022, 2, 6), plays_chunk(2023, 1, 4)
+        )
+        session = session_factory()
+        commit = session.commit
+        commits = []
+        loader.db_manager.get_session.side_effect = lambda: session
+
+        with patch.object(session, 'commit', side_effect=lambda: commits.append(commit())):
+            result = PlayLoadPipeline(loader, workers=1, queue_size=2).run([2022, 2023], batch_size=4)
+
+        assert result.success is True, result.errors
+        assert (result.records_processed, result.records_inserted) == (16, 16)
+        assert session_factory().query(PlayModel).count() == 16
+        # 2 + 2 + 1 batches, plus the closing team-season refresh and the watermarks
+        assert len(commits) == 7
+        loader.nfl_client.iter_plays.assert_called_once_with(
+            [2022, 2023], None, None, columns=loader.data_mapper.play_columns
+        )
+
+    def test_records_play_watermarks(self, loader, session_factory):
+        week_one = plays_chunk(2023, 1, 6)
+        # Week 1 spans the first two chunks
+        chunks = [week_one.iloc[:4], week_one.iloc[4:], plays_chunk(2023, 2, 2)]
+        loader.nfl_client.iter_plays.side_effect = chunks_of(*chunks)
+
+        result = PlayLoadPipeline(loader, workers=1).run([2023], batch_size=4)
+
+        assert result.success is True, result.errors
+        expected = week_fingerprints(pd.concat(chunks))
+        assert stored_hashes(session_factory(), 'plays', [2023]) == {
+            key: fingerprint.content_hash for key, fingerprint in expected.items()
+        }
+
+    def test_failed_load_records_no_watermarks(self, loader, session_factory):
+        loader.nfl_client.iter_plays.side_effect = chunks_of(plays_chunk(2023, 1, 4))
+
+        with patch.object(loader, '_write_play_batch', side_effect=RuntimeError("disk full")):
+            PlayLoadPipeline(loader, workers=1).run([2023])
+
+        assert stored_hashes(session_factory(), 'plays', [2023]) == {}
+
+    def test_stage_metrics(self, loader):
+        loader.nfl_client.iter_plays.side_effect = chunks_of(plays_chunk(2023, 1, 4), plays_chunk(2023, 2, 4))
+
+        result = PlayLoadPipeline(loader, workers=1).run([2023], batch_size=3)
+
+        metrics = result.to_dict()['stage_metrics']
+        assert list(metrics) == list(STAGES)
+        assert [metrics[stage]['items'] for stage in STAGES] == [2, 2, 2, 4]
+        assert all(metrics[stage]['rows'] == 8 for stage in STAGES)
+        assert metrics['write']['busy_seconds'] > 0
+
+    def test_read_failure_stops_the_load(self, loader):
+        def iter_plays(seasons, weeks, memory_budget_mb, columns=None):
+            yield plays_chunk(2023, 1, 2)
+            raise ConnectionError("source unavailable")
+
+        loader.nfl_client.iter_plays.side_effect = iter_plays
+
+        result = PlayLoadPipeline(loader, workers=1).run([2023])
+
+        assert result.success is False
+        assert result.errors == ['read: source unavailable']
+
+    def test_write_failure_rolls_back_batch(self, loader, session_factory):
+        loader.nfl_client.iter_plays.side_effect = chunks_of(plays_chunk(2023, 1, 4))
+
+        with patch.object(loader, '_write_play_batch', side_effect=RuntimeError("disk full")):
+            result = PlayLoadPipeline(loader, workers=1).run([2023])
+
+        assert result.success is False
+        assert result.errors == ['disk full']
+        assert session_factory().query(PlayModel).count() == 0
+
+    def test_before_write_runs_before_first_batch(self, loader):
+        loader.nfl_client.iter_plays.side_effect = chunks_of(plays_chunk(2023, 1, 2))
+        events = []
+        write = loader._write_play_batch
+
+        def record_write(*args, **kwargs):
+            events.append('write')
+            return write(*args, **kwargs)
+
+        with patch.object(loader, '_write_play_batch', side_effect=record_write):
+            PlayLoadPipeline(loader, workers=1).run([2023], before_write=lambda: events.append('reference'))
+
+        assert events == ['reference', 'write']
+
+    def test_process_pool_workers(self, loader, session_factory):
+        loader.nfl_client.iter_plays.side_effect = chunks_of(
+            *(plays_chunk(2023, week, 4) for week in range(1, 6))
+        )
+
+        result = PlayLoadPipeline(loader, workers=2).run([2023], batch_size=4)
+
+        assert result.success is True, result.errors
+        assert result.stage_metrics['map']['items'] == 5
+        assert session_factory().query(PlayModel).count() == 20
+
+    def test_full_dataset_pipelined(self, loader):
+        for fetch in ('fetch_teams', 'fetch_games', 'fetch_players'):
+            getattr(loader.nfl_client, fetch).return_value = pd.DataFrame()
+        loader.nfl_client.iter_plays.side_effect = chunks_of(plays_chunk(2023, 1, 2))
+
+        results = loader.load_full_dataset([2023], pipelined=True, workers=1)
+
+        assert list(results) == ['teams', 'games', 'players', 'plays']
+        assert all(result.success for result in results.values())
+        assert results['plays'].records_inserted == 2
+        loader.nfl_client.fetch_plays.assert_not_called()
+
+    def test_full_dataset_pipelined_stops_when_games_fail(self, loader, session_factory):
+        for fetch in ('fetch_teams', 'fetch_players'):
+            getattr(loader.nfl_client, fetch).return_value = pd.DataFrame()
+        loader.nfl_client.fetch_games.side_effect = RuntimeError("schedules unavailable")
+        loader.nfl_client.iter_plays.side_effect = chunks_of(plays_chunk(2023, 1, 2))
+
+        results = loader.load_full_dataset([2023], pipelined=True, workers=1)
+
+        assert results['games'].success is False
+        assert results['plays'].success is False
+        assert results['plays'].errors == ['Plays not loaded: games load failed']
+        assert session_factory().query(PlayModel).count() == 0
+
+
+def test_map_play_chunk_reports_rows_and_timings():
+    batches, source_rows, map_seconds, validate_seconds = map_play_chunk(plays_chunk(2023, 1, 6), 4)
+
+    assert [len(batch) for batch in batches] == [4, 2]
+    assert source_rows == 6
+    assert map_seconds >= 0 and validate_seconds >= 0
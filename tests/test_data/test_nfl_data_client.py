@@ -367,4 +367,82 @@ class TestNFLDataClientErrorHandling:
         mock_import.return_value = mock_df
         
         result = client.fetch_recent_games()
-        assert len(result) == 0  # Should return empty DataFrame
\ No newline at end of file
+        assert len(result) == 0  # Should return empty DataFrame
+
+class TestStreamingPlays:
+    """Test reading play-by-play data in memory-bounded chunks."""
+    
+    @pytest.fixture
+    def client(self, tmp_path, monkeypatch):
+        """Client whose extracted-data directory is empty."""
+        monkeypatch.setattr('src.data.nfl_data_client.PBP_DATA_DIR', tmp_path)
+        return NFLDataClient(DataFetchConfig(cache_enabled=True))
+    
+    @staticmethod
+    def season_plays(season, count=5000):
+        return pd.DataFrame({
+            'play_id': [str(i) for i in range(count)],
+            'game_id': [f'{season}_01_SF_KC'] * count,
+            'season': season,
+            'week': [i % 4 + 1 for i in range(count)],
+            'desc': ['Pass complete short right'] * count,
+        })
+    
+    @patch('src.data.nfl_data_client.NFL_DATA_PY_AVAILABLE', True)
+    @patch('src.data.nfl_data_client.nfl.import_pbp_data')
+    def test_chunks_fit_budget(self, mock_import, client):
+        """Test each season is fetched on its own and split into budget-sized chunks."""
+        mock_import.side_effect = lambda seasons, downcast: self.season_plays(seasons[0])
+        
+        chunks = list(client.iter_plays([2022, 2023], memory_budget_mb=1))
+        
+        assert len(chunks) > 2
+        assert all(len(chunk) < 5000 for chunk in chunks)
+        assert sum(len(chunk) for chunk in chunks) == 10000
+        assert [call.args[0] for call in mock_import.call_args_list] == [[2022], [2023]]
+        assert client._cache == {}
+    
+    @patch('src.data.nfl_data_client.NFL_DATA_PY_AVAILABLE', True)
+    @patch('src.data.nfl_data_client.nfl.import_pbp_data')
+    def test_weeks_filter_per_chunk(self, mock_import, client):
+        """Test only the requested weeks are yielded."""
+        mock_import.return_value = self.season_plays(2023)
+        
+        chunks = list(client.iter_plays([2023], weeks=[2]))
+        
+        assert sum(len(chunk) for chunk in chunks) == 1250
+        assert all(set(chunk['week']) == {2} for chunk in chunks)
+    
+    @patch('src.data.nfl_data_client.NFL_DATA_PY_AVAILABLE', True)
+    @patch('src.data.nfl_data_client.nfl.import_pbp_data')
+    def test_column_projection(self, mock_import, client):
+        """Test only the requested columns are read, plus week when filtering weeks."""
+        mock_import.return_value = self.season_plays(2023)
+        
+        list(client.iter_plays([2023], weeks=[1], columns=['play_id', 'game_id']))
+        client.fetch_plays([2023], columns=['play_id'])
+        
+        assert [call.kwargs['columns'] for call in mock_import.call_args_list] == [
+            ['play_id', 'game_id', 'week'], ['play_id']
+        ]
+    
+    def test_no_source_raises(self, client):
+        """Test a season with neither a file nor nfl_data_py fails."""
+        with patch('src.data.nfl_data_client.NFL_DATA_PY_AVAILABLE', False):
+            with pytest.raises(ImportError):
+                list(client.iter_plays([2023]))
+    
+    def test_parquet_read_by_record_batch(self, client, tmp_path):
+        """Test an extracted file is read in several record batches rather than at once."""
+        pa = pytest.importorskip('pyarrow', exc_type=ImportError)
+        pq = pytest.importorskip('pyarrow.parquet', exc_type=ImportError)
+        pq.write_table(pa.Table.from_pandas(self.season_plays(2023, 50000)), tmp_path / 'pbp_2023.parquet',
+                       row_group_size=5000)
+        
+        chunks = list(client.iter_plays([2023], memory_budget_mb=1))
+        projected = list(client.iter_plays([2023], memory_budget_mb=1, columns=['play_id', 'epa']))
+        
+        assert len(chunks) > 1
+        assert sum(len(chunk) for chunk in chunks) == 50000
+        assert sum(len(chunk) for chunk in projected) == 50000
+        assert all(list(chunk.columns) == ['play_id'] for chunk in projected)
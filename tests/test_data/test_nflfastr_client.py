@@ -0,0 +1,224 @@
+"""Tests for nflfastR file downloads against a local HTTP server."""
+
+import hashlib
+import re
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from src.data.nflfastr_client import NFLFastRClient, NFLFastRConfig
+
+
+class FileServer(ThreadingHTTPServer):
+    """Serves in-memory files with Range support and injectable failures."""
+    daemon_threads = True
+
+    def __init__(self):
+        super().__init__(('127.0.0.1', 0), RangeHandler)
+        self.files = {}
+        self.requests = []
+        # Path -> number of upcoming responses to cut off halfway
+        self.truncate = {}
+        self.lock = threading.Lock()
+        self.active = 0
+        self.peak_active = 0
+        # Seconds each response is held back, to overlap concurrent requests
+        self.delay = 0
+
+
+class RangeHandler(BaseHTTPRequestHandler):
+
+    def do_GET(self):
+        server = self.server
+        with server.lock:
+            server.requests.append((self.path, self.headers.get('Range')))
+            server.active += 1
+            server.peak_active = max(server.peak_active, server.active)
+        try:
+            time.sleep(server.delay)
+            self._respond(server)
+        finally:
+            with server.lock:
+                server.active -= 1
+
+    def _respond(self, server):
+        body = server.files.get(self.path)
+        if body is None:
+            self.send_error(404)
+            return
+
+        start = 0
+        match = re.match(r'bytes=(\d+)-$', self.headers.get('Range') or '')
+        if match:
+            start = int(match.group(1))
+            if start >= len(body):
+                self.send_response(416)
+                self.send_header('Content-Range', f'bytes */{len(body)}')
+                self.send_header('Content-Length', '0')
+                self.end_headers()
+                return
+            self.send_response(206)
+            self.send_header('Content-Range', f'bytes {start}-{len(body) - 1}/{len(body)}')
+        else:
+            self.send_response(200)
+        payload = body[start:]
+        self.send_header('Content-Length', str(len(payload)))
+        self.end_headers()
+
+        with server.lock:
+            cut = server.truncate.get(self.path, 0) > 0
+            if cut:
+                server.truncate[self.path] -= 1
+        if cut:
+            self.wfile.write(payload[:len(payload) // 2])
+            self.wfile.flush()
+            self.close_connection = True
+            return
+        self.wfile.write(payload)
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def server():
+    server = FileServer()
+    thread = threading.Thread(target=server.serve_forever, kwargs={'poll_interval': 0.01}, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture
+def make_client(server, tmp_path):
+    def make(**overrides):
+        config = NFLFastRConfig(
+            base_url=f'http://127.0.0.1:{server.server_address[1]}',
+            cache_dir=str(tmp_path),
+            timeout_seconds=5,
+            chunk_size=64,
+            backoff_seconds=0,
+            **overrides
+        )
+        return NFLFastRClient(config)
+    return make
+
+
+def payload(size=1000, seed=0):
+    return bytes((i * 7 + seed) % 251 for i in range(size))
+
+
+class TestDownloadFile:
+    """Test streaming, resuming and verifying single downloads."""
+
+    def test_streams_file_into_place(self, server, make_client, tmp_path):
+        server.files['/pbp/play_by_play_2023.parquet'] = payload()
+        client = make_client()
+
+        ok = client._download_file(f'{client.config.base_url}/pbp/play_by_play_2023.parquet',
+                                   tmp_path / 'play_by_play_2023.parquet')
+
+        assert ok is True
+        assert (tmp_path / 'play_by_play_2023.parquet').read_bytes() == payload()
+        assert not (tmp_path / 'play_by_play_2023.parquet.part').exists()
+
+    def test_resumes_broken_transfer_with_range(self, server, make_client, tmp_path):
+        server.files['/pbp/play_by_play_2023.parquet'] = payload()
+        server.truncate['/pbp/play_by_play_2023.parquet'] = 1
+        client = make_client()
+
+        ok = client._download_file(f'{client.config.base_url}/pbp/play_by_play_2023.parquet',
+                                   tmp_path / 'play_by_play_2023.parquet')
+
+        assert ok is True
+        assert (tmp_path / 'play_by_play_2023.parquet').read_bytes() == payload()
+        first, resumed = [header for _, header in server.requests]
+        # Continues from the bytes on disk, at most the half the server sent
+        assert first is None and 0 < int(re.match(r'bytes=(\d+)-', resumed).group(1)) <= 500
+
+    def test_partial_file_with_every_byte_is_finalized(self, server, make_client, tmp_path):
+        server.files['/pbp/play_by_play_2023.parquet'] = payload()
+        (tmp_path / 'play_by_play_2023.parquet.part').write_bytes(payload())
+        client = make_client()
+
+        ok = client._download_file(f'{client.config.base_url}/pbp/play_by_play_2023.parquet',
+                                   tmp_path / 'play_by_play_2023.parquet')
+
+        assert ok is True
+        assert (tmp_path / 'play_by_play_2023.parquet').read_bytes() == payload()
+
+    def test_checksum_mismatch_fails_and_keeps_no_file(self, server, make_client, tmp_path):
+        server.files['/pbp/play_by_play_2023.parquet'] = payload()
+        client = make_client(max_retries=2, manifest={
+            'play_by_play_2023.parquet': {'sha256': hashlib.sha256(b'other').hexdigest()}
+        })
+
+        ok = client._download_file(f'{client.config.base_url}/pbp/play_by_play_2023.parquet',
+                                   tmp_path / 'play_by_play_2023.parquet')
+
+        assert ok is False
+        assert list(tmp_path.iterdir()) == []
+        # A failed check restarts from scratch rather than resuming
+        assert [header for _, header in server.requests] == [None, None]
+
+    def test_manifest_match(self, server, make_client, tmp_path):
+        server.files['/pbp/play_by_play_2023.parquet'] = payload()
+        client = make_client(manifest={'play_by_play_2023.parquet': {
+            'size': 1000, 'sha256': hashlib.sha256(payload()).hexdigest()
+        }})
+
+        assert client._download_file(f'{client.config.base_url}/pbp/play_by_play_2023.parquet',
+                                     tmp_path / 'play_by_play_2023.parquet') is True
+
+    def test_gives_up_after_max_retries(self, server, make_client, tmp_path):
+        client = make_client(max_retries=3)
+
+        ok = client._download_file(f'{client.config.base_url}/pbp/missing.parquet', tmp_path / 'missing.parquet')
+
+        assert ok is False
+        assert len(server.requests) == 3
+        assert not (tmp_path / 'missing.parquet').exists()
+
+
+class TestDownloadSeasons:
+    """Test concurrent downloads of several seasons and datasets."""
+
+    def test_downloads_concurrently_with_bounded_workers(self, server, make_client, tmp_path):
+        seasons = range(2019, 2025)
+        for season in seasons:
+            server.files[f'/pbp/play_by_play_{season}.parquet'] = payload(seed=season)
+            server.files[f'/schedules/schedules_{season}.parquet'] = payload(200, seed=season)
+        server.delay = 0.1
+        client = make_client(download_workers=3)
+
+        status = client.download_seasons(['play_by_play', 'schedules'], seasons)
+
+        assert all(status.values()) and len(status) == 12
+        assert server.peak_active == 3
+        for season in seasons:
+            assert (tmp_path / f'play_by_play_{season}.parquet').read_bytes() == payload(seed=season)
+
+    def test_skips_cached_files(self, server, make_client, tmp_path):
+        server.files['/rosters/rosters_2024.parquet'] = payload()
+        (tmp_path / 'rosters_2023.parquet').write_bytes(b'cached')
+        client = make_client()
+
+        status = client.download_seasons(['rosters'], [2023, 2024])
+
+        assert status == {('rosters', 2023): True, ('rosters', 2024): True}
+        assert [path for path, _ in server.requests] == ['/rosters/rosters_2024.parquet']
+
+    def test_reports_failed_seasons(self, server, make_client):
+        server.files['/rosters/rosters_2024.parquet'] = payload()
+        client = make_client(max_retries=1)
+
+        status = client.download_seasons(['rosters'], [2023, 2024])
+
+        assert status == {('rosters', 2023): False, ('rosters', 2024): True}
+
+    def test_unknown_dataset(self, make_client):
+        with pytest.raises(ValueError, match="Unknown dataset"):
+            make_client().download_seasons(['injuries'], [2024])
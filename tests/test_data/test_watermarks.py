@@ -0,0 +1,63 @@
+"""Tests for per-week load watermarks."""
+
+from datetime import date
+
+import pandas as pd
+
+from src.data.watermarks import ChunkedWeekFingerprints, changed_weeks, week_fingerprints
+
+GAMES = pd.DataFrame({
+    'game_id': ['2023_01_SF_KC', '2023_01_DAL_BUF', '2023_02_SF_LA'],
+    'season': [2023, 2023, 2023],
+    'week': [1, 1, 2],
+    'gameday': ['2023-09-10', '2023-09-11', '2023-09-17'],
+    'home_score': [21.0, None, 14.0],
+})
+
+
+def test_fingerprints_per_week():
+    fingerprints = week_fingerprints(GAMES, date_column='gameday')
+
+    assert sorted(fingerprints) == [(2023, 1), (2023, 2)]
+    week_one = fingerprints[(2023, 1)]
+    assert (week_one.row_count, week_one.last_game_id, week_one.last_game_date) == (
+        2, '2023_01_SF_KC', date(2023, 9, 11)
+    )
+
+
+def test_hash_ignores_row_and_column_order():
+    shuffled = GAMES.iloc[::-1][list(reversed(GAMES.columns))]
+
+    assert ({key: f.content_hash for key, f in week_fingerprints(shuffled).items()}
+            == {key: f.content_hash for key, f in week_fingerprints(GAMES).items()})
+
+
+def test_changed_weeks():
+    fingerprints = week_fingerprints(GAMES)
+    stored = {key: f.content_hash for key, f in fingerprints.items()}
+
+    scored = GAMES.assign(home_score=[21.0, 30.0, 14.0])
+
+    assert changed_weeks(fingerprints, stored) == []
+    assert changed_weeks(week_fingerprints(scored), stored) == [(2023, 1)]
+    assert changed_weeks(fingerprints, {}) == [(2023, 1), (2023, 2)]
+
+
+def test_empty_source():
+    assert week_fingerprints(pd.DataFrame()) == {}
+
+
+def test_chunked_fingerprints_match_whole_source():
+    fingerprints = ChunkedWeekFingerprints(date_column='gameday')
+    # Week 1 spans both chunks, its later game in the first one
+    fingerprints.add(GAMES.iloc[[1]])
+    fingerprints.add(GAMES.iloc[[0, 2]])
+
+    assert fingerprints.result() == week_fingerprints(GAMES, date_column='gameday')
+
+
+def test_chunked_fingerprints_hash_only_given_columns():
+    fingerprints = ChunkedWeekFingerprints(columns=['game_id', 'season', 'week', 'home_score'])
+    fingerprints.add(GAMES.assign(unread='x'))
+
+    assert fingerprints.result() == week_fingerprints(GAMES.drop(columns=['gameday']))
@@ -398,4 +398,32 @@ class TestMigrationManagerErrorHandling:
                     assert status['current_revision'] is None
                     assert status['up_to_date'] is False
         finally:
-            shutil.rmtree(temp_dir)
\ No newline at end of file
+            shutil.rmtree(temp_dir)
+
+class TestMigrationChain:
+    """Test the project's own revisions against the ORM models."""
+    
+    def test_upgrade_head_matches_models(self, tmp_path, monkeypatch):
+        """A database built by migrations has exactly the models' schema."""
+        from alembic import command
+        from alembic.autogenerate import compare_metadata
+        from alembic.config import Config
+        from alembic.migration import MigrationContext
+        
+        import src.models  # noqa: F401 - registers every table
+        from src.models.base import Base
+        
+        database_url = f"sqlite:///{tmp_path / 'migrated.db'}"
+        monkeypatch.setenv('DATABASE_URL', database_url)
+        config = Config(str(Path(__file__).parent.parent.parent / "alembic.ini"))
+        
+        command.upgrade(config, "head")
+        
+        engine = create_engine(database_url)
+        try:
+            with engine.connect() as connection:
+                assert compare_metadata(MigrationContext.configure(connection), Base.metadata) == []
+        finally:
+            engine.dispose()
+        
+        command.downgrade(config, "base")
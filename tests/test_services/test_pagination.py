@@ -0,0 +1,121 @@
+"""Tests for keyset (cursor) pagination."""
+
+import pytest
+from datetime import date
+from sqlalchemy import event
+
+from src.models.game import GameModel
+from src.models.play import PlayModel
+from src.models.team import TeamModel
+from src.services.base import BaseService, ValidationException
+from src.services.pagination import decode_cursor, encode_cursor, keyset_page
+
+SEASON = 1999  # Keeps these rows apart from other tests' data in the shared database
+
+PLAY_KEY = ((PlayModel.game_id, False), (PlayModel.play_id, False))
+GAME_KEY = ((GameModel.game_date, True), (GameModel.id, True))
+
+
+@pytest.fixture
+def paged_rows(test_session):
+    """Five games (two on the same day) with three plays each, flushed but not committed."""
+    days = [date(1999, 9, 12), date(1999, 9, 12), date(1999, 9, 19), date(1999, 9, 26), date(1999, 10, 3)]
+    for i, day in enumerate(days):
+        game_id = f"1999_0{i + 1}_AAA_BBB"
+        test_session.add(GameModel(game_id=game_id, season=SEASON, season_type='REG', week=i + 1,
+                                   game_date=day, home_team='BBB', away_team='AAA'))
+        for play_id in ('1', '2', '3'):
+            test_session.add(PlayModel(game_id=game_id, play_id=play_id, season=SEASON))
+    test_session.flush()
+
+
+def pages(query, sort_key, limit):
+    rows, cursor, pages = [], None, 0
+    while True:
+        page, cursor = keyset_page(query, sort_key, limit, cursor)
+        rows.extend(page)
+        pages += 1
+        if cursor is None:
+            return rows, pages
+
+
+class TestKeysetPage:
+    """Test seeking through ordered rows page by page."""
+
+    def test_pages_match_full_ordering(self, test_session, paged_rows):
+        query = test_session.query(PlayModel).filter(PlayModel.season == SEASON)
+
+        rows, page_count = pages(query, PLAY_KEY, 4)
+        expected = query.order_by(PlayModel.game_id, PlayModel.play_id).all()
+
+        assert [row.id for row in rows] == [row.id for row in expected]
+        assert page_count == 4
+
+    def test_descending_key_with_ties(self, test_session, paged_rows):
+        query = test_session.query(GameModel).filter(GameModel.season == SEASON)
+
+        rows, _ = pages(query, GAME_KEY, 1)
+
+        assert [row.game_date for row in rows] == sorted((row.game_date for row in rows), reverse=True)
+        assert len({row.id for row in rows}) == 5
+
+    def test_offset_page_returns_cursor(self, test_session, paged_rows):
+        query = test_session.query(PlayModel).filter(PlayModel.season == SEASON)
+
+        offset_page, cursor = keyset_page(query, PLAY_KEY, 2, offset=2)
+        next_page, _ = keyset_page(query, PLAY_KEY, 2, cursor)
+
+        assert [(row.game_id, row.play_id) for row in offset_page + next_page] == [
+            ('1999_01_AAA_BBB', '3'), ('1999_02_AAA_BBB', '1'),
+            ('1999_02_AAA_BBB', '2'), ('1999_02_AAA_BBB', '3'),
+        ]
+
+    def test_deep_page_is_one_seek_query(self, test_session, test_engine, paged_rows):
+        statements = []
+
+        def record(conn, cursor, statement, parameters, context, executemany):
+            statements.append(statement)
+
+        query = test_session.query(PlayModel).filter(PlayModel.season == SEASON)
+        event.listen(test_engine, "before_cursor_execute", record)
+        try:
+            page, _ = keyset_page(query, PLAY_KEY, 10, encode_cursor(['1999_04_AAA_BBB', '3']))
+        finally:
+            event.remove(test_engine, "before_cursor_execute", record)
+
+        assert [row.game_id for row in page] == ['1999_05_AAA_BBB'] * 3
+        assert len(statements) == 1
+        assert 'plays.game_id > ?' in statements[0]
+
+
+class TestCursors:
+    """Test cursor encoding."""
+
+    def test_round_trip_converts_dates(self):
+        cursor = encode_cursor([date(1999, 9, 12), 7])
+
+        assert decode_cursor(cursor, GAME_KEY) == [date(1999, 9, 12), 7]
+
+    @pytest.mark.parametrize("cursor", ["not-a-cursor", encode_cursor(['only one value'])])
+    def test_invalid_cursor(self, cursor):
+        with pytest.raises(ValidationException):
+            decode_cursor(cursor, GAME_KEY)
+
+
+class TestBaseServiceListPage:
+    """Test cursor pagination through the base service."""
+
+    def test_list_page_orders_by_column_then_id(self, test_session):
+        for abbr in ('ZZC', 'ZZA', 'ZZB'):
+            test_session.add(TeamModel(team_abbr=abbr, team_name=f"Team {abbr}", team_nick=abbr,
+                                       team_conf='AFC',
+                                       team_division='Test'))
+        test_session.flush()
+        service = BaseService(test_session, TeamModel)
+
+        first, cursor = service.list_page(limit=2, filters={'team_division': 'Test'}, order_by='team_abbr')
+        second, last = service.list_page(limit=2, cursor=cursor, filters={'team_division': 'Test'},
+                                         order_by='team_abbr')
+
+        assert [team.team_abbr for team in first + second] == ['ZZA', 'ZZB', 'ZZC']
+        assert last is None